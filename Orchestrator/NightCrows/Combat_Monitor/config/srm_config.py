@@ -3,7 +3,9 @@
 from enum import Enum, auto
 from typing import final
 
-from pyautogui import click
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 # =============================================================================
@@ -359,7 +361,16 @@ SRM1_CONFIG = {
         'recovery_wait_min': 10.0,  # 최소 부활 대기 시간
         'recovery_timeout': 30.0,  # 부활 타임아웃
         'flee_wait_min': 12.0,  # 최소 도주 대기 시간
-        'potion_step_timeout': 30.0  # 물약 구매 단계별 타임아웃
+        'potion_step_timeout': 30.0,  # 물약 구매 단계별 타임아웃
+        # 상태별 폴링 간격 (초) - 위험 상태는 촘촘히, 정상 상태는 느슨하게 (없는 상태는 모니터 기본 1.0초)
+        'state_intervals': {
+            ScreenState.NORMAL: 1.0,
+            ScreenState.HOSTILE: 0.2,
+            ScreenState.S1_EMERGENCY_FLEE: 0.2,
+            ScreenState.DEAD: 0.5,
+            ScreenState.RECOVERING: 0.5,
+            ScreenState.FLEEING: 0.5,
+        }
     },
 
     # 전투 우선순위 - SRM1 고유 정책
@@ -446,39 +457,39 @@ def validate_state_policies() -> bool:
         # 필수 키 검증
         for key in required_keys:
             if key not in policy:
-                print(f"오류: {state.name} 상태에 '{key}' 정책이 없습니다.")
+                log.error(f"오류: {state.name} 상태에 '{key}' 정책이 없습니다.")
                 return False
 
         # action_type 유효성 검증
         action_type = policy.get('action_type')
         if action_type not in valid_action_types:
-            print(f"오류: {state.name}의 action_type '{action_type}'이 유효하지 않습니다.")
+            log.error(f"오류: {state.name}의 action_type '{action_type}'이 유효하지 않습니다.")
             return False
 
         # conditional_flow 유효성 검증
         flow_type = policy.get('conditional_flow')
         if flow_type not in valid_flows:
-            print(f"오류: {state.name}의 conditional_flow '{flow_type}'이 유효하지 않습니다.")
+            log.error(f"오류: {state.name}의 conditional_flow '{flow_type}'이 유효하지 않습니다.")
             return False
 
         # ✅ SM1 패턴: targets 일관성 검증
         if action_type in ['time_based_wait', 'sequence']:
             targets = policy.get('targets', [])
             if targets:
-                print(f"경고: {state.name} 상태({action_type})에 불필요한 targets가 있습니다.")
+                log.warning(f"경고: {state.name} 상태({action_type})에 불필요한 targets가 있습니다.")
         else:
             if 'targets' not in policy or not policy['targets']:
-                print(f"오류: {state.name} 상태에 targets가 필요합니다.")
+                log.error(f"오류: {state.name} 상태에 targets가 필요합니다.")
                 return False
 
         # transitions 유효성 검증
         transitions = policy.get('transitions', {})
         for result, next_state in transitions.items():
             if not isinstance(next_state, ScreenState):
-                print(f"오류: {state.name}의 전이 결과 '{result}'가 유효하지 않은 상태입니다.")
+                log.error(f"오류: {state.name}의 전이 결과 '{result}'가 유효하지 않은 상태입니다.")
                 return False
 
-    print("✅ 모든 SRM1 상태 정책이 올바르게 정의되었습니다.")
+    log.info("✅ 모든 SRM1 상태 정책이 올바르게 정의되었습니다.")
     return True
 
 
@@ -489,26 +500,26 @@ def validate_config() -> bool:
         required_sections = ['timing', 'combat_priorities', 'screen_management', 'location_contexts', 'game_settings']
         for section in required_sections:
             if section not in SRM1_CONFIG:
-                print(f"오류: 필수 설정 섹션 '{section}'이 없습니다.")
+                log.error(f"오류: 필수 설정 섹션 '{section}'이 없습니다.")
                 return False
 
         # 타이밍 값 검증
         timing = SRM1_CONFIG['timing']
         if timing['check_interval'] <= 0:
-            print("오류: check_interval은 0보다 커야 합니다.")
+            log.error("오류: check_interval은 0보다 커야 합니다.")
             return False
 
         # 화면 설정 검증
         screens = SRM1_CONFIG['screen_management']
         if not screens['target_screens']:
-            print("오류: target_screens가 비어있습니다.")
+            log.error("오류: target_screens가 비어있습니다.")
             return False
 
-        print("✅ SRM1_CONFIG 유효성 검증 완료")
+        log.info("✅ SRM1_CONFIG 유효성 검증 완료")
         return True
 
     except Exception as e:
-        print(f"오류: 설정 검증 중 예외 발생 - {e}")
+        log.error(f"오류: 설정 검증 중 예외 발생 - {e}")
         return False
 
 
@@ -517,19 +528,19 @@ def validate_config() -> bool:
 # =============================================================================
 
 if __name__ == "__main__":
-    print("🎯 SRM1 통합 설정 테스트 (SM1 패턴 적용)")
-    print("=" * 60)
+    log.info("🎯 SRM1 통합 설정 테스트 (SM1 패턴 적용)")
+    log.info("=" * 60)
 
     # 정책 유효성 검증
-    print("📊 정책 검증 중...")
+    log.info("📊 정책 검증 중...")
     policies_valid = validate_state_policies()
 
-    print("\n📊 설정 검증 중...")
+    log.info("\n📊 설정 검증 중...")
     config_valid = validate_config()
 
     if policies_valid and config_valid:
-        print(f"\n📊 정의된 상태 수: {len(SRM1_STATE_POLICIES)}")
-        print(f"📋 지원 상태들:")
+        log.info(f"\n📊 정의된 상태 수: {len(SRM1_STATE_POLICIES)}")
+        log.info(f"📋 지원 상태들:")
 
         for i, state in enumerate(get_all_states(), 1):
             policy = get_state_policy(state)
@@ -537,37 +548,37 @@ if __name__ == "__main__":
             flow_type = policy.get('conditional_flow', 'N/A')
             transitions = policy.get('transitions', {})
 
-            print(f"  {i}. {state.name}")
-            print(f"     • 액션: {action_type}")
-            print(f"     • 흐름: {flow_type}")
-            print(f"     • 전이: {len(transitions)}개 가능")
+            log.info(f"  {i}. {state.name}")
+            log.info(f"     • 액션: {action_type}")
+            log.info(f"     • 흐름: {flow_type}")
+            log.info(f"     • 전이: {len(transitions)}개 가능")
 
             # sequence나 time_based_wait 특수 설정 표시
             if action_type == 'sequence' and 'sequence_config' in policy:
                 actions = policy['sequence_config'].get('actions', [])
-                print(f"     • 시퀀스: {len(actions)}개 액션")
+                log.info(f"     • 시퀀스: {len(actions)}개 액션")
             if action_type == 'time_based_wait' and 'expected_duration' in policy:
                 duration = policy['expected_duration']
-                print(f"     • 대기 시간: {duration}초")
-            print()
-
-        print("📊 주요 운영 설정:")
-        print(f"  • 체크 간격: {SRM1_CONFIG['timing']['check_interval']}초")
-        print(f"  • 부활 타임아웃: {SRM1_CONFIG['timing']['recovery_timeout']}초")
-        print(f"  • 도주 대기 시간: {SRM1_CONFIG['timing']['flee_wait_min']}초")
-        print(f"  • 위험 감지 순서: {SRM1_CONFIG['combat_priorities']['threat_detection_order']}")
-        print(f"  • 대상 화면: {SRM1_CONFIG['screen_management']['target_screens']}")
-        print(f"  • 우선순위 화면: {SRM1_CONFIG['screen_management']['priority_screens']}")
-
-        print("\n🎯 SM1 패턴 적용 결과:")
-        print("  • action_type 4가지로 통일: detect_only, detect_and_click, sequence, time_based_wait")
-        print("  • sequence/time_based_wait는 targets=[] (빈 배열)")
-        print("  • 실제 동작은 sequence_config, expected_duration에서 정의")
-        print("  • SM1과 완전 호환되는 4대 정책 범주 구조")
-        print("  • 브릿지에서 빈 targets 방어 로직 처리")
+                log.info(f"     • 대기 시간: {duration}초")
+            log.info("")
+
+        log.info("📊 주요 운영 설정:")
+        log.info(f"  • 체크 간격: {SRM1_CONFIG['timing']['check_interval']}초")
+        log.info(f"  • 부활 타임아웃: {SRM1_CONFIG['timing']['recovery_timeout']}초")
+        log.info(f"  • 도주 대기 시간: {SRM1_CONFIG['timing']['flee_wait_min']}초")
+        log.info(f"  • 위험 감지 순서: {SRM1_CONFIG['combat_priorities']['threat_detection_order']}")
+        log.info(f"  • 대상 화면: {SRM1_CONFIG['screen_management']['target_screens']}")
+        log.info(f"  • 우선순위 화면: {SRM1_CONFIG['screen_management']['priority_screens']}")
+
+        log.info("\n🎯 SM1 패턴 적용 결과:")
+        log.info("  • action_type 4가지로 통일: detect_only, detect_and_click, sequence, time_based_wait")
+        log.info("  • sequence/time_based_wait는 targets=[] (빈 배열)")
+        log.info("  • 실제 동작은 sequence_config, expected_duration에서 정의")
+        log.info("  • SM1과 완전 호환되는 4대 정책 범주 구조")
+        log.info("  • 브릿지에서 빈 targets 방어 로직 처리")
 
     else:
-        print("❌ 설정 또는 정책 검증 실패!")
+        log.error("❌ 설정 또는 정책 검증 실패!")
 
-    print("\n" + "=" * 60)
-    print("SRM1 통합 설정 테스트 완료")
\ No newline at end of file
+    log.info("\n" + "=" * 60)
+    log.info("SRM1 통합 설정 테스트 완료")
\ No newline at end of file
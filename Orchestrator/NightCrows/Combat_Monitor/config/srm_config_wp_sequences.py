@@ -2,7 +2,9 @@
 스크린별 WP(Waypoint) 이동 시퀀스 정의
 녹화된 이동 경로를 operation 형식으로 저장
 """
-from matplotlib.style.core import context
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 # S1 WP3 시퀀스 (ARENA)
 S1_WP3_ARENA = [
@@ -595,6 +597,6 @@ def get_wp_sequence(screen_id: str, wp_name: str = 'wp3', context: str = 'ARENA'
     sequence = sequences.get(key, [])
 
     if not sequence:
-        print(f"WARN: WP sequence not found for key '{key}'")
+        log.warning(f"WP sequence not found for key '{key}'")
 
     return sequence
\ No newline at end of file
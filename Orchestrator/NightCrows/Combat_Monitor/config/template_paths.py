@@ -1,5 +1,8 @@
 # Orchestrator/NightCrows/Combat_Monitor/config/template_paths.py
 import os
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 # 중앙 템플릿 베이스 경로
 BASE_TEMPLATE_PATH = r"C:\Users\yjy16\template"
@@ -152,12 +155,12 @@ def verify_template_paths():
                 missing_templates.append(f"{screen_id}.{template_name}: {path}")
 
     if missing_templates:
-        print("경고: 다음 템플릿 파일이 존재하지 않습니다:")
+        log.warning("경고: 다음 템플릿 파일이 존재하지 않습니다:")
         for template in missing_templates:
-            print(f"  - {template}")
-        print("템플릿 이미지 파일을 해당 경로에 생성하거나 경로를 수정하세요.")
+            log.info(f"  - {template}")
+        log.info("템플릿 이미지 파일을 해당 경로에 생성하거나 경로를 수정하세요.")
         return False
-    print("모든 템플릿 경로가 유효합니다.")
+    log.info("모든 템플릿 경로가 유효합니다.")
     return True
 
 
@@ -172,7 +175,7 @@ def get_template(screen_id, template_name):
     # TEMPLATES 딕셔너리에서 직접 찾음
     if screen_id in TEMPLATES and template_name in TEMPLATES[screen_id]:
         return TEMPLATES[screen_id][template_name]
-    print(f"경고: 템플릿을 찾을 수 없음 - Screen ID: {screen_id}, Template Name: {template_name}")
+    log.warning(f"경고: 템플릿을 찾을 수 없음 - Screen ID: {screen_id}, Template Name: {template_name}")
     return None
 
 
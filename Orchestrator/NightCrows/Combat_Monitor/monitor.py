@@ -1,16 +1,10 @@
 # Orchestrator/NightCrows/Combat_Monitor/monitor.py
 # 전체 리팩토링 버전 - 기능 동일, 가독성 및 유지보수성 개선
 
-import pyautogui
-import pytweening
-import traceback
 import cv2
 import time
 import threading
 import os
-import keyboard
-import win32api
-import win32con
 import sys
 import numpy as np
 from dataclasses import dataclass, field
@@ -18,10 +12,23 @@ from typing import Tuple, List, Dict, Optional, Callable, Any
 from Orchestrator.NightCrows.utils import image_utils
 from Orchestrator.NightCrows.utils.screen_info import FIXED_UI_COORDS
 from Orchestrator.src.core.io_scheduler import IOScheduler, Priority
+from Orchestrator.src.core.screen_layout import screen_ids
+from Orchestrator.src.core.shared_state_store import SharedStateStore
+from Orchestrator.src.core.tick_scheduler import TickScheduler
+from Orchestrator.src.core.checkpoint import decode_state
+from Orchestrator.src.core.detection_pool import DETECTION_POOL
+from Orchestrator.src.core.watchdog import WATCHDOG
+from Orchestrator.src.utils.wait_utils import wait_for
+from Orchestrator.src.utils.profiler import PROFILER
 from .config import srm_config, template_paths
 from .config.srm_config import ScreenState
 from enum import Enum, auto
 from Orchestrator.NightCrows.System_Monitor.config.sm_config import SystemState
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 # ============================================================================
@@ -61,15 +68,11 @@ class ScreenMonitorInfo:
     policy_step_start_time: float = 0.0
     party_check_count: int = 0
 
-    # [신규] 프로퍼티 정의
+    # [신규] 프로퍼티 정의 (읽기 전용, 쓰기는 CombatMonitor가 store.set으로 출처/사유와 함께 기록)
     @property
     def current_state(self):
         return self._shared_state_ref.get(self.screen_id, ScreenState.NORMAL)
 
-    @current_state.setter
-    def current_state(self, new_state):
-        self._shared_state_ref[self.screen_id] = new_state
-
 
 class BaseMonitor:
     """오케스트레이터와 호환되는 모니터의 기본 클래스"""
@@ -85,13 +88,14 @@ class BaseMonitor:
         self.monitor_id = monitor_id
         self.config = config if isinstance(config, dict) else {}
         self.vd_name = vd_name
-        self.shared_states = shared_states if shared_states is not None else {}
+        self.shared_states = shared_states if shared_states is not None else SharedStateStore(vd_name)
+        self.spans = PROFILER.for_monitor(monitor_id)  # 틱 구간 계측 (비활성 시 no-op)
 
     def run_loop(self, stop_event: threading.Event):
         raise NotImplementedError("Subclasses should implement this method.")
 
     def stop(self):
-        print(f"INFO: Stopping BaseMonitor for {self.monitor_id}")
+        log.info(f"Stopping BaseMonitor for {self.monitor_id}")
 
 
 # ============================================================================
@@ -110,6 +114,7 @@ class CombatMonitor(BaseMonitor):
     HOSTILE_SAMPLE_COUNT = 3
     HOSTILE_SAMPLE_INTERVAL = 0.1
     PARTY_CHECK_THRESHOLD = 3
+    LOOP_INTERVAL = 1.0  # 상태별 폴링 간격(srm_config timing['state_intervals'])이 없는 화면의 간격
     SAFE_STATES = [ScreenState.NORMAL, ScreenState.RETURNING, ScreenState.INITIALIZING]
 
     def __init__(self, monitor_id="SRM1", config=None, vd_name="VD1",
@@ -129,6 +134,9 @@ class CombatMonitor(BaseMonitor):
         self.stop_event = None
         self.screens: List[ScreenMonitorInfo] = []
         self.confidence = self.config.get('confidence', 0.85)
+        self.state_intervals = dict(srm_config.SRM1_CONFIG['timing']['state_intervals'])
+        self.ticks = TickScheduler(self.monitor_id)  # 화면별 데드라인 틱
+        self._pending_checkpoint: Optional[Tuple[dict, dict, float]] = None  # restore_checkpoint → run_loop 시작 시 적용
 
         # 템플릿 경로 초기화
         self.arena_template_path = getattr(template_paths, 'ARENA_TEMPLATE', None)
@@ -160,26 +168,26 @@ class CombatMonitor(BaseMonitor):
     def _verify_templates(self):
         """필수 템플릿 검증"""
         if not all([self.arena_template_path, self.dead_template_path, self.hostile_template_path]):
-            print(f"WARNING: [{self.monitor_id}] Essential templates missing in config.")
+            log.warning(f"[{self.monitor_id}] Essential templates missing in config.")
 
-        print(f"INFO: [{self.monitor_id}] Verifying ALL registered template paths...")
+        log.info(f"[{self.monitor_id}] Verifying ALL registered template paths...")
         if not template_paths.verify_template_paths():
-            print(f"ERROR: [{self.monitor_id}] Critical templates are missing.")
+            log.error(f"[{self.monitor_id}] Critical templates are missing.")
         else:
-            print(f"INFO: [{self.monitor_id}] All registered template paths are valid.")
+            log.info(f"[{self.monitor_id}] All registered template paths are valid.")
 
     def add_screen(self, screen_id: str, region: Tuple[int, int, int, int]):
         """모니터링할 화면 영역 등록"""
         if not isinstance(screen_id, str) or not screen_id:
-            print(f"ERROR: [{self.monitor_id}] Invalid screen_id '{screen_id}'. Skipping.")
+            log.error(f"[{self.monitor_id}] Invalid screen_id '{screen_id}'. Skipping.")
             return
 
         if not isinstance(region, tuple) or len(region) != 4:
-            print(f"ERROR: [{self.monitor_id}] Invalid region for '{screen_id}'. Skipping.")
+            log.error(f"[{self.monitor_id}] Invalid region for '{screen_id}'. Skipping.")
             return
 
         if any(s.screen_id == screen_id for s in self.screens):
-            print(f"WARNING: [{self.monitor_id}] Screen '{screen_id}' already added. Skipping.")
+            log.warning(f"[{self.monitor_id}] Screen '{screen_id}' already added. Skipping.")
             return
 
         screen = ScreenMonitorInfo(
@@ -188,7 +196,7 @@ class CombatMonitor(BaseMonitor):
             _shared_state_ref=self.shared_states  # <--- 전달
         )
         self.screens.append(screen)
-        print(f"INFO: [{self.monitor_id}] Screen added: ID={screen_id}, Region={region}")
+        log.info(f"[{self.monitor_id}] Screen added: ID={screen_id}, Region={region}")
 
     # ========================================================================
     # Public API (Orchestrator 호출용)
@@ -198,7 +206,7 @@ class CombatMonitor(BaseMonitor):
         """화면의 현재 상태 조회 (Orchestrator용)"""
         screen = self._find_screen(screen_id)
         if not screen:
-            print(f"WARN: [{self.monitor_id}] get_current_state: Screen {screen_id} not found.")
+            log.warning(f"[{self.monitor_id}] get_current_state: Screen {screen_id} not found.")
             return None
         return screen.current_state
 
@@ -206,16 +214,16 @@ class CombatMonitor(BaseMonitor):
         """화면 강제 리셋 (Orchestrator용)"""
         screen = self._find_screen(screen_id)
         if not screen:
-            print(f"WARN: [{self.monitor_id}] force_reset_screen: Screen {screen_id} not found.")
+            log.warning(f"[{self.monitor_id}] force_reset_screen: Screen {screen_id} not found.")
             return
 
-        print(f"INFO: [{self.monitor_id}] Screen {screen_id} forcibly reset by Orchestrator.")
+        log.info(f"[{self.monitor_id}] Screen {screen_id} forcibly reset by Orchestrator.")
         screen.policy_step = 0
         screen.policy_step_start_time = 0.0
         screen.retry_count = 0
         screen.s1_completed = False
         screen.party_check_count = 0
-        self._change_state(screen, ScreenState.NORMAL)
+        self._change_state(screen, ScreenState.NORMAL, 'force_reset')
 
     # ========================================================================
     # Template & Image Utilities
@@ -227,26 +235,45 @@ class CombatMonitor(BaseMonitor):
             return None
 
         if not os.path.exists(template_path):
-            print(f"ERROR: [{self.monitor_id}] Template not found: {template_path}")
+            log.error(f"[{self.monitor_id}] Template not found: {template_path}")
             return None
 
         try:
             template = cv2.imread(template_path)
             if template is None:
-                print(f"ERROR: [{self.monitor_id}] Failed to load template: {template_path}")
+                log.error(f"[{self.monitor_id}] Failed to load template: {template_path}")
             return template
         except Exception as e:
-            print(f"ERROR: [{self.monitor_id}] Exception loading template: {e}")
+            log.error(f"[{self.monitor_id}] Exception loading template: {e}")
             return None
 
-    def _get_template(self, screen: ScreenMonitorInfo, key: str,
-                      fallback_attr: Optional[str] = None) -> Optional[cv2.typing.MatLike]:
-        """템플릿 경로 조회 및 로드 통합"""
+    def _get_template_path(self, screen: ScreenMonitorInfo, key: str,
+                           fallback_attr: Optional[str] = None) -> Optional[str]:
+        """화면별 템플릿 경로 (없으면 template_paths의 fallback_attr)"""
         path = template_paths.get_template(screen.screen_id, key)
         if not path and fallback_attr:
             path = getattr(template_paths, fallback_attr, None)
+        return path
+
+    def _get_template(self, screen: ScreenMonitorInfo, key: str,
+                      fallback_attr: Optional[str] = None) -> Optional[cv2.typing.MatLike]:
+        """템플릿 경로 조회 및 로드 통합"""
+        path = self._get_template_path(screen, key, fallback_attr)
         return self._load_template(path) if path else None
 
+    def _pool_present(self, screen: ScreenMonitorInfo, screenshot, key: str,
+                      fallback_attr: Optional[str] = None) -> Optional[bool]:
+        """탐지 작업 프로세스로 템플릿 확인 (DETECTION_POOL 미사용 / 실패 시 None → 스레드 안에서 매칭)"""
+        if not DETECTION_POOL.running:
+            return None
+        path = self._get_template_path(screen, key, fallback_attr)
+        if not path or not os.path.exists(path):
+            return None
+        scores = DETECTION_POOL.match((self.vd_name, screen.screen_id), screenshot, [(key, path)])
+        if scores is None or key not in scores:
+            return None
+        return scores[key][0] > self.confidence  # compare_images와 같은 비교
+
     def _check_template_present(self, screen: ScreenMonitorInfo, template_key: str) -> bool:
         """템플릿 존재 여부 확인"""
         template_path = template_paths.get_template(screen.screen_id, template_key)
@@ -254,7 +281,7 @@ class CombatMonitor(BaseMonitor):
             template_path = getattr(template_paths, template_key, None)
 
         if not template_path or not os.path.exists(template_path):
-            print(f"WARN: [{self.monitor_id}] Template not found for key '{template_key}'")
+            log.warning(f"[{self.monitor_id}] Template not found for key '{template_key}'")
             return False
 
         screenshot = self.orchestrator.capture_screen_safely(screen.screen_id)
@@ -271,7 +298,7 @@ class CombatMonitor(BaseMonitor):
     def _get_character_state_on_screen(self, screen: ScreenMonitorInfo) -> CharacterState:
         """화면의 캐릭터 상태 확인"""
         if not screen or not screen.region:
-            print(f"ERROR: [{self.monitor_id}] Invalid screen for state check.")
+            log.error(f"[{self.monitor_id}] Invalid screen for state check.")
             return CharacterState.NORMAL
 
         screenshot = self._capture_screenshot_safe(screen)
@@ -290,27 +317,33 @@ class CombatMonitor(BaseMonitor):
             return CharacterState.NORMAL
 
         except Exception as e:
-            print(f"ERROR: [{self.monitor_id}] State check error (Screen: {screen.screen_id}): {e}")
-            traceback.print_exc()
+            log.exception(f"[{self.monitor_id}] State check error (Screen: {screen.screen_id}): {e}")
             return CharacterState.NORMAL
 
     def _capture_screenshot_safe(self, screen: ScreenMonitorInfo) -> Optional[np.ndarray]:
         """안전한 스크린샷 캡처"""
         try:
-            screenshot = self.orchestrator.capture_screen_safely(screen.screen_id)
+            with self.spans.span('capture', screen.screen_id):
+                screenshot = self.orchestrator.capture_screen_safely(screen.screen_id)
             if screenshot is None:
-                print(f"ERROR: [{self.monitor_id}] Screenshot failed (Screen: {screen.screen_id}).")
+                log.error(f"[{self.monitor_id}] Screenshot failed (Screen: {screen.screen_id}).")
             return screenshot
         except Exception as e:
-            print(f"ERROR: [{self.monitor_id}] Screenshot exception (Screen: {screen.screen_id}): {e}")
+            log.error(f"[{self.monitor_id}] Screenshot exception (Screen: {screen.screen_id}): {e}")
             return None
 
     def _check_dead_state(self, screen: ScreenMonitorInfo, screenshot: np.ndarray) -> bool:
         """사망 상태 확인"""
+        with self.spans.span('match.dead', screen.screen_id):
+            present = self._pool_present(screen, screenshot, 'DEAD', 'dead_template_path')
+        if present is not None:
+            return present
         dead_template = self._get_template(screen, 'DEAD', 'dead_template_path')
         if dead_template is None:
             return False
-        return image_utils.compare_images(screenshot, dead_template, threshold=self.confidence)
+        with self.spans.span('match.dead', screen.screen_id):
+            return image_utils.compare_images(screenshot, dead_template, threshold=self.confidence,
+                                              signature_key=(screen.screen_id, 'DEAD'))
 
     def _check_hostile_state(self, screen: ScreenMonitorInfo) -> bool:
         """적대 상태 확인 (연속 샘플링)"""
@@ -330,24 +363,30 @@ class CombatMonitor(BaseMonitor):
                 if screenshot is None:
                     continue
 
-                if image_utils.compare_images(screenshot, hostile_template,
-                                              threshold=self.confidence):
-                    print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: "
+                with self.spans.span('match.hostile', screen.screen_id):
+                    is_hostile = self._pool_present(screen, screenshot, 'HOSTILE', 'HOSTILE_TEMPLATE')
+                    if is_hostile is None:
+                        is_hostile = image_utils.compare_images(screenshot, hostile_template,
+                                                                threshold=self.confidence,
+                                                                signature_key=(screen.screen_id, 'HOSTILE'))
+                if is_hostile:
+                    log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: "
                           f"HOSTILE detected on sample {sample_idx + 1}/{self.HOSTILE_SAMPLE_COUNT}")
                     return True
 
             except Exception as e:
-                print(f"ERROR: [{self.monitor_id}] HOSTILE sampling error {sample_idx + 1}: {e}")
+                log.error(f"[{self.monitor_id}] HOSTILE sampling error {sample_idx + 1}: {e}")
 
             if sample_idx < self.HOSTILE_SAMPLE_COUNT - 1:
-                time.sleep(self.HOSTILE_SAMPLE_INTERVAL)
+                with self.spans.span('sleep.hostile_sample', screen.screen_id):
+                    clock.sleep(self.HOSTILE_SAMPLE_INTERVAL)
 
         return False
 
     def _is_character_in_arena(self, screen: ScreenMonitorInfo) -> bool:
         """아레나 내부 확인"""
         if not screen or not screen.region:
-            print(f"ERROR: [{self.monitor_id}] Invalid screen for arena check.")
+            log.error(f"[{self.monitor_id}] Invalid screen for arena check.")
             return False
 
         arena_template = self._get_template(screen, 'ARENA', 'arena_template_path')
@@ -358,24 +397,28 @@ class CombatMonitor(BaseMonitor):
             screenshot = self._capture_screenshot_safe(screen)
             if screenshot is None:
                 return False
+            present = self._pool_present(screen, screenshot, 'ARENA', 'arena_template_path')
+            if present is not None:
+                return present
             return image_utils.compare_images(screenshot, arena_template,
-                                              threshold=self.confidence)
+                                              threshold=self.confidence,
+                                              signature_key=(screen.screen_id, 'ARENA'))
         except Exception as e:
-            print(f"ERROR: [{self.monitor_id}] Arena check exception: {e}")
+            log.error(f"[{self.monitor_id}] Arena check exception: {e}")
             return False
 
     # ========================================================================
     # State Management
     # ========================================================================
 
-    def _change_state(self, screen: ScreenMonitorInfo, new_state: ScreenState):
-        """화면 상태 변경 및 S1 긴급 귀환 처리"""
+    def _change_state(self, screen: ScreenMonitorInfo, new_state: ScreenState, reason: str):
+        """화면 상태 변경 및 S1 긴급 귀환 처리. reason은 전이 저널에 기록됨"""
         if screen.current_state == new_state:
             return
 
         old_state = screen.current_state
-        screen.current_state = new_state
-        screen.last_state_change_time = time.time()
+        self._set_screen_state(screen, new_state, reason)
+        screen.last_state_change_time = clock.time()
         screen.retry_count = 0
 
         # S1 긴급 귀환 로직
@@ -385,8 +428,12 @@ class CombatMonitor(BaseMonitor):
             self._handle_s1_emergency_return()
 
         if old_state != new_state:
-            print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: "
-                  f"State changed: {old_state.name} -> {new_state.name}")
+            log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: "
+                     f"State changed: {old_state.name} -> {new_state.name}",
+                     monitor_id=self.monitor_id, screen_id=screen.screen_id, state=new_state)
+
+    def _set_screen_state(self, screen: ScreenMonitorInfo, state: ScreenState, reason: str):
+        self.shared_states.set(screen.screen_id, state, source=self.monitor_id, reason=reason)
 
     def _handle_s1_emergency_return(self):
         """S1 긴급 귀환 처리 (FIELD 컨텍스트)"""
@@ -394,20 +441,20 @@ class CombatMonitor(BaseMonitor):
         if not s1_screen or s1_screen.current_state not in self.SAFE_STATES:
             return
 
-        print(f"INFO: [{self.monitor_id}] S1 emergency return triggered (FIELD context).")
+        log.info(f"[{self.monitor_id}] S1 emergency return triggered (FIELD context).")
 
         is_sleeping = self._check_s1_sleeping_state(s1_screen)
         target_state = (ScreenState.S1_EMERGENCY_FLEE if is_sleeping
                         else ScreenState.HOSTILE)
 
-        self._change_state(s1_screen, target_state)
+        self._change_state(s1_screen, target_state, 's1_emergency')
 
     def _check_s1_sleeping_state(self, s1_screen: ScreenMonitorInfo) -> bool:
         """S1 절전 상태 확인"""
         sleep_template_path = template_paths.get_template(s1_screen.screen_id, 'SLEEP')
 
         if not sleep_template_path or not os.path.exists(sleep_template_path):
-            print(f"WARN: [{self.monitor_id}] 'SLEEP' template not defined for S1. Assuming AWAKE.")
+            log.warning(f"[{self.monitor_id}] 'SLEEP' template not defined for S1. Assuming AWAKE.")
             return False
 
         try:
@@ -416,26 +463,27 @@ class CombatMonitor(BaseMonitor):
 
             if screenshot is not None and sleep_template is not None:
                 if image_utils.compare_images(screenshot, sleep_template,
-                                              threshold=self.confidence):
-                    print(f"INFO: [{self.monitor_id}] S1 is visually SLEEPING.")
+                                              threshold=self.confidence,
+                                              signature_key=(s1_screen.screen_id, 'SLEEP')):
+                    log.info(f"[{self.monitor_id}] S1 is visually SLEEPING.")
                     return True
-                print(f"INFO: [{self.monitor_id}] S1 is visually AWAKE.")
+                log.info(f"[{self.monitor_id}] S1 is visually AWAKE.")
                 return False
 
-            print(f"WARN: [{self.monitor_id}] Could not verify S1 sleep state. Assuming AWAKE.")
+            log.warning(f"[{self.monitor_id}] Could not verify S1 sleep state. Assuming AWAKE.")
             return False
 
         except Exception as e:
-            print(f"WARN: [{self.monitor_id}] Error checking S1 sleep state: {e}. Assuming AWAKE.")
+            log.warning(f"[{self.monitor_id}] Error checking S1 sleep state: {e}. Assuming AWAKE.")
             return False
 
     def _notify_s1_completion(self):
         """S1 파티 수집 완료 알림"""
-        print(f"INFO: [{self.monitor_id}] S1 party gathering completed! Notifying waiting screens...")
+        log.info(f"[{self.monitor_id}] S1 party gathering completed! Notifying waiting screens...")
         for screen in self.screens:
             if screen.screen_id != 'S1' and screen.current_state == ScreenState.RETURNING:
                 screen.s1_completed = True
-                print(f"INFO: [{self.monitor_id}] Notified {screen.screen_id}")
+                log.info(f"[{self.monitor_id}] Notified {screen.screen_id}")
 
     # ========================================================================
     # Policy Execution Engine
@@ -476,16 +524,16 @@ class CombatMonitor(BaseMonitor):
     def _handle_time_based_wait(self, screen: ScreenMonitorInfo, policy: dict):
         """시간 기반 대기 처리"""
         expected_duration = policy.get('expected_duration', 10.0)
-        elapsed = time.time() - screen.last_state_change_time
+        elapsed = clock.time() - screen.last_state_change_time
 
         if elapsed >= expected_duration:
-            print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: "
+            log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: "
                   f"'{screen.current_state.name}' duration ({expected_duration}s) complete.")
 
             next_state_key = policy.get('transitions', {}).get('duration_complete', 'NORMAL')
             next_state = (next_state_key if isinstance(next_state_key, ScreenState)
                           else ScreenState.NORMAL)
-            self._change_state(screen, next_state)
+            self._change_state(screen, next_state, 'duration_complete')
 
     def _check_initialization_ready(self, screen: ScreenMonitorInfo) -> bool:
         """INITIALIZING 상태 대기 로직 (S2-S5)"""
@@ -499,9 +547,9 @@ class CombatMonitor(BaseMonitor):
 
         # 3. 위치 정보가 이미 확보되었다면 통과
         if self.location_flag != Location.UNKNOWN:
-            print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: "
+            log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: "
                   f"Location confirmed ({self.location_flag.name}). Moving to NORMAL.")
-            self._change_state(screen, ScreenState.NORMAL)
+            self._change_state(screen, ScreenState.NORMAL, 'location_confirmed')
             screen.policy_step = 0
             return False  # 이번 틱 종료, 다음 틱부터 NORMAL 로직 수행
 
@@ -512,7 +560,7 @@ class CombatMonitor(BaseMonitor):
 
         # S1이 아직 등록되지 않았으면 기다림
         if not s1_screen:
-            print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: Waiting for S1 to register...")
+            log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: Waiting for S1 to register...")
             return False
 
         # ✅ [핵심 수정] S1이 정상이 아닌 경우 (SM이 작업 중이거나, 위험 상태)
@@ -525,44 +573,44 @@ class CombatMonitor(BaseMonitor):
 
         # S1이 제정신이 아니라면(시스템 복구 중이거나 위험함), 우린 걍 각자도생(NORMAL) 한다.
         if is_s1_busy_with_system or is_s1_unsafe:
-            print(f"WARN: [{self.monitor_id}] S1 is unavailable ({s1_screen.current_state}). "
+            log.warning(f"[{self.monitor_id}] S1 is unavailable ({s1_screen.current_state}). "
                   f"Forcing {screen.screen_id} to NORMAL (Break Dependency).")
-            self._change_state(screen, ScreenState.NORMAL)
+            self._change_state(screen, ScreenState.NORMAL, 's1_unavailable')
             screen.policy_step = 0
             return False
 
         # ---------------------------------------------------------
         # S1도 INITIALIZING 중이라면 타임아웃 체크 (너무 오래 걸리면 포기)
         if s1_screen.current_state == ScreenState.INITIALIZING:
-            elapsed = time.time() - s1_screen.last_state_change_time  # [이전 수정 반영]
+            elapsed = clock.time() - s1_screen.last_state_change_time  # [이전 수정 반영]
 
             if elapsed > 60.0:
-                print(f"WARN: [{self.monitor_id}] S1 initialization timed out ({elapsed:.0f}s). "
+                log.warning(f"[{self.monitor_id}] S1 initialization timed out ({elapsed:.0f}s). "
                       f"Forcing {screen.screen_id} to NORMAL.")
-                self._change_state(screen, ScreenState.NORMAL)
+                self._change_state(screen, ScreenState.NORMAL, 's1_init_timeout')
                 screen.policy_step = 0
                 return False
 
-        print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: "
+        log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: "
               f"Waiting for S1 to determine location...")
         return False
 
     def _complete_sequence(self, screen: ScreenMonitorInfo, policy: dict):
         """시퀀스 완료 처리"""
-        print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: "
+        log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: "
               f"Sequence '{screen.current_state.name}' completed.")
 
         # S1 INITIALIZING 성공 시 ARENA 설정
         if screen.current_state == ScreenState.INITIALIZING and screen.screen_id == 'S1':
             self.location_flag = Location.ARENA
-            print(f"INFO: [{self.monitor_id}] Initial Location (S1 Success): "
+            log.info(f"[{self.monitor_id}] Initial Location (S1 Success): "
                   f"{self.location_flag.name}")
 
         next_state_key = policy.get('transitions', {}).get('sequence_complete', 'NORMAL')
         next_state = (next_state_key if isinstance(next_state_key, ScreenState)
                       else ScreenState.NORMAL)
 
-        self._change_state(screen, next_state)
+        self._change_state(screen, next_state, 'sequence_complete')
         screen.policy_step = 0
         screen.policy_step_start_time = 0.0
 
@@ -574,7 +622,7 @@ class CombatMonitor(BaseMonitor):
 
         required_context = getattr(Location, required_context_str, Location.UNKNOWN)
         if self.location_flag != required_context:
-            print(f"INFO: [{self.monitor_id}] Action skipped "
+            log.info(f"[{self.monitor_id}] Action skipped "
                   f"(Context mismatch: {self.location_flag.name} != {required_context_str})")
             return False
 
@@ -583,7 +631,7 @@ class CombatMonitor(BaseMonitor):
     def _skip_to_next_step(self, screen: ScreenMonitorInfo):
         """다음 스텝으로 건너뛰기"""
         screen.policy_step += 1
-        screen.policy_step_start_time = time.time()
+        screen.policy_step_start_time = clock.time()
 
     def _execute_operation(self, screen: ScreenMonitorInfo, action: dict):
         """액션의 operation 실행"""
@@ -591,9 +639,10 @@ class CombatMonitor(BaseMonitor):
         handler = self.policy_handlers.get(operation)
 
         if handler:
-            handler(screen, action)
+            with self.spans.span(f'op.{operation}', screen.screen_id):
+                handler(screen, action)
         else:
-            print(f"WARN: [{self.monitor_id}] Unknown operation '{operation}'")
+            log.warning(f"[{self.monitor_id}] Unknown operation '{operation}'")
 
     # ========================================================================
     # Policy Operation Handlers
@@ -695,7 +744,7 @@ class CombatMonitor(BaseMonitor):
 
             elif subroutine_name == '_do_wp3_movement':
                 # ★ [신규] WP3 이동 시퀀스 처리 (CRITICAL 우선순위)
-                print(f"INFO: [{self.monitor_id}] Requesting Atomic WP3 Macro for {screen.screen_id}")
+                log.info(f"[{self.monitor_id}] Requesting Atomic WP3 Macro for {screen.screen_id}")
                 self.io_scheduler.request(
                     component=self.monitor_id,
                     screen_id=screen.screen_id,
@@ -705,7 +754,7 @@ class CombatMonitor(BaseMonitor):
                 self._advance_step(screen, action.get('operation'))
 
             else:
-                print(f"ERROR: [{self.monitor_id}] Unknown subroutine '{subroutine_name}'")
+                log.error(f"[{self.monitor_id}] Unknown subroutine '{subroutine_name}'")
 
         # [신규 메서드 추가] _do_wp3_movement
     def _do_wp3_movement(self, screen: ScreenMonitorInfo):
@@ -718,11 +767,11 @@ class CombatMonitor(BaseMonitor):
             # 1. 시퀀스 데이터 로드
             sequence = get_wp_sequence(screen.screen_id, 'wp3', 'ARENA')
             if not sequence:
-                print(f"WARN: [{self.monitor_id}] No WP3 sequence found for {screen.screen_id}")
+                log.warning(f"[{self.monitor_id}] No WP3 sequence found for {screen.screen_id}")
                 return
 
-            print(
-                f"INFO: [{self.monitor_id}] Starting Atomic WP3 Sequence ({len(sequence)} ops) for {screen.screen_id}")
+            log.info(
+                f"[{self.monitor_id}] Starting Atomic WP3 Sequence ({len(sequence)} ops) for {screen.screen_id}")
 
             try:
                 # 2. 포커스 확보 (필수)
@@ -744,27 +793,26 @@ class CombatMonitor(BaseMonitor):
                         self._do_keypress_action(screen, op)
                     elif op_type == 'wait_duration':
                         # wait_duration은 _do 메서드가 없으므로 직접 처리
-                        time.sleep(op.get('duration', 0.1))
+                        clock.sleep(op.get('duration', 0.1))
 
                     # 디버깅용 (필요시 주석 해제)
                     # print(f"   [{i+1}/{len(sequence)}] {op_type} done.")
 
-                print(f"INFO: [{self.monitor_id}] Atomic WP3 Sequence Completed.")
+                log.info(f"[{self.monitor_id}] Atomic WP3 Sequence Completed.")
 
             except Exception as e:
-                print(f"ERROR: [{self.monitor_id}] WP3 Sequence Failed: {e}")
-                traceback.print_exc()
+                log.exception(f"[{self.monitor_id}] WP3 Sequence Failed: {e}")
 
     def _handle_wait_duration(self, screen: ScreenMonitorInfo, action: dict):
         """wait_duration operation 처리"""
         if screen.policy_step_start_time == 0.0 and action.get('initial') == True:
-            screen.policy_step_start_time = time.time()
+            screen.policy_step_start_time = clock.time()
 
-        elapsed = time.time() - screen.policy_step_start_time
+        elapsed = clock.time() - screen.policy_step_start_time
         duration = action.get('duration', 5.0)
 
         if elapsed >= duration:
-            print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: "
+            log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: "
                   f"wait_duration {duration}s complete.")
             self._advance_step(screen, 'wait_duration')
 
@@ -774,10 +822,10 @@ class CombatMonitor(BaseMonitor):
 
         # 🔥 step 시작 시간 초기화 확인
         if screen.policy_step_start_time == 0.0:
-            screen.policy_step_start_time = time.time()
+            screen.policy_step_start_time = clock.time()
 
         if self._check_template_present(screen, template_key):
-            print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: "
+            log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: "
                   f"wait '{template_key}' complete.")
             self._advance_step(screen, 'wait')
             return
@@ -787,12 +835,12 @@ class CombatMonitor(BaseMonitor):
         if not step_timeout:
             return
 
-        elapsed_on_step = time.time() - screen.policy_step_start_time
+        elapsed_on_step = clock.time() - screen.policy_step_start_time
         if elapsed_on_step <= step_timeout:
             return
 
         # 타임아웃 발생
-        print(f"WARN: [{self.monitor_id}] wait '{template_key}' timed out after {elapsed_on_step:.1f}s")
+        log.warning(f"[{self.monitor_id}] wait '{template_key}' timed out after {elapsed_on_step:.1f}s")
 
         on_timeout_action = action.get('on_timeout')
         if on_timeout_action == 'fail_sequence':
@@ -803,7 +851,7 @@ class CombatMonitor(BaseMonitor):
         # S1 INITIALIZING 타임아웃 시 FIELD 설정
         if screen.current_state == ScreenState.INITIALIZING and screen.screen_id == 'S1':
             self.location_flag = Location.FIELD
-            print(f"INFO: [{self.monitor_id}] Initial Location (S1 Timeout): "
+            log.info(f"[{self.monitor_id}] Initial Location (S1 Timeout): "
                   f"{self.location_flag.name}")
 
         policy = srm_config.get_state_policy(screen.current_state)
@@ -811,7 +859,7 @@ class CombatMonitor(BaseMonitor):
         next_state = (next_state_key if isinstance(next_state_key, ScreenState)
                       else ScreenState.NORMAL)
 
-        self._change_state(screen, next_state)
+        self._change_state(screen, next_state, 'sequence_failed')
         screen.policy_step = 0
         screen.policy_step_start_time = 0.0
 
@@ -826,10 +874,10 @@ class CombatMonitor(BaseMonitor):
 
     def _advance_step(self, screen: ScreenMonitorInfo, operation: str):
         """다음 스텝으로 진행"""
-        print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: "
+        log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: "
               f"Step {screen.policy_step} ({operation}) requested.")
         screen.policy_step += 1
-        screen.policy_step_start_time = time.time()
+        screen.policy_step_start_time = clock.time()
 
     # ========================================================================
     # IO Actions (스케줄러가 실행)
@@ -840,42 +888,42 @@ class CombatMonitor(BaseMonitor):
         event = action.get('event')  # 'press' 또는 'release'
 
         if not key:
-            print(f"ERROR: [{self.monitor_id}] key_press_raw operation missing 'key'")
+            log.error(f"[{self.monitor_id}] key_press_raw operation missing 'key'")
             return
 
         if not event or event not in ['press', 'release']:
-            print(f"ERROR: [{self.monitor_id}] key_press_raw operation missing or invalid 'event'")
+            log.error(f"[{self.monitor_id}] key_press_raw operation missing or invalid 'event'")
             return
 
         if event == 'press':
-            keyboard.press(key)
+            inputs.key_down(key)
         else:  # release
-            keyboard.release(key)
+            inputs.key_up(key)
 
         self._apply_delay(action)
 
     def _do_key_hold_action(self, screen: ScreenMonitorInfo, action: dict):
         """key_hold 액션 실행 (press → duration → release)"""
         if not self._click_relative(screen, 'safe_click_point', delay_after=0.3):
-            print(f"ERROR: [{self.monitor_id}] Failed to click safe_click_point for {screen.screen_id}")
+            log.error(f"[{self.monitor_id}] Failed to click safe_click_point for {screen.screen_id}")
             return
 
         key = action.get('key')
         duration = action.get('duration', 0.0)
 
         if not key:
-            print(f"ERROR: [{self.monitor_id}] key_hold operation missing 'key'")
+            log.error(f"[{self.monitor_id}] key_hold operation missing 'key'")
             return
 
         # Press
-        keyboard.press(key)
+        inputs.key_down(key)
 
         # Hold
         if duration > 0:
-            time.sleep(duration)
+            clock.sleep(duration)
 
         # Release
-        keyboard.release(key)
+        inputs.key_up(key)
 
         self._apply_delay(action)
 
@@ -883,7 +931,7 @@ class CombatMonitor(BaseMonitor):
         """click 액션 실행"""
         template_key = action.get('template')
         if not template_key:
-            print(f"ERROR: [{self.monitor_id}] click operation missing 'template' key")
+            log.error(f"[{self.monitor_id}] click operation missing 'template' key")
             return
 
         template_path = template_paths.get_template(screen.screen_id, template_key)
@@ -891,7 +939,7 @@ class CombatMonitor(BaseMonitor):
             template_path = getattr(template_paths, template_key, None)
 
         if not template_path or not os.path.exists(template_path):
-            print(f"ERROR: [{self.monitor_id}] Template not found for '{template_key}'")
+            log.error(f"[{self.monitor_id}] Template not found for '{template_key}'")
             return
 
         screenshot = self._capture_screenshot_safe(screen)
@@ -899,9 +947,9 @@ class CombatMonitor(BaseMonitor):
                                                   self.confidence, screenshot)
 
         if location:
-            pyautogui.click(location)
+            inputs.click(location)
         else:
-            print(f"WARN: [{self.monitor_id}] Failed to find template '{template_key}'")
+            log.warning(f"[{self.monitor_id}] Failed to find template '{template_key}'")
 
         self._apply_delay(action)
 
@@ -917,7 +965,7 @@ class CombatMonitor(BaseMonitor):
         button = action.get('button', 'left')
 
         if None in [from_x, from_y, to_x, to_y]:
-            print(f"ERROR: [{self.monitor_id}] mouse_drag missing coordinates")
+            log.error(f"[{self.monitor_id}] mouse_drag missing coordinates")
             return
 
         # 스크린 절대 좌표 계산
@@ -929,28 +977,28 @@ class CombatMonitor(BaseMonitor):
 
         try:
             # 1. 시작 지점으로 이동
-            pyautogui.moveTo(abs_start_x, abs_start_y)
+            inputs.move_to(abs_start_x, abs_start_y)
 
             # 2. 드래그 실행 (Tweening 적용!)
             # tester.py에서 성공했던 그 느낌 그대로
-            pyautogui.dragTo(abs_end_x, abs_end_y, duration=duration, button=button, tween=pyautogui.easeOutQuad)
+            inputs.drag_to(abs_end_x, abs_end_y, duration=duration, button=button)
 
         except Exception as e:
-            print(f"ERROR: [{self.monitor_id}] Drag failed: {e}")
+            log.error(f"[{self.monitor_id}] Drag failed: {e}")
 
         self._apply_delay(action)
 
     def _do_keypress_action(self, screen: ScreenMonitorInfo, action: dict):
         """key_press 액션 실행"""
         if not self._click_relative(screen, 'safe_click_point', delay_after=0.3):
-            print(f"ERROR: [{self.monitor_id}] Failed to click safe_click_point for {screen.screen_id}")
+            log.error(f"[{self.monitor_id}] Failed to click safe_click_point for {screen.screen_id}")
             return
 
         key = action.get('key')
         if key:
-            keyboard.press_and_release(key)
+            inputs.key_press(key)
         else:
-            print(f"ERROR: [{self.monitor_id}] key_press operation missing 'key'")
+            log.error(f"[{self.monitor_id}] key_press operation missing 'key'")
 
         self._apply_delay(action)
 
@@ -966,14 +1014,14 @@ class CombatMonitor(BaseMonitor):
 
         # 2. 마우스를 화면 중앙으로 이동 후 스크롤 (pyautogui 지원 기능)
         # (마우스가 엉뚱한 곳에 있으면 스크롤이 안 먹힐 수 있으므로 중앙 이동 필수)
-        pyautogui.scroll(amount, x=center_x, y=center_y)
+        inputs.scroll(amount, x=center_x, y=center_y)
 
         self._apply_delay(action)
 
     def _do_set_focus(self, screen: ScreenMonitorInfo):
         """set_focus 액션 실행"""
         if not image_utils.set_focus(screen.screen_id, delay_after=0.5):
-            print(f"ERROR: [{self.monitor_id}] Failed to set focus on {screen.screen_id}")
+            log.error(f"[{self.monitor_id}] Failed to set focus on {screen.screen_id}")
 
     def _do_click_relative_action(self, screen: ScreenMonitorInfo, action: dict):
         """click_relative 액션 실행"""
@@ -981,7 +1029,7 @@ class CombatMonitor(BaseMonitor):
         if key:
             self._click_relative(screen, key, delay_after=0.0)
         else:
-            print(f"ERROR: [{self.monitor_id}] click_relative operation missing 'key'")
+            log.error(f"[{self.monitor_id}] click_relative operation missing 'key'")
 
         self._apply_delay(action)
 
@@ -991,7 +1039,7 @@ class CombatMonitor(BaseMonitor):
         y = action.get('y')
 
         if x is None or y is None:
-            print(f"ERROR: [{self.monitor_id}] click_xy operation missing 'x' or 'y'")
+            log.error(f"[{self.monitor_id}] click_xy operation missing 'x' or 'y'")
             return
 
         self._click_relative(screen, (x, y), delay_after=0.0)
@@ -1001,105 +1049,98 @@ class CombatMonitor(BaseMonitor):
         """액션의 delay_after 적용"""
         delay = action.get('delay_after', 0)
         if delay > 0:
-            time.sleep(delay)
+            clock.sleep(delay)
 
     def _do_flight(self, screen: ScreenMonitorInfo):
         """도주 버튼 클릭 실행 (상태에 따라 깨우기 동작 분기)"""
         try:
             if screen.current_state == ScreenState.S1_EMERGENCY_FLEE:
-                print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: S1 Emergency Flee. Waking up screen...")
+                log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: S1 Emergency Flee. Waking up screen...")
                 if not self._wake_screen(screen):
                     return
 
                 # ✅ 개선 1: 화면 깨운 후 0.8초 대기 (UI 렌더링 완료 기다림)
-                print(f"INFO: [{self.monitor_id}] Waiting for UI to render after wake-up...")
-                time.sleep(0.8)
+                log.info(f"[{self.monitor_id}] Waiting for UI to render after wake-up...")
+                clock.sleep(0.8)
             else:
                 pass
 
             flight_template_path = template_paths.get_template(screen.screen_id, 'FLIGHT_BUTTON')
             if not flight_template_path or not os.path.exists(flight_template_path):
-                print(f"WARN: [{self.monitor_id}] Flight template not found. Using fixed coordinates...")
+                log.warning(f"[{self.monitor_id}] Flight template not found. Using fixed coordinates...")
                 self._click_relative(screen, 'flight_button', delay_after=0.2)
                 return
 
-            # ✅ 개선 2: 최대 5회(2.5초) 동안 템플릿 등장 대기
-            max_wait_attempts = 5
-            wait_interval = 0.5
-            center_coords = None
+            # ✅ 개선 2: 최대 2.5초 동안 템플릿 등장 대기 (빠르게 시작 → 점점 느리게 폴링)
+            max_wait_time = 2.5
 
-            print(f"INFO: [{self.monitor_id}] Waiting for FLIGHT_BUTTON template to appear...")
-            for attempt in range(max_wait_attempts):
+            def _find_flight_button():
                 screenshot = self._capture_screenshot_safe(screen)
                 if screenshot is None:
-                    time.sleep(wait_interval)
-                    continue
-
-                center_coords = image_utils.return_ui_location(
+                    return None
+                return image_utils.return_ui_location(
                     template_path=flight_template_path,
                     region=screen.region,
                     threshold=self.confidence,
                     screenshot_img=screenshot
                 )
 
-                if center_coords:
-                    print(f"INFO: [{self.monitor_id}] FLIGHT_BUTTON found on attempt {attempt + 1}/{max_wait_attempts}")
-                    break
-
-                if attempt < max_wait_attempts - 1:
-                    time.sleep(wait_interval)
+            log.info(f"[{self.monitor_id}] Waiting for FLIGHT_BUTTON template to appear...")
+            center_coords = wait_for(_find_flight_button, timeout=max_wait_time,
+                                     label=f"NC.{screen.screen_id}.FLIGHT_BUTTON")
+            if center_coords:
+                log.info(f"[{self.monitor_id}] FLIGHT_BUTTON found within {max_wait_time}s")
 
             if center_coords:
-                pyautogui.click(center_coords)
-                print(f"INFO: [{self.monitor_id}] Flight via template matching at {center_coords}.")
+                inputs.click(center_coords)
+                log.info(f"[{self.monitor_id}] Flight via template matching at {center_coords}.")
             else:
-                print(
-                    f"WARN: [{self.monitor_id}] Template matching failed after {max_wait_attempts} attempts. Using fixed coordinates...")
+                log.warning(
+                    f"[{self.monitor_id}] Template matching failed after {max_wait_time}s. Using fixed coordinates...")
                 if self._click_relative(screen, 'flight_button', delay_after=0.2):
-                    print(f"INFO: [{self.monitor_id}] Flight via fixed coordinates.")
+                    log.info(f"[{self.monitor_id}] Flight via fixed coordinates.")
                     # ✅ 개선 3: 고정 좌표도 이중 클릭 (씹힘 방지)
-                    time.sleep(0.2)
+                    clock.sleep(0.2)
                     self._click_relative(screen, 'flight_button', delay_after=0.2)
                 else:
-                    print(f"ERROR: [{self.monitor_id}] Both template and fixed coords failed.")
+                    log.error(f"[{self.monitor_id}] Both template and fixed coords failed.")
 
         except Exception as e:
-            print(f"ERROR: [{self.monitor_id}] Exception in _do_flight: {e}")
-            traceback.print_exc()
+            log.exception(f"[{self.monitor_id}] Exception in _do_flight: {e}")
 
     def _wake_screen(self, screen: ScreenMonitorInfo) -> bool:
         """화면 활성화 (포커스 + ESC)"""
         if not self._click_relative(screen, 'safe_click_point', delay_after=0.2):
-            print(f"WARN: [{self.monitor_id}] safe_click_point failed. Clicking center.")
+            log.warning(f"[{self.monitor_id}] safe_click_point failed. Clicking center.")
             try:
                 region_x, region_y, region_w, region_h = screen.region
                 center_x = region_x + (region_w // 2)
                 center_y = region_y + (region_h // 2)
-                pyautogui.click(center_x, center_y)
-                time.sleep(0.1)
+                inputs.click(center_x, center_y)
+                clock.sleep(0.1)
             except Exception as e:
-                print(f"ERROR: [{self.monitor_id}] Failed to click center: {e}")
+                log.error(f"[{self.monitor_id}] Failed to click center: {e}")
                 return False
 
-        keyboard.press_and_release('esc')
-        time.sleep(0.3)
+        inputs.key_press('esc')
+        clock.sleep(0.3)
         return True
 
     def _click_relative(self, screen: ScreenMonitorInfo, coord_key: str,
                         delay_after: float = 0.5, random_offset: int = 2) -> bool:
         """상대 좌표 클릭 (드래그 방지용 안전 클릭 적용)"""
         if not screen or not screen.region or not hasattr(screen, 'screen_id'):
-            print(f"ERROR: [{self.monitor_id}] Invalid screen for relative click.")
+            log.error(f"[{self.monitor_id}] Invalid screen for relative click.")
             return False
 
         screen_coords = FIXED_UI_COORDS.get(screen.screen_id)
         if not screen_coords:
-            print(f"ERROR: [{self.monitor_id}] Coordinates not found for '{screen.screen_id}'.")
+            log.error(f"[{self.monitor_id}] Coordinates not found for '{screen.screen_id}'.")
             return False
 
         relative_coord = screen_coords.get(coord_key)
         if not relative_coord or not isinstance(relative_coord, tuple) or len(relative_coord) != 2:
-            print(f"ERROR: [{self.monitor_id}] Invalid coordinate '{coord_key}' for '{screen.screen_id}'.")
+            log.error(f"[{self.monitor_id}] Invalid coordinate '{coord_key}' for '{screen.screen_id}'.")
             return False
 
         region_x, region_y, _, _ = screen.region
@@ -1108,33 +1149,33 @@ class CombatMonitor(BaseMonitor):
             click_x = int(region_x + relative_coord[0])
             click_y = int(region_y + relative_coord[1])
         except ValueError:
-            print(f"ERROR: [{self.monitor_id}] Invalid coordinate values for '{coord_key}'.")
+            log.error(f"[{self.monitor_id}] Invalid coordinate values for '{coord_key}'.")
             return False
 
         try:
             # ✅ [수정] 안전한 클릭 시퀀스 (Ghost Drag 방지)
 
             # 1. 좌표로 이동
-            pyautogui.moveTo(click_x, click_y)
+            inputs.move_to(click_x, click_y)
 
             # 2. 누르기 (Press)
-            pyautogui.mouseDown()
+            inputs.mouse_down()
 
             # 3. 확실하게 눌린 상태 유지 (OS가 인식할 시간 부여)
-            time.sleep(0.1)
+            clock.sleep(0.1)
 
             # 4. 떼기 (Release)
-            pyautogui.mouseUp()
+            inputs.mouse_up()
 
             # 5. 떼고 나서도 아주 잠깐 대기 (OS가 '드래그 끝' 인식할 시간 부여)
-            time.sleep(0.05)
+            clock.sleep(0.05)
 
             if delay_after > 0:
-                time.sleep(delay_after)
+                clock.sleep(delay_after)
             return True
 
         except Exception as e:
-            print(f"ERROR: [{self.monitor_id}] Failed to click '{coord_key}': {e}")
+            log.error(f"[{self.monitor_id}] Failed to click '{coord_key}': {e}")
             return False
     # ========================================================================
     # State Handlers
@@ -1167,9 +1208,9 @@ class CombatMonitor(BaseMonitor):
         character_state = self._get_character_state_on_screen(screen)
 
         if character_state == CharacterState.DEAD:
-            self._change_state(screen, ScreenState.DEAD)
+            self._change_state(screen, ScreenState.DEAD, 'detection')
         elif character_state == CharacterState.HOSTILE_ENGAGE:
-            self._change_state(screen, ScreenState.HOSTILE)
+            self._change_state(screen, ScreenState.HOSTILE, 'detection')
 
     def _handle_returning_state(self, screen: ScreenMonitorInfo):
         """RETURNING 상태 처리 (FIELD/ARENA 분기)"""
@@ -1180,7 +1221,7 @@ class CombatMonitor(BaseMonitor):
 
     def _handle_field_return(self, screen: ScreenMonitorInfo):
         """필드 복귀 처리 (파티 수집)"""
-        elapsed = time.time() - screen.last_state_change_time
+        elapsed = clock.time() - screen.last_state_change_time
 
         if screen.screen_id == 'S1':
             self._handle_s1_party_gathering(screen, elapsed)
@@ -1195,32 +1236,32 @@ class CombatMonitor(BaseMonitor):
 
         # 성공 조건
         if screen.party_check_count >= self.PARTY_CHECK_THRESHOLD:
-            print(f"INFO: [{self.monitor_id}] S1: Party gathering completed.")
+            log.info(f"[{self.monitor_id}] S1: Party gathering completed.")
             screen.party_check_count = 0
-            self._change_state(screen, ScreenState.RESUME_COMBAT)
+            self._change_state(screen, ScreenState.RESUME_COMBAT, 'party_gathered')
             self._notify_s1_completion()
             return
 
         # 실패 조건
         if screen.retry_count >= self.MAX_RETRIES_LEADER:
-            print(f"WARN: [{self.monitor_id}] S1: Max retry attempts reached.")
+            log.warning(f"[{self.monitor_id}] S1: Max retry attempts reached.")
             screen.party_check_count = 0
-            self._change_state(screen, ScreenState.RESUME_COMBAT)
+            self._change_state(screen, ScreenState.RESUME_COMBAT, 'max_retries')
             self._notify_s1_completion()
             return
 
         if elapsed > self.TIMEOUT_LEADER_GATHERING:
-            print(f"WARN: [{self.monitor_id}] S1: Total timeout. Giving up.")
+            log.warning(f"[{self.monitor_id}] S1: Total timeout. Giving up.")
             screen.party_check_count = 0
-            self._change_state(screen, ScreenState.RESUME_COMBAT)
+            self._change_state(screen, ScreenState.RESUME_COMBAT, 'timeout')
             self._notify_s1_completion()
             return
 
         # 재시도
         if elapsed >= (screen.retry_count * 2.0):
             screen.retry_count += 1
-            print(
-                f"INFO: [{self.monitor_id}] S1: Retrying party gathering ({screen.retry_count}/{self.MAX_RETRIES_LEADER})...")
+            log.info(
+                f"[{self.monitor_id}] S1: Retrying party gathering ({screen.retry_count}/{self.MAX_RETRIES_LEADER})...")
             self.io_scheduler.request(
                 component=self.monitor_id,
                 screen_id=screen.screen_id,
@@ -1232,7 +1273,7 @@ class CombatMonitor(BaseMonitor):
         """팔로워 복귀 처리"""
         # S1 완료 대기
         if not screen.s1_completed:
-            print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: Waiting for S1 completion...")
+            log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: Waiting for S1 completion...")
             return
 
         # S1 확인
@@ -1241,29 +1282,29 @@ class CombatMonitor(BaseMonitor):
 
         # 성공 조건
         if screen.party_check_count >= self.PARTY_CHECK_THRESHOLD:
-            print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: Successfully returned to party.")
+            log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: Successfully returned to party.")
             screen.party_check_count = 0
-            self._change_state(screen, ScreenState.RESUME_COMBAT)
+            self._change_state(screen, ScreenState.RESUME_COMBAT, 'party_gathered')
             return
 
         # 실패 조건
         if screen.retry_count >= self.MAX_RETRIES_FOLLOWER:
-            print(f"WARN: [{self.monitor_id}] Screen {screen.screen_id}: Max retry attempts reached.")
+            log.warning(f"[{self.monitor_id}] Screen {screen.screen_id}: Max retry attempts reached.")
             screen.party_check_count = 0
-            self._change_state(screen, ScreenState.RESUME_COMBAT)
+            self._change_state(screen, ScreenState.RESUME_COMBAT, 'max_retries')
             return
 
         if elapsed > self.TIMEOUT_FOLLOWER_RETURN:
-            print(f"WARN: [{self.monitor_id}] Screen {screen.screen_id}: Total timeout.")
+            log.warning(f"[{self.monitor_id}] Screen {screen.screen_id}: Total timeout.")
             screen.party_check_count = 0
-            self._change_state(screen, ScreenState.RESUME_COMBAT)
+            self._change_state(screen, ScreenState.RESUME_COMBAT, 'timeout')
             return
 
         # 재시도
         if elapsed >= (screen.retry_count * 2.0):
             screen.retry_count += 1
-            print(
-                f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: Retrying field return ({screen.retry_count}/{self.MAX_RETRIES_FOLLOWER})...")
+            log.info(
+                f"[{self.monitor_id}] Screen {screen.screen_id}: Retrying field return ({screen.retry_count}/{self.MAX_RETRIES_FOLLOWER})...")
             self.io_scheduler.request(
                 component=self.monitor_id,
                 screen_id=screen.screen_id,
@@ -1284,7 +1325,7 @@ class CombatMonitor(BaseMonitor):
         try:
             template = cv2.imread(template_path)
             if template is None:
-                print(f"ERROR: [{self.monitor_id}] Failed to load PARTY_UI template: {template_path}")
+                log.error(f"[{self.monitor_id}] Failed to load PARTY_UI template: {template_path}")
                 return False
 
             template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
@@ -1298,22 +1339,23 @@ class CombatMonitor(BaseMonitor):
             min_val, _, _, _ = cv2.minMaxLoc(match_result)
 
             if min_val < threshold:
-                print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: "
+                log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: "
                       f"Party UI found (template: {os.path.basename(template_path)}, match: {min_val:.4f})")
                 return True
 
             return False
 
         except Exception as e:
-            print(f"ERROR: [{self.monitor_id}] Exception in _check_single_party_template: {e}")
+            log.error(f"[{self.monitor_id}] Exception in _check_single_party_template: {e}")
             return False
 
     def _check_returned_well_s1(self, screen: ScreenMonitorInfo) -> bool:
-        """S1용: S2~S5 중 하나라도 매칭되면 True"""
-        for member_id in ['S2', 'S3', 'S4', 'S5']:
-            template_path = template_paths.get_template('S1', member_id)
+        """S1용: 등록된 파티원 화면(S1 외 전부) 중 하나라도 매칭되면 True (S1 템플릿 표에 파티원 템플릿이 있는 화면만)"""
+        s1_templates = template_paths.TEMPLATES.get('S1', {})
+        for member_id in [s.screen_id for s in self.screens if s.screen_id != 'S1']:
+            template_path = s1_templates.get(member_id)
             if template_path and self._check_single_party_template(screen, template_path):
-                print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: Found party member {member_id}")
+                log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: Found party member {member_id}")
                 return True
         return False
 
@@ -1321,7 +1363,7 @@ class CombatMonitor(BaseMonitor):
         """S2~S5용: S1 파티 템플릿만 체크"""
         s1_template_path = template_paths.get_template('S1', 'PARTY_UI')
         if s1_template_path and self._check_single_party_template(screen, s1_template_path):
-            print(f"INFO: [{self.monitor_id}] Screen {screen.screen_id}: Found S1")
+            log.info(f"[{self.monitor_id}] Screen {screen.screen_id}: Found S1")
             return True
         return False
 
@@ -1329,18 +1371,18 @@ class CombatMonitor(BaseMonitor):
         """필드 복귀 재시도"""
         try:
             if not self._click_relative(screen, 'field_return_button', delay_after=0.5):
-                print(f"WARN: [{self.monitor_id}] Failed to click field return button.")
+                log.warning(f"[{self.monitor_id}] Failed to click field return button.")
                 return False
 
             if is_first_attempt:
-                time.sleep(0.3)
-                keyboard.press_and_release('y')
-                print(f"INFO: [{self.monitor_id}] Pressed Y key (first attempt).")
+                clock.sleep(0.3)
+                inputs.key_press('y')
+                log.info(f"[{self.monitor_id}] Pressed Y key (first attempt).")
 
             return True
 
         except Exception as e:
-            print(f"ERROR: [{self.monitor_id}] Field return retry failed: {e}")
+            log.error(f"[{self.monitor_id}] Field return retry failed: {e}")
             return False
 
     # ========================================================================
@@ -1357,20 +1399,97 @@ class CombatMonitor(BaseMonitor):
 
     def win32_click(self, x, y):
         """Win32 API 클릭"""
-        win32api.SetCursorPos((x, y))
-        win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0)
-        win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0)
+        inputs.raw_click(x, y)
 
     # ========================================================================
     # Main Loop
     # ========================================================================
 
+    # ========================================================================
+    # Checkpoint / Warm Restart (src/core/checkpoint.py)
+    # ========================================================================
+
+    # 화면별로 저장하는 진행 상황 (ScreenMonitorInfo 필드)
+    CHECKPOINT_SCREEN_FIELDS = ('policy_step', 'policy_step_start_time', 'last_state_change_time',
+                                'retry_count', 's1_completed', 'party_check_count')
+
+    def checkpoint_state(self) -> dict:
+        """체크포인트에 저장할 진행 상황 (JSON 직렬화 가능)"""
+        return {
+            'location_flag': self.location_flag.name,
+            'current_wp': self.current_wp,
+            'death_count': self.death_count,
+            'screens': {screen.screen_id: {name: getattr(screen, name) for name in self.CHECKPOINT_SCREEN_FIELDS}
+                        for screen in self.screens},
+        }
+
+    def restore_checkpoint(self, data: dict, states: dict, saved_at: float):
+        """체크포인트 보관 (적용은 run_loop 시작 시 화면 확인 후)"""
+        self._pending_checkpoint = (data, states, saved_at)
+
+    def _verify_restored_state(self, screen: ScreenMonitorInfo, state: ScreenState) -> bool:
+        """저장된 상태가 지금 화면과 맞는지 한 번 확인 (NORMAL ↔ 사망 템플릿 없음, DEAD ↔ 있음)"""
+        if state == ScreenState.INITIALIZING:
+            return False
+        if state not in (ScreenState.NORMAL, ScreenState.DEAD):
+            return True  # 진행 중인 시퀀스는 이어서 (정책이 다시 확인함)
+        screenshot = self._capture_screenshot_safe(screen)
+        if screenshot is None:
+            return False
+        return self._check_dead_state(screen, screenshot) == (state == ScreenState.DEAD)
+
+    def apply_warm_start(self) -> bool:
+        """
+        보관한 체크포인트 적용. location_flag가 S1 화면과 맞지 않으면 전체 콜드 스타트(False).
+        화면별로 확인에 실패한 화면만 INITIALIZING, SM이 관리하던 화면(SystemState)은 건드리지 않음
+        """
+        data, states, saved_at = self._pending_checkpoint
+        self._pending_checkpoint = None
+        location = Location.__members__.get(data.get('location_flag', ''), Location.UNKNOWN)
+        s1_screen = self._find_screen('S1')
+        if location == Location.UNKNOWN or s1_screen is None:
+            return False
+        if self._is_character_in_arena(s1_screen) != (location == Location.ARENA):
+            log.info(f"[{self.monitor_id}] Checkpoint location {location.name} does not match S1. Cold start.")
+            return False
+
+        self.location_flag = location
+        self.current_wp = data.get('current_wp', 0)
+        self.death_count = data.get('death_count', 0)
+        saved_screens = data.get('screens', {})
+        restored = []
+        for screen in self.screens:
+            value = states.get(screen.screen_id, (None, 0.0))[0]
+            if decode_state(value, SystemState) is not None:
+                continue  # SM 소관 (SM이 복원)
+            state = decode_state(value, ScreenState)
+            if state == ScreenState.HOSTILE:
+                state = ScreenState.NORMAL  # 적대는 다음 틱에 다시 감지
+            if state is None or not self._verify_restored_state(screen, state):
+                self._reset_screen_progress(screen)
+                continue
+            self._set_screen_state(screen, state, 'checkpoint')
+            for name, value in saved_screens.get(screen.screen_id, {}).items():
+                if name in self.CHECKPOINT_SCREEN_FIELDS:
+                    setattr(screen, name, value)
+            restored.append(f"{screen.screen_id}={state.name}")
+        log.info(f"[{self.monitor_id}] Warm start ({clock.time() - saved_at:.0f}s old checkpoint): "
+                 f"{location.name}, wp={self.current_wp}, {', '.join(restored) or 'no screens restored'}")
+        return True
+
+    def _reset_screen_progress(self, screen: ScreenMonitorInfo):
+        self._set_screen_state(screen, ScreenState.INITIALIZING, 'reset')
+        screen.last_state_change_time = clock.time()
+        screen.retry_count = 0
+        screen.policy_step = 0
+        screen.policy_step_start_time = 0.0
+
     def run_loop(self, stop_event: threading.Event):
         """메인 모니터링 루프"""
-        print(f"INFO: Starting CombatMonitor {self.monitor_id} on {self.vd_name}...")
+        log.info(f"Starting CombatMonitor {self.monitor_id} on {self.vd_name}...")
 
         if not self.screens:
-            print(f"ERROR: [{self.monitor_id}] No screens added. Stopping monitor.")
+            log.error(f"[{self.monitor_id}] No screens added. Stopping monitor.")
             return
 
         self.stop_event = stop_event
@@ -1379,51 +1498,54 @@ class CombatMonitor(BaseMonitor):
         try:
             self.max_wp = self._get_max_wp_num()
         except Exception as e:
-            print(f"ERROR: [{self.monitor_id}] Error getting max waypoint number: {e}")
+            log.error(f"[{self.monitor_id}] Error getting max waypoint number: {e}")
             self.max_wp = 0
 
-        self.location_flag = Location.UNKNOWN
-        print(f"INFO: [{self.monitor_id}] Initial monitoring context: UNKNOWN")
-
-        # 초기 상태 설정
-        for screen in self.screens:
-            screen.current_state = ScreenState.INITIALIZING
-            screen.last_state_change_time = time.time()
-            screen.retry_count = 0
-            screen.policy_step = 0
-            screen.policy_step_start_time = 0.0
-
-        # 메인 루프
+        # 초기 상태 설정 (체크포인트가 있으면 화면 확인 후 이어서)
+        if self._pending_checkpoint is None or not self.apply_warm_start():
+            self.location_flag = Location.UNKNOWN
+            log.info(f"[{self.monitor_id}] Initial monitoring context: UNKNOWN")
+            for screen in self.screens:
+                self._reset_screen_progress(screen)
+
+        # 메인 루프 (화면별 데드라인: 상태별 폴링 간격)
+        screens_by_id = {s.screen_id: s for s in self.screens}
+        ticks = self.ticks
+        run = ticks.reset(screens_by_id, clock.time())  # 이 루프의 실행 세대 (워치독 재시작 시 교체)
         while not stop_event.is_set():
             try:
-                # HOSTILE 우선 처리
-                hostile_screens = [s for s in self.screens if s.current_state == ScreenState.HOSTILE]
-                for screen in hostile_screens:
-                    if stop_event.is_set():
-                        break
-                    self._handle_screen_state(screen, stop_event)
-
-                # 나머지 처리
-                other_screens = [s for s in self.screens if s.current_state != ScreenState.HOSTILE]
-                for screen in other_screens:
+                # 같은 시점에 돌아온 화면 중 HOSTILE 우선 처리
+                due_screens = [screens_by_id[key] for key in ticks.pop_due(clock.time())]
+                due_screens.sort(key=lambda s: s.current_state != ScreenState.HOSTILE)
+                for screen in due_screens:
                     if stop_event.is_set():
                         break
-                    self._handle_screen_state(screen, stop_event)
-
-                if stop_event.wait(1.0):
+                    started = clock.time()
+                    with WATCHDOG.activity(self.monitor_id, screen.screen_id), self.spans.span('tick', screen.screen_id):
+                        self._handle_screen_state(screen, stop_event)
+                    state = screen.current_state
+                    interval = self.state_intervals.get(state, self.LOOP_INTERVAL)
+                    if not ticks.schedule(screen.screen_id, started, interval, getattr(state, 'name', str(state)),
+                                          run=run):
+                        log.warning(f"[{self.monitor_id}] Stale run loop exiting (replaced after a watchdog restart)")
+                        return  # self.stop()은 새 루프의 몫
+
+                with self.spans.span('sleep.loop'):
+                    stopped = clock.wait(stop_event, ticks.time_until_next(clock.time(), self.LOOP_INTERVAL))
+                if stopped:
                     break
 
             except Exception as e:
-                print(f"ERROR: [{self.monitor_id}] Unhandled exception in main loop: {e}")
-                traceback.print_exc()
-                if stop_event.wait(5.0):
+                log.exception(f"[{self.monitor_id}] Unhandled exception in main loop: {e}")
+                if clock.wait(stop_event, 5.0):
                     break
+                run = ticks.reset(screens_by_id, clock.time())  # 예외 후에는 모든 화면을 바로 다시 확인
 
         self.stop()
 
     def stop(self):
         """모니터 중지 및 정리"""
-        print(f"INFO: CombatMonitor {self.monitor_id} received stop signal. Cleaning up...")
+        log.info(f"CombatMonitor {self.monitor_id} received stop signal. Cleaning up...")
         super().stop()
 
 
@@ -1431,15 +1553,15 @@ class CombatMonitor(BaseMonitor):
 # Standalone Test
 # ============================================================================
 if __name__ == "__main__":
-    print("INFO: Running CombatMonitor in standalone test mode...")
-    print("INFO: 시작 대기중... 10초 후에 모니터링이 시작됩니다.")
+    log.info("Running CombatMonitor in standalone test mode...")
+    log.info("시작 대기중... 10초 후에 모니터링이 시작됩니다.")
 
     start_delay = 10
     for i in range(start_delay, 0, -1):
-        print(f"INFO: {i}초 후 시작...")
+        log.info(f"{i}초 후 시작...")
         time.sleep(1)
 
-    print("INFO: 모니터링을 시작합니다!")
+    log.info("모니터링을 시작합니다!")
     stop_event = threading.Event()
 
     monitor_config = {'confidence': 0.85}
@@ -1454,50 +1576,47 @@ if __name__ == "__main__":
         from screen_info import SCREEN_REGIONS
 
         if SCREEN_REGIONS and isinstance(SCREEN_REGIONS, dict):
-            for screen_id in ['S1', 'S2', 'S3', 'S4', 'S5']:
-                if screen_id in SCREEN_REGIONS:
-                    monitor.add_screen(screen_id=screen_id, region=SCREEN_REGIONS[screen_id])
-                else:
-                    print(f"WARN: Screen ID '{screen_id}' not found in SCREEN_REGIONS.")
+            for screen_id in screen_ids(SCREEN_REGIONS):
+                monitor.add_screen(screen_id=screen_id, region=SCREEN_REGIONS[screen_id])
         else:
-            print("ERROR: Could not load SCREEN_REGIONS")
+            log.error("Could not load SCREEN_REGIONS")
             sys.exit(1)
 
     except ImportError:
-        print("ERROR: Could not import SCREEN_REGIONS")
+        log.error("Could not import SCREEN_REGIONS")
         sys.exit(1)
     except Exception as e:
-        print(f"ERROR: Error loading screen info: {e}")
+        log.error(f"Error loading screen info: {e}")
         sys.exit(1)
 
     if not monitor.screens:
-        print("ERROR: No screens were added. Exiting test.")
+        log.error("No screens were added. Exiting test.")
         sys.exit(1)
 
-    print(f"INFO: Starting monitor thread for {len(monitor.screens)} screens...")
+    log.info(f"Starting monitor thread for {len(monitor.screens)} screens...")
     monitor_thread = threading.Thread(target=monitor.run_loop, args=(stop_event,), daemon=True)
     monitor_thread.start()
 
     try:
         test_duration = 240
-        print(f"INFO: Monitor running for {test_duration} seconds... Press Ctrl+C to stop early.")
+        log.info(f"Monitor running for {test_duration} seconds... Press Ctrl+C to stop early.")
         start_time = time.time()
 
         while monitor_thread.is_alive() and time.time() - start_time < test_duration:
             time.sleep(0.5)
 
         if monitor_thread.is_alive():
-            print(f"\nINFO: Standalone test duration ({test_duration}s) elapsed.")
+            log.info(f"\nINFO: Standalone test duration ({test_duration}s) elapsed.")
         else:
-            print("\nINFO: Monitor thread finished early.")
+            log.info("\nINFO: Monitor thread finished early.")
 
     except KeyboardInterrupt:
-        print("\nINFO: Ctrl+C detected. Stopping monitor...")
+        log.info("\nINFO: Ctrl+C detected. Stopping monitor...")
     finally:
         if monitor_thread.is_alive():
-            print("INFO: Signaling monitor thread to stop...")
+            log.info("Signaling monitor thread to stop...")
             stop_event.set()
             monitor_thread.join(timeout=10)
             if monitor_thread.is_alive():
-                print("WARN: Monitor thread did not stop gracefully.")
-        print("INFO: Standalone test finished.")
\ No newline at end of file
+                log.warning("Monitor thread did not stop gracefully.")
+        log.info("Standalone test finished.")
\ No newline at end of file
@@ -5,13 +5,14 @@ from enum import Enum
 from typing import List, Tuple, Optional, Dict # Dict 추가
 import cv2
 import numpy as np
-import traceback
-import pyautogui
-import keyboard
-import time
 import random
 # NightCrows 경로 확인
 from Orchestrator.NightCrows.utils.screen_info import SCREEN_REGIONS, EVENT_UI_REGIONS
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 # 화면별 빨간 점 감지 파라미터 (기존과 동일)
 SCREEN_PARAMETERS = {
@@ -77,7 +78,7 @@ class DailyPresent:
     def find_ui_location_in_region(self, region: Tuple[int, int, int, int], template_path: str) -> Optional[Tuple[int, int]]:
         # ... (기존 코드와 동일) ...
         try:
-            screenshot = pyautogui.screenshot(region=region)
+            screenshot = inputs.screenshot(region=region)
             template = cv2.imread(template_path)
             if template is None: return None
             screen_gray = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2GRAY)
@@ -92,7 +93,7 @@ class DailyPresent:
                 random_offset_y = random.randint(-3, 3)
                 return (center_x + random_offset_x, center_y + random_offset_y)
             return None
-        except Exception as e: print(f"Error in find_ui_location_in_region: {e}"); return None
+        except Exception as e: log.error(f"Error in find_ui_location_in_region: {e}"); return None
 
     def find_ui_location(self, screen: Screen, template_path: str) -> Optional[Tuple[int, int]]:
         return self.find_ui_location_in_region(screen.region, template_path)
@@ -108,7 +109,7 @@ class DailyPresent:
 
         try:
             # 1. 전체 화면 스크린샷 및 ROI 추출
-            full_screenshot = pyautogui.screenshot()
+            full_screenshot = inputs.screenshot()
             full_img_np = np.array(full_screenshot)
 
             # ROI 영역 추출 (경계 체크 포함)
@@ -117,7 +118,7 @@ class DailyPresent:
             actual_h = min(h_region, img_h - y_region)
 
             if actual_w <= 0 or actual_h <= 0:
-                print(f"Warning: {screen_id} 영역이 이미지 경계를 벗어남")
+                log.warning(f"{screen_id} 영역이 이미지 경계를 벗어남")
                 return []
 
             roi_image = full_img_np[y_region:y_region + actual_h, x_region:x_region + actual_w]
@@ -251,13 +252,12 @@ class DailyPresent:
                     final_y = y_region + kp_y + random.randint(-2, 2)
                     valid_centers.append((final_x, final_y))
 
-            print(f"{screen_id} 영역에서 감지된 빨간색 요소 (개선된 2단계 필터링): {len(valid_centers)}개")
-            print(f"  └ Keypoint: {stats['total_keypoints']}, 최종통과: {stats['final_valid']}")
+            log.debug(f"{screen_id} 영역에서 감지된 빨간색 요소 (개선된 2단계 필터링): {len(valid_centers)}개",
+                      screen_id=screen_id, keypoints=stats['total_keypoints'], valid=stats['final_valid'])
             return valid_centers
 
         except Exception as e:
-            print(f"빨간점 감지 중 오류 발생 ({screen_id}): {e}")
-            traceback.print_exc()
+            log.exception(f"빨간점 감지 중 오류 발생 ({screen_id}): {e}")
             return []
 
     # --- find_red_dot_in_left_menu, find_red_dot_in_right_content (변경 없음) ---
@@ -271,7 +271,7 @@ class DailyPresent:
 
     # --- click_with_offset (변경 없음) ---
     def click_with_offset(self, position: Tuple[int, int], offset_x: int = -2, offset_y: int = 2):
-        pyautogui.click(position[0] + offset_x, position[1] + offset_y)
+        inputs.click(position[0] + offset_x, position[1] + offset_y)
 
     # --- scroll_in_left_menu, scroll_in_right_content (변경 없음, 단 sleep 시간은 이전 논의대로 수정 가정) ---
     def scroll_in_left_menu(self, screen: Screen):
@@ -280,14 +280,14 @@ class DailyPresent:
             menu_region = self.get_left_menu_region(screen); start_x = menu_region[0] + menu_region[2] // 2
             if self.left_scroll_direction_down: start_y = menu_region[1] + menu_region[3] * 2 // 3; end_y = menu_region[1] + menu_region[3] // 3; direction_str = "DOWN"
             else: start_y = menu_region[1] + menu_region[3] // 3; end_y = menu_region[1] + menu_region[3] * 2 // 3; direction_str = "UP"
-            end_x = start_x; print(f"[{screen.screen_id}] 왼쪽 메뉴 {direction_str} 스크롤 시작")
-            pyautogui.moveTo(start_x, start_y);  time.sleep(0.01) # 필요시 아주 짧게
-            pyautogui.mouseDown(button='left');  time.sleep(0.01) # 필요시 아주 짧게
-            pyautogui.moveTo(end_x, end_y, duration=0.15) # duration 조절
-            pyautogui.mouseUp(button='left'); time.sleep(1.0) # 스크롤 후 짧은 대기
+            end_x = start_x; log.info(f"[{screen.screen_id}] 왼쪽 메뉴 {direction_str} 스크롤 시작")
+            inputs.move_to(start_x, start_y);  clock.sleep(0.01) # 필요시 아주 짧게
+            inputs.mouse_down(button='left');  clock.sleep(0.01) # 필요시 아주 짧게
+            inputs.move_to(end_x, end_y, duration=0.15) # duration 조절
+            inputs.mouse_up(button='left'); clock.sleep(1.0) # 스크롤 후 짧은 대기
             self.left_scroll_direction_down = not self.left_scroll_direction_down
-            print(f"[{screen.screen_id}] {direction_str} 스크롤 완료"); return True
-        except Exception as e: print(f"Error in scroll_in_left_menu: {e}"); pyautogui.mouseUp(button='left'); return False
+            log.info(f"[{screen.screen_id}] {direction_str} 스크롤 완료"); return True
+        except Exception as e: log.error(f"Error in scroll_in_left_menu: {e}"); inputs.mouse_up(button='left'); return False
 
     def scroll_in_right_content(self, screen: Screen):
         # ... (기존 스크롤 로직, sleep 시간 단축 적용 가정) ...
@@ -295,25 +295,25 @@ class DailyPresent:
             content_region = self.get_right_content_region(screen); start_x = content_region[0] + content_region[2] // 2
             if self.right_scroll_direction_down: start_y = content_region[1] + content_region[3] * 3 //4; end_y = content_region[1] + content_region[3] // 4; direction_str = "DOWN"
             else: start_y = content_region[1] + content_region[3] * 2 // 5; end_y = content_region[1] + content_region[3] * 2 // 3; direction_str = "UP"
-            end_x = start_x; print(f"[{screen.screen_id}] 오른쪽 콘텐츠 {direction_str} 스크롤 시작")
-            pyautogui.moveTo(start_x, start_y);  time.sleep(0.01)
-            pyautogui.mouseDown(button='left');  time.sleep(0.01)
-            pyautogui.moveTo(end_x, end_y, duration=0.15) # duration 조절
-            pyautogui.mouseUp(button='left'); time.sleep(0.1) # 스크롤 후 짧은 대기
+            end_x = start_x; log.info(f"[{screen.screen_id}] 오른쪽 콘텐츠 {direction_str} 스크롤 시작")
+            inputs.move_to(start_x, start_y);  clock.sleep(0.01)
+            inputs.mouse_down(button='left');  clock.sleep(0.01)
+            inputs.move_to(end_x, end_y, duration=0.15) # duration 조절
+            inputs.mouse_up(button='left'); clock.sleep(0.1) # 스크롤 후 짧은 대기
             self.right_scroll_direction_down = not self.right_scroll_direction_down
-            print(f"[{screen.screen_id}] {direction_str} 스크롤 완료"); return True
-        except Exception as e: print(f"Error in scroll_in_right_content: {e}"); pyautogui.mouseUp(button='left'); return False
+            log.info(f"[{screen.screen_id}] {direction_str} 스크롤 완료"); return True
+        except Exception as e: log.error(f"Error in scroll_in_right_content: {e}"); inputs.mouse_up(button='left'); return False
 
     # === 상태 처리 메소드 수정 ===
 
     def process_main_screen(self, screen: Screen):
         """메인 화면 처리 (변경 없음)"""
-        print(f"[{screen.screen_id}] 메인 화면 처리 중...")
+        log.info(f"[{screen.screen_id}] 메인 화면 처리 중...")
         event_icon_pos = self.find_ui_location(screen, screen.main_event_icon)
         if event_icon_pos:
-            print(f"[{screen.screen_id}] 이벤트 아이콘 발견, 클릭")
-            pyautogui.click(event_icon_pos[0], event_icon_pos[1])
-            time.sleep(0.2) # 메뉴 로딩 대기 (값 조절 가능)
+            log.info(f"[{screen.screen_id}] 이벤트 아이콘 발견, 클릭")
+            inputs.click(event_icon_pos[0], event_icon_pos[1])
+            clock.sleep(0.2) # 메뉴 로딩 대기 (값 조절 가능)
             # 초기 상태 재설정: 다음 화면으로 넘어갈 때를 대비해 여기서도 초기화
             self.last_clicked_left_dot_pos = None
             self.right_scroll_needed = False
@@ -321,13 +321,13 @@ class DailyPresent:
             self.is_first_entry_to_event_menu = True # 첫 진입 플래그도 여기서 관리하는게 나을 수 있음
             self.current_state = PresentState.EVENT_MENU
             return True
-        print(f"[{screen.screen_id}] 이벤트 아이콘을 찾을 수 없음")
+        log.info(f"[{screen.screen_id}] 이벤트 아이콘을 찾을 수 없음")
         # 실패 시 다음 화면으로 넘어가도록 처리 (run 메소드에서 처리됨)
         return False # 실패 시 False 반환
 
     def process_event_menu(self, screen: Screen):
         """이벤트 메뉴 처리 (수정됨)"""
-        print(f"[{screen.screen_id}] 이벤트 메뉴 처리 중...")
+        log.info(f"[{screen.screen_id}] 이벤트 메뉴 처리 중...")
 
         # 왼쪽 메뉴에서 붉은 점 찾기
         red_dot_positions = self.find_red_dot_in_left_menu(screen)
@@ -337,15 +337,15 @@ class DailyPresent:
             # TODO: 이전에 처리한 점을 건너뛰는 로직 추가 가능 (더 복잡해짐)
             # 현재는 항상 찾은 목록의 첫번째 점을 시도함
             target_dot_pos = red_dot_positions[0]
-            print(f"[{screen.screen_id}] 왼쪽 붉은 점 발견: {target_dot_pos}")
+            log.info(f"[{screen.screen_id}] 왼쪽 붉은 점 발견: {target_dot_pos}")
 
             # 이전에 클릭한 점과 같은지 비교
             if self.last_clicked_left_dot_pos == target_dot_pos:
                 # 같은 점을 다시 클릭하는 경우 -> 오른쪽 스크롤 필요
                 self.current_item_right_scroll_attempts += 1
-                print(f"  -> 같은 항목 재클릭 감지. 오른쪽 스크롤 시도 ({self.current_item_right_scroll_attempts}/{self.max_right_scroll_per_item}).")
+                log.info(f"  -> 같은 항목 재클릭 감지. 오른쪽 스크롤 시도 ({self.current_item_right_scroll_attempts}/{self.max_right_scroll_per_item}).")
                 if self.current_item_right_scroll_attempts > self.max_right_scroll_per_item:
-                    print(f"  -> 오른쪽 최대 스크롤 도달. 이 항목 건너뛰기.")
+                    log.info(f"  -> 오른쪽 최대 스크롤 도달. 이 항목 건너뛰기.")
                     # TODO: 이 항목을 '처리 완료' 또는 '오류'로 기록하고 다음 붉은 점을 찾도록 개선 가능
                     # 현재 로직에서는 그냥 다음 왼쪽 스크롤로 넘어감 (아래 else if 조건으로)
                     self.current_state = PresentState.LEFT_MENU_SCROLL # 강제로 왼쪽 스크롤 시도
@@ -354,27 +354,27 @@ class DailyPresent:
                     self.right_scroll_needed = True
             else:
                 # 다른 점을 클릭하는 경우 -> 오른쪽 스크롤 불필요, 카운터 리셋
-                print(f"  -> 새로운 항목 클릭.")
+                log.info(f"  -> 새로운 항목 클릭.")
                 self.right_scroll_needed = False
                 self.current_item_right_scroll_attempts = 0 # 새 항목이므로 리셋
 
             # 선택된 붉은 점 클릭
             self.click_with_offset(target_dot_pos, -2, 2)
             self.last_clicked_left_dot_pos = target_dot_pos # 마지막 클릭 정보 업데이트
-            time.sleep(0.2) # 클릭 후 오른쪽 로딩 대기 (값 조절 가능)
+            clock.sleep(0.2) # 클릭 후 오른쪽 로딩 대기 (값 조절 가능)
             self.current_state = PresentState.RIGHT_CONTENT # 오른쪽 처리하러 전환
             return True
 
         # 붉은 점이 없다면 왼쪽 스크롤 시도
         elif self.left_scroll_attempts < self.max_scroll_attempts:
-            print(f"[{screen.screen_id}] 왼쪽 붉은 점 없음, 스크롤 시도 ({self.left_scroll_attempts + 1}/{self.max_scroll_attempts})")
+            log.info(f"[{screen.screen_id}] 왼쪽 붉은 점 없음, 스크롤 시도 ({self.left_scroll_attempts + 1}/{self.max_scroll_attempts})")
             self.current_state = PresentState.LEFT_MENU_SCROLL
             return True
         else:
             # 왼쪽 스크롤 다 했는데도 붉은 점 없으면 종료
-            print(f"[{screen.screen_id}] 왼쪽 붉은 점 없음, 최대 스크롤 시도 도달, DP 종료.")
-            keyboard.press_and_release('esc') # 이벤트 메뉴 나가기
-            time.sleep(0.3)
+            log.info(f"[{screen.screen_id}] 왼쪽 붉은 점 없음, 최대 스크롤 시도 도달, DP 종료.")
+            inputs.key_press('esc') # 이벤트 메뉴 나가기
+            clock.sleep(0.3)
             # 다음 화면으로 넘어가기 위해 상태를 MAIN_SCREEN으로 하고 current_screen_index 증가 필요
             # 이 로직은 run() 메소드에서 처리하는 것이 더 깔끔할 수 있음
             # 여기서는 일단 MAIN_SCREEN으로 보내서 run() 메소드의 실패 처리 로직 타도록 유도
@@ -389,43 +389,43 @@ class DailyPresent:
 
     def process_left_menu_scroll(self, screen: Screen):
         """왼쪽 메뉴 스크롤 처리 (변경 없음)"""
-        print(f"[{screen.screen_id}] 왼쪽 메뉴 스크롤 중... (시도 {self.left_scroll_attempts + 1}/{self.max_scroll_attempts})")
+        log.info(f"[{screen.screen_id}] 왼쪽 메뉴 스크롤 중... (시도 {self.left_scroll_attempts + 1}/{self.max_scroll_attempts})")
         if self.scroll_in_left_menu(screen):
             self.left_scroll_attempts += 1
-            print(f"[{screen.screen_id}] 스크롤 완료 (총 {self.left_scroll_attempts}회)")
+            log.info(f"[{screen.screen_id}] 스크롤 완료 (총 {self.left_scroll_attempts}회)")
             self.current_state = PresentState.EVENT_MENU # 스크롤 후 다시 이벤트 메뉴 확인
             return True
-        print(f"[{screen.screen_id}] 스크롤 실패")
+        log.info(f"[{screen.screen_id}] 스크롤 실패")
         # 스크롤 실패 시에도 일단 EVENT_MENU로 돌아가서 최종 종료 로직 타도록 함
         self.current_state = PresentState.EVENT_MENU
         return False # 실패 처리
 
     def process_right_content(self, screen: Screen):
         """오른쪽 콘텐츠 처리 (수정됨)"""
-        print(f"[{screen.screen_id}] 오른쪽 콘텐츠 처리 중...")
+        log.info(f"[{screen.screen_id}] 오른쪽 콘텐츠 처리 중...")
 
         # 스크롤이 필요한 경우인지 확인
         if self.right_scroll_needed:
-            print(f"  -> 오른쪽 스크롤 필요 플래그 감지.")
+            log.info(f"  -> 오른쪽 스크롤 필요 플래그 감지.")
             self.right_scroll_needed = False # 플래그 사용했으니 리셋
             self.current_state = PresentState.RIGHT_CONTENT_SCROLL # 스크롤 상태로 전환
             return True
 
         # 스크롤 필요 없으면 보이는 영역에서 붉은 점 찾기
-        print(f"  -> 보이는 영역에서 오른쪽 붉은 점(보상) 찾기 시도...")
+        log.info(f"  -> 보이는 영역에서 오른쪽 붉은 점(보상) 찾기 시도...")
         red_dot_positions = self.find_red_dot_in_right_content(screen)
 
         if red_dot_positions:
             # 붉은 점(보상)을 찾았으면 클릭하고 REWARD_CLAIM 상태로
             target_dot_pos = red_dot_positions[0]
-            print(f"    -> 오른쪽 붉은 점 발견: {target_dot_pos}, 클릭.")
+            log.info(f"    -> 오른쪽 붉은 점 발견: {target_dot_pos}, 클릭.")
             self.click_with_offset(target_dot_pos, -2, 2)
-            time.sleep(0.2) # 클릭 후 상태 전환 전 잠시 대기
+            clock.sleep(0.2) # 클릭 후 상태 전환 전 잠시 대기
             self.current_state = PresentState.REWARD_CLAIM
             return True
         else:
             # 보이는 영역에 붉은 점 없으면 -> 왼쪽 메뉴 확인하러 돌아감 (스크롤 X)
-            print(f"    -> 보이는 영역에 오른쪽 붉은 점 없음. 왼쪽 메뉴로 복귀.")
+            log.info(f"    -> 보이는 영역에 오른쪽 붉은 점 없음. 왼쪽 메뉴로 복귀.")
             # 왼쪽 메뉴로 돌아갈 때, 마지막 클릭 정보는 유지해야 함 (같은 왼쪽 항목을 다시 처리할 수 있으므로)
             self.current_state = PresentState.EVENT_MENU
             return True
@@ -433,35 +433,35 @@ class DailyPresent:
     def process_right_content_scroll(self, screen: Screen):
         """오른쪽 콘텐츠 스크롤 처리 (변경 없음)"""
         # 이 메소드는 스크롤만 하고 다시 RIGHT_CONTENT로 돌아감
-        print(f"[{screen.screen_id}] 오른쪽 콘텐츠 스크롤 중... (시도 {self.current_item_right_scroll_attempts}/{self.max_right_scroll_per_item})") # 카운터 표시
+        log.info(f"[{screen.screen_id}] 오른쪽 콘텐츠 스크롤 중... (시도 {self.current_item_right_scroll_attempts}/{self.max_right_scroll_per_item})") # 카운터 표시
         if self.scroll_in_right_content(screen):
-            print(f"[{screen.screen_id}] 스크롤 완료")
-            time.sleep(0.1) # 스크롤 후 짧은 대기
+            log.info(f"[{screen.screen_id}] 스크롤 완료")
+            clock.sleep(0.1) # 스크롤 후 짧은 대기
             self.current_state = PresentState.RIGHT_CONTENT # 스크롤 했으니 다시 오른쪽 확인
             return True
-        print(f"[{screen.screen_id}] 스크롤 실패")
+        log.info(f"[{screen.screen_id}] 스크롤 실패")
         # 스크롤 실패 시, 해당 아이템 처리 포기하고 왼쪽 메뉴로 돌아가도록 함
         self.current_state = PresentState.EVENT_MENU
         return False
 
     def process_reward_claim(self, screen: Screen):
         """보상 수령 처리 (수정됨)"""
-        print(f"[{screen.screen_id}] 보상 수령 중...")
+        log.info(f"[{screen.screen_id}] 보상 수령 중...")
 
         # 보상 수령 후 약간의 시간을 두고 처리 (애니메이션 대기 등)
 
-        print(f"  -> 대기 시간 시작 (0.3초)...")
-        time.sleep(0.3)
+        log.info(f"  -> 대기 시간 시작 (0.3초)...")
+        clock.sleep(0.3)
 
         # === ESC 대신 마우스 클릭으로 변경 ===
-        print(f"  -> 대기 시간 종료. 마우스 클릭 실행 (현재 위치).")
-        pyautogui.click() # 현재 마우스 위치에서 싱글 클릭
+        log.info(f"  -> 대기 시간 종료. 마우스 클릭 실행 (현재 위치).")
+        inputs.click() # 현재 마우스 위치에서 싱글 클릭
         # === 변경 완료 ===
 
-        time.sleep(0.5) # 클릭 후 안정화 시간
+        clock.sleep(0.5) # 클릭 후 안정화 시간
 
         # === 다음 상태를 EVENT_MENU로 변경 ===
-        print(f"  -> 보상 처리 완료. 왼쪽 메뉴 확인하러 복귀.")
+        log.info(f"  -> 보상 처리 완료. 왼쪽 메뉴 확인하러 복귀.")
         self.current_state = PresentState.EVENT_MENU
         # === 변경 완료 ===
         return True
@@ -480,16 +480,16 @@ class DailyPresent:
             return self.process_right_content_scroll(screen)
         elif self.current_state == PresentState.REWARD_CLAIM:
             return self.process_reward_claim(screen)
-        print(f"!!! 알 수 없는 상태: {self.current_state} !!!")
+        log.error(f"!!! 알 수 없는 상태: {self.current_state} !!!")
         return False
 
     def run(self):
         """모든 화면에서 Daily Present 처리 (수정됨 - 초기화 로직 위치 수정)""" # 독스트링 수정
-        print("Daily Present 처리 시작...")
+        log.info("Daily Present 처리 시작...")
         countdown_time = 5
         for i in range(countdown_time, 0, -1):
-            print(f"시작까지 {i}초...")
-            time.sleep(1)
+            log.info(f"시작까지 {i}초...")
+            clock.sleep(1)
 
         try:
             # 화면 처리 루프 시작 전 초기화 (index는 여기서 하는게 맞음)
@@ -498,7 +498,7 @@ class DailyPresent:
                 # ... (키보드 중단 체크) ...
 
                 screen = self.screens[self.current_screen_index]
-                print(f"\n--- 화면 {screen.screen_id} 처리 시작 --- (상태: {self.current_state.name})")
+                log.info(f"\n--- 화면 {screen.screen_id} 처리 시작 --- (상태: {self.current_state.name})")
 
                 # 상태 처리
                 result = self.process_current_state(screen)
@@ -509,14 +509,14 @@ class DailyPresent:
                     pass
                 else:
                     # 실패 또는 화면 처리 완료 시 (False 반환 시): 다음 화면으로 넘어감
-                    print(f"화면 {screen.screen_id} 처리 완료 또는 실패 감지. 다음 화면으로 이동.")
+                    log.info(f"화면 {screen.screen_id} 처리 완료 또는 실패 감지. 다음 화면으로 이동.")
                     self.current_screen_index += 1
                     self.current_state = PresentState.MAIN_SCREEN # 다음 화면은 항상 메인부터
 
                     # ================================================
                     # >> 다음 화면 처리를 위한 상태 변수 초기화 <<
                     # ================================================
-                    print(f"  -> 다음 화면({self.current_screen_index})을 위해 상태 변수 초기화") # 로그 추가
+                    log.info(f"  -> 다음 화면({self.current_screen_index})을 위해 상태 변수 초기화") # 로그 추가
                     self.left_scroll_attempts = 0 # <<< 왼쪽 스크롤 횟수 초기화
                     self.last_clicked_left_dot_pos = None # 마지막 클릭 정보 초기화
                     self.right_scroll_needed = False # 오른쪽 스크롤 필요 플래그 초기화
@@ -524,18 +524,17 @@ class DailyPresent:
                     # self.is_first_entry_to_event_menu = True # 이 플래그도 필요 시 초기화
                     # ================================================
 
-                time.sleep(0.3) # 메인 루프 지연
+                clock.sleep(0.3) # 메인 루프 지연
 
-            print("\n--- 모든 화면의 Daily Present 처리 완료 ---")
+            log.info("\n--- 모든 화면의 Daily Present 처리 완료 ---")
 
         # ... (except, finally 블록은 동일) ...
         except KeyboardInterrupt:
-            print("키보드 인터럽트로 중단됨")
+            log.info("키보드 인터럽트로 중단됨")
         except Exception as e:
-            print(f"에러 발생: {e}")
-            traceback.print_exc()
+            log.exception(f"에러 발생: {e}")
         finally:
-            print("Daily Present 처리 종료")
+            log.info("Daily Present 처리 종료")
 
 if __name__ == "__main__":
     # 샘플 실행 코드
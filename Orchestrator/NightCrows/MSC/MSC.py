@@ -1,14 +1,18 @@
 from enum import Enum
 from dataclasses import dataclass
 from typing import List, Tuple, Optional
-import pyautogui
-import keyboard
 import numpy as np
 import time
 import cv2
 import random
-from threading import Thread
-from queue import Queue
+import sys
+from threading import Thread, Lock
+from concurrent.futures import ThreadPoolExecutor
+from Orchestrator.src.utils.wait_utils import wait_for, sleep_unless, PollPolicy, SLOW_POLL
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class ScreenState(Enum):
@@ -42,29 +46,91 @@ class MultiScreenChecker:
         self.screen_completion_status = {}
         self.screen_ready = {}
 
+        # 파티 체크용 상시 워커 풀 + 템플릿 캐시 (매 사이클 Thread/Queue 생성 제거)
+        self._executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="MSC-Party")
+        self._template_cache = {}
+        self._template_cache_lock = Lock()
+        self._stats_lock = Lock()  # cycle_stats (파티 체크 / 측정 스레드 공용)
+        self.cycle_stats = {'cycles': 0, 'total_time': 0.0, 'max_time': 0.0, 'frames': 0}
+
     def add_screen(self, template_path: str, region: Tuple[int, int, int, int], additional_templates: List[str], map_templates: List[str],completion_ui_template: str,party_ui_templates: List[str],scale: float=1.0):
         screen_info = ScreenInfo(template_path=template_path, region=region, additional_templates=additional_templates,map_templates=map_templates,completion_ui_template=completion_ui_template,party_ui_templates=party_ui_templates, scale = scale)
         self.screens.append(screen_info)
         self.screen_completion_status[id(screen_info)] = False  # 새로운 화면 추가시 상태 초기화
 
+    # ========================================================================
+    # 템플릿 캐시 / 공유 프레임
+    # ========================================================================
+    def _get_template_gray(self, template_path: str) -> Optional[np.ndarray]:
+        """템플릿을 한 번만 읽어 그레이스케일로 캐싱"""
+        with self._template_cache_lock:
+            if template_path not in self._template_cache:
+                template = cv2.imread(template_path)
+                self._template_cache[template_path] = (
+                    cv2.cvtColor(template, cv2.COLOR_BGR2GRAY) if template is not None else None
+                )
+            return self._template_cache[template_path]
+
+    def preload_templates(self):
+        """파티/수면/완료 템플릿을 미리 로드"""
+        loaded, missing = 0, 0
+        for screen_info in self.screens:
+            paths = [screen_info.template_path, screen_info.completion_ui_template] + list(screen_info.party_ui_templates)
+            for path in paths:
+                if not path:
+                    continue
+                if self._get_template_gray(path) is None:
+                    log.error(f"Could not load template image at {path}")
+                    missing += 1
+                else:
+                    loaded += 1
+        log.info(f"Templates preloaded: {loaded} loaded, {missing} missing")
+
+    def _grab_frame_gray(self) -> np.ndarray:
+        """전체 화면을 한 번 캡처해 그레이스케일로 변환 (한 사이클 동안 모든 화면이 공유)"""
+        with self._stats_lock:
+            self.cycle_stats['frames'] += 1
+        return cv2.cvtColor(np.array(inputs.screenshot()), cv2.COLOR_RGB2GRAY)
+
+    @staticmethod
+    def _crop(frame_gray: np.ndarray, region: Tuple[int, int, int, int]) -> np.ndarray:
+        x, y, w, h = region
+        return frame_gray[y:y + h, x:x + w]
+
+    def _locate_on_frame(self, frame_gray: np.ndarray, screen_info: ScreenInfo, template_path: str,
+                         threshold=None) -> Optional[Tuple[int, int]]:
+        """공유 프레임에서 템플릿 위치 탐색 (return_ui_location과 동일한 좌표 규칙)"""
+        if threshold is None:
+            threshold = self.confidence_threshold
+        template_gray = self._get_template_gray(template_path)
+        if template_gray is None:
+            return None
+        result = cv2.matchTemplate(self._crop(frame_gray, screen_info.region), template_gray, cv2.TM_CCOEFF_NORMED)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        if max_val > threshold:
+            template_height, template_width = template_gray.shape
+            final_x = screen_info.region[0] + max_loc[0] + template_width // 2 + random.randint(-3, 3)
+            final_y = screen_info.region[1] + max_loc[1] + template_height // 2 + random.randint(-3, 3)
+            return (final_x, final_y)
+        return None
+
     def return_ui_location(self, screen_info: ScreenInfo, template_path: str, threshold=None) -> Optional[Tuple[int, int]]:
         """Find the UI element location based on the given template path."""
         if threshold is None:
            threshold = self.confidence_threshold
         try:
-            screen = pyautogui.screenshot(region=screen_info.region)
-            template = cv2.imread(template_path)
+            screen = inputs.screenshot(region=screen_info.region)
+            template_gray = self._get_template_gray(template_path)
 
-            if template is None:
-                print(f"Error: Could not load template image at {template_path}")
+            if template_gray is None:
+                log.error(f"Could not load template image at {template_path}")
                 return None
 
             screen_gray = cv2.cvtColor(np.array(screen), cv2.COLOR_RGB2GRAY)
-            template_gray = cv2.cvtColor(template, cv2.COLOR_BGR2GRAY)
 
             result = cv2.matchTemplate(screen_gray, template_gray, cv2.TM_CCOEFF_NORMED)
             min_val, max_val, min_loc, max_loc = cv2.minMaxLoc(result)
-            print(f"Template matching confidence: {max_val}")  # Add this debug print
+            log.info(f"Template matching confidence: {max_val}")  # Add this debug print
 
             # Only return location if confidence threshold is met
             if max_val > threshold:
@@ -82,7 +148,7 @@ class MultiScreenChecker:
             return None
 
         except Exception as e:
-            print(f"Error in return_ui_location: {e}")
+            log.error(f"Error in return_ui_location: {e}")
             return None
 
     def additional_ui_interaction(self, screen_info: ScreenInfo):
@@ -100,13 +166,13 @@ class MultiScreenChecker:
                 if click_pos:
                     time.sleep(0.3)
                     x, y = click_pos
-                    pyautogui.click(x, y)
+                    inputs.click(x, y)
                     time.sleep(0.2)
-                    print(f"Clicked at {click_pos} with template {template_path}")
+                    log.info(f"Clicked at {click_pos} with template {template_path}")
 
                     if i == len(screen_info.additional_templates) - 1:
                         self.screen_completion_status[id(screen_info)] = True
-                        print(f"마지막 템플릿 클릭 완료 - Screen {screen_info.region}")
+                        log.info(f"마지막 템플릿 클릭 완료 - Screen {screen_info.region}")
                         return
 
                     time.sleep(0.1)
@@ -114,24 +180,24 @@ class MultiScreenChecker:
                 time.sleep(0.1)
 
         except Exception as e:
-            print(f"Error in additional_ui_interaction: {e}")
+            log.error(f"Error in additional_ui_interaction: {e}")
 
     def check_screen(self, screen_info: ScreenInfo) -> bool:
         try:
-            screen = pyautogui.screenshot(region=screen_info.region)
-            template = cv2.imread(screen_info.template_path)
+            screen = inputs.screenshot(region=screen_info.region)
+            template_gray = self._get_template_gray(screen_info.template_path)
 
-            if template is None:
-                print(f"Error: Could not load template image at {screen_info.template_path}")
+            if template_gray is None:
+                log.error(f"Could not load template image at {screen_info.template_path}")
                 return False
 
-            is_sleep = self.compare_images(screen, template)
+            is_sleep = self.compare_images(screen, template_gray)
 
             screen_info.state = ScreenState.SLEEP if is_sleep else ScreenState.AWAKE
             return is_sleep
 
         except Exception as e:
-            print(f"Error in check_screen: {e}")
+            log.error(f"Error in check_screen: {e}")
             return False
 
     def handle_screen(self, screen_info: ScreenInfo):
@@ -139,9 +205,9 @@ class MultiScreenChecker:
             click_pos = self.return_ui_location(screen_info, screen_info.template_path)
             if click_pos:
                 x, y = click_pos
-                pyautogui.click(x, y)
+                inputs.click(x, y)
                 time.sleep(0.1)
-                keyboard.press_and_release('esc')
+                inputs.key_press('esc')
                 screen_info.attempts += 1
                 time.sleep(0.1)
 
@@ -154,20 +220,20 @@ class MultiScreenChecker:
             threshold = self.confidence_threshold
 
         screen_gray = cv2.cvtColor(np.array(screen_img), cv2.COLOR_RGB2GRAY)
-        template_gray = cv2.cvtColor(template_img, cv2.COLOR_BGR2GRAY)
+        template_gray = template_img if template_img.ndim == 2 else cv2.cvtColor(template_img, cv2.COLOR_BGR2GRAY)
         result = cv2.matchTemplate(screen_gray, template_gray, cv2.TM_CCOEFF_NORMED)
         _, max_val, _, _ = cv2.minMaxLoc(result)
-        print(f"Compare images max_val: {max_val}")  # 이렇게 디버그 출력 추가
+        log.info(f"Compare images max_val: {max_val}")  # 이렇게 디버그 출력 추가
         return max_val > threshold
 
     def debug_template_matching(self, screen_info):
         for template_path in screen_info.additional_templates:
-            print(f"Testing template: {template_path}")
+            log.info(f"Testing template: {template_path}")
             location = self.return_ui_location(screen_info, template_path)
             if location:
-                print(f"Template matched at location: {location}")
+                log.info(f"Template matched at location: {location}")
             else:
-                print("No match found or template load error.")
+                log.info("No match found or template load error.")
 
     def perform_click_sequence(self, random_range: int = 3):
         """시작 위치를 포함한 모든 클릭 위치에서 ±random_range 픽셀 내에서 랜덤하게 클릭"""
@@ -182,16 +248,16 @@ class MultiScreenChecker:
         for x, y in positions:
             final_x = x + random.randint(-random_range, random_range)
             final_y = y + random.randint(-random_range, random_range)
-            pyautogui.click(final_x, final_y)
-            print(f"Clicked at ({final_x}, {final_y})")
+            inputs.click(final_x, final_y)
+            log.info(f"Clicked at ({final_x}, {final_y})")
             time.sleep(0.2)  # 클릭 간 약간의 딜레이
-            keyboard.press_and_release('esc')  # esc키 입력
+            inputs.key_press('esc')  # esc키 입력
             time.sleep(0.2)
-            pyautogui.click(final_x, final_y)
+            inputs.click(final_x, final_y)
             time.sleep(0.2)
-            keyboard.press_and_release('y')
+            inputs.key_press('y')
             time.sleep(0.1)
-            keyboard.press_and_release('y')
+            inputs.key_press('y')
 
     def situate_at_the_scene(self):
 
@@ -215,91 +281,91 @@ class MultiScreenChecker:
             for screen in self.screens:
                 region_center_x = screen.region[0] + screen.region[2] // 2
                 region_center_y = screen.region[1] + screen.region[3] // 2
-                pyautogui.click(region_center_x, region_center_y)
+                inputs.click(region_center_x, region_center_y)
                 time.sleep(0.2)
-                keyboard.press_and_release('m')
+                inputs.key_press('m')
                 time.sleep(0.2)
-                print(f"Map interface activated for screen: {screen.region}")
+                log.info(f"Map interface activated for screen: {screen.region}")
 
             time.sleep(4.0)
 
             for screen in self.screens:
 
-                print(f"\nStarting process for screen: {screen.region}")
+                log.info(f"\nStarting process for screen: {screen.region}")
                 time.sleep(0.5)
                 current_map_templates = [template for template in screen.map_templates
                                          if f"map{current_map}_" in template]
 
                 for template_path in current_map_templates:
-                    print(f"Trying template: {template_path}")
+                    log.info(f"Trying template: {template_path}")
                     click_pos = self.return_ui_location(screen, template_path, threshold=map_confidence_threshold)
-                    print(f"Return value from return_ui_location: {click_pos}")
+                    log.info(f"Return value from return_ui_location: {click_pos}")
                     if click_pos:
-                        print(f"Match found! Confidence above threshold")
-                        print(f"About to click at: {click_pos}")
+                        log.info(f"Match found! Confidence above threshold")
+                        log.info(f"About to click at: {click_pos}")
 
                         try:
-                            pyautogui.click(click_pos[0], click_pos[1])
-                            print("First click completed")
+                            inputs.click(click_pos[0], click_pos[1])
+                            log.info("First click completed")
                             time.sleep(0.5)
                             moverel_x, moverel_y = screen_moverel[screen.region]
-                            pyautogui.moveRel(moverel_x, moverel_y)
-                            print("Moved relative position")
+                            inputs.move_rel(moverel_x, moverel_y)
+                            log.info("Moved relative position")
                             time.sleep(0.3)
-                            pyautogui.click()
-                            print("Second click completed")
-                            keyboard.press_and_release('m')
+                            inputs.click()
+                            log.info("Second click completed")
+                            inputs.key_press('m')
 
                         except Exception as e:
-                            print(f"Error during mouse operations: {e}")
+                            log.error(f"Error during mouse operations: {e}")
                         break
 
-            time.sleep(24)
+            # 이동 완료를 알려주는 UI가 없으므로 최대 24초 대기 (중단 요청 시 즉시 종료)
+            if sleep_unless(lambda: not self.running, 24):
+                return
             for screen in self.screens:
                 region_center_x = screen.region[0] + screen.region[2] // 2
                 region_center_y = screen.region[1] + screen.region[3] // 2
 
                 # 화면 활성화를 위한 클릭
-                pyautogui.click(region_center_x, region_center_y)
+                inputs.click(region_center_x, region_center_y)
                 time.sleep(0.2)  # 약간의 딜레이
-                keyboard.press_and_release('q')
+                inputs.key_press('q')
                 time.sleep(0.3)
 
-            time.sleep(65)
-
-            # completion UI 처리
-            attempts_per_screen = 16
+            # completion UI 처리: 고정 65초 + 11초 간격 16회 대신, 등장하는 즉시 클릭
+            completion_timeout = 65 + 16 * 11
             completion_found = {id(screen): False for screen in self.screens}
 
-            for attempt in range(attempts_per_screen):
-                # 모든 스크린을 한 번씩 체크
+            def _click_completed_screens():
+                if not self.running:
+                    return True
+                # 아직 찾지 못한 스크린만 체크
                 for screen in self.screens:
-                    if not completion_found[id(screen)]:  # 아직 찾지 못한 스크린만 체크
+                    if not completion_found[id(screen)]:
                         completion_ui_pos = self.return_ui_location(
                             screen,
                             template_path=screen.completion_ui_template
                         )
                         if completion_ui_pos:
-                            print(f"Screen {screen.region}: Completion UI found and clicked")
-                            pyautogui.click(completion_ui_pos[0], completion_ui_pos[1])
+                            log.info(f"Screen {screen.region}: Completion UI found and clicked")
+                            inputs.click(completion_ui_pos[0], completion_ui_pos[1])
                             completion_found[id(screen)] = True
+                return all(completion_found.values())
 
-                # 모든 스크린에서 찾았는지 체크
-                if all(completion_found.values()):
-                    break
-
-                time.sleep(11)  # 다음 시도 전 대기
+            wait_for(_click_completed_screens, timeout=completion_timeout, poll_policy=SLOW_POLL,
+                     label=f"MSC.map{current_map}.COMPLETION_UI")
 
             all_completed = all(completion_found.values())
 
             if all_completed:
                 current_map += 1  # map5가 완료되면 current_map이 6이 되어 while 조건에서 false가 됨
                 if current_map > 5:
-                    print("Map 5 completed. Exiting map sequence.")
+                    log.info("Map 5 completed. Exiting map sequence.")
                     break  # 필요없음 - 이미 다음 while 조건 검사에서 종료될 것이기 때문
 
                 time.sleep(0.5)
-                print(f"Moving to map {current_map}...")
+                log.info(f"Moving to map {current_map}...")
 
                 # perform_click_sequence의 positions 동작 수행
                 positions = [
@@ -313,30 +379,26 @@ class MultiScreenChecker:
                 for x, y in positions:
                     final_x = x + random.randint(-3, 3)
                     final_y = y + random.randint(-3, 3)
-                    pyautogui.click(final_x, final_y)
-                    print(f"Clicked at ({final_x}, {final_y})")
+                    inputs.click(final_x, final_y)
+                    log.info(f"Clicked at ({final_x}, {final_y})")
                     time.sleep(0.2)
-                    keyboard.press_and_release('y')
+                    inputs.key_press('y')
                     time.sleep(0.2)
-                    keyboard.press_and_release('y')
+                    inputs.key_press('y')
 
-                print(f"Positions clicked. Current map: {current_map}, self.running: {self.running}")
+                log.info(f"Positions clicked. Current map: {current_map}, self.running: {self.running}")
                 time.sleep(15)
 
             else:
-                print(f"Completion UI not confirmed for all screens on map {current_map}")
-
-    def check_screen_thread(self, screen_info, result_queue):
-        result = self.check_ui_state_with_samples(screen_info)
-        result_queue.put((screen_info, result))
+                log.info(f"Completion UI not confirmed for all screens on map {current_map}")
 
     def repetitive_party_check(self):
         for screen_info in self.screens:
             self.screen_ready[id(screen_info)] = screen_info.region == (0, 0, 766, 346)
 
-        pyautogui.click(600 + random.randint(-3, 3), 103 + random.randint(-3, 3))
+        inputs.click(600 + random.randint(-3, 3), 103 + random.randint(-3, 3))
         time.sleep(0.2)
-        keyboard.press_and_release('y')
+        inputs.key_press('y')
 
         positions = {
             (770, 0, 840, 378): (1430, 109),
@@ -346,35 +408,27 @@ class MultiScreenChecker:
         }
 
         while self.running:
-            if keyboard.is_pressed('alt+q'):
+            if inputs.is_pressed('alt+q'):
                 return
 
-            threads = []
-            result_queue = Queue()
+            cycle_start = time.perf_counter()
+            pending_screens = [screen_info for screen_info in self.screens
+                               if screen_info.region != (0, 0, 766, 346) and not self.screen_ready.get(id(screen_info))]
             not_ready_screens = []
 
-            for screen_info in self.screens:
-                if screen_info.region != (0, 0, 766, 346) and not self.screen_ready.get(id(screen_info)):
-                    thread = Thread(target=self.check_screen_thread, args=(screen_info, result_queue))
-                    thread.start()
-                    threads.append(thread)
-
-            for thread in threads:
-                thread.join()
-
-            while not result_queue.empty():
-                screen, is_ready = result_queue.get()
+            for screen, is_ready in zip(pending_screens, self.check_party_ui_batch(pending_screens)):
                 if not is_ready:
                     not_ready_screens.append(screen)
                 else:
                     self.screen_ready[id(screen)] = True
+            self._record_cycle(time.perf_counter() - cycle_start)
 
             if not_ready_screens:
                 for screen in not_ready_screens:
                     x, y = positions[screen.region]
-                    pyautogui.click(x + random.randint(-3, 3), y + random.randint(-3, 3))
+                    inputs.click(x + random.randint(-3, 3), y + random.randint(-3, 3))
                     time.sleep(0.1)
-                    keyboard.press_and_release('y')
+                    inputs.key_press('y')
             time.sleep(2.0)
 
             if all(self.screen_ready.values()):
@@ -383,18 +437,20 @@ class MultiScreenChecker:
                 completion_found = {id(screen): False for screen in self.screens}
 
                 for attempt in range(attempts_per_screen):
-                    if not self.running or keyboard.is_pressed('alt+q'):
+                    if not self.running or inputs.is_pressed('alt+q'):
                         return
 
+                    frame_gray = self._grab_frame_gray()
                     for screen in self.screens:
                         if not completion_found[id(screen)]:
-                            completion_ui_pos = self.return_ui_location(
+                            completion_ui_pos = self._locate_on_frame(
+                                frame_gray,
                                 screen,
                                 template_path=screen.completion_ui_template
                             )
                             if completion_ui_pos:
-                                print(f"Screen {screen.region}: Completion UI found and clicked")
-                                pyautogui.click(completion_ui_pos[0], completion_ui_pos[1])
+                                log.info(f"Screen {screen.region}: Completion UI found and clicked")
+                                inputs.click(completion_ui_pos[0], completion_ui_pos[1])
                                 completion_found[id(screen)] = True
 
                     if all(completion_found.values()):
@@ -402,11 +458,11 @@ class MultiScreenChecker:
                         for x, y in positions_list:
                             final_x = x + random.randint(-3, 3)
                             final_y = y + random.randint(-3, 3)
-                            pyautogui.click(final_x, final_y)
+                            inputs.click(final_x, final_y)
                             time.sleep(0.2)
-                            keyboard.press_and_release('y')
+                            inputs.key_press('y')
                             time.sleep(0.2)
-                            keyboard.press_and_release('y')
+                            inputs.key_press('y')
 
                         time.sleep(10)
                         for screen_info in self.screens:
@@ -416,48 +472,144 @@ class MultiScreenChecker:
 
                     time.sleep(11)
 
-    def check_ui_state_with_samples(self, screen_info, samples=7, threshold=0.15, sample_interval=0.5):
+    def _party_ui_score(self, frame_gray: np.ndarray, screen_info: ScreenInfo) -> Optional[float]:
+        """공유 프레임에서 파티 UI 매칭 점수(TM_SQDIFF_NORMED 최소값) 계산"""
         if len(screen_info.party_ui_templates) == 0:
-            return False
-
-        min_vals = []  # max_vals 대신 min_vals 사용
-        template = cv2.imread(screen_info.party_ui_templates[0])
-        if template is None:
-            return False
-
-        for i in range(samples):
-            screen_img = pyautogui.screenshot(region=screen_info.region)
-            match_result = cv2.matchTemplate(
-                cv2.cvtColor(np.array(screen_img), cv2.COLOR_RGB2GRAY),
-                cv2.cvtColor(template, cv2.COLOR_BGR2GRAY),
-                cv2.TM_SQDIFF_NORMED
-            )
-            min_val, _, _, _ = cv2.minMaxLoc(match_result)
-            min_vals.append(min_val)
-            print(f"Screen {screen_info.region}: Sample {i + 1} match = {min_val:.4f}")
-
-            if min_val < threshold:  # threshold보다 작으면 매칭 성공
-                print(f"Screen {screen_info.region}: Match found below threshold")
-                return True
-
-            time.sleep(sample_interval)
-
-        print(f"Screen {screen_info.region}: Best match = {min(min_vals):.4f}")
-        return False
+            return None
+        template_gray = self._get_template_gray(screen_info.party_ui_templates[0])
+        if template_gray is None:
+            return None
+        match_result = cv2.matchTemplate(self._crop(frame_gray, screen_info.region), template_gray,
+                                         cv2.TM_SQDIFF_NORMED)
+        min_val, _, _, _ = cv2.minMaxLoc(match_result)
+        return min_val
+
+    def _party_ui_scores(self, frame_gray: np.ndarray, screens: List[ScreenInfo],
+                         dispatch: str = 'pool') -> List[Optional[float]]:
+        """
+        화면별 파티 UI 점수를 병렬로 계산.
+        dispatch='pool': 상시 워커 풀, 'threads': 호출마다 화면별 Thread 생성 (이전 방식, 비교 측정용)
+        """
+        if dispatch == 'pool':
+            return list(self._executor.map(lambda scr: self._party_ui_score(frame_gray, scr), screens))
+        scores: List[Optional[float]] = [None] * len(screens)
+
+        def _score(index: int, screen: ScreenInfo):
+            scores[index] = self._party_ui_score(frame_gray, screen)
+
+        threads = [Thread(target=_score, args=(i, screen)) for i, screen in enumerate(screens)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return scores
+
+    def check_party_ui_batch(self, screens: List[ScreenInfo], samples=7, threshold=0.15,
+                             sample_interval=0.5, dispatch: str = 'pool') -> List[bool]:
+        """
+        여러 화면의 파티 UI를 동시에 샘플링.
+        샘플마다 전체 화면을 한 번만 캡처하고, 상시 워커 풀에서 화면별 매칭을 수행합니다 (dispatch: _party_ui_scores).
+        """
+        results = {id(screen): False for screen in screens}
+        best_vals = {id(screen): None for screen in screens}
+        pending = [screen for screen in screens if screen.party_ui_templates]
+
+        def _sample_once():
+            frame_gray = self._grab_frame_gray()
+            scores = self._party_ui_scores(frame_gray, pending, dispatch)
+            for screen, min_val in zip(list(pending), scores):
+                if min_val is None:
+                    pending.remove(screen)
+                    continue
+                if best_vals[id(screen)] is None or min_val < best_vals[id(screen)]:
+                    best_vals[id(screen)] = min_val
+                if min_val < threshold:  # threshold보다 작으면 매칭 성공
+                    log.info(f"Screen {screen.region}: Match found below threshold ({min_val:.4f})")
+                    results[id(screen)] = True
+                    pending.remove(screen)
+            return not pending
+
+        wait_for(_sample_once, timeout=samples * sample_interval,
+                 poll_policy=PollPolicy(initial_interval=0.1, max_interval=sample_interval, backoff=1.5),
+                 label="MSC.PARTY_UI")
+
+        for screen in pending:
+            if best_vals[id(screen)] is not None:
+                log.info(f"Screen {screen.region}: Best match = {best_vals[id(screen)]:.4f}")
+        return [results[id(screen)] for screen in screens]
 
+    def check_ui_state_with_samples(self, screen_info, samples=7, threshold=0.15, sample_interval=0.5):
+        return self.check_party_ui_batch([screen_info], samples, threshold, sample_interval)[0]
+
+    # ========================================================================
+    # 사이클 측정
+    # ========================================================================
+    def _record_cycle(self, elapsed: float):
+        with self._stats_lock:
+            stats = self.cycle_stats
+            stats['cycles'] += 1
+            stats['total_time'] += elapsed
+            stats['max_time'] = max(stats['max_time'], elapsed)
+            report = stats['cycles'] % 10 == 0
+        if report:
+            self.print_cycle_stats()
+
+    def print_cycle_stats(self):
+        with self._stats_lock:
+            stats = dict(self.cycle_stats)
+        if stats['cycles'] == 0:
+            return
+        avg_ms = stats['total_time'] / stats['cycles'] * 1000
+        log.info(f"Party check cycles: {stats['cycles']}, avg {avg_ms:.1f}ms, "
+              f"max {stats['max_time'] * 1000:.1f}ms, frames captured {stats['frames']}")
+
+    def measure_dispatch_overhead(self, cycles: int = 30) -> dict:
+        """
+        실제 파티 체크 한 사이클(전체 캡처 1회 + 화면별 파티 UI 매칭)의 지연을
+        사이클마다 Thread를 새로 만드는 방식과 상시 워커 풀로 비교 (등록된 화면 / 템플릿 / 입력 백엔드 그대로)
+        """
+        screens = [screen for screen in self.screens if screen.party_ui_templates]
+        if not screens:
+            log.warning("No screens with party UI templates - nothing to measure")
+            return {}
+        self.preload_templates()
+
+        result = {}
+        for dispatch in ('threads', 'pool'):
+            # threshold < 0: 매칭 성공으로 끝나지 않게 해 매 사이클 모든 화면을 정확히 한 번 샘플링
+            self.check_party_ui_batch(screens, samples=1, threshold=-1.0, sample_interval=0.0, dispatch=dispatch)
+            timings = []
+            for _ in range(cycles):
+                start = time.perf_counter()
+                self.check_party_ui_batch(screens, samples=1, threshold=-1.0, sample_interval=0.0, dispatch=dispatch)
+                timings.append(time.perf_counter() - start)
+            timings.sort()
+            result[dispatch] = {
+                'avg_ms': sum(timings) / len(timings) * 1000,
+                'p50_ms': timings[len(timings) // 2] * 1000,
+                'max_ms': timings[-1] * 1000,
+            }
+            log.info(f"Party check cycle ({len(screens)} screens, {dispatch}): avg {result[dispatch]['avg_ms']:.2f}ms, "
+                     f"p50 {result[dispatch]['p50_ms']:.2f}ms, max {result[dispatch]['max_ms']:.2f}ms")
+        return result
+
+    def shutdown(self):
+        self.print_cycle_stats()
+        self._executor.shutdown(wait=False)
 
     def run(self):
         countdown_time = 7
         for i in range(countdown_time, 0, -1):
-            print(f"Starting in {i} seconds...")
+            log.info(f"Starting in {i} seconds...")
             time.sleep(1)
 
-        print("Monitoring started... Press 'p' to stop")
+        self.preload_templates()
+        log.info("Monitoring started... Press 'p' to stop")
 
         try:
             while self.running:
-                if keyboard.is_pressed('p'):
-                    print("\nStop key pressed. Shutting down...")
+                if inputs.is_pressed('p'):
+                    log.info("\nStop key pressed. Shutting down...")
                     self.running = False
                     break
 
@@ -470,15 +622,15 @@ class MultiScreenChecker:
 
                     if self.check_screen(screen):
                         self.handle_screen(screen)
-                        print(f"Screen at region {screen.region} is sleeping. Attempting to wake...")
+                        log.info(f"Screen at region {screen.region} is sleeping. Attempting to wake...")
                         all_awake = False
                     else:
-                        print(f"Screen at region {screen.region} is awake.")
+                        log.info(f"Screen at region {screen.region} is awake.")
 
                 # 2단계: UI 상호작용
                 if all_awake and self.running:
                     if not self.all_awake_message_printed:
-                        print("All screens are awake. Proceeding with additional UI interactions.")
+                        log.info("All screens are awake. Proceeding with additional UI interactions.")
                         self.all_awake_message_printed = True
 
                     # UI 상호작용 실행
@@ -493,14 +645,14 @@ class MultiScreenChecker:
                                         for screen in self.screens)
 
                     if all_completed:
-                        print("모든 화면의 작업이 완료되었습니다.")
+                        log.info("모든 화면의 작업이 완료되었습니다.")
                         self.perform_click_sequence()
                         time.sleep(12)
-                        print("\nStarting map sequence...")
+                        log.info("\nStarting map sequence...")
                         self.situate_at_the_scene()  # 모든 screen을 한번에 전달
 
                         time.sleep(12)
-                        print("\nStarting repetitive party check...")
+                        log.info("\nStarting repetitive party check...")
                         self.repetitive_party_check()
                         self.running = False
 
@@ -508,13 +660,14 @@ class MultiScreenChecker:
 
                 else:
                     self.all_awake_message_printed = False
-                    print("Not all screens are awake. Continuing to check...")
+                    log.info("Not all screens are awake. Continuing to check...")
                     time.sleep(1)
 
         except KeyboardInterrupt:
-            print("\nKeyboard interrupt detected. Exiting program...")
+            log.info("\nKeyboard interrupt detected. Exiting program...")
         finally:
-            print("Monitoring stopped.")
+            self.shutdown()
+            log.info("Monitoring stopped.")
 
 if __name__ == "__main__":
     checker = MultiScreenChecker(max_attempts=5)
@@ -638,4 +791,7 @@ if __name__ == "__main__":
     )
 
     # Add other screens similarly
-    checker.run()
+    if "--measure-dispatch" in sys.argv:
+        checker.measure_dispatch_overhead()
+    else:
+        checker.run()
@@ -2,6 +2,9 @@ import sys
 import os
 from pathlib import Path
 import time
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 # --- 경로 설정 시작 ---
 # 이 main.py 파일의 위치를 기준으로 프로젝트 루트 경로 계산
@@ -30,14 +33,14 @@ try:
     # 프로젝트 루트부터의 전체 경로를 사용
     from Orchestrator.NightCrows.Mail_opener.src.core.opener import MailOpener
 except ImportError as e:
-    print(f"Error importing MailOpener: {e}")
-    print(f"Current sys.path: {sys.path}")
-    print("Please check the folder structure and import path.")
+    log.error(f"Error importing MailOpener: {e}")
+    log.info(f"Current sys.path: {sys.path}")
+    log.info("Please check the folder structure and import path.")
     sys.exit(1) # 오류 발생 시 종료
 
 
 if __name__ == "__main__":
-    print("Starting MO1 (NightCrows Mail Opener)...")
+    log.info("Starting MO1 (NightCrows Mail Opener)...")
 
     # 화면 준비 과정 추가
     preparer = TaskScreenPreparer()
@@ -65,9 +68,9 @@ if __name__ == "__main__":
         collect_all_path = template_base_path / config['open']
 
         if not mail_icon_path.exists():
-            print(f"Warning: Mail icon template not found for {config['id']} at {mail_icon_path}")
+            log.warning(f"Mail icon template not found for {config['id']} at {mail_icon_path}")
         if not collect_all_path.exists():
-            print(f"Warning: Collect all template not found for {config['id']} at {collect_all_path}")
+            log.warning(f"Collect all template not found for {config['id']} at {collect_all_path}")
 
         # MailOpener는 screen_id만 받도록 수정하거나, 여기서 region 정보를 직접 넘겨야 함
         # 우선 기존 add_screen 인터페이스 유지
@@ -76,23 +79,21 @@ if __name__ == "__main__":
             mail_icon=str(mail_icon_path),
             collect_all=str(collect_all_path)
         )
-        print(f"Added screen config for {config['id']}")
+        log.info(f"Added screen config for {config['id']}")
 
     # 5초 카운트다운 (사용자 준비 시간)
     countdown_time = 5
-    print(f"--- MO1 will start in {countdown_time} seconds. Prepare NightCrows screens. ---")
+    log.info(f"--- MO1 will start in {countdown_time} seconds. Prepare NightCrows screens. ---")
     for i in range(countdown_time, 0, -1):
-        print(f"{i}...")
+        log.info(f"{i}...")
         time.sleep(1)
 
     # 메일 열기 실행
-    print("Running mail opening process...")
+    log.info("Running mail opening process...")
     try:
         mo.run()
-        print("MO1 process completed successfully.")
+        log.info("MO1 process completed successfully.")
         sys.exit(0) # 정상 종료
     except Exception as e:
-        print(f"An error occurred during MO1 execution: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception(f"An error occurred during MO1 execution: {e}")
         sys.exit(1) # 비정상 종료
\ No newline at end of file
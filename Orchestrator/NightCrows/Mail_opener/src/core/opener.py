@@ -1,12 +1,14 @@
 from dataclasses import dataclass
 import cv2
 import numpy as np
-import pyautogui
-import keyboard
-import time
 from typing import List
 from dataclasses import dataclass
 from Orchestrator.NightCrows.utils.screen_info import SCREEN_REGIONS, FIXED_UI_COORDS
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 @dataclass
@@ -32,7 +34,7 @@ class MailOpener:
     def find_and_click(self, screen: Screen, template_path: str) -> bool:
         """템플릿 매칭으로 요소를 찾아 클릭"""
         try:
-            screenshot = pyautogui.screenshot(region=screen.region)
+            screenshot = inputs.screenshot(region=screen.region)
             template = cv2.imread(template_path)
 
             if template is None:
@@ -49,7 +51,7 @@ class MailOpener:
                 center_x = screen.region[0] + max_loc[0] + template_w // 2
                 center_y = screen.region[1] + max_loc[1] + template_h // 2
 
-                pyautogui.click(
+                inputs.click(
                     center_x + np.random.randint(-2, 3),
                     center_y + np.random.randint(-2, 3)
                 )
@@ -58,7 +60,7 @@ class MailOpener:
             return False
 
         except Exception as e:
-            print(f"Error in find_and_click: {e}")
+            log.error(f"Error in find_and_click: {e}")
             return False
 
     def click_fixed_coord(self, screen: Screen, coord_key: str) -> bool:
@@ -70,8 +72,8 @@ class MailOpener:
 
             # 해당 화면의 고정 UI 좌표 정보 가져오기
             if screen.screen_id not in FIXED_UI_COORDS or coord_key not in FIXED_UI_COORDS[screen.screen_id]:
-                print(
-                    f"Error: Fixed coordinate '{coord_key}' not defined for screen '{screen.screen_id}' in screen_info.py")
+                log.error(
+                    f"Fixed coordinate '{coord_key}' not defined for screen '{screen.screen_id}' in screen_info.py")
                 return False
 
             relative_coords = FIXED_UI_COORDS[screen.screen_id][coord_key]  # 예: (550, 50)
@@ -84,51 +86,51 @@ class MailOpener:
             # 계산된 절대 좌표 클릭 (약간의 랜덤 오프셋 추가 가능)
             click_x = absolute_x + np.random.randint(-1, 2)
             click_y = absolute_y + np.random.randint(-1, 2)
-            pyautogui.click(click_x, click_y)
-            print(f"Clicked fixed coord '{coord_key}' for screen {screen.screen_id} at ({click_x}, {click_y})")
+            inputs.click(click_x, click_y)
+            log.info(f"Clicked fixed coord '{coord_key}' for screen {screen.screen_id} at ({click_x}, {click_y})")
             return True
 
         except Exception as e:
-            print(f"Error in click_fixed_coord: {e}")
+            log.error(f"Error in click_fixed_coord: {e}")
             return False
 
     def process_screen(self, screen: Screen):
         """한 화면의 메일 수집 처리"""
-        print(f"Processing screen: {screen.screen_id}")
+        log.info(f"Processing screen: {screen.screen_id}")
 
         # 0. (추가됨) 메인 메뉴(三) 버튼 클릭
-        print("Clicking main menu button...")
+        log.info("Clicking main menu button...")
         if self.click_fixed_coord(screen, 'main_menu_button'):
-            time.sleep(1.0)  # 메뉴가 열릴 때까지 잠시 대기 (시간 조절 필요)
+            clock.sleep(1.0)  # 메뉴가 열릴 때까지 잠시 대기 (시간 조절 필요)
 
             # 1. 메일 아이콘 클릭
-            print("Finding and clicking mail icon...")
+            log.info("Finding and clicking mail icon...")
             if self.find_and_click(screen, screen.mail_icon):
-                time.sleep(0.5)
+                clock.sleep(0.5)
 
                 # 2. 모두받기 버튼 클릭
-                print("Finding and clicking collect all button...")
+                log.info("Finding and clicking collect all button...")
                 if self.find_and_click(screen, screen.collect_all):
-                    time.sleep(0.5)
+                    clock.sleep(0.5)
 
                     # 3. ESC 두 번 입력
-                    print("Closing mail window with ESC...")
-                    keyboard.press_and_release('esc')
-                    time.sleep(0.3)
-                    keyboard.press_and_release('esc')
-                    print(f"Screen {screen.screen_id} processed.")
+                    log.info("Closing mail window with ESC...")
+                    inputs.key_press('esc')
+                    clock.sleep(0.3)
+                    inputs.key_press('esc')
+                    log.info(f"Screen {screen.screen_id} processed.")
                 else:
-                    print(f"Collect all button not found on screen {screen.screen_id}. Closing menu.")
+                    log.info(f"Collect all button not found on screen {screen.screen_id}. Closing menu.")
                     # 모두 받기 실패 시에도 메뉴는 닫도록 ESC 추가
-                    keyboard.press_and_release('esc')
-                    time.sleep(0.3)
-                    keyboard.press_and_release('esc')
+                    inputs.key_press('esc')
+                    clock.sleep(0.3)
+                    inputs.key_press('esc')
 
     def run(self):
         """모든 화면 처리"""
         for screen in self.screens:
             self.process_screen(screen)
-            time.sleep(0.5)  # 화면 간 딜레이
+            clock.sleep(0.5)  # 화면 간 딜레이
 
 
 if __name__ == "__main__":
@@ -10,6 +10,9 @@ SM1 v3 리모델링 설정 (제너레이터 '상황반장' 아키텍처)
 from enum import Enum, auto
 from typing import Generator, Dict, Any, Optional
 from Orchestrator.NightCrows.Combat_Monitor.config.srm_config import ScreenState
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 
@@ -44,7 +47,7 @@ def policy_connection_error(screen: dict) -> Generator[Dict[str, Any], Any, None
     [상황반장: 연결 오류]
     v1의 'detect_and_click' (retry 3회) 로직을 번역합니다.
     """
-    print(f"INFO: [{screen['screen_id']}] 상황반장: '연결 오류' 접수. 3회 확인 시도.")
+    log.info(f"[{screen['screen_id']}] 상황반장: '연결 오류' 접수. 3회 확인 시도.")
 
     # v1의 'retry_config': max_attempts: 3, retry_delay: 2.5
     for attempt in range(1, 4):  # 1, 2, 3
@@ -55,7 +58,7 @@ def policy_connection_error(screen: dict) -> Generator[Dict[str, Any], Any, None
         }
 
         if pos:
-            print(f"INFO: [{screen['screen_id']}] 연결 오류 확인 버튼 클릭 성공.")
+            log.info(f"[{screen['screen_id']}] 연결 오류 확인 버튼 클릭 성공.")
             return  # 성공! 제너레이터 종료 (-> 'complete' 전이)
 
         # 실패 시 2.5초 대기 후 다음 시도
@@ -70,7 +73,7 @@ def policy_client_crashed(screen: dict) -> Generator[Dict[str, Any], Any, None]:
     [상황반장: 클라이언트 크래시]
     APP_ICON 클릭 후 실제 실행 여부(아이콘 소멸 여부)를 검증하는 로직 추가
     """
-    print(f"INFO: [{screen['screen_id']}] 상황반장: '클라이언트 크래시' 접수. 3회 재시작 시도.")
+    log.info(f"[{screen['screen_id']}] 상황반장: '클라이언트 크래시' 접수. 3회 재시작 시도.")
 
     # v1의 'retry_config': max_attempts: 3
     for attempt in range(1, 4):
@@ -81,7 +84,7 @@ def policy_client_crashed(screen: dict) -> Generator[Dict[str, Any], Any, None]:
         }
 
         if pos:
-            print(f"INFO: [{screen['screen_id']}] 앱 아이콘 클릭 시도({attempt}). 10초 후 실행 여부 검증...")
+            log.info(f"[{screen['screen_id']}] 앱 아이콘 클릭 시도({attempt}). 10초 후 실행 여부 검증...")
 
             # 2. 10초 대기 (앱이 실행되어 화면을 덮거나 아이콘이 사라질 시간)
             yield {'operation': 'wait_duration', 'duration': 10.0}
@@ -96,11 +99,11 @@ def policy_client_crashed(screen: dict) -> Generator[Dict[str, Any], Any, None]:
 
             if not still_there:
                 # 아이콘을 못 찾음 -> 게임 창이 떴거나 아이콘이 사라짐 -> 성공!
-                print(f"INFO: [{screen['screen_id']}] 앱 실행 확인됨 (아이콘 사라짐).")
+                log.info(f"[{screen['screen_id']}] 앱 실행 확인됨 (아이콘 사라짐).")
                 return  # 성공적으로 제너레이터 종료 -> RESTARTING_APP 상태로 전이
 
             # 아이콘이 여전히 있음 -> 클릭이 씹혔거나 실행 실패 -> 루프 계속(재시도)
-            print(f"WARN: [{screen['screen_id']}] 앱 아이콘이 여전히 화면에 있습니다. 클릭 실패로 간주하고 재시도합니다.")
+            log.warning(f"[{screen['screen_id']}] 앱 아이콘이 여전히 화면에 있습니다. 클릭 실패로 간주하고 재시도합니다.")
 
         # 클릭 실패 또는 검증 실패 시 잠시 대기 후 재시도
         yield {'operation': 'wait_duration', 'duration': 2.0}
@@ -114,13 +117,13 @@ def policy_restarting_app(screen: dict) -> Generator[Dict[str, Any], Any, None]:
     [상황반장: 앱 재시작 대기]
     v1의 'time_based_wait' (expected_duration: 30.0) 로직을 번역합니다.
     """
-    print(f"INFO: [{screen['screen_id']}] 상황반장: '앱 재시작' 대기 (30초).")
+    log.info(f"[{screen['screen_id']}] 상황반장: '앱 재시작' 대기 (30초).")
 
     # v1의 'expected_duration': 30.0
     yield {'operation': 'wait_duration', 'duration': 30.0}
 
     # 30초 대기 후, 제너레이터가 정상 종료 (-> 'complete' 전이)
-    print(f"INFO: [{screen['screen_id']}] 앱 재시작 시간 경과. 'LOGIN_REQUIRED'로 이동.")
+    log.info(f"[{screen['screen_id']}] 앱 재시작 시간 경과. 'LOGIN_REQUIRED'로 이동.")
 
 
 def policy_logging_in(screen: dict) -> Generator[Dict[str, Any], Any, None]:
@@ -128,12 +131,12 @@ def policy_logging_in(screen: dict) -> Generator[Dict[str, Any], Any, None]:
     [상황반장: 로그인 진행 중]
     v1의 'time_based_wait' (expected_duration: 15.0) 로직을 번역합니다.
     """
-    print(f"INFO: [{screen['screen_id']}] 상황반장: '로그인' 대기 (15초).")
+    log.info(f"[{screen['screen_id']}] 상황반장: '로그인' 대기 (15초).")
 
     # v1의 'expected_duration': 15.0
     yield {'operation': 'wait_duration', 'duration': 15.0}
 
-    print(f"INFO: [{screen['screen_id']}] 로그인 시간 경과. 'RETURNING_TO_GAME'으로 이동.")
+    log.info(f"[{screen['screen_id']}] 로그인 시간 경과. 'RETURNING_TO_GAME'으로 이동.")
 
 
 def policy_returning_to_game(screen: dict) -> Generator[Dict[str, Any], Any, None]:
@@ -154,10 +157,10 @@ def policy_returning_to_game(screen: dict) -> Generator[Dict[str, Any], Any, Non
     my_char_name = party_config.get('character_names', {}).get(screen_id)
 
     if not my_char_name:
-        print(f"WARN: [{screen_id}] 캐릭터 이름 설정이 없습니다. 파티 초대가 실패할 수 있습니다.")
+        log.warning(f"[{screen_id}] 캐릭터 이름 설정이 없습니다. 파티 초대가 실패할 수 있습니다.")
         my_char_name = "Unknown"
 
-    print(f"INFO: [{screen_id}] 게임 로딩 대기 및 정밀 컨텍스트 분석 시작")
+    log.info(f"[{screen_id}] 게임 로딩 대기 및 정밀 컨텍스트 분석 시작")
 
     # 2. 로딩 대기 및 초기화 (공통 수행)
     yield {'operation': 'wait_duration', 'duration': 15.0}  # 로딩 대기
@@ -185,14 +188,14 @@ def policy_returning_to_game(screen: dict) -> Generator[Dict[str, Any], Any, Non
         pos = yield {'operation': 'check_template', 'template': template_name}
         if not pos:
             party_is_full = False
-            print(f"INFO: [{screen_id}] 파티원 슬롯 '{template_name}' 비어있음.")
+            log.info(f"[{screen_id}] 파티원 슬롯 '{template_name}' 비어있음.")
             break
 
     # =========================================================================
     # 🚀 분기 1: 파티원이 모두 있음 (최상의 시나리오)
     # =========================================================================
     if party_is_full:
-        print(f"INFO: [{screen_id}] 파티원 확인 완료. 마을 확인 건너뛰고 즉시 전투 재개.")
+        log.info(f"[{screen_id}] 파티원 확인 완료. 마을 확인 건너뛰고 즉시 전투 재개.")
 
         # 즉시 SRM에게 전투 재개 지시
         yield {
@@ -204,7 +207,7 @@ def policy_returning_to_game(screen: dict) -> Generator[Dict[str, Any], Any, Non
     # =========================================================================
     # 🔧 분기 2: 파티원이 없음 -> 초대 후 위치 판단
     # =========================================================================
-    print(f"INFO: [{screen_id}] 파티원 부족 -> {manager_screen}를 통해 파티 초대 로직 실행.")
+    log.info(f"[{screen_id}] 파티원 부족 -> {manager_screen}를 통해 파티 초대 로직 실행.")
 
     # ❌ [삭제] MANAGER_SCREEN = 'S5' (하드코딩 삭제)
     # 이제 상단에서 정의한 manager_screen 변수를 사용합니다.
@@ -252,7 +255,7 @@ def policy_returning_to_game(screen: dict) -> Generator[Dict[str, Any], Any, Non
             'template_name': 'PARTY_SEND_INVITE_BUTTON',
             'target_screen': manager_screen
         }
-        print(f"INFO: [{screen_id}] {manager_screen}에게 파티 초대 요청 보냄 완료.")
+        log.info(f"[{screen_id}] {manager_screen}에게 파티 초대 요청 보냄 완료.")
 
         # 7. 파티창 닫기 (L)
         yield {'operation': 'key_press', 'key': 'L', 'target_screen': manager_screen}
@@ -261,23 +264,23 @@ def policy_returning_to_game(screen: dict) -> Generator[Dict[str, Any], Any, Non
         # 8. (초대 수락 로직은 주석 처리된 상태 유지)
 
     except Exception as e:
-        print(f"ERROR: [{screen_id}] 파티 초대 시퀀스 실패: {e}. {manager_screen} UI 닫기 시도.")
+        log.error(f"[{screen_id}] 파티 초대 시퀀스 실패: {e}. {manager_screen} UI 닫기 시도.")
         # 실패 시 관리자 화면의 UI 닫기 시도
         yield {'operation': 'key_press', 'key': 'esc', 'target_screen': manager_screen}
         yield {'operation': 'wait_duration', 'duration': 1.0}
 
     # 5. 마을 여부 확인
-    print(f"INFO: [{screen_id}] 파티 초대 후 위치(마을/필드) 확인.")
+    log.info(f"[{screen_id}] 파티 초대 후 위치(마을/필드) 확인.")
     town_pos = yield {'operation': 'check_template', 'template': 'TOWN_ZONE_INDICATOR'}
 
     if town_pos:
-        print(f"INFO: [{screen_id}] 마을 감지됨 -> 정비 후 복귀(BUYING_POTIONS).")
+        log.info(f"[{screen_id}] 마을 감지됨 -> 정비 후 복귀(BUYING_POTIONS).")
         yield {
             'operation': 'set_shared_state',
             'state': ScreenState.BUYING_POTIONS
         }
     else:
-        print(f"INFO: [{screen_id}] 필드 감지됨(또는 마을 아님) -> 전투 재개(RESUME_COMBAT).")
+        log.info(f"[{screen_id}] 필드 감지됨(또는 마을 아님) -> 전투 재개(RESUME_COMBAT).")
         yield {
             'operation': 'set_shared_state',
             'state': ScreenState.RESUME_COMBAT
@@ -291,7 +294,7 @@ def policy_login_required(screen: dict) -> Generator[Dict[str, Any], Any, None]:
     2. 광고 팝업이 있다면 모두 닫기 (여러 개일 수 있음 -> Loop)
     3. 로그인 버튼 클릭
     """
-    print(f"INFO: [{screen['screen_id']}] 상황반장: '로그인 시퀀스' 시작.")
+    log.info(f"[{screen['screen_id']}] 상황반장: '로그인 시퀀스' 시작.")
 
     for attempt in range(1, 11):
         try:
@@ -319,14 +322,14 @@ def policy_login_required(screen: dict) -> Generator[Dict[str, Any], Any, None]:
 
                 if found_ad:
                     ad_close_count += 1
-                    print(f"INFO: [{screen['screen_id']}] {ad_close_count}번째 광고 팝업 닫음.")
+                    log.info(f"[{screen['screen_id']}] {ad_close_count}번째 광고 팝업 닫음.")
                     # 닫았으면 팝업 닫히는 애니메이션 & 다음 팝업 대기
                     yield {'operation': 'wait_duration', 'duration': 1.5}
                     # continue 되어 다시 while문 처음으로 -> 또 있는지 확인
                 else:
                     # 더 이상 광고가 발견되지 않음 -> 루프 탈출
                     if ad_close_count > 0:
-                        print(f"INFO: [{screen['screen_id']}] 모든 광고 팝업 제거 완료.")
+                        log.info(f"[{screen['screen_id']}] 모든 광고 팝업 제거 완료.")
                     break
             # ---------------------------------------------------------
             # ✅ [추가] 2.5단계: 로그인 전 재정비 (Buffer & Focus)
@@ -349,12 +352,12 @@ def policy_login_required(screen: dict) -> Generator[Dict[str, Any], Any, None]:
                 'template_name': 'LOGIN_BUTTON'
             }
 
-            print(f"INFO: [{screen['screen_id']}] 로그인 버튼 클릭 성공.")
+            log.info(f"[{screen['screen_id']}] 로그인 버튼 클릭 성공.")
             return  # 성공 시 제너레이터 종료
 
         except Exception as e:
             # 로그인 버튼을 못 찾았거나 중간에 문제 발생 시
-            print(f"WARN: [{screen['screen_id']}] 로그인 시도 {attempt} 실패: {e}")
+            log.warning(f"[{screen['screen_id']}] 로그인 시도 {attempt} 실패: {e}")
             yield {'operation': 'wait_duration', 'duration': 3.0}
 
     raise Exception("Failed to login after 10 attempts")
@@ -436,7 +439,17 @@ STATE_POLICY_MAP = {
 SM_CONFIG = {
     'timing': {
         'check_interval': 5.0,
-        'default_timeout': 60.0
+        'default_timeout': 60.0,
+        # 상태별 폴링 간격 (초). 없는 상태(NORMAL, SRM 담당 상태)는 check_interval
+        'state_intervals': {
+            SystemState.CONNECTION_ERROR: 1.0,
+            SystemState.CLIENT_CRASHED: 1.0,
+            SystemState.RESTARTING_APP: 2.0,
+            SystemState.LOGIN_REQUIRED: 1.0,
+            SystemState.LOGGING_IN: 1.0,
+            SystemState.RETURNING_TO_GAME: 1.0,
+        },
+        'poll_interval': 0.5  # 대기형 지시(wait_for_template) 중인 화면
     },
     'target_screens': {
         'included': ['S1', 'S2', 'S3', 'S4'],
@@ -512,27 +525,27 @@ def validate_config() -> bool:
         required_sections = ['timing', 'target_screens', 'io_policy', 'game_settings']
         for section in required_sections:
             if section not in SM_CONFIG:
-                print(f"오류: 필수 설정 섹션 '{section}'이 없습니다.")
+                log.error(f"오류: 필수 설정 섹션 '{section}'이 없습니다.")
                 return False
         if SM_CONFIG['timing']['check_interval'] <= 0:
-            print("오류: check_interval은 0보다 커야 합니다.")
+            log.error("오류: check_interval은 0보다 커야 합니다.")
             return False
         if not SM_CONFIG['target_screens']['included']:
-            print("오류: 대상 화면이 비어있습니다.")
+            log.error("오류: 대상 화면이 비어있습니다.")
             return False
 
-        print("✅ SM_CONFIG 유효성 검증 완료")
+        log.info("✅ SM_CONFIG 유효성 검증 완료")
 
         # [v3] 제너레이터 맵 검증
         if not STATE_POLICY_MAP or not DETECTION_POLICY_MAP:
-            print("오류: v3 정책 맵(STATE_POLICY_MAP, DETECTION_POLICY_MAP)이 비어있습니다.")
+            log.error("오류: v3 정책 맵(STATE_POLICY_MAP, DETECTION_POLICY_MAP)이 비어있습니다.")
             return False
 
-        print("✅ v3 제너레이터 정책 맵 로드됨")
+        log.info("✅ v3 제너레이터 정책 맵 로드됨")
         return True
 
     except Exception as e:
-        print(f"오류: 설정 검증 중 예외 발생 - {e}")
+        log.error(f"오류: 설정 검증 중 예외 발생 - {e}")
         return False
 
 
@@ -541,8 +554,8 @@ def validate_config() -> bool:
 # =============================================================================
 
 if __name__ == "__main__":
-    print("🎯 SM1 v3 '상황반장' 설정 테스트")
-    print("=" * 60)
+    log.info("🎯 SM1 v3 '상황반장' 설정 테스트")
+    log.info("=" * 60)
 
     config_valid = validate_config()
 
@@ -552,22 +565,22 @@ if __name__ == "__main__":
         #         ")
 
         # ✅ 수정된 부분 (들여쓰기 수정)
-        print("\n[v3 감지 전용 상태 (DetectOnly)]:")
+        log.info("\n[v3 감지 전용 상태 (DetectOnly)]:")
         for state, policy in get_detection_policy().items():
-            print(f"  - {state.name} (감지 템플릿: {len(policy.get('targets', []))}개)")
+            log.info(f"  - {state.name} (감지 템플릿: {len(policy.get('targets', []))}개)")
 
         # ❌ 잘못된 부분 (들여쓰기 한 칸 많음)
         #   print("\n[v3 상황반장 상태 (Generator)]:
         #         ")
 
         # ✅ 수정된 부분 (들여쓰기 수정)
-        print("\n[v3 상황반장 상태 (Generator)]:")
+        log.info("\n[v3 상황반장 상태 (Generator)]:")
         for state, policy in get_state_policies().items():
             gen_name = policy.get('generator', lambda: None).__name__
-            print(f"  - {state.name} -> {gen_name}")
+            log.info(f"  - {state.name} -> {gen_name}")
 
     else:
-        print("❌ 설정 검증 실패!")
+        log.error("❌ 설정 검증 실패!")
 
-    print("\n" + "=" * 60)
-    print("sm_config.py (v3) 테스트 완료")
\ No newline at end of file
+    log.info("\n" + "=" * 60)
+    log.info("sm_config.py (v3) 테스트 완료")
\ No newline at end of file
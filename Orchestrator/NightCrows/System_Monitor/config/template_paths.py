@@ -7,6 +7,9 @@ SystemMonitor 템플릿 경로 정의
 """
 
 import os
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 # =============================================================================
 # 📁 중앙 템플릿 베이스 경로
@@ -127,7 +130,7 @@ def get_template(screen_id: str, template_name: str) -> str:
     if screen_id in TEMPLATES and template_name in TEMPLATES[screen_id]:
         return TEMPLATES[screen_id][template_name]
 
-    print(f"경고: SM1 템플릿을 찾을 수 없음 - Screen ID: {screen_id}, Template Name: {template_name}")
+    log.warning(f"경고: SM1 템플릿을 찾을 수 없음 - Screen ID: {screen_id}, Template Name: {template_name}")
     return None
 
 
@@ -146,13 +149,13 @@ def verify_template_paths() -> bool:
                 missing_templates.append(f"{screen_id}.{template_name}: {path}")
 
     if missing_templates:
-        print("경고: 다음 SM1 템플릿 파일이 존재하지 않습니다:")
+        log.warning("경고: 다음 SM1 템플릿 파일이 존재하지 않습니다:")
         for template in missing_templates:
-            print(f"  - {template}")
-        print("템플릿 이미지 파일을 해당 경로에 생성하거나 경로를 수정하세요.")
+            log.info(f"  - {template}")
+        log.info("템플릿 이미지 파일을 해당 경로에 생성하거나 경로를 수정하세요.")
         return False
 
-    print("모든 SM1 템플릿 경로가 유효합니다.")
+    log.info("모든 SM1 템플릿 경로가 유효합니다.")
     return True
 
 
@@ -185,11 +188,11 @@ def get_available_screens() -> list:
 
 if __name__ == "__main__":
     # 템플릿 경로 유효성 검사 실행 (직접 실행할 때만)
-    print("SM1 템플릿 경로 유효성 검사를 시작합니다...")
+    log.info("SM1 템플릿 경로 유효성 검사를 시작합니다...")
     verify_template_paths()
 
-    print(f"\n지원 화면: {get_available_screens()}")
+    log.info(f"\n지원 화면: {get_available_screens()}")
 
     # 예시: S1 화면의 연결 확인 버튼 템플릿 경로 확인
     test_template = get_template('S1', 'CONNECTION_CONFIRM_BUTTON')
-    print(f"\nS1 연결 확인 버튼 템플릿: {test_template}")
\ No newline at end of file
+    log.info(f"\nS1 연결 확인 버튼 템플릿: {test_template}")
\ No newline at end of file
@@ -6,13 +6,18 @@ System Monitor 브릿지 (v3 제너레이터 '상황반장' 아키텍처)
 - monitor는 제너레이터의 '지시서'를 받아 IO 스케줄러에 요청
 """
 
-import time
 import threading
 from typing import Dict, List, Optional, Any, Tuple
-import pyautogui
+from Orchestrator.src.core.instruction_vm import InstructionError, OpcodeTable, PolicyRunner, StepResult
 from Orchestrator.src.core.io_scheduler import Priority
+from Orchestrator.src.core.shared_state_store import SharedStateStore
+from Orchestrator.src.core.tick_scheduler import TickScheduler
+from Orchestrator.src.core.checkpoint import restored_states
+from Orchestrator.src.core.watchdog import WATCHDOG
+from Orchestrator.src.utils.profiler import PROFILER
 from Orchestrator.NightCrows.utils.image_utils import set_focus
-from Orchestrator.NightCrows.utils.screen_info import SCREEN_REGIONS
+from Orchestrator.NightCrows.utils.screen_info import SCREEN_ALIASES, SCREEN_REGIONS
+from Orchestrator.src.core.screen_layout import screen_ids
 
 # ❗️ [신규] SRM 상태 확인을 위해 ScreenState 임포트
 from Orchestrator.NightCrows.Combat_Monitor.config.srm_config import ScreenState
@@ -27,6 +32,11 @@ from Orchestrator.NightCrows.System_Monitor.config.sm_config import (
     get_detection_policy,
     validate_config
 )
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class SystemMonitor:
@@ -44,37 +54,43 @@ class SystemMonitor:
 
         self.monitor_id = monitor_id
         self.vd_name = vd_name
+        self.spans = PROFILER.for_monitor(monitor_id)  # 틱 구간 계측 (비활성 시 no-op)
 
         # ❗️ [신규] 공유 상태 저장소 저장
-        self.shared_states = shared_states if shared_states is not None else {}
+        self.shared_states = shared_states if shared_states is not None else SharedStateStore(vd_name)
 
         self.local_config = SM_CONFIG
         self.exception_policies = SM_EXCEPTION_POLICIES
 
         self.state_policy_map = get_state_policies()
         self.detection_policy_map = get_detection_policy()
+        self.opcodes = self._build_opcode_table()
+        self.ticks = TickScheduler(monitor_id)  # 화면별 데드라인 틱 (timing['state_intervals'])
+        self._pending_checkpoint = None  # restore_checkpoint → 시작 시 apply_warm_start
 
         self.screens = {}
         self._initialize_screens()
 
-        print(f"INFO: [{self.monitor_id}] SystemMonitor Bridge initialized (Generator Model)")
-        print(f"INFO: [{self.monitor_id}] Target screens: {list(self.screens.keys())}")
+        log.info(f"[{self.monitor_id}] SystemMonitor Bridge initialized (Generator Model)")
+        log.info(f"[{self.monitor_id}] Target screens: {list(self.screens.keys())}")
 
     def _initialize_screens(self):
-        """screen_info.py 기반으로 화면 객체들 생성 (동일)"""
-        target_screens = self.local_config['target_screens']['included']
-        for screen_id in target_screens:
-            self.add_screen(screen_id)
+        """screen_info.py 기반으로 화면 객체들 생성 (배치 파일로 추가한 화면은 따라 한 화면이 대상이면 포함)"""
+        targets = self.local_config['target_screens']
+        included, excluded = set(targets['included']), set(targets.get('excluded', ()))
+        for screen_id in screen_ids(SCREEN_REGIONS):
+            base = SCREEN_ALIASES.get(screen_id, screen_id)
+            if screen_id in included or (base in included and screen_id not in excluded):
+                self.add_screen(screen_id)
 
     def add_screen(self, screen_id: str) -> bool:
         """화면 객체 생성 (v3 제너레이터 상태 필드 추가)"""
         if screen_id not in SCREEN_REGIONS:
-            print(f"WARN: [{self.monitor_id}] Unknown screen_id: {screen_id}")
+            log.warning(f"[{self.monitor_id}] Unknown screen_id: {screen_id}")
             return False
 
         # ❗️ [신규] 공유 상태 초기값 등록 (SRM이 먼저 등록했을 수도 있음)
-        if screen_id not in self.shared_states:
-            self.shared_states[screen_id] = SystemState.NORMAL
+        self.shared_states.setdefault(screen_id, SystemState.NORMAL, source=self.monitor_id)
 
         screen_region = SCREEN_REGIONS[screen_id]
 
@@ -82,67 +98,165 @@ class SystemMonitor:
         self.screens[screen_id] = {
             'screen_id': screen_id,
             # 'current_state': SystemState.NORMAL,  <-- 삭제됨
-            'state_enter_time': time.time(),
+            'state_enter_time': clock.time(),
             'region': screen_region,
-            'current_generator': None,
-            'generator_wait_start_time': 0.0,
-            'generator_wait_timeout': 0.0,
-            'generator_last_yielded_value': None,
+            'runner': None,  # 진행 중인 제너레이터 정책 (PolicyRunner)
+            'resume_credit': 0.0,  # 웜 리스타트: 복원한 상태에서 이미 흐른 시간 (다음 정책의 선행 대기에서 차감)
         }
-        print(f"INFO: [{self.monitor_id}] Added screen {screen_id}")
+        log.info(f"[{self.monitor_id}] Added screen {screen_id}")
         return True
 
     # =========================================================================
     # 🔌 Orchestrator 인터페이스 (run_loop 수정됨)
     # =========================================================================
 
+    @property
+    def tick_interval(self) -> float:
+        return self.local_config['timing']['check_interval']
+
+    def screen_keys(self) -> List[str]:
+        return list(self.screens.keys())
+
     def run_loop(self, stop_event: threading.Event):
         """Orchestrator 스레드에서 실행되는 메인 루프 (v3 모델)"""
-        print(f"INFO: [{self.monitor_id}] Starting SystemMonitor bridge loop... (Generator Model)")
-        check_interval = self.local_config['timing']['check_interval']
+        log.info(f"[{self.monitor_id}] Starting SystemMonitor bridge loop... (Generator Model)")
+        self.apply_warm_start()
+
+        ticks = self.ticks
+        run = ticks.reset(self.screen_keys(), clock.time())  # 이 루프의 실행 세대 (워치독 재시작 시 교체)
+        versions = {}  # 화면 → 마지막으로 본 공유 상태 버전
 
         while not stop_event.is_set():
             try:
-                current_time = time.time()
+                # 데드라인이 지난 화면만 틱 (상태별 폴링 간격)
+                for screen_id in ticks.pop_due(clock.time()):
+                    started = clock.time()
+                    self.tick_screen(screen_id, started)
+                    if not ticks.schedule(screen_id, started, *self.next_tick_interval(screen_id), run=run):
+                        log.warning(f"[{self.monitor_id}] Stale run loop exiting (replaced after a watchdog restart)")
+                        return
+
+                # 다음 틱까지 대기하되, 다른 모니터(SRM)가 화면 상태를 바꾸면 바로 깨어나 그 화면을 당겨서 확인
+                seen = self.shared_states.global_version
+                self._wake_changed_screens(versions, clock.time())
+                with self.spans.span('sleep.loop'):
+                    self.shared_states.wait_for_change(
+                        seen, timeout=ticks.time_until_next(clock.time(), self.tick_interval), stop_event=stop_event)
+                if stop_event.is_set():
+                    break
+            except Exception as e:
+                log.error(f"[{self.monitor_id}] SystemMonitor loop exception: {e}")
+                self.handle_tick_error(e)
+                if clock.wait(stop_event, 5.0):
+                    break
+                run = ticks.reset(self.screen_keys(), clock.time())  # 예외 후에는 모든 화면을 바로 다시 확인
 
-                for screen_id, screen_obj in self.screens.items():
-                    # ❗️ [수정] 공유 상태 읽기
-                    current_state = self.shared_states.get(screen_id)
+        log.info(f"[{self.monitor_id}] SystemMonitor bridge loop stopped")
 
-                    # ❗️ [신규] 교통 정리: 내 담당(SystemState)이 아니면?
-                    if not isinstance(current_state, SystemState):
-                        # SRM 상태(ScreenState)라면 게임이 정상 동작 중이거나 전투 중임.
-                        # 하지만 SM은 '감시자'이므로 에러(팝업, 튕김) 감지는 계속 해야 함.
+    def _wake_changed_screens(self, versions: Dict[str, int], now: float):
+        """공유 상태가 다른 모니터에 의해 바뀐 화면은 다음 틱을 now로 당김 (versions 갱신)"""
+        for screen_id in self.screens:
+            record = self.shared_states.get_record(screen_id)
+            if record is None or versions.get(screen_id) == record.version:
+                continue
+            if screen_id in versions and record.source != self.monitor_id:
+                self.ticks.wake(screen_id, now)
+            versions[screen_id] = record.version
+
+    def checkpoint_state(self) -> Dict:
+        """진행 상황은 공유 상태(SystemState + 진입 시각)로 충분 - 제너레이터 내부는 저장할 수 없음"""
+        return {}
 
-                        # NORMAL 상태의 감지 로직만 빌려와서 실행 (상태 변경 없이 감지만 수행)
-                        # (감지되면 _handle_detect_only_state 내부에서 report_system_error 등을 통해 개입 시도)
-                        if SystemState.NORMAL in self.detection_policy_map:
-                            self._handle_detect_only_state(screen_obj, self.detection_policy_map[SystemState.NORMAL])
-                        continue
+    def restore_checkpoint(self, data: Dict, states: Dict, saved_at: float):
+        """체크포인트 보관 (적용은 시작 시 apply_warm_start)"""
+        self._pending_checkpoint = (states, saved_at)
+
+    def apply_warm_start(self):
+        """
+        저장된 SystemState(로그인 중 등)를 복원하고 정책을 처음부터 다시 시작하되, 선행 대기에는 이미 흐른 시간을 반영.
+        정책이 템플릿 대기로 화면을 다시 확인하므로 별도 확인 없이 복원 (NORMAL 감지가 계속 덮어씀)
+        """
+        if self._pending_checkpoint is None:
+            return
+        states, saved_at = self._pending_checkpoint
+        self._pending_checkpoint = None
+        now = clock.time()
+        restored = []
+        for screen_id, (state, since) in restored_states(states, SystemState).items():
+            screen_obj = self.screens.get(screen_id)
+            if screen_obj is None or state == SystemState.NORMAL:
+                continue
+            current = self.shared_states.get(screen_id)
+            if not self.shared_states.compare_and_set(screen_id, current, state, source=self.monitor_id,
+                                                      reason='checkpoint'):
+                continue
+            screen_obj['state_enter_time'] = since
+            screen_obj['resume_credit'] = max(0.0, now - since)
+            restored.append(f"{screen_id}={state.name}")
+        log.info(f"[{self.monitor_id}] Warm start ({now - saved_at:.0f}s old checkpoint): "
+                 f"{', '.join(restored) or 'no system states restored'}")
+
+    def tick_screen(self, screen_id: str, current_time: Optional[float] = None):
+        """화면 하나의 한 틱 (run_loop / asyncio 런타임 공용, 워치독 하트비트)"""
+        with WATCHDOG.activity(self.monitor_id, screen_id):
+            self._tick_screen(screen_id, current_time)
+
+    def _tick_screen(self, screen_id: str, current_time: Optional[float]):
+        screen_obj = self.screens[screen_id]
+        if current_time is None:
+            current_time = clock.time()
 
-                    # --- 이하 내 담당 상태(SystemState) 처리 ---
+        # ❗️ [수정] 공유 상태 읽기
+        current_state = self.shared_states.get(screen_id)
+
+        # ❗️ [신규] 교통 정리: 내 담당(SystemState)이 아니면?
+        if not isinstance(current_state, SystemState):
+            # SRM 상태(ScreenState)라면 게임이 정상 동작 중이거나 전투 중임.
+            # 하지만 SM은 '감시자'이므로 에러(팝업, 튕김) 감지는 계속 해야 함.
+
+            # NORMAL 상태의 감지 로직만 빌려와서 실행 (상태 변경 없이 감지만 수행)
+            # (감지되면 _handle_detect_only_state 내부에서 report_system_error 등을 통해 개입 시도)
+            if SystemState.NORMAL in self.detection_policy_map:
+                with self.spans.span('detect_only', screen_id):
+                    self._handle_detect_only_state(screen_obj, self.detection_policy_map[SystemState.NORMAL])
+            return
 
-                    if current_state in self.state_policy_map:
-                        policy = self.state_policy_map[current_state]
-                        self._run_generator_step(screen_obj, policy, current_time)
+        # --- 이하 내 담당 상태(SystemState) 처리 ---
 
-                    elif current_state in self.detection_policy_map:
-                        policy = self.detection_policy_map[current_state]
-                        self._handle_detect_only_state(screen_obj, policy)
-                    else:
-                        pass
+        if current_state in self.state_policy_map:
+            policy = self.state_policy_map[current_state]
+            with self.spans.span(f'policy.{current_state.name}', screen_id):
+                self._run_generator_step(screen_obj, policy, current_time)
 
-                if stop_event.wait(check_interval):
-                    break
-            except Exception as e:
-                print(f"ERROR: [{self.monitor_id}] SystemMonitor loop exception: {e}")
-                self._handle_exception_policy('state_machine_error')
-                time.sleep(5.0)
+        elif current_state in self.detection_policy_map:
+            policy = self.detection_policy_map[current_state]
+            with self.spans.span('detect', screen_id):
+                self._handle_detect_only_state(screen_obj, policy)
+        else:
+            pass
 
-        print(f"INFO: [{self.monitor_id}] SystemMonitor bridge loop stopped")
+    def next_tick_interval(self, screen_id: str) -> Tuple[float, str, float]:
+        """
+        방금 틱한 화면의 다음 틱까지 간격: 상태별 간격(없으면 check_interval), 대기형 지시 중이면 poll_interval,
+        wait_duration이면 끝나는 시각까지. (간격, 통계 라벨, 상태에 선언된 간격)
+        """
+        timing = self.local_config['timing']
+        state = self.shared_states.get(screen_id)
+        declared = timing['state_intervals'].get(state, timing['check_interval'])
+        label = getattr(state, 'name', str(state))
+        runner = self.screens[screen_id]['runner']
+        if runner is None:
+            return declared, label, declared
+        interval, waiting = runner.next_interval(declared, timing['poll_interval'])
+        return interval, f"{label}+wait" if waiting else label, declared
+
+    def handle_tick_error(self, error: Exception):
+        """틱 예외 처리 정책 (모든 화면 NORMAL 복귀)"""
+        self._handle_exception_policy('state_machine_error')
 
     def stop(self):
-        print(f"INFO: [{self.monitor_id}] SystemMonitor stopping...")
+        log.info(f"[{self.monitor_id}] SystemMonitor stopping...")
+        self.shared_states.wake_waiters()  # run_loop의 wait_for_change가 stop_event를 바로 확인
 
     # =========================================================================
     # 🎯 v3 상태머신 실행 엔진
@@ -167,7 +281,7 @@ class SystemMonitor:
             pos = self._detect_template(screen_obj, template_path=template_path)
 
             if pos:  # 템플릿을 찾았다면
-                print(f"INFO: [{screen_obj['screen_id']}] DetectOnly: '{template_name}' 발견.")
+                log.info(f"[{screen_obj['screen_id']}] DetectOnly: '{template_name}' 발견.")
 
                 # --- Orchestrator에게 오류 보고 및 확인 ---
                 is_false_positive = False
@@ -176,8 +290,8 @@ class SystemMonitor:
                     is_false_positive = self.orchestrator.report_system_error(self.monitor_id, screen_obj['screen_id'])
 
                 if is_false_positive:
-                    print(
-                        f"INFO: [{screen_obj['screen_id']}] Orchestrator confirmed False Positive. SM1 will NOT transition state.")
+                    log.info(
+                        f"[{screen_obj['screen_id']}] Orchestrator confirmed False Positive. SM1 will NOT transition state.")
                     return  # 상태 전이 중단
 
                 # (is_false_positive가 False인 경우에만 전이)
@@ -185,62 +299,24 @@ class SystemMonitor:
                 return  # 감지했으므로 루프 종료
 
     def _run_generator_step(self, screen_obj: dict, policy: dict, current_time: float):
-        """[v3] '제너레이터' 상태 처리기 (예: LOGGING_IN)"""
-
-        # 1. 대기 확인
-        if screen_obj['generator_wait_start_time'] > 0.0:
-            if current_time < screen_obj['generator_wait_start_time']:
-                return
-            else:
-                screen_obj['generator_wait_start_time'] = 0.0
-
-        if screen_obj['generator_wait_timeout'] > 0.0:
-            if current_time > screen_obj['generator_wait_timeout']:
-                screen_obj['generator_wait_timeout'] = 0.0
-                try:
-                    screen_obj['current_generator'].throw(Exception("Template Wait Timeout"))
-                except StopIteration:
-                    pass
-                except Exception:
-                    pass
-                return
-
-        # 2. 제너레이터 생성
-        if not screen_obj['current_generator']:
-            gen_func = policy['generator']
-            screen_obj['current_generator'] = gen_func(screen_obj)
-            screen_obj['generator_last_yielded_value'] = None
-
-        # 3. 제너레이터 실행
-        try:
-            # A. 실행 권한 부여
-            instruction = screen_obj['current_generator'].send(
-                screen_obj['generator_last_yielded_value']
-            )
-
-            # B. 지시사항 수행
-            try:
-                result_value = self._process_instruction(screen_obj, instruction)
-                screen_obj['generator_last_yielded_value'] = result_value
+        """[v3] '제너레이터' 상태 처리기 (예: LOGGING_IN) - 공용 실행기(PolicyRunner)로 한 틱 진행"""
+        runner = screen_obj['runner']
+        if runner is None:
+            runner = PolicyRunner(self.opcodes, policy['generator'](screen_obj), ctx=screen_obj,
+                                  credit=screen_obj['resume_credit'])
+            screen_obj['runner'] = runner
+            screen_obj['resume_credit'] = 0.0
 
-            except Exception as io_error:
-                print(f"WARN: [{screen_obj['screen_id']}] Instruction failed: {io_error}. Throwing to generator...")
-                recovery_instruction = screen_obj['current_generator'].throw(io_error)
-                result_value = self._process_instruction(screen_obj, recovery_instruction)
-                screen_obj['generator_last_yielded_value'] = result_value
+        result = runner.step(current_time)
 
-        except StopIteration:
+        if result is StepResult.COMPLETE:
             next_state = policy['transitions']['complete']
             self._transition_screen_to_state(screen_obj, next_state, "generator_complete")
 
-        except Exception as e:
-            print(f"ERROR: [{screen_obj['screen_id']}] Generator failed or unhandled error: {e}")
+        elif result is StepResult.FAILED:
+            log.error(f"[{screen_obj['screen_id']}] Generator failed or unhandled error: {runner.error}")
             next_state = policy['transitions']['fail']
-
-            if screen_obj['current_generator']:
-                screen_obj['current_generator'].close()
-                screen_obj['current_generator'] = None
-
+            screen_obj['runner'] = None
             self._transition_screen_to_state(screen_obj, next_state, "generator_failed")
 
         # =========================================================================
@@ -258,221 +334,199 @@ class SystemMonitor:
         """
         try:
             # 1. 누르기 (Press)
-            pyautogui.keyDown(key)
-            time.sleep(0.1)  # 0.1초 동안 확실히 누름 유지
+            inputs.vkey_down(key)
+            clock.sleep(0.1)  # 0.1초 동안 확실히 누름 유지
 
             # 2. 떼기 (Release)
-            pyautogui.keyUp(key)
-            time.sleep(0.05)  # 뗀 상태 확실히 인식
+            inputs.vkey_up(key)
+            clock.sleep(0.05)  # 뗀 상태 확실히 인식
 
         except Exception as e:
-            print(f"WARN: Atomic Key Failed ({key}): {e}")
+            log.warning(f"Atomic Key Failed ({key}): {e}")
             # 비상시 강제 Release
             try:
-                pyautogui.keyUp(key)
+                inputs.vkey_up(key)
             except:
                 pass
 
     def _atomic_click(self, x: int, y: int):
         """
         [원자적 클릭] 이동 -> 누름 -> 대기 -> 뗌
-        - pyautogui.click()의 빠른 속도로 인한 입력 씹힘 방지
+        - inputs.click()의 빠른 속도로 인한 입력 씹힘 방지
         - 드래그(Ghost Drag) 발생 원천 차단
         """
         try:
             # 1. 이동 후 안정화
-            pyautogui.moveTo(x, y)
+            inputs.move_to(x, y)
 
             # 2. 누르기 (Press)
-            pyautogui.mouseDown()
-            time.sleep(0.1)  # 0.1초 동안 확실히 누름 유지
+            inputs.mouse_down()
+            clock.sleep(0.1)  # 0.1초 동안 확실히 누름 유지
 
             # 3. 떼기 (Release)
-            pyautogui.mouseUp()
-            time.sleep(0.05)  # 뗀 상태 확실히 인식
+            inputs.mouse_up()
+            clock.sleep(0.05)  # 뗀 상태 확실히 인식
 
         except Exception as e:
-            print(f"WARN: Atomic Click Failed: {e}")
+            log.warning(f"Atomic Click Failed: {e}")
             # 비상시 강제 Release
-            pyautogui.mouseUp()
+            inputs.mouse_up()
 
     # =========================================================================
     # 🎯 v3 상태머신 실행 엔진
     # =========================================================================
 
-    def _process_instruction(self, screen_obj: dict, instruction: Dict[str, Any]) -> Any:
-        """[v3] 지시 처리기 (원격 제어 및 Atomic Click 적용 완료)"""
-
-        if not instruction:
-            return None
-
-        # ---------------------------------------------------------------------
-        # ✅ [핵심] 원격 제어 컨텍스트(Context) 생성
-        # 지시서에 'target_screen'이 있으면 그 화면을 실행 대상으로 설정 (S5 등)
-        # 없으면 본인(screen_id)이 실행 대상이 됨
-        # ---------------------------------------------------------------------
-        target_id = instruction.get('target_screen', screen_obj['screen_id'])
-
-        # 타겟의 region 정보 조회 (self.screens에 없을 수 있으므로 전역 정보 사용)
-        target_region = SCREEN_REGIONS.get(target_id)
-        if not target_region:
-            print(f"ERROR: Unknown target screen {target_id}")
-            return None
+    def _build_opcode_table(self) -> OpcodeTable:
+        """[v3] 지시어 → 처리기 등록 (wait_duration은 공용 실행기 기본 제공)"""
+        table = OpcodeTable(self.monitor_id, validate=self._validate_target_screen)
+        # 템플릿 대기: 찾으면 좌표, timeout 동안 못 찾으면 None (generator가 '존재 여부'로 판단)
+        table.register('wait_for_template', self._op_wait_for_template, required=('template_name',), poll=True,
+                       timeout=5.0, optional=True)
+        table.register('click', self._op_click, required=('template_name',))
+        table.register('click_if_present', self._op_click_if_present, required=('template_name',))
+        table.register('set_focus', self._op_set_focus)
+        table.register('check_party_templates', self._op_check_party_templates)
+        table.register('check_template', self._op_check_template, required=('template',))
+        table.register('set_shared_state', self._op_set_shared_state)
+        table.register('key_drag', self._op_key_drag, required=('from', 'to'),
+                       key='ctrl', duration=0.5, delay_after=0.0)
+        table.register('input_text', self._op_input_text, required=('text',))
+        table.register('key_press', self._op_key_press, required=('key',))
+        return table
+
+    @staticmethod
+    def _validate_target_screen(raw: Dict[str, Any]):
+        target_id = raw.get('target_screen')
+        if target_id is not None and target_id not in SCREEN_REGIONS:
+            raise InstructionError(f"Unknown target screen {target_id}")
+
+    def _target_ctx(self, screen_obj: dict, inst) -> dict:
+        """
+        ✅ [핵심] 원격 제어 컨텍스트(Context) 생성
+        지시서에 'target_screen'이 있으면 그 화면을 실행 대상으로 설정 (S5 등), 없으면 본인(screen_id)이 실행 대상.
 
-        # [중요] ctx_obj는 '실행(Action/IO)'을 담당하는 객체입니다.
-        # - screen_id: 타겟 화면 ID (예: S5) -> 템플릿 경로 찾기, 락 걸기 용도
-        # - region: 타겟 화면 좌표 (예: S5 영역) -> 이미지 서치, 클릭 좌표 용도
+        [중요] 반환 객체는 '실행(Action/IO)'을 담당합니다.
+        - screen_id: 타겟 화면 ID (예: S5) -> 템플릿 경로 찾기, 락 걸기 용도
+        - region: 타겟 화면 좌표 (예: S5 영역) -> 이미지 서치, 클릭 좌표 용도
+        screen_obj는 '생각(Logic/State)'을 담당하는 원본 객체입니다. (예: S1)
+        """
+        target_id = inst.get('target_screen') or screen_obj['screen_id']
+        if target_id == screen_obj['screen_id']:
+            return screen_obj
         ctx_obj = screen_obj.copy()
         ctx_obj['screen_id'] = target_id
-        ctx_obj['region'] = target_region
-
-        # screen_obj는 '생각(Logic/State)'을 담당하는 원본 객체입니다. (예: S1)
-        # - generator_wait_*: 본인의 대기 상태 관리
-        source_id = screen_obj['screen_id']
-        op = instruction.get('operation')
-
-        # ---------------------------------------------------------------------
-
-        # 1. 대기 (Duration) - [Logic] 시간 흐름은 원본(screen_obj) 관리
-        if op == 'wait_duration':
-            duration = instruction.get('duration', 1.0)
-            screen_obj['generator_wait_start_time'] = time.time() + duration
-            return None
-
-        # 2. 템플릿 대기 (Wait for Template) - [Action: ctx / Logic: screen_obj]
-        elif op == 'wait_for_template':
-            template_name = instruction['template_name']
-            # ★ 타겟 화면(ctx)의 템플릿 경로를 가져옴
-            template_path = get_template(ctx_obj['screen_id'], template_name)
-            timeout = instruction.get('timeout', 5.0)
-
-            # ★ 타겟 화면(ctx)에서 이미지 감지
-            pos = self._detect_template(ctx_obj, template_path=template_path)
-
-            if pos:
-                # 찾았으면 원본의 대기 타이머 해제
-                screen_obj['generator_wait_timeout'] = 0.0
-                return pos
-            else:
-                # 못 찾았으면 원본의 타임아웃 체크
-                if screen_obj['generator_wait_timeout'] == 0.0:
-                    screen_obj['generator_wait_timeout'] = time.time() + timeout
-                return None
-
-        # 3. 클릭 (Click) - [Action: ctx]
-        elif op == 'click':
-            template_name = instruction['template_name']
-            # ★ 타겟 화면(ctx)의 템플릿 경로
-            template_path = get_template(ctx_obj['screen_id'], template_name)
-
-            # ★ 타겟 화면(ctx)에서 감지
-            pos = self._detect_template(ctx_obj, template_path=template_path)
-            if not pos:
-                # 타겟 화면에서 못 찾음
-                raise Exception(f"Template not found on {ctx_obj['screen_id']} for click: {template_name}")
-
-            # ★ 타겟 화면(ctx)으로 IO 요청 (S5에 락을 걺)
-            action_lambda = lambda: self._atomic_click(pos[0], pos[1])
-            self._request_io_action(ctx_obj, action_lambda)
-            return pos
-
-        # 4. 있으면 클릭 (Click if present) - [Action: ctx]
-        elif op == 'click_if_present':
-            template_name = instruction['template_name']
-            template_path = get_template(ctx_obj['screen_id'], template_name)
-
-            pos = self._detect_template(ctx_obj, template_path=template_path)
-            if pos:
-                action_lambda = lambda: self._atomic_click(pos[0], pos[1])
-                self._request_io_action(ctx_obj, action_lambda)
-            return pos
-
-        # 5. 포커스 (Set Focus) - [Action: ctx]
-        elif op == 'set_focus':
-            # ★ 타겟 화면(ctx)의 region 사용
-            region = ctx_obj['region']
-            center_x = region[0] + region[2] // 2
-            center_y = region[1] + region[3] // 2
-
-            action_lambda = lambda: self._atomic_click(center_x, center_y)
-            self._request_io_action(ctx_obj, action_lambda)
-            return None
-
-        # 6. 파티원 확인 (Multi-Template) - [Action: ctx]
-        elif op == 'check_party_templates':
-            candidate_templates = [
-                'PARTY_MEMBER_1', 'PARTY_MEMBER_2', 'PARTY_MEMBER_3', 'PARTY_MEMBER_4'
-            ]
+        ctx_obj['region'] = SCREEN_REGIONS[target_id]
+        return ctx_obj
+
+    # 1. 템플릿 대기 (Wait for Template) - [Action: ctx]
+    def _op_wait_for_template(self, runner: PolicyRunner, inst) -> Any:
+        ctx_obj = self._target_ctx(runner.ctx, inst)
+        # ★ 타겟 화면(ctx)의 템플릿 경로로 이미지 감지
+        template_path = get_template(ctx_obj['screen_id'], inst['template_name'])
+        pos = self._detect_template(ctx_obj, template_path=template_path)
+        return runner.poll(pos, inst['timeout'], inst['optional'], what=f"wait_for_template '{inst['template_name']}'")
+
+    # 2. 클릭 (Click) - [Action: ctx]
+    def _op_click(self, runner: PolicyRunner, inst) -> Any:
+        ctx_obj = self._target_ctx(runner.ctx, inst)
+        template_name = inst['template_name']
+        template_path = get_template(ctx_obj['screen_id'], template_name)
+
+        pos = self._detect_template(ctx_obj, template_path=template_path)
+        if not pos:
+            # 타겟 화면에서 못 찾음
+            raise Exception(f"Template not found on {ctx_obj['screen_id']} for click: {template_name}")
+
+        # ★ 타겟 화면(ctx)으로 IO 요청 (S5에 락을 걺)
+        self._request_io_action(ctx_obj, lambda: self._atomic_click(pos[0], pos[1]))
+        return pos
+
+    # 3. 있으면 클릭 (Click if present) - [Action: ctx]
+    def _op_click_if_present(self, runner: PolicyRunner, inst) -> Any:
+        ctx_obj = self._target_ctx(runner.ctx, inst)
+        template_path = get_template(ctx_obj['screen_id'], inst['template_name'])
+
+        pos = self._detect_template(ctx_obj, template_path=template_path)
+        if pos:
+            self._request_io_action(ctx_obj, lambda: self._atomic_click(pos[0], pos[1]))
+        return pos
+
+    # 4. 포커스 (Set Focus) - [Action: ctx]
+    def _op_set_focus(self, runner: PolicyRunner, inst) -> Any:
+        ctx_obj = self._target_ctx(runner.ctx, inst)
+        region = ctx_obj['region']
+        center_x = region[0] + region[2] // 2
+        center_y = region[1] + region[3] // 2
+
+        self._request_io_action(ctx_obj, lambda: self._atomic_click(center_x, center_y))
+        return None
+
+    # 5. 파티원 확인 (Multi-Template) - [Action: ctx]
+    def _op_check_party_templates(self, runner: PolicyRunner, inst) -> Any:
+        ctx_obj = self._target_ctx(runner.ctx, inst)
+        candidate_templates = [
+            'PARTY_MEMBER_1', 'PARTY_MEMBER_2', 'PARTY_MEMBER_3', 'PARTY_MEMBER_4'
+        ]
+
+        for template_key in candidate_templates:
+            try:
+                template_path = get_template(ctx_obj['screen_id'], template_key)
+                pos = self._detect_template(ctx_obj, template_path=template_path)
 
-            for template_key in candidate_templates:
-                try:
-                    # ★ 타겟 화면(ctx) 기준으로 템플릿 확인
-                    template_path = get_template(ctx_obj['screen_id'], template_key)
-                    pos = self._detect_template(ctx_obj, template_path=template_path)
+                if pos:
+                    log.info(f"[{ctx_obj['screen_id']}] 파티원 감지 성공 ({template_key})")
+                    return pos
 
-                    if pos:
-                        print(f"INFO: [{ctx_obj['screen_id']}] 파티원 감지 성공 ({template_key})")
-                        return pos
+            except Exception:
+                continue
+        return None
+
+    # 6. 단순 템플릿 확인 (Check Template) - [Action: ctx]
+    def _op_check_template(self, runner: PolicyRunner, inst) -> Any:
+        ctx_obj = self._target_ctx(runner.ctx, inst)
+        template_path = get_template(ctx_obj['screen_id'], inst['template'])
+        return self._detect_template(ctx_obj, template_path=template_path)
+
+    # 7. 공유 상태 변경 (Set Shared State) - [Logic: screen_obj]
+    # ★ 주의: 상태 변경은 로직의 주체(S1)가 변경되는 것임. 타겟(S5)의 상태를 바꾸는 게 아님.
+    def _op_set_shared_state(self, runner: PolicyRunner, inst) -> Any:
+        new_state = inst.get('state')
+        if new_state:
+            source_id = runner.ctx['screen_id']
+            self.shared_states.set(source_id, new_state, source=self.monitor_id, reason='set_shared_state')
+            log.info(f"[{source_id}] Shared State 전환 -> {new_state.name}")
+        return True
 
-                except Exception:
-                    continue
-            return None
+    # 8. 드래그 동작 (Key Drag) - [Action: ctx]
+    def _op_key_drag(self, runner: PolicyRunner, inst) -> Any:
+        ctx_obj = self._target_ctx(runner.ctx, inst)
+        action_config = {
+            'key': inst['key'],
+            'from': inst['from'],
+            'to': inst['to'],
+            'duration': inst['duration'],
+            'delay_after': inst['delay_after']
+        }
+        # ★ 타겟 화면 ID와 타겟 Region 전달
+        self._handle_key_drag_operation(ctx_obj['screen_id'], ctx_obj['region'], action_config)
+        return True
 
-        # 7. 단순 템플릿 확인 (Check Template) - [Action: ctx]
-        elif op == 'check_template':
-            template_name = instruction['template']
-            template_path = get_template(ctx_obj['screen_id'], template_name)
-            # ★ 타겟 화면(ctx)에서 감지
-            pos = self._detect_template(ctx_obj, template_path=template_path)
-            return pos
-
-        # 8. 공유 상태 변경 (Set Shared State) - [Logic: screen_obj]
-        # ★ 주의: 상태 변경은 로직의 주체(S1)가 변경되는 것임. 타겟(S5)의 상태를 바꾸는 게 아님.
-        elif op == 'set_shared_state':
-            new_state = instruction.get('state')
-            if new_state:
-                self.shared_states[source_id] = new_state
-                print(f"INFO: [{source_id}] Shared State 전환 -> {new_state.name}")
-            return True
-
-        # 9. 드래그 동작 (Key Drag) - [Action: ctx]
-        elif op == 'key_drag':
-            action_config = {
-                'key': instruction.get('key', 'ctrl'),
-                'from': instruction.get('from'),
-                'to': instruction.get('to'),
-                'duration': instruction.get('duration', 0.5),
-                'delay_after': instruction.get('delay_after', 0.0)
-            }
-            # ★ 타겟 화면 ID와 타겟 Region 전달
-            self._handle_key_drag_operation(ctx_obj['screen_id'], ctx_obj['region'], action_config)
-            return True
-
-        # 10. 텍스트 입력 (Input Text) - [Action: ctx]
-        elif op == 'input_text':
-            text = instruction.get('text')
-            if not text:
-                raise Exception("Input Text operation requires a 'text' parameter.")
-
-            action_lambda = lambda: pyautogui.write(text, interval=0.01)
-            # ★ 타겟 화면(ctx)에 락을 걸고 입력 (Priority.HIGH)
-            self._request_io_action(ctx_obj, action_lambda, priority=Priority.HIGH)
-            print(f"INFO: [{ctx_obj['screen_id']}] 텍스트 입력 요청: {text}")
-            return True
-        # 11. 키 입력 (Key Press) - [Action: ctx]
-        elif op == 'key_press':
-            key = instruction.get('key')
-            if not key:
-                raise Exception("Key Press requires 'key' parameter")
-
-            action_lambda = lambda: self._atomic_key(key)
-            self._request_io_action(ctx_obj, action_lambda, priority=Priority.NORMAL)
-            print(f"INFO: [{ctx_obj['screen_id']}] Atomic Key: {key}")
-            return True
+    # 9. 텍스트 입력 (Input Text) - [Action: ctx]
+    def _op_input_text(self, runner: PolicyRunner, inst) -> Any:
+        ctx_obj = self._target_ctx(runner.ctx, inst)
+        text = inst['text']
+        # ★ 타겟 화면(ctx)에 락을 걸고 입력 (Priority.HIGH)
+        self._request_io_action(ctx_obj, lambda: inputs.write(text, interval=0.01), priority=Priority.HIGH)
+        log.info(f"[{ctx_obj['screen_id']}] 텍스트 입력 요청: {text}")
+        return True
 
-        else:
-            print(f"WARN: [{source_id}] 알 수 없는 지시어: {op}")
-            return None
+    # 10. 키 입력 (Key Press) - [Action: ctx]
+    def _op_key_press(self, runner: PolicyRunner, inst) -> Any:
+        ctx_obj = self._target_ctx(runner.ctx, inst)
+        key = inst['key']
+        self._request_io_action(ctx_obj, lambda: self._atomic_key(key), priority=Priority.NORMAL)
+        log.info(f"[{ctx_obj['screen_id']}] Atomic Key: {key}")
+        return True
 
     # =========================================================================
     # 🔧 유틸리티
@@ -488,18 +542,20 @@ class SystemMonitor:
             raise ValueError("template_path or template_name required")
 
         try:
-            screenshot = self.orchestrator.capture_screen_safely(screen_obj['screen_id'])
+            with self.spans.span('capture', screen_obj['screen_id']):
+                screenshot = self.orchestrator.capture_screen_safely(screen_obj['screen_id'])
 
             # NightCrows 유틸 사용
             from Orchestrator.NightCrows.utils.image_utils import return_ui_location
-            return return_ui_location(
-                template_path=path,
-                region=screen_obj['region'],
-                threshold=0.82,
-                screenshot_img=screenshot
-            )
+            with self.spans.span('match', screen_obj['screen_id']):
+                return return_ui_location(
+                    template_path=path,
+                    region=screen_obj['region'],
+                    threshold=0.82,
+                    screenshot_img=screenshot
+                )
         except Exception as e:
-            print(f"WARN: [{self.monitor_id}] Template detection error: {e}")
+            log.warning(f"[{self.monitor_id}] Template detection error: {e}")
             return None
 
     def _request_io_action(self, screen_obj, action_lambda, priority=Priority.NORMAL):
@@ -526,22 +582,21 @@ class SystemMonitor:
         if old_state == new_state:
             return
 
-        print(f"INFO: [{self.monitor_id}] {screen_id}: {old_state.name} → {new_state.name} ({reason})")
+        # ❗️ 원자적 전이: 읽은 뒤 SRM이 상태를 바꿨다면 이번 전이는 포기 (다음 틱에 재평가)
+        if not self.shared_states.compare_and_set(screen_id, old_state, new_state,
+                                                  source=self.monitor_id, reason=reason):
+            log.warning(f"[{self.monitor_id}] {screen_id}: State changed concurrently. "
+                  f"Skipping transition → {new_state.name} ({reason})")
+            return
 
-        if screen_obj['current_generator']:
-            try:
-                screen_obj['current_generator'].close()
-            except Exception as e:
-                print(f"WARN: [{screen_id}] Generator close error: {e}")
+        log.info(f"[{self.monitor_id}] {screen_id}: {old_state.name} → {new_state.name} ({reason})")
 
-        # ❗️ [수정] 공유 상태 쓰기
-        self.shared_states[screen_id] = new_state
-        screen_obj['state_enter_time'] = time.time()
+        if screen_obj['runner']:
+            screen_obj['runner'].close()
 
-        screen_obj['current_generator'] = None
-        screen_obj['generator_wait_start_time'] = 0.0
-        screen_obj['generator_wait_timeout'] = 0.0
-        screen_obj['generator_last_yielded_value'] = None
+        screen_obj['state_enter_time'] = clock.time()
+        screen_obj['runner'] = None
+        screen_obj['resume_credit'] = 0.0
 
     def _handle_exception_policy(self, error_type: str):
         """예외 처리 정책"""
@@ -570,9 +625,7 @@ class SystemMonitor:
         )
 
     def _execute_key_drag(self, region: tuple, config: dict):
-        """실제 PyAutoGUI 동작 실행"""
-        import pyautogui
-
+        """실제 키+드래그 동작 실행"""
         key = config.get('key', 'ctrl')
         from_x, from_y = config.get('from')
         to_x, to_y = config.get('to')
@@ -585,16 +638,16 @@ class SystemMonitor:
         abs_end_y = region_y + to_y
 
         try:
-            pyautogui.keyDown(key)
-            pyautogui.moveTo(abs_start_x, abs_start_y)
-            pyautogui.dragTo(abs_end_x, abs_end_y, duration=duration, tween=pyautogui.easeOutQuad)
+            inputs.vkey_down(key)
+            inputs.move_to(abs_start_x, abs_start_y)
+            inputs.drag_to(abs_end_x, abs_end_y, duration=duration)
         except Exception as e:
-            print(f"ERROR: Drag failed: {e}")
+            log.error(f"Drag failed: {e}")
         finally:
-            pyautogui.keyUp(key)  # 무조건 키 뗌
+            inputs.vkey_up(key)  # 무조건 키 뗌
 
         if config.get('delay_after'):
-            time.sleep(config.get('delay_after'))
+            clock.sleep(config.get('delay_after'))
 
 # =============================================================================
 # 🔌 Orchestrator 호출 인터페이스
@@ -607,4 +660,4 @@ def create_system_monitor(monitor_id: str, vd_name: str, orchestrator=None, shar
 
 
 if __name__ == "__main__":
-    print("이 파일은 직접 실행할 수 없으며, Orchestrator가 로드해야 합니다.")
\ No newline at end of file
+    log.info("이 파일은 직접 실행할 수 없으며, Orchestrator가 로드해야 합니다.")
\ No newline at end of file
@@ -3,11 +3,19 @@
 
 from typing import Callable, Generator, Dict, Any, Optional
 from Orchestrator.Raven2.Combat_Monitor.src.models.screen_info import ScreenState
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 # =============================================================================
 # 🎯 1. 상태 정의 (monitor_v1의 ScreenState 계승)
 # =============================================================================
 
+# 사냥터 도착 확인용 픽셀 프로브 (coord_key는 FIXED_UI_COORDS의 키)
+COMBAT_SPOT_PROBES = [
+    {'coord_key': 'leader_hp_pixel', 'color': (108, 69, 71), 'tolerance': 15},
+]
+
 # =============================================================================
 # 🎯 2. "상황반장" 정책 (monitor_v1.py 로직의 "번역")
 # =============================================================================
@@ -34,7 +42,7 @@ def policy_dead(screen: Any) -> Generator[Dict[str, Any], Any, None]:
     v1의 process_death_recovery 로직을 수행합니다.
     ❗️ [수정] '이중 탐색' 문제를 해결한 견고한 패턴을 사용합니다.
     """
-    print(f"INFO: [{screen.window_id}] 상황반장: '사망' 상태 접수. 부활을 시작합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '사망' 상태 접수. 부활을 시작합니다.")
 
     # 1. v1의 'return_ui_location' 로직 -> 'wait_for_template' 지시로 번역
     #    (v2에서 추가된 5초 타임아웃을 적용하여 안정성 확보)
@@ -48,7 +56,7 @@ def policy_dead(screen: Any) -> Generator[Dict[str, Any], Any, None]:
     # 2. v1의 'pyautogui.click(return_pos)' 로직 -> 'click_at' 지시로 번역
     #    ❗️ [수정] 템플릿을 '다시 찾는' 비효율적인 'click' 대신,
     #           기억해 둔 'pos' 위치에 'click_at'을 지시합니다.
-    #           (monitor.py의 _process_instruction이 pos를 반환해 줌)
+    #           (monitor.py의 wait_for_template 처리기가 pos를 반환해 줌)
     yield {
         'operation': 'click_at',
         'x': pos[0],
@@ -61,7 +69,7 @@ def policy_dead(screen: Any) -> Generator[Dict[str, Any], Any, None]:
         'operation': 'wait_duration',
         'duration': 0.5
     }
-    print(f"INFO: [{screen.window_id}] 상황반장: '부활' 지시 완료. 'RECOVERING' 상태로 전환합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '부활' 지시 완료. 'RECOVERING' 상태로 전환합니다.")
 
 # --- Policy: RECOVERING (monitor_v1.py의 'RECOVERING' 루프 번역) ---
 def policy_recovering(screen: Any) -> Generator[Dict[str, Any], Any, None]:
@@ -69,7 +77,7 @@ def policy_recovering(screen: Any) -> Generator[Dict[str, Any], Any, None]:
     [상황반장: 부활 중]
     v1의 is_recovered (TOWN_UI)를 60초 타임아웃으로 대기합니다.
     """
-    print(f"INFO: [{screen.window_id}] 상황반장: '부활 중'. 마을 UI가 보일 때까지 60초간 대기합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '부활 중'. 마을 UI가 보일 때까지 60초간 대기합니다.")
 
     # 1. v1의 'is_recovered' (is_in_safe_zone -> template1)를
     #    'retry_count > 60' (60초 타임아웃)으로 대기
@@ -78,7 +86,7 @@ def policy_recovering(screen: Any) -> Generator[Dict[str, Any], Any, None]:
         'template_key': 'TOWN_UI_TEMPLATE',  # 'combat.template1'
         'timeout': 60.0
     }
-    print(f"INFO: [{screen.window_id}] 상황반장: '마을 UI' 감지. 'SAFE_ZONE' 상태로 전환합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '마을 UI' 감지. 'SAFE_ZONE' 상태로 전환합니다.")
 
 
 # --- Policy: ABNORMAL (monitor_v1.py의 retreat_to_safe_zone 번역) ---
@@ -87,7 +95,7 @@ def policy_abnormal(screen: Any) -> Generator[Dict[str, Any], Any, None]:
     [상황반장: 비정상]
     v1의 retreat_to_safe_zone 로직을 수행합니다.
     """
-    print(f"INFO: [{screen.window_id}] 상황반장: '비정상' 상태 접수. 후퇴를 시작합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '비정상' 상태 접수. 후퇴를 시작합니다.")
 
     # 1. v1의 'confirm_pos' 템플릿 클릭 (optional=True)
     yield {
@@ -121,7 +129,7 @@ def policy_abnormal(screen: Any) -> Generator[Dict[str, Any], Any, None]:
         'operation': 'click',
         'template_key': 'RETREAT_BUTTON'
     }
-    print(f"INFO: [{screen.window_id}] 상황반장: '후퇴' 지시 완료. 'RETREATING' 상태로 전환합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '후퇴' 지시 완료. 'RETREATING' 상태로 전환합니다.")
 
 
 # --- Policy: RETREATING (monitor_v1.py의 'RETREATING' 루프 번역) ---
@@ -131,7 +139,7 @@ def policy_retreating(screen: Any) -> Generator[Dict[str, Any], Any, None]:
     v1의 is_in_safe_zone (TOWN_UI)를 60초 타임아웃으로 대기합니다.
     (policy_recovering과 로직 동일)
     """
-    print(f"INFO: [{screen.window_id}] 상황반장: '후퇴 중'. 마을 UI가 보일 때까지 60초간 대기합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '후퇴 중'. 마을 UI가 보일 때까지 60초간 대기합니다.")
 
     # 1. v1의 'is_in_safe_zone' (template1)를
     #    'retry_count > 60' (60초 타임아웃)으로 대기
@@ -140,7 +148,7 @@ def policy_retreating(screen: Any) -> Generator[Dict[str, Any], Any, None]:
         'template_key': 'TOWN_UI_TEMPLATE',  # 'combat.template1'
         'timeout': 60.0
     }
-    print(f"INFO: [{screen.window_id}] 상황반장: '마을 UI' 감지. 'SAFE_ZONE' 상태로 전환합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '마을 UI' 감지. 'SAFE_ZONE' 상태로 전환합니다.")
 
 
 # --- Policy: SAFE_ZONE (monitor_v1.py의 replenish_potions 번역) ---
@@ -149,7 +157,7 @@ def policy_safe_zone(screen: Any) -> Generator[Dict[str, Any], Any, None]:
     [상황반장: 물약 구매]
     v1의 replenish_potions (단순 시퀀스)를 완벽하게 번역합니다.
     """
-    print(f"INFO: [{screen.window_id}] 상황반장: '안전 지대' 도착. 물약 구매를 시작합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '안전 지대' 도착. 물약 구매를 시작합니다.")
 
     # 1. time.sleep(2.5)
     yield {'operation': 'wait_duration', 'duration': 2.5}
@@ -181,7 +189,7 @@ def policy_safe_zone(screen: Any) -> Generator[Dict[str, Any], Any, None]:
     # 12. time.sleep(1.0)
     yield {'operation': 'wait_duration', 'duration': 1.0}
 
-    print(f"INFO: [{screen.window_id}] 상황반장: '물약 구매' 완료. 'POTIONS_PURCHASED' 상태로 전환합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '물약 구매' 완료. 'POTIONS_PURCHASED' 상태로 전환합니다.")
 
 
 # --- Policy: POTIONS_PURCHASED (monitor_v1.py의 return_to_combat 번역) ---
@@ -191,7 +199,7 @@ def policy_potions_purchased(screen: Any) -> Generator[Dict[str, Any], Any, None
     v1의 return_to_combat (복잡한 로직)을 번역합니다.
     제너레이터는 'if'문, '계산' 등 모든 파이썬 코드를 실행할 수 있습니다.
     """
-    print(f"INFO: [{screen.window_id}] 상황반장: '복귀 시작'. v1의 return_to_combat 로직을 실행합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '복귀 시작'. v1의 return_to_combat 로직을 실행합니다.")
 
     # 1. Template 1 (마을 UI) 클릭
     yield {'operation': 'wait_for_template', 'template_key': 'TOWN_UI_TEMPLATE', 'timeout': 5.0}
@@ -236,7 +244,7 @@ def policy_potions_purchased(screen: Any) -> Generator[Dict[str, Any], Any, None
         abs_end_x = screen_x + end_rel[0]
         abs_end_y = screen_y + end_rel[1]
 
-        print(f"INFO: [{screen.window_id}] 드래그 수행: ({abs_start_x}, {abs_start_y}) -> ({abs_end_x}, {abs_end_y})")
+        log.info(f"[{screen.window_id}] 드래그 수행: ({abs_start_x}, {abs_start_y}) -> ({abs_end_x}, {abs_end_y})")
 
         # 드래그 수행
         yield {
@@ -248,7 +256,7 @@ def policy_potions_purchased(screen: Any) -> Generator[Dict[str, Any], Any, None
             'duration': 0.5  # 요청하신대로 0.5초 고정
         }
     else:
-        print(f"WARN: [{screen.window_id}] 드래그 설정이 없습니다. 스킵합니다.")
+        log.warning(f"[{screen.window_id}] 드래그 설정이 없습니다. 스킵합니다.")
 
     # 5. time.sleep(1.0)
     yield {'operation': 'wait_duration', 'duration': 1.0}
@@ -260,7 +268,7 @@ def policy_potions_purchased(screen: Any) -> Generator[Dict[str, Any], Any, None
     }
     target_pos = after_drag_positions.get(screen.window_id)
     if not target_pos:
-        print(f"[{screen.window_id}] 드래그 후 UI 절대 좌표 정보를 찾을 수 없음")
+        log.info(f"[{screen.window_id}] 드래그 후 UI 절대 좌표 정보를 찾을 수 없음")
         # 실패 처리: 제너레이터를 종료시켜 'sequence_failed' 유도
         raise Exception("after_drag_positions not found")
 
@@ -287,7 +295,7 @@ def policy_potions_purchased(screen: Any) -> Generator[Dict[str, Any], Any, None
     # 11. time.sleep(0.2)
     yield {'operation': 'wait_duration', 'duration': 0.2}
 
-    print(f"INFO: [{screen.window_id}] 상황반장: '복귀 1단계' 완료. 'RETURNING_TO_COMBAT' 상태로 전환합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '복귀 1단계' 완료. 'RETURNING_TO_COMBAT' 상태로 전환합니다.")
 
 
 # --- Policy: RETURNING_TO_COMBAT (monitor_v1.py의 'RETURNING_TO_COMBAT' 루프 번역) ---
@@ -297,28 +305,28 @@ def policy_returning_to_combat(screen: Any) -> Generator[Dict[str, Any], Any, No
     v1의 'RETURNING_TO_COMBAT' 루프 (픽셀 체크, 10회 재시도, perform_repeated_combat_return)를
     완벽하게 번역합니다.
     """
-    print(f"INFO: [{screen.window_id}] 상황반장: '복귀 2단계' 시작. 10회 내 사냥터 도착을 시도합니다.")
+    log.info(f"[{screen.window_id}] 상황반장: '복귀 2단계' 시작. 10회 내 사냥터 도착을 시도합니다.")
 
     # 1. v1의 'wait_time = 3.3'
     yield {'operation': 'wait_duration', 'duration': 3.3}
 
     # 2. v1의 'retry_count > 10' 루프
     for attempt in range(1, 11):  # 1부터 10까지
-        print(f"INFO: [{screen.window_id}] 사냥터 도착 확인 시도 ({attempt}/10)")
+        log.info(f"[{screen.window_id}] 사냥터 도착 확인 시도 ({attempt}/10)")
 
         # 3. v1의 'is_at_combat_spot' (픽셀 체크 3초 루프)
-        # ❗️ 'check_pixel_loop' 지시: 3초간 픽셀 일치 여부 확인 후 bool 반환
+        # ❗️ 'check_pixel_loop' 지시: 3초간 픽셀 프로브 일치 여부 확인 후 bool 반환
+        #    (캐시된 프레임에서 probes 전체를 한 번에 검사)
         is_at_spot = yield {
             'operation': 'check_pixel_loop',
-            'coord_key': 'leader_hp_pixel',
-            'color': (108, 69, 71),
-            'tolerance': 15,
+            'probes': COMBAT_SPOT_PROBES,
+            'match': 'all',
             'duration': 3.0  # v1의 check_duration
         }
 
         # 4. 성공 시 제너레이터 종료 (sequence_complete)
         if is_at_spot:
-            print(f"INFO: [{screen.window_id}] 상황반장: '사냥터 도착' 확인. 임무 완료.")
+            log.info(f"[{screen.window_id}] 상황반장: '사냥터 도착' 확인. 임무 완료.")
             return  # 제너레이터 종료
 
         # 5. S5는 재시도 안 함
@@ -326,14 +334,14 @@ def policy_returning_to_combat(screen: Any) -> Generator[Dict[str, Any], Any, No
             continue
 
         # 6. v1의 'perform_repeated_combat_return' 로직 (S1-S4)
-        print(f"INFO: [{screen.window_id}] 사냥터 미도착. '반복 복귀' 액션 1회 수행.")
+        log.info(f"[{screen.window_id}] 사냥터 미도착. '반복 복귀' 액션 1회 수행.")
         map_ui_activate = {
             "S1": (92, 77), "S2": (791, 86), "S3": (114, 435), "S4": (79, 783)
         }
         target_pos = map_ui_activate.get(screen.window_id)
 
         if not target_pos:
-            print(f"WARN: [{screen.window_id}] Map UI 활성화 좌표 없음.")
+            log.warning(f"[{screen.window_id}] Map UI 활성화 좌표 없음.")
             continue
 
         # 6-1. Map UI 클릭 (하드코딩)
@@ -361,7 +369,7 @@ def policy_returning_to_combat(screen: Any) -> Generator[Dict[str, Any], Any, No
         yield {'operation': 'wait_duration', 'duration': 0.5}
 
     # 10회 루프를 모두 돌았는데 return하지 못하면 'sequence_failed'
-    print(f"WARN: [{screen.window_id}] 상황반장: 10회 시도 후에도 사냥터 도착 실패.")
+    log.warning(f"[{screen.window_id}] 상황반장: 10회 시도 후에도 사냥터 도착 실패.")
 
 
 # =============================================================================
@@ -468,6 +476,25 @@ def get_state_policies() -> Dict[ScreenState, Dict[str, Any]]:
     }
 
 
+# =============================================================================
+# 🎯 4. 운영 설정 (화면별 폴링 간격)
+# =============================================================================
+
+SRM_CONFIG = {
+    'timing': {
+        'check_interval': 0.5,  # 상태별 간격이 없는 화면의 폴링 간격
+        # 상태별 폴링 간격 (초) - 사망/상태이상은 촘촘히, 잠금(SLEEP)은 느슨하게
+        'state_intervals': {
+            ScreenState.SLEEP: 1.0,
+            ScreenState.AWAKE: 0.5,
+            ScreenState.ABNORMAL: 0.25,
+            ScreenState.DEAD: 0.25,
+        },
+        'poll_interval': 0.25  # 대기형 지시(wait_for_template / click_and_get_pos / check_pixel_loop) 중인 화면
+    }
+}
+
+
 # =============================================================================
 # 🔧 유틸리티 함수들
 # =============================================================================
@@ -482,17 +509,17 @@ def get_initial_state() -> ScreenState:
 # =============================================================================
 
 if __name__ == "__main__":
-    print("=" * 60)
-    print("🎯 Raven2 SRM Config (v3 - 제너레이터 '상황반장' 모델)")
-    print("=" * 60)
-    print("이 파일은 monitor_v3.py에 의해 'import'되어 사용됩니다.")
-    print("monitor_v1.py의 모든 하드코딩된 로직이 '정책 함수'로 번역되었습니다.")
-    print("\n[v3 정책 '상황반장' 목록]:")
+    log.info("=" * 60)
+    log.info("🎯 Raven2 SRM Config (v3 - 제너레이터 '상황반장' 모델)")
+    log.info("=" * 60)
+    log.info("이 파일은 monitor_v3.py에 의해 'import'되어 사용됩니다.")
+    log.info("monitor_v1.py의 모든 하드코딩된 로직이 '정책 함수'로 번역되었습니다.")
+    log.info("\n[v3 정책 '상황반장' 목록]:")
     for state, func in POLICY_GENERATOR_MAP.items():
-        print(f"  - {state.name: <20} -> {func.__name__}")
+        log.info(f"  - {state.name: <20} -> {func.__name__}")
 
-    print("\n[v3에서 'detect_only'로 처리되는 상태]:")
-    print(f"  - {ScreenState.SLEEP.name}")
-    print(f"  - {ScreenState.AWAKE.name}")
+    log.info("\n[v3에서 'detect_only'로 처리되는 상태]:")
+    log.info(f"  - {ScreenState.SLEEP.name}")
+    log.info(f"  - {ScreenState.AWAKE.name}")
 
-    print("\n테스트 완료. monitor_v3.py를 실행하여 이 로직을 사용하세요.")
\ No newline at end of file
+    log.info("\n테스트 완료. monitor_v3.py를 실행하여 이 로직을 사용하세요.")
\ No newline at end of file
@@ -1,5 +1,8 @@
 # Orchestrator/Raven2/Combat_Monitor/src/config/template_paths.py
 import os
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 # =============================================================================
 # 📁 경로 설정
@@ -95,12 +98,12 @@ def get_template(screen_id: str, template_key: str) -> str:
 
 def verify_template_paths() -> bool:
     """파일 존재 여부 검증"""
-    print("SRM2 템플릿 경로 검증 중...")
+    log.info("SRM2 템플릿 경로 검증 중...")
     all_valid = True
     for screen_id, templates in TEMPLATE_PATHS.items():
         for key, path in templates.items():
             if not os.path.exists(path):
-                print(f"❌ [Missing] {screen_id} {key}: {path}")
+                log.error(f"❌ [Missing] {screen_id} {key}: {path}")
                 all_valid = False
     return all_valid
 
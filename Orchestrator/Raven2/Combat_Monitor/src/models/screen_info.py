@@ -37,12 +37,8 @@ class CombatScreenInfo:
     policy_step_start_time: float = 0.0
 
     # [신규] current_state를 프로퍼티로 정의하여 공유 딕셔너리 접근
+    # (읽기 전용, 쓰기는 CombatMonitor._change_state가 store.set으로 출처/사유와 함께 기록)
     @property
     def current_state(self):
         # 딕셔너리에 없으면 기본값 SLEEP 반환
-        return self._shared_state_ref.get(self.window_id, ScreenState.SLEEP)
-
-    @current_state.setter
-    def current_state(self, new_state):
-        # 딕셔너리에 값 쓰기 (모든 모니터가 즉시 알게 됨)
-        self._shared_state_ref[self.window_id] = new_state
\ No newline at end of file
+        return self._shared_state_ref.get(self.window_id, ScreenState.SLEEP)
\ No newline at end of file
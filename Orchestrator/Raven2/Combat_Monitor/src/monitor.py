@@ -1,13 +1,7 @@
 # C:/Orchestrator/Raven2/Combat_Monitor/monitor.py
 # (v3 - "CCTV 감시요원" / 제너레이터 실행기 아키텍처)
 
-import time
 import os
-import traceback
-import pyautogui
-import keyboard
-import win32api
-import win32con
 import numpy as np
 import cv2
 from threading import Event
@@ -21,11 +15,23 @@ from Orchestrator.NightCrows.Combat_Monitor.monitor import BaseMonitor
 from .config import srm_config_raven2 as srm_config
 
 # ❗️ 3. [공통] Raven2의 의존성들 (v1과 동일)
+from Orchestrator.src.core.instruction_vm import InstructionTimeout, OpcodeTable, PolicyRunner, StepResult
 from Orchestrator.src.core.io_scheduler import IOScheduler, Priority
+from Orchestrator.src.core.shared_state_store import SharedStateStore
+from Orchestrator.src.core.tick_scheduler import TickScheduler
+from Orchestrator.src.core.checkpoint import restored_states
+from Orchestrator.src.core.detection_pool import DETECTION_POOL
+from Orchestrator.src.core.watchdog import WATCHDOG
 from Orchestrator.Raven2.Combat_Monitor.src.models.screen_info import CombatScreenInfo, ScreenState
 from Orchestrator.Raven2.utils.screen_info import SCREEN_REGIONS, FIXED_UI_COORDS
 from Orchestrator.Raven2.utils.image_utils import return_ui_location, compare_images
 from Orchestrator.Raven2.Combat_Monitor.src.config.template_paths import get_template
+from Orchestrator.src.utils.pixel_probe import PixelProbeSet, normalize_probes
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 class CombatMonitor(BaseMonitor):
     """
@@ -45,25 +51,36 @@ class CombatMonitor(BaseMonitor):
         self.io_scheduler = io_scheduler
 
         # [신규] 공유 상태 저장소 저장
-        self.shared_states = shared_states if shared_states is not None else {}
+        self.shared_states = shared_states if shared_states is not None else SharedStateStore(vd_name)
 
         # 3. v1의 변수들 (config에서 로드)
         self.check_interval = self.config.get('check_interval', 0.5)
         self.confidence = self.config.get('confidence', 0.85)
+        # 같은 틱 안에서 재사용할 프레임의 최대 수명 (초)
+        self.frame_max_age = self.config.get('frame_max_age', 0.1)
 
         # 4. 모니터링 화면 리스트
         self.screens: List[CombatScreenInfo] = []
         self.stop_event: Optional[Event] = None
 
-        # 5. v3 정책 맵 로드
+        # 5. v3 정책 맵 로드 + 지시어 등록표
         self.policy_map = srm_config.get_state_policies()
+        self.opcodes = self._build_opcode_table()
+
+        # 6. 화면별 데드라인 틱 (상태별 폴링 간격)
+        timing = srm_config.SRM_CONFIG['timing']
+        self.state_intervals = dict(timing['state_intervals'])
+        self.poll_interval = self.config.get('poll_interval', timing['poll_interval'])
+        self.ticks = TickScheduler(self.monitor_id)
+
+        # 7. 체크포인트 (restore_checkpoint → 시작 시 apply_warm_start)
+        self._pending_checkpoint: Optional[Tuple[Dict, float]] = None
 
     def add_screen(self, window_id: str, region: Tuple[int, int, int, int], ratio: float = 1.0):
         """모니터링할 화면을 등록합니다."""
 
         # [신규] 공유 상태에 초기값 등록 (이미 있으면 건드리지 않음 - SM이 먼저 등록했을 수도 있음)
-        if window_id not in self.shared_states:
-            self.shared_states[window_id] = ScreenState.SLEEP
+        self.shared_states.setdefault(window_id, ScreenState.SLEEP, source=self.monitor_id)
 
         # [수정] CombatScreenInfo 생성 시 _shared_state_ref 전달
         screen = CombatScreenInfo(
@@ -73,14 +90,17 @@ class CombatMonitor(BaseMonitor):
             _shared_state_ref=self.shared_states  # 참조 전달
         )
 
-        # ❗️ v3: 제너레이터 실행을 위한 상태 변수들
-        screen.active_generator = None  # "상황반장" 저장
-        screen.yielded_instruction = None  # "다음 지시" 저장
-        screen.last_result = None  # "지시 결과" 저장
-        screen.wait_start_time = 0.0  # 'wait' 지시용 타이머
+        # ❗️ v3: 제너레이터 실행 상태 ("상황반장" + 대기 중 지시 + 지시 결과, PolicyRunner)
+        screen.runner = None
+        screen.resume_credit = 0.0  # 웜 리스타트: 복원한 상태에서 이미 흐른 시간 (다음 '상황반장'의 선행 대기에서 차감)
+
+        # 픽셀 프로브: FIXED_UI_COORDS를 화면 등록 시 한 번만 해석
+        screen.pixel_probes = PixelProbeSet.from_fixed_coords(window_id, FIXED_UI_COORDS)
+        screen.cached_frame = None
+        screen.cached_frame_time = 0.0
 
         self.screens.append(screen)
-        print(f"[{self.monitor_id}] Screen registered - ID: {window_id}, State: {screen.current_state.name}")
+        log.info(f"[{self.monitor_id}] Screen registered - ID: {window_id}, State: {screen.current_state.name}")
 
     def force_reset_screen(self, screen_id: str):
         """
@@ -90,7 +110,7 @@ class CombatMonitor(BaseMonitor):
         screen = next((s for s in self.screens if s.window_id == screen_id), None)
 
         if screen:
-            print(f"INFO: [{self.monitor_id}] Screen {screen_id} is being forcibly reset by Orchestrator.")
+            log.info(f"[{self.monitor_id}] Screen {screen_id} is being forcibly reset by Orchestrator.")
 
             # 1. 진행 중인 모든 시퀀스 변수 초기화
             screen.policy_step = 0
@@ -101,9 +121,9 @@ class CombatMonitor(BaseMonitor):
                 del screen.party_check_count  # 파티 체크 카운터 삭제
 
             # 2. 상태를 NORMAL로 변경 (이로 인해 다음 틱부터는 _get_character_state_on_screen만 실행됨)
-            self._change_state(screen, ScreenState.SLEEP)
+            self._change_state(screen, ScreenState.SLEEP, 'force_reset')
         else:
-            print(f"WARN: [{self.monitor_id}] force_reset_screen: Screen {screen_id} not found.")
+            log.warning(f"[{self.monitor_id}] force_reset_screen: Screen {screen_id} not found.")
 
     # =========================================================================
     # 🎯 1. [v3] 메인 루프 (v1의 거대 if/elif 제거)
@@ -111,29 +131,104 @@ class CombatMonitor(BaseMonitor):
 
     def run_loop(self, stop_event: Event):
         """[v3] Orchestrator의 메인 루프. "감시요원"의 텅 빈 루프."""
-        print(f"[{self.monitor_id}] v3 Generator Executor (CCTV 감시요원) run_loop started.")
+        log.info(f"[{self.monitor_id}] v3 Generator Executor (CCTV 감시요원) run_loop started.")
         self.stop_event = stop_event
+        self.apply_warm_start()
+        ticks = self.ticks
+        run = ticks.reset(self.screen_keys(), clock.time())  # 이 루프의 실행 세대 (워치독 재시작 시 교체)
 
         while not stop_event.is_set():
             try:
-                for screen in self.screens:
+                # 데드라인이 지난 화면만 틱 (상태별 폴링 간격)
+                for window_id in ticks.pop_due(clock.time()):
                     if stop_event.is_set():
                         break
 
                     # ❗️ 모든 로직을 '감시요원의 두뇌'(_handle_screen_state)에 위임
-                    self._handle_screen_state(screen)
-
-                # 루프 지연 (v1과 동일)
-                if stop_event.wait(timeout=self.check_interval):
+                    started = clock.time()
+                    self.tick_screen(window_id)
+                    if not ticks.schedule(window_id, started, *self.next_tick_interval(window_id), run=run):
+                        log.warning(f"[{self.monitor_id}] Stale run loop exiting (replaced after a watchdog restart)")
+                        return
+
+                # 다음 화면의 데드라인까지 대기
+                with self.spans.span('sleep.loop'):
+                    stopped = clock.wait(stop_event, ticks.time_until_next(clock.time(), self.check_interval))
+                if stopped:
                     break
 
             except Exception as e:
-                print(f"!!! [{self.monitor_id}] Unhandled exception in run_loop: {e} !!!")
-                traceback.print_exc()
-                if stop_event.wait(timeout=5.0):
+                log.exception(f"!!! [{self.monitor_id}] Unhandled exception in run_loop: {e} !!!")
+                if clock.wait(stop_event, 5.0):
                     break
+                run = ticks.reset(self.screen_keys(), clock.time())  # 예외 후에는 모든 화면을 바로 다시 확인
 
-        print(f"[{self.monitor_id}] v3 Generator Executor stopped.")
+        log.info(f"[{self.monitor_id}] v3 Generator Executor stopped.")
+
+    # =========================================================================
+    # 🎯 1b. 체크포인트 / 웜 리스타트 (src/core/checkpoint.py)
+    # =========================================================================
+
+    def checkpoint_state(self) -> Dict:
+        """진행 상황은 공유 상태(정책 상태 + 진입 시각)로 충분 - 제너레이터 내부는 저장할 수 없음"""
+        return {}
+
+    def restore_checkpoint(self, data: Dict, states: Dict, saved_at: float):
+        """체크포인트 보관 (적용은 시작 시 apply_warm_start)"""
+        self._pending_checkpoint = (states, saved_at)
+
+    def apply_warm_start(self):
+        """
+        저장된 정책 상태(DEAD, SAFE_ZONE, ...)를 복원하고 '상황반장'을 처음부터 다시 배정하되,
+        선행 대기에는 그 상태에서 이미 흐른 시간을 반영. DEAD/ABNORMAL은 화면을 한 번 확인한 뒤에만 복원.
+        SLEEP/AWAKE는 첫 틱의 check_status가 다시 판단하므로 복원하지 않음
+        """
+        if self._pending_checkpoint is None:
+            return
+        states, saved_at = self._pending_checkpoint
+        self._pending_checkpoint = None
+        now = clock.time()
+        restored = []
+        for screen in self.screens:
+            state, since = restored_states(states, ScreenState).get(screen.window_id, (None, 0.0))
+            if state is None or state in (ScreenState.SLEEP, ScreenState.AWAKE):
+                continue
+            if not isinstance(screen.current_state, ScreenState):
+                continue  # SM 작업 중
+            if state in (ScreenState.DEAD, ScreenState.ABNORMAL) and self.check_status(screen) != state:
+                continue
+            self._change_state(screen, state, 'checkpoint')
+            screen.resume_credit = max(0.0, now - since)
+            restored.append(f"{screen.window_id}={state.name}")
+        log.info(f"[{self.monitor_id}] Warm start ({now - saved_at:.0f}s old checkpoint): "
+                 f"{', '.join(restored) or 'no policy states restored'}")
+
+    @property
+    def tick_interval(self) -> float:
+        return self.check_interval
+
+    def screen_keys(self) -> List[str]:
+        return [screen.window_id for screen in self.screens]
+
+    def tick_screen(self, window_id: str):
+        """화면 하나의 한 틱 (run_loop / asyncio 런타임 공용, 워치독 하트비트)"""
+        screen = next(s for s in self.screens if s.window_id == window_id)
+        with WATCHDOG.activity(self.monitor_id, window_id), self.spans.span('tick', window_id):
+            self._handle_screen_state(screen)
+
+    def next_tick_interval(self, window_id: str) -> Tuple[float, str, float]:
+        """
+        방금 틱한 화면의 다음 틱까지 간격: 상태별 간격, 대기형 지시 중이면 poll_interval,
+        wait_duration이면 끝나는 시각까지. (간격, 통계 라벨, 상태에 선언된 간격)
+        """
+        screen = next(s for s in self.screens if s.window_id == window_id)
+        state = screen.current_state
+        declared = self.state_intervals.get(state, self.check_interval)
+        label = getattr(state, 'name', str(state))
+        if screen.runner is None:
+            return declared, label, declared
+        interval, waiting = screen.runner.next_interval(declared, self.poll_interval)
+        return interval, f"{label}+wait" if waiting else label, declared
 
     # =========================================================================
     # 🎯 2. [v3] "감시요원의 두뇌" (핵심 실행기)
@@ -143,7 +238,7 @@ class CombatMonitor(BaseMonitor):
         """화면의 현재 상태 조회 (Orchestrator용)"""
         screen = next((s for s in self.screens if s.window_id == screen_id), None)
         if not screen:
-            print(f"WARN: [{self.monitor_id}] get_current_state: Screen {screen_id} not found.")
+            log.warning(f"[{self.monitor_id}] get_current_state: Screen {screen_id} not found.")
             return None
         return screen.current_state
 
@@ -160,175 +255,115 @@ class CombatMonitor(BaseMonitor):
 
             # 3. [정상 로직] 내 담당 상태면 하던 일 계속
         if state in [ScreenState.SLEEP, ScreenState.AWAKE]:
-            visual_status = self.check_status(screen)
+            with self.spans.span('detect', screen.window_id):
+                visual_status = self.check_status(screen)
             if visual_status != state:
                 # 상태 변경 시에도 프로퍼티를 통해 공유 딕셔너리가 업데이트됨
-                self._change_state(screen, visual_status)
+                self._change_state(screen, visual_status, 'detection')
             return
 
         # --- 2. '정책 실행' 상태 (DEAD, ABNORMAL, ...) ---
 
         # 2a. 현재 '상황반장'이 없으면 새로 할당
-        if screen.active_generator is None:
+        if screen.runner is None:
             policy = self.policy_map.get(state)
             if policy and 'generator' in policy:
                 generator_func = policy['generator']
                 # ❗️ "상황반장"(generator_func)을 호출하여 "지시"를 받을 준비
-                screen.active_generator = generator_func(screen)
-                screen.yielded_instruction = None
-                screen.last_result = None
-                print(f"[{screen.window_id}] '상황반장' {generator_func.__name__} 배정됨.")
+                screen.runner = PolicyRunner(self.opcodes, generator_func(screen), ctx=screen,
+                                             credit=screen.resume_credit)
+                screen.resume_credit = 0.0
+                log.info(f"[{screen.window_id}] '상황반장' {generator_func.__name__} 배정됨.")
             else:
                 # 정책이 없으면 'SLEEP'로 리셋
-                print(f"WARN: [{screen.window_id}] {state.name} 상태의 '상황반장'을 찾을 수 없음. SLEEP로 리셋.")
-                self._change_state(screen, ScreenState.SLEEP)
+                log.warning(f"[{screen.window_id}] {state.name} 상태의 '상황반장'을 찾을 수 없음. SLEEP로 리셋.")
+                self._change_state(screen, ScreenState.SLEEP, 'no_policy')
                 return
 
-        # 2b. "상황반장"에게 다음 지시를 받을 차례인가?
-        if screen.yielded_instruction is None:
-            try:
-                # ❗️ "반장님, 이전 결과(last_result)입니다. 다음 지시(yield) 내려주세요."
-                #
-                instruction = screen.active_generator.send(screen.last_result)
-                screen.last_result = None  # 이전 결과 비우기
-                screen.yielded_instruction = instruction
-
-            except StopIteration:
-                # "상황반장"이 전화를 끊음 (임무 완수)
-                print(f"INFO: [{screen.window_id}] '상황반장' 임무 완료 (StopIteration).")
-                self._on_sequence_complete(screen)  # -> 'RECOVERING' 등으로 상태 전이
-                return
-
-            except Exception as e:
-                # "상황반장"이 로직 수행 중 오류 발생
-                print(f"ERROR: [{screen.window_id}] '상황반장' 임무 실패: {e}")
-                traceback.print_exc()
-                self._on_sequence_failed(screen, e)  # -> 'SLEEP' 등으로 상태 전이
-                return
-
-                # 2c. "상황반장"의 지시(instruction)를 처리할 차례인가?
-        if screen.yielded_instruction:
-                    try:
-                        # ❗️ "지시를 처리하고, 완료 여부(is_done)와 결과(result)를 받아옵니다."
-                        is_done, result = self._process_instruction(screen, screen.yielded_instruction)
-
-                        if is_done:
-                            # 지시가 '완료'되었으면
-                            screen.yielded_instruction = None  # 다음 지시를 받을 수 있도록 비움
-                            screen.last_result = result  # 다음 'send'를 위해 결과 저장
-
-                    except Exception as e:
-                        # 🚨 [수정됨] 지시 수행 중 에러(타임아웃 등) 발생 시 처리
-                        print(f"WARN: [{screen.window_id}] 지시 수행 실패 ({e}). 시퀀스를 실패 처리합니다.")
-
-                        # 지시서 비우기 (중요: 안 비우면 다음 루프에서 또 실행함)
-                        screen.yielded_instruction = None
-
-                        # 시퀀스 실패 로직 호출 (상태 전이 발생 -> 예: SLEEP으로 리셋)
-                        self._on_sequence_failed(screen, e)
+        # 2b. "반장님, 이전 결과입니다. 다음 지시 내려주세요." → 지시 처리
+        #     (대기형 지시는 완료될 때까지 틱마다 다시 실행, 지시 실패는 '상황반장'에게 throw)
+        runner = screen.runner
+        with self.spans.span('policy', screen.window_id):
+            result = runner.step(clock.time())
+
+        if result is StepResult.COMPLETE:
+            # "상황반장"이 전화를 끊음 (임무 완수)
+            log.info(f"[{screen.window_id}] '상황반장' 임무 완료 (StopIteration).")
+            self._on_sequence_complete(screen)  # -> 'RECOVERING' 등으로 상태 전이
+
+        elif result is StepResult.FAILED:
+            # "상황반장"이 로직 수행 중 오류 발생 (또는 지시 실패/타임아웃을 처리하지 않음)
+            error = runner.error
+            # 지시 타임아웃은 예상된 실패라 traceback 없이 기록
+            log.error(f"[{screen.window_id}] '상황반장' 임무 실패: {error}",
+                      exc_info=None if isinstance(error, InstructionTimeout) else error)
+            screen.runner = None  # 'fail'이 같은 상태(예: SAFE_ZONE)면 다음 틱에 정책을 처음부터 다시 시작
+            self._on_sequence_failed(screen, error)  # -> 'SLEEP' 등으로 상태 전이
 
     # =========================================================================
     # 🎯 3. [v3] "지시 처리기" (Dispatcher)
     # =========================================================================
 
-    def _process_instruction(self, screen: CombatScreenInfo, instruction: Dict[str, Any]) -> Tuple[bool, Any]:
+    def _build_opcode_table(self) -> OpcodeTable:
         """
-        [v3] "상황반장"이 'yield'한 '지시'를 해석하고 처리합니다.
-        '지시'가 완료되면 (True, result)를,
-        '대기' 중이면 (False, None)을 반환합니다.
-        (이 함수는 '비동기'입니다. 절대로 'sleep'하면 안 됩니다.)
+        [v3] "상황반장"이 'yield'하는 지시어 → 처리기 등록 (wait_duration은 공용 실행기 기본 제공).
+        처리기는 완료 시 결과를, 대기 중이면 PENDING을 반환합니다.
+        (처리기는 '비동기'입니다. 절대로 'sleep'하면 안 됩니다.)
         """
-        op = instruction.get('operation')
+        table = OpcodeTable(self.monitor_id)
 
         # --- 1. [I/O 지시] (Fire-and-Forget, 즉시 완료) ---
-        if op in ['click', 'click_at', 'click_fixed', 'key_press', 'drag']:
-            # ❗️ "경찰(IOScheduler)에게 요청만 하고, 지시 자체는 '완료'로 간주"
-            #    (v3 config는 I/O 후에 항상 'wait_duration'을 yield하도록 설계됨)
-            #
+        table.register('click', self._op_io, required=('template_key',))
+        table.register('click_at', self._op_io, required=('x', 'y'))
+        table.register('click_fixed', self._op_io, required=('coord_key',))
+        table.register('key_press', self._op_io, required=('key',))
+        table.register('drag', self._op_io, required=('start_x', 'start_y', 'end_x', 'end_y', 'duration'))
+
+        # --- 2. [템플릿 대기 지시] (timeout이 없으면 무한 대기, optional이면 타임아웃 시 None으로 진행) ---
+        table.register('wait_for_template', self._op_wait_for_template, required=('template_key',), poll=True,
+                       timeout=None, optional=False)
+
+        # --- 3. [v3 config 전용 지시] (복합 지시) ---
+        table.register('click_and_get_pos', self._op_click_and_get_pos, required=('template_key',), poll=True,
+                       timeout=5.0)
+        table.register('check_pixel_loop', self._op_check_pixel_loop, required=('duration',), poll=True)
+        return table
+
+    def _op_io(self, runner: PolicyRunner, inst) -> Any:
+        # ❗️ "경찰(IOScheduler)에게 요청만 하고, 지시 자체는 '완료'로 간주"
+        #    (v3 config는 I/O 후에 항상 'wait_duration'을 yield하도록 설계됨)
+        screen = runner.ctx
+        with self.spans.span('io_enqueue', screen.window_id):
             self.io_scheduler.request(
                 component=self.monitor_id,
                 screen_id=screen.window_id,
-                action=lambda s=screen, i=instruction: self._do_io_action(s, i),
+                action=lambda s=screen, i=inst: self._do_io_action(s, i),
                 priority=Priority.NORMAL
             )
-            return True, None  # (완료, 결과 없음)
+        return None
 
-        # --- 2. [대기 지시] (Stateful Wait, 비동기) ---
-        elif op == 'wait_duration':
-            if screen.wait_start_time == 0.0:
-                screen.wait_start_time = time.time()  # 타이머 시작
-
-            elapsed = time.time() - screen.wait_start_time
-            if elapsed >= instruction['duration']:
-                screen.wait_start_time = 0.0  # 타이머 리셋
-                return True, None  # (완료, 결과 없음)
-            else:
-                return False, None  # (아직 대기 중)
-
-        # --- 3. [템플릿 대기 지시] (Stateful Check, 비동기) ---
-        elif op == 'wait_for_template':
-            pos = self._helper_find_template_once(screen, instruction['template_key'])
-            if pos:
-                screen.wait_start_time = 0.0  # 타이머 리셋
-                return True, pos  # (완료, 찾은 좌표 반환)
-
-            # 타이머 시작
-            if screen.wait_start_time == 0.0:
-                screen.wait_start_time = time.time()
-
-            # 타임아웃 체크 로직 개선
-            timeout = instruction.get('timeout')  # timeout 키가 없거나 None이면 무한 대기
-
-            if timeout is not None and timeout > 0:
-                elapsed = time.time() - screen.wait_start_time
-                if elapsed >= timeout:
-                    screen.wait_start_time = 0.0  # 타이머 리셋
-
-                    # [신규] optional=True이면 예외 없이 넘어감 (못 찾았지만 진행)
-                    if instruction.get('optional', False):
-                        print(
-                            f"WARN: [{screen.window_id}] Optional template '{instruction['template_key']}' not found. Proceeding.")
-                        return True, None
-
-                        # 필수 요소라면 예외 발생
-                    raise Exception(f"Template '{instruction['template_key']}' timed out after {timeout}s")
-
-            # 타임아웃이 없거나(무한대기), 시간 안 지났으면 계속 대기
-            return False, None
-
-        # --- 4. [v3 config 전용 지시] (복합 지시) ---
-        elif op == 'click_and_get_pos':
-            pos = self._helper_find_template_once(screen, instruction['template_key'])
-            if pos:
-                # ❗️ I/O 요청을 즉시 보냄
-                self._do_io_action(screen, {'operation': 'click_at', 'x': pos[0], 'y': pos[1]})
-                return True, pos  # (완료, 클릭한 좌표 반환)
-
-            # (타임아웃 로직은 'wait_for_template'과 동일하게)
-            if screen.wait_start_time == 0.0: screen.wait_start_time = time.time()
-            if time.time() - screen.wait_start_time > 5.0:  # (하드코딩된 5초 타임아웃)
-                screen.wait_start_time = 0.0
-                raise Exception(f"click_and_get_pos '{instruction['template_key']}' timed out")
-            return False, None  # (아직 대기 중)
-
-        elif op == 'check_pixel_loop':
-            # ❗️ v1의 'is_at_combat_spot'을 '비동기'로 실행
-            if screen.wait_start_time == 0.0: screen.wait_start_time = time.time()
-
-            is_match = self._helper_check_pixel_once(screen, instruction)
-            if is_match:
-                screen.wait_start_time = 0.0
-                return True, True  # (완료, 찾음)
-
-            if time.time() - screen.wait_start_time > instruction['duration']:
-                screen.wait_start_time = 0.0
-                return True, False  # (완료, 못 찾음)
-
-            return False, None  # (아직 대기 중)
-
-        # --- 5. 알 수 없는 지시 ---
-        else:
-            raise Exception(f"알 수 없는 지시(operation)입니다: {op}")
+    def _op_wait_for_template(self, runner: PolicyRunner, inst) -> Any:
+        screen = runner.ctx
+        pos = self._helper_find_template_once(screen, inst['template_key'])
+        result = runner.poll(pos, inst['timeout'], inst['optional'], what=f"Template '{inst['template_key']}'")
+        if result is None:
+            # optional=True 타임아웃: 못 찾았지만 진행
+            log.warning(f"[{screen.window_id}] Optional template '{inst['template_key']}' not found. Proceeding.")
+        return result
+
+    def _op_click_and_get_pos(self, runner: PolicyRunner, inst) -> Any:
+        screen = runner.ctx
+        pos = self._helper_find_template_once(screen, inst['template_key'])
+        if pos:
+            # ❗️ I/O 요청을 즉시 보냄
+            self._do_io_action(screen, {'operation': 'click_at', 'x': pos[0], 'y': pos[1]})
+            return pos  # (클릭한 좌표 반환)
+        return runner.poll(None, inst['timeout'], what=f"click_and_get_pos '{inst['template_key']}'")
+
+    def _op_check_pixel_loop(self, runner: PolicyRunner, inst) -> Any:
+        # ❗️ v1의 'is_at_combat_spot'을 '비동기'로 실행: duration 동안 일치하면 True, 끝내 불일치면 False
+        is_match = self._helper_check_pixel_once(runner.ctx, inst)
+        return runner.poll(is_match, inst['duration'], optional=True, timeout_value=False)
 
     # =========================================================================
     # 🎯 4. [v3] "경찰" (IOScheduler가 호출할 실제 I/O)
@@ -345,19 +380,19 @@ class CombatMonitor(BaseMonitor):
             if op == 'click':
                 pos = self._helper_find_template_once(screen, instruction['template_key'])
                 if pos:
-                    pyautogui.click(pos[0], pos[1])
+                    inputs.click(pos[0], pos[1])
                 elif not instruction.get('optional', False):
-                    print(f"ERROR: [{screen.window_id}] 'click' 지시 실패 (템플릿 없음): {instruction['template_key']}")
+                    log.error(f"[{screen.window_id}] 'click' 지시 실패 (템플릿 없음): {instruction['template_key']}")
 
             elif op == 'click_at':
-                pyautogui.click(instruction['x'], instruction['y'])
+                inputs.click(instruction['x'], instruction['y'])
 
             elif op == 'click_fixed':
                 coords = self._helper_get_coords(screen, instruction['coord_key'])
                 if coords:
-                    pyautogui.click(coords[0], coords[1])
+                    inputs.click(coords[0], coords[1])
                 elif not instruction.get('optional', False):
-                    print(f"ERROR: [{screen.window_id}] 'click_fixed' 지시 실패 (좌표 없음): {instruction['coord_key']}")
+                    log.error(f"[{screen.window_id}] 'click_fixed' 지시 실패 (좌표 없음): {instruction['coord_key']}")
 
 
             elif op == 'key_press':
@@ -368,52 +403,53 @@ class CombatMonitor(BaseMonitor):
 
                 if safe_coords:
 
-                    pyautogui.click(safe_coords[0], safe_coords[1])
+                    inputs.click(safe_coords[0], safe_coords[1])
 
-                    time.sleep(0.1)  # 포커스 안착 대기
+                    clock.sleep(0.1)  # 포커스 안착 대기
 
                 else:
 
-                    print(f"ERROR: [{screen.window_id}] safe_click_point not found! key_press may fail.")
+                    log.error(f"[{screen.window_id}] safe_click_point not found! key_press may fail.")
 
                     return  # 포커스 실패 시 키 입력 중단
 
                 # 🌟 [2단계] 실제 키 입력 (포커스 확보된 상태에서)
 
-                keyboard.press_and_release(instruction['key'])
+                inputs.key_press(instruction['key'])
 
             elif op == 'drag':
-                # v1의 드래그 로직 (win32api 사용)
-                pyautogui.moveTo(instruction['start_x'], instruction['start_y'])
-                time.sleep(0.3)
-                win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0)
-                time.sleep(0.1)
-                pyautogui.moveTo(instruction['end_x'], instruction['end_y'], duration=instruction['duration'])
-                time.sleep(0.1)
-                win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0)
+                # v1의 드래그 로직 (저수준 mouse_event 사용)
+                inputs.move_to(instruction['start_x'], instruction['start_y'])
+                clock.sleep(0.3)
+                inputs.raw_mouse_down()
+                clock.sleep(0.1)
+                inputs.move_to(instruction['end_x'], instruction['end_y'], duration=instruction['duration'])
+                clock.sleep(0.1)
+                inputs.raw_mouse_up()
 
         except Exception as e:
-            print(f"ERROR: [{screen.window_id}] _do_io_action ({op}) 실패: {e}")
+            log.error(f"[{screen.window_id}] _do_io_action ({op}) 실패: {e}")
             if op == 'drag':  # 드래그 실패 시 마우스 강제 업
-                win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0)
+                inputs.raw_mouse_up()
 
     # =========================================================================
     # 🎯 5. [v3] 상태 전이 (Transitions)
     # =========================================================================
 
-    def _change_state(self, screen: CombatScreenInfo, new_state: ScreenState):
-        """[v3] 화면 상태를 변경하고 "상황반장"을 해임합니다."""
+    def _change_state(self, screen: CombatScreenInfo, new_state: ScreenState, reason: str):
+        """[v3] 화면 상태를 변경하고 "상황반장"을 해임합니다. reason은 전이 저널에 기록됩니다."""
         if screen.current_state == new_state:
             return
 
-        print(f"INFO: [{screen.window_id}] State Transition: {screen.current_state.name} -> {new_state.name}")
-        screen.current_state = new_state
+        log.info(f"[{screen.window_id}] State Transition: {screen.current_state.name} -> {new_state.name}",
+                 monitor_id=self.monitor_id, screen_id=screen.window_id, state=new_state)
+        self.shared_states.set(screen.window_id, new_state, source=self.monitor_id, reason=reason)
 
         # ❗️ [중요] 상태가 바뀌면, 기존 "상황반장"은 즉시 해임
-        screen.active_generator = None
-        screen.yielded_instruction = None
-        screen.last_result = None
-        screen.wait_start_time = 0.0
+        if screen.runner is not None:
+            screen.runner.close()
+            screen.runner = None
+        screen.resume_credit = 0.0
 
     def _on_sequence_complete(self, screen: CombatScreenInfo):
         """'상황반장'이 임무를 완수했을 때 다음 상태로 전이합니다."""
@@ -423,7 +459,7 @@ class CombatMonitor(BaseMonitor):
         if policy and 'transitions' in policy:
             next_state = policy['transitions'].get('complete', ScreenState.SLEEP)
 
-        self._change_state(screen, next_state)
+        self._change_state(screen, next_state, 'complete')
 
     def _on_sequence_failed(self, screen: CombatScreenInfo, error: Exception):
         """'상황반장'이 임무에 실패(Exception)했을 때 다음 상태로 전이합니다."""
@@ -433,7 +469,7 @@ class CombatMonitor(BaseMonitor):
         if policy and 'transitions' in policy:
             next_state = policy['transitions'].get('fail', ScreenState.SLEEP)
 
-        self._change_state(screen, next_state)
+        self._change_state(screen, next_state, 'fail')
 
     # =========================================================================
     # 🎯 6. [v1 계승] 헬퍼 함수들 (내부 도구)
@@ -449,22 +485,25 @@ class CombatMonitor(BaseMonitor):
     def check_status(self, screen_info: CombatScreenInfo) -> ScreenState:
         """[v1 계승] 'SLEEP'/'AWAKE' 상태에서 사용되는 기본 상태 검사기"""
         try:
-            screen_img = self.orchestrator.capture_screen_safely(screen_info.window_id)
+            screen_img = self._get_screen_frame(screen_info)
             if screen_img is None:
                 return screen_info.current_state
 
-            # (v1의 템플릿 검사 로직)
-            if self._helper_find_template_once(screen_info, 'DEAD_TEMPLATE', screen_img):
-                return ScreenState.DEAD
-            if self._helper_find_template_once(screen_info, 'ABNORMAL_TEMPLATE', screen_img):
-                return ScreenState.ABNORMAL
-            if self._helper_find_template_once(screen_info, 'AWAKE_TEMPLATE', screen_img):
-                return ScreenState.AWAKE
+            # (v1의 템플릿 검사 로직) 탐지 작업 프로세스를 쓰면 세 템플릿을 한 번에 요청
+            checks = (('DEAD_TEMPLATE', ScreenState.DEAD), ('ABNORMAL_TEMPLATE', ScreenState.ABNORMAL),
+                      ('AWAKE_TEMPLATE', ScreenState.AWAKE))
+            found = self._helper_match_in_pool(screen_info, [key for key, _ in checks], screen_img)
+            for template_key, state in checks:
+                if found is not None:
+                    if found.get(template_key):
+                        return state
+                elif self._helper_find_template_once(screen_info, template_key, screen_img):
+                    return state
 
             return ScreenState.SLEEP
 
         except Exception as e:
-            print(f"[{screen_info.window_id}] Error in check_status: {e}")
+            log.exception(f"[{screen_info.window_id}] Error in check_status: {e}")
             return screen_info.current_state
 
     def _helper_find_template_once(self, screen: CombatScreenInfo, template_key: str,
@@ -475,25 +514,65 @@ class CombatMonitor(BaseMonitor):
             return None
 
         if screen_img is None:
-            screen_img = self.orchestrator.capture_screen_safely(screen.window_id)
+            screen_img = self._get_screen_frame(screen)
         if screen_img is None:
             return None
 
-        return return_ui_location(template_path, screen.region, self.confidence, screen_img)
+        with self.spans.span(f'match.{template_key}', screen.window_id):
+            found = self._helper_match_in_pool(screen, [template_key], screen_img)
+            if found is not None:
+                return found.get(template_key)
+            return return_ui_location(template_path, screen.region, self.confidence, screen_img)
+
+    def _helper_match_in_pool(self, screen: CombatScreenInfo, template_keys: List[str],
+                              screen_img) -> Optional[Dict[str, Optional[Tuple[int, int]]]]:
+        """
+        탐지 작업 프로세스로 템플릿 묶음을 한 번에 매칭 → 키 → 절대 중심 좌표 (없으면 None).
+        DETECTION_POOL을 쓰지 않거나 실패하면 None (스레드 안에서 return_ui_location)
+        """
+        if not DETECTION_POOL.running:
+            return None
+        battery = []
+        for template_key in template_keys:
+            template_path = self._get_template_path_from_key(template_key, screen.window_id)
+            if template_path and os.path.exists(template_path):
+                battery.append((template_key, template_path))
+        if not battery:
+            return {template_key: None for template_key in template_keys}
+        scores = DETECTION_POOL.match((self.vd_name, screen.window_id), screen_img, battery)
+        if scores is None:
+            return None
+        found = {}
+        for template_key in template_keys:
+            score, (x, y) = scores.get(template_key, (0.0, (0, 0)))
+            # return_ui_location과 같은 비교 / 좌표 (화면 영역 기준 → 절대 좌표)
+            found[template_key] = (x + screen.region[0], y + screen.region[1]) if score >= self.confidence else None
+        return found
+
+    def _get_screen_frame(self, screen: CombatScreenInfo):
+        """화면 프레임을 frame_max_age 동안 캐싱해 같은 틱의 검사들이 공유하도록 함"""
+        now = clock.time()
+        if screen.cached_frame is not None and now - screen.cached_frame_time <= self.frame_max_age:
+            return screen.cached_frame
+
+        with self.spans.span('capture', screen.window_id):
+            frame = self.orchestrator.capture_screen_safely(screen.window_id)
+        if frame is not None:
+            screen.cached_frame = frame
+            screen.cached_frame_time = now
+        return frame
 
     def _helper_check_pixel_once(self, screen: CombatScreenInfo, instruction: Dict[str, Any]) -> bool:
-        """[v3] 픽셀을 '한 번'만 체크하는 비동기 헬퍼 (v1 is_at_combat_spot 기반)"""
-        coords = self._helper_get_coords(screen, instruction['coord_key'])
-        if not coords:
+        """[v3] 캐시된 프레임에서 픽셀 프로브들을 한 번에 체크하는 비동기 헬퍼 (v1 is_at_combat_spot 기반)"""
+        probes = normalize_probes(instruction)
+        if not probes:
             return False
 
         try:
-            return pyautogui.pixelMatchesColor(coords[0], coords[1], instruction['color'],
-                                               tolerance=instruction['tolerance'])
-        except OSError:
-            return False  # (pyautogui의 일반적인 예외)
+            frame = self._get_screen_frame(screen)
+            return screen.pixel_probes.check_all(frame, probes, instruction.get('match', 'all'))
         except Exception as e:
-            print(f"ERROR: [{screen.window_id}] _helper_check_pixel_once 실패: {e}")
+            log.error(f"[{screen.window_id}] _helper_check_pixel_once 실패: {e}")
             return False
 
     def _helper_get_coords(self, screen: CombatScreenInfo, coord_key: str) -> Optional[Tuple[int, int]]:
@@ -506,7 +585,7 @@ class CombatMonitor(BaseMonitor):
 
     def stop(self):
         """[v1 계승] Orchestrator의 종료 호출"""
-        print(f"[{self.monitor_id}] CombatMonitor stop() method called.")
+        log.info(f"[{self.monitor_id}] CombatMonitor stop() method called.")
         # (BaseMonitor의 stop이 있다면 호출)
         # super().stop()
 
@@ -515,18 +594,18 @@ class CombatMonitor(BaseMonitor):
 # 🧪 (v1의 __main__ 테스트 스텁은 v3에서도 동일하게 작동해야 함)
 # =============================================================================
 if __name__ == "__main__":
-    print("CombatMonitor 모듈 직접 실행 테스트 (v3 제너레이터 모델)")
+    log.info("CombatMonitor 모듈 직접 실행 테스트 (v3 제너레이터 모델)")
 
     # ❗️ [가상] srm_config_raven2.py (v3)가 v2와 동일한 정책 맵을 제공한다고 가정
     # (실제로는 srm_config.py에 get_state_policies()가 구현되어 있어야 함)
     try:
         if not hasattr(srm_config, 'get_state_policies'):
-            print("ERROR: srm_config_raven2.py에 get_state_policies()가 없습니다.")
-            print("       v3 config 파일이 올바르게 구현되었는지 확인하세요.")
+            log.error("srm_config_raven2.py에 get_state_policies()가 없습니다.")
+            log.info("       v3 config 파일이 올바르게 구현되었는지 확인하세요.")
             exit()
     except Exception as e:
-        print(f"ERROR: srm_config_raven2.py 임포트 중 오류: {e}")
+        log.error(f"srm_config_raven2.py 임포트 중 오류: {e}")
         exit()
 
     monitor = CombatMonitor()  # (v1 테스트 스텁은 io_scheduler 없이 호출함 - 실제론 실패)
-    print("테스트 스텁 실행... (실제 실행을 위해서는 Orchestrator가 필요합니다)")
\ No newline at end of file
+    log.info("테스트 스텁 실행... (실제 실행을 위해서는 Orchestrator가 필요합니다)")
\ No newline at end of file
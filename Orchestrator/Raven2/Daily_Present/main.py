@@ -2,6 +2,9 @@ import sys
 import os
 from Orchestrator.Raven2.utils.screen_utils import TaskScreenPreparer      # Raven2용
 import time
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 # 상대 경로 임포트를 위한 경로 설정 - 단순화
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -14,7 +17,7 @@ from src.core.daily_present import DailyPresent
 
 def main():
     """Daily Present 모듈의 진입점"""
-    print("Daily Present 모듈 시작...")
+    log.info("Daily Present 모듈 시작...")
 
     preparer = TaskScreenPreparer()
     preparer.prepare_all_screens()
@@ -52,9 +55,9 @@ def main():
     try:
         dp.run()
     except Exception as e:
-        print(f"예외 발생: {e}")
+        log.exception(f"예외 발생: {e}")
     finally:
-        print("Daily Present 모듈 종료")
+        log.info("Daily Present 모듈 종료")
 
 
 if __name__ == "__main__":
@@ -6,13 +6,14 @@ from enum import Enum
 from typing import List, Tuple, Optional, Dict # Dict 추가 (DP1 참고)
 import cv2
 import numpy as np
-import traceback
-import pyautogui
-import keyboard
-import time
 import random
 import os
 from Orchestrator.Raven2.utils.screen_info import SCREEN_REGIONS, EVENT_UI_REGIONS
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 DEBUG_OUTPUT_FOLDER = r"C:\Users\yjy16\template\test"
@@ -84,7 +85,7 @@ class DailyPresent:
     def find_ui_location_in_region(self, region: Tuple[int, int, int, int], template_path: str) -> Optional[Tuple[int, int]]:
         # ... (기존 DP2 코드와 동일) ...
         try:
-            screenshot = pyautogui.screenshot(region=region)
+            screenshot = inputs.screenshot(region=region)
             template = cv2.imread(template_path)
             if template is None: return None # 경로 오류 등
             screen_gray = cv2.cvtColor(np.array(screenshot), cv2.COLOR_RGB2GRAY)
@@ -99,7 +100,7 @@ class DailyPresent:
                 random_offset_y = random.randint(-3, 3)
                 return (center_x + random_offset_x, center_y + random_offset_y)
             return None
-        except Exception as e: print(f"Error in find_ui_location_in_region: {e}"); return None
+        except Exception as e: log.error(f"Error in find_ui_location_in_region: {e}"); return None
 
     def find_ui_location(self, screen: Screen, template_path: str) -> Optional[Tuple[int, int]]:
         return self.find_ui_location_in_region(screen.region, template_path)
@@ -119,7 +120,7 @@ class DailyPresent:
 
             try:
                 # 1. 지정된 영역만 캡처
-                screenshot_roi = pyautogui.screenshot(region=region)
+                screenshot_roi = inputs.screenshot(region=region)
                 img_roi = np.array(screenshot_roi)
                 img_roi_bgr = cv2.cvtColor(img_roi, cv2.COLOR_RGB2BGR)
 
@@ -175,17 +176,17 @@ class DailyPresent:
                             final_y = center_y_abs + random.randint(-2, 2)
                             valid_centers.append((final_x, final_y))
 
-                print(f"{screen_id} 영역에서 감지된 빨간색 요소 (단순 필터링): {len(valid_centers)}개")
+                log.debug(f"{screen_id} 영역에서 감지된 빨간색 요소 (단순 필터링): {len(valid_centers)}개",
+                          screen_id=screen_id)
                 return valid_centers
 
             except Exception as e:
-                print(f"단순 빨간점 감지 중 오류 발생 ({screen_id}): {e}")
-                traceback.print_exc()
+                log.exception(f"단순 빨간점 감지 중 오류 발생 ({screen_id}): {e}")
                 return []
     def find_glowing_items_in_region(self, region: Tuple[int, int, int, int], screen_id: str) -> List[Tuple[int, int]]: # 반환 타입 좌표 튜플 리스트 유지
         try:
             x, y, w, h = region
-            screenshot = pyautogui.screenshot(region=region)
+            screenshot = inputs.screenshot(region=region)
             image_roi = np.array(screenshot) # ROI 이미지
 
             # --- 가우시안 블러 제거 ---
@@ -257,8 +258,7 @@ class DailyPresent:
             return found_items
 
         except Exception as e:
-            print(f"빛나는 UI 요소 감지 중 오류 발생 ({screen_id}): {e}") # 에러 로그에 screen_id 추가
-            traceback.print_exc()
+            log.exception(f"빛나는 UI 요소 감지 중 오류 발생 ({screen_id}): {e}") # 에러 로그에 screen_id 추가
             return []
 
     # --- Wrapper 메서드 (DP1 구조 참고하되, 내부 호출은 DP2 탐지 메서드 유지) ---
@@ -281,7 +281,7 @@ class DailyPresent:
 
     # --- 클릭/스크롤 메서드 (변경 없음) ---
     def click_with_offset(self, position: Tuple[int, int], offset_x: int = -2, offset_y: int = 2):
-        pyautogui.click(position[0] + offset_x, position[1] + offset_y)
+        inputs.click(position[0] + offset_x, position[1] + offset_y)
 
     def scroll_in_left_menu(self, screen: Screen):
         # ... (기존 DP2 스크롤 로직 유지 또는 DP1 로직 적용 - DP1 로직 적용) ...
@@ -290,14 +290,14 @@ class DailyPresent:
             # DP1의 스크롤 방향 및 위치 로직 적용
             if self.left_scroll_direction_down: start_y = menu_region[1] + menu_region[3] * 3 // 4; end_y = menu_region[1] + menu_region[3] // 3; direction_str = "DOWN"
             else: start_y = menu_region[1] + menu_region[3] // 3; end_y = menu_region[1] + menu_region[3] * 3 // 4; direction_str = "UP"
-            end_x = start_x; print(f"[{screen.screen_id}] 왼쪽 메뉴 {direction_str} 스크롤 시작")
-            pyautogui.moveTo(start_x, start_y); time.sleep(0.05) # DP1 스타일 sleep
-            pyautogui.mouseDown(button='left'); time.sleep(0.05) # DP1 스타일 sleep
-            pyautogui.moveTo(end_x, end_y, duration=0.15) # DP1 스타일 duration
-            pyautogui.mouseUp(button='left'); time.sleep(0.5) # DP1 스타일 sleep (0.1->0.5로 약간 늘림)
+            end_x = start_x; log.info(f"[{screen.screen_id}] 왼쪽 메뉴 {direction_str} 스크롤 시작")
+            inputs.move_to(start_x, start_y); clock.sleep(0.05) # DP1 스타일 sleep
+            inputs.mouse_down(button='left'); clock.sleep(0.05) # DP1 스타일 sleep
+            inputs.move_to(end_x, end_y, duration=0.15) # DP1 스타일 duration
+            inputs.mouse_up(button='left'); clock.sleep(0.5) # DP1 스타일 sleep (0.1->0.5로 약간 늘림)
             self.left_scroll_direction_down = not self.left_scroll_direction_down
-            print(f"[{screen.screen_id}] {direction_str} 스크롤 완료"); return True
-        except Exception as e: print(f"Error in scroll_in_left_menu: {e}"); pyautogui.mouseUp(button='left'); return False
+            log.info(f"[{screen.screen_id}] {direction_str} 스크롤 완료"); return True
+        except Exception as e: log.error(f"Error in scroll_in_left_menu: {e}"); inputs.mouse_up(button='left'); return False
 
     def scroll_in_right_content(self, screen: Screen):
         # ... (기존 DP2 스크롤 로직 유지 또는 DP1 로직 적용 - DP1 로직 적용) ...
@@ -306,26 +306,26 @@ class DailyPresent:
             # DP1의 스크롤 방향 및 위치 로직 적용 (비율은 DP2 것 유지)
             if self.right_scroll_direction_down: start_y = content_region[1] + content_region[3] * 5 // 6; end_y = content_region[1] + content_region[3] // 3; direction_str = "DOWN" # DP2 비율
             else: start_y = content_region[1] + content_region[3] * 1 // 5; end_y = content_region[1] + content_region[3] * 4 // 5; direction_str = "UP" # DP2 비율
-            end_x = start_x; print(f"[{screen.screen_id}] 오른쪽 콘텐츠 {direction_str} 스크롤 시작")
-            pyautogui.moveTo(start_x, start_y); time.sleep(0.05) # DP1 스타일 sleep
-            pyautogui.mouseDown(button='left'); time.sleep(0.05) # DP1 스타일 sleep
-            pyautogui.moveTo(end_x, end_y, duration=0.15) # DP1 스타일 duration (0.3->0.15)
-            pyautogui.mouseUp(button='left'); time.sleep(0.1) # DP1 스타일 sleep (0.2->0.1)
+            end_x = start_x; log.info(f"[{screen.screen_id}] 오른쪽 콘텐츠 {direction_str} 스크롤 시작")
+            inputs.move_to(start_x, start_y); clock.sleep(0.05) # DP1 스타일 sleep
+            inputs.mouse_down(button='left'); clock.sleep(0.05) # DP1 스타일 sleep
+            inputs.move_to(end_x, end_y, duration=0.15) # DP1 스타일 duration (0.3->0.15)
+            inputs.mouse_up(button='left'); clock.sleep(0.1) # DP1 스타일 sleep (0.2->0.1)
             self.right_scroll_direction_down = not self.right_scroll_direction_down
-            print(f"[{screen.screen_id}] {direction_str} 스크롤 완료"); return True
-        except Exception as e: print(f"Error in scroll_in_right_content: {e}"); pyautogui.mouseUp(button='left'); return False
+            log.info(f"[{screen.screen_id}] {direction_str} 스크롤 완료"); return True
+        except Exception as e: log.error(f"Error in scroll_in_right_content: {e}"); inputs.mouse_up(button='left'); return False
 
 
     # === 상태 처리 메소드 수정 (DP1 로직 기반) ===
 
     def process_main_screen(self, screen: Screen):
         """메인 화면 처리 (DP1 로직 적용)"""
-        print(f"[{screen.screen_id}] 메인 화면 처리 중...")
+        log.info(f"[{screen.screen_id}] 메인 화면 처리 중...")
         event_icon_pos = self.find_ui_location(screen, screen.main_event_icon)
         if event_icon_pos:
-            print(f"[{screen.screen_id}] 이벤트 아이콘 발견, 클릭")
-            pyautogui.click(event_icon_pos[0], event_icon_pos[1])
-            time.sleep(0.3) # DP1과 유사한 대기 시간 (0.3)
+            log.info(f"[{screen.screen_id}] 이벤트 아이콘 발견, 클릭")
+            inputs.click(event_icon_pos[0], event_icon_pos[1])
+            clock.sleep(0.3) # DP1과 유사한 대기 시간 (0.3)
             # <<< DP1의 상태 변수 초기화 로직 추가 >>>
             self.last_clicked_left_dot_pos = None
             self.right_scroll_needed = False
@@ -334,19 +334,19 @@ class DailyPresent:
             # <<< 초기화 끝 >>>
             self.current_state = PresentState.EVENT_MENU
             return True
-        print(f"[{screen.screen_id}] 이벤트 아이콘을 찾을 수 없음")
+        log.info(f"[{screen.screen_id}] 이벤트 아이콘을 찾을 수 없음")
         return False # 실패 시 False 반환 (run 메소드에서 처리)
 
     def process_event_menu(self, screen: Screen):
         """이벤트 메뉴 처리 (DP1 로직 적용 + 근접성 체크 추가)"""
-        print(f"[{screen.screen_id}] 이벤트 메뉴 처리 중...")
+        log.info(f"[{screen.screen_id}] 이벤트 메뉴 처리 중...")
 
         # 왼쪽 메뉴에서 붉은 점 찾기 (DP2 탐지 메서드 호출)
         red_dot_positions = self.find_red_dot_in_left_menu(screen)
 
         if red_dot_positions:
             target_dot_pos = red_dot_positions[0]  # 첫 번째 점 선택
-            print(f"[{screen.screen_id}] 왼쪽 붉은 점 발견: {target_dot_pos}")
+            log.info(f"[{screen.screen_id}] 왼쪽 붉은 점 발견: {target_dot_pos}")
 
             # --- 근접성 체크 로직 ---
             is_same_item = False
@@ -363,10 +363,10 @@ class DailyPresent:
             # if self.last_clicked_left_dot_pos == target_dot_pos: # 기존 비교 제거
             if is_same_item:  # 수정된 비교 사용
                 self.current_item_right_scroll_attempts += 1
-                print(
+                log.info(
                     f"  -> 근접한 항목 재클릭 감지 (거리 제곱: {dist_sq:.2f}). 오른쪽 스크롤 시도 ({self.current_item_right_scroll_attempts}/{self.max_right_scroll_per_item}).")
                 if self.current_item_right_scroll_attempts > self.max_right_scroll_per_item:
-                    print(f"  -> 오른쪽 최대 스크롤 도달. 이 항목 건너뛰고 왼쪽 스크롤 시도.")
+                    log.info(f"  -> 오른쪽 최대 스크롤 도달. 이 항목 건너뛰고 왼쪽 스크롤 시도.")
                     self.current_state = PresentState.LEFT_MENU_SCROLL
                     # 다음 왼쪽 스크롤 시도를 위해 현재 아이템 정보 초기화 (선택 사항)
                     # self.last_clicked_left_dot_pos = None # 필요시 주석 해제
@@ -376,7 +376,7 @@ class DailyPresent:
                     # 같은 아이템이므로 last_clicked_left_dot_pos 업데이트 안 함
             else:
                 # 다른 점 클릭 시 초기화
-                print(f"  -> 새로운 항목 클릭.")
+                log.info(f"  -> 새로운 항목 클릭.")
                 self.right_scroll_needed = False
                 self.current_item_right_scroll_attempts = 0  # 새 항목이므로 리셋
                 self.last_clicked_left_dot_pos = target_dot_pos  # 마지막 클릭 정보 업데이트 (새 항목일 때만)
@@ -384,94 +384,94 @@ class DailyPresent:
             # 선택된 붉은 점 클릭 (같은 아이템이어도 클릭은 다시 수행)
             self.click_with_offset(target_dot_pos, -2, 2)
             # last_clicked_left_dot_pos 업데이트는 is_same_item == False 일 때 위에서 처리됨
-            time.sleep(0.2)
+            clock.sleep(0.2)
             self.current_state = PresentState.RIGHT_CONTENT
             return True
 
         # 붉은 점이 없다면 왼쪽 스크롤 시도 (DP1 로직)
         elif self.left_scroll_attempts < self.max_scroll_attempts:
-            print(
+            log.info(
                 f"[{screen.screen_id}] 왼쪽 붉은 점 없음, 스크롤 시도 ({self.left_scroll_attempts + 1}/{self.max_scroll_attempts})")
             self.current_state = PresentState.LEFT_MENU_SCROLL
             return True
         else:
             # 왼쪽 스크롤 다 했는데도 붉은 점 없으면 종료 (DP1 로직)
-            print(f"[{screen.screen_id}] 왼쪽 붉은 점 없음, 최대 스크롤 시도 도달, DP 종료.")
-            keyboard.press_and_release('esc')
-            time.sleep(0.3)
+            log.info(f"[{screen.screen_id}] 왼쪽 붉은 점 없음, 최대 스크롤 시도 도달, DP 종료.")
+            inputs.key_press('esc')
+            clock.sleep(0.3)
             self.current_state = PresentState.MAIN_SCREEN
             return False
     def process_left_menu_scroll(self, screen: Screen):
         """왼쪽 메뉴 스크롤 처리 (DP1 로직과 동일)"""
-        print(f"[{screen.screen_id}] 왼쪽 메뉴 스크롤 중... (시도 {self.left_scroll_attempts + 1}/{self.max_scroll_attempts})")
+        log.info(f"[{screen.screen_id}] 왼쪽 메뉴 스크롤 중... (시도 {self.left_scroll_attempts + 1}/{self.max_scroll_attempts})")
         if self.scroll_in_left_menu(screen):
             self.left_scroll_attempts += 1
-            print(f"[{screen.screen_id}] 스크롤 완료 (총 {self.left_scroll_attempts}회)")
+            log.info(f"[{screen.screen_id}] 스크롤 완료 (총 {self.left_scroll_attempts}회)")
             self.current_state = PresentState.EVENT_MENU # 스크롤 후 다시 이벤트 메뉴 확인
             return True
-        print(f"[{screen.screen_id}] 스크롤 실패")
+        log.info(f"[{screen.screen_id}] 스크롤 실패")
         # 스크롤 실패 시에도 일단 EVENT_MENU로 돌아가서 최종 종료 로직 타도록 함 (DP1과 동일)
         self.current_state = PresentState.EVENT_MENU
         return False # 실패 처리
 
     def process_right_content(self, screen: Screen):
         """오른쪽 콘텐츠 처리 (DP1 로직 적용, 탐지 메서드는 DP2 것 사용)"""
-        print(f"[{screen.screen_id}] 오른쪽 콘텐츠 처리 중...")
+        log.info(f"[{screen.screen_id}] 오른쪽 콘텐츠 처리 중...")
 
         # 스크롤이 필요한 경우인지 확인 (DP1 로직)
         if self.right_scroll_needed:
-            print(f"  -> 오른쪽 스크롤 필요 플래그 감지.")
+            log.info(f"  -> 오른쪽 스크롤 필요 플래그 감지.")
             self.right_scroll_needed = False # 플래그 사용했으니 리셋
             self.current_state = PresentState.RIGHT_CONTENT_SCROLL # 스크롤 상태로 전환
             return True
 
         # 스크롤 필요 없으면 보이는 영역에서 아이템 찾기
-        print(f"  -> 보이는 영역에서 오른쪽 빛나는 아이템(보상) 찾기 시도...")
+        log.info(f"  -> 보이는 영역에서 오른쪽 빛나는 아이템(보상) 찾기 시도...")
         # <<< DP2의 빛나는 아이템 탐지 메서드 호출 >>>
         glowing_item_positions = self.find_red_dot_in_right_content(screen) # 이름은 find_red_dot이지만 실제로는 glowing 탐색
 
         if glowing_item_positions:
             # 아이템(보상)을 찾았으면 클릭하고 REWARD_CLAIM 상태로
             target_item_pos = glowing_item_positions[0]
-            print(f"    -> 오른쪽 빛나는 아이템 발견: {target_item_pos}, 클릭.")
+            log.info(f"    -> 오른쪽 빛나는 아이템 발견: {target_item_pos}, 클릭.")
             self.click_with_offset(target_item_pos, -2, 2)
-            time.sleep(0.2) # 클릭 후 상태 전환 전 잠시 대기 (DP1 값)
+            clock.sleep(0.2) # 클릭 후 상태 전환 전 잠시 대기 (DP1 값)
             self.current_state = PresentState.REWARD_CLAIM
             return True
         else:
             # 보이는 영역에 아이템 없으면 -> 왼쪽 메뉴 확인하러 돌아감 (스크롤 X) (DP1 로직)
-            print(f"    -> 보이는 영역에 오른쪽 빛나는 아이템 없음. 왼쪽 메뉴로 복귀.")
+            log.info(f"    -> 보이는 영역에 오른쪽 빛나는 아이템 없음. 왼쪽 메뉴로 복귀.")
             self.current_state = PresentState.EVENT_MENU
             return True
 
     def process_right_content_scroll(self, screen: Screen):
         """오른쪽 콘텐츠 스크롤 처리 (DP1 로직 적용)"""
         # 이 메소드는 스크롤만 하고 다시 RIGHT_CONTENT로 돌아감
-        print(f"[{screen.screen_id}] 오른쪽 콘텐츠 스크롤 중... (항목 내 시도 {self.current_item_right_scroll_attempts}/{self.max_right_scroll_per_item})") # 카운터 표시 (DP1 참고)
+        log.info(f"[{screen.screen_id}] 오른쪽 콘텐츠 스크롤 중... (항목 내 시도 {self.current_item_right_scroll_attempts}/{self.max_right_scroll_per_item})") # 카운터 표시 (DP1 참고)
         if self.scroll_in_right_content(screen):
-            print(f"[{screen.screen_id}] 스크롤 완료")
-            time.sleep(0.1) # 스크롤 후 짧은 대기 (DP1 값)
+            log.info(f"[{screen.screen_id}] 스크롤 완료")
+            clock.sleep(0.1) # 스크롤 후 짧은 대기 (DP1 값)
             self.current_state = PresentState.RIGHT_CONTENT # 스크롤 했으니 다시 오른쪽 확인
             return True
-        print(f"[{screen.screen_id}] 스크롤 실패")
+        log.info(f"[{screen.screen_id}] 스크롤 실패")
         # 스크롤 실패 시, 해당 아이템 처리 포기하고 왼쪽 메뉴로 돌아가도록 함 (DP1 로직)
         self.current_state = PresentState.EVENT_MENU
         return False
 
     def process_reward_claim(self, screen: Screen):
         """보상 수령 처리 (DP1 로직 적용)"""
-        print(f"[{screen.screen_id}] 보상 수령 중...")
+        log.info(f"[{screen.screen_id}] 보상 수령 중...")
 
         # 보상 수령 후 처리 (DP1은 마우스 클릭, DP2는 ESC 사용 -> 우선 DP2의 ESC 유지)
         # 대기 시간은 DP2의 값(2.5초)을 사용 (게임별 애니메이션 시간 다를 수 있음)
-        print(f"  -> 대기 시간 시작 (2.5초)...")
-        time.sleep(2.5)
-        print(f"  -> 대기 시간 종료. ESC 키 입력 실행.")
-        keyboard.press_and_release('esc')
-        time.sleep(0.6) # ESC 후 안정화 시간 (DP2 값 유지)
+        log.info(f"  -> 대기 시간 시작 (2.5초)...")
+        clock.sleep(2.5)
+        log.info(f"  -> 대기 시간 종료. ESC 키 입력 실행.")
+        inputs.key_press('esc')
+        clock.sleep(0.6) # ESC 후 안정화 시간 (DP2 값 유지)
 
         # === 다음 상태를 EVENT_MENU로 변경 (DP1 로직 적용) ===
-        print(f"  -> 보상 처리 완료. 왼쪽 메뉴 확인하러 복귀.")
+        log.info(f"  -> 보상 처리 완료. 왼쪽 메뉴 확인하러 복귀.")
         self.current_state = PresentState.EVENT_MENU
         # ==============================================
         return True
@@ -490,28 +490,28 @@ class DailyPresent:
             return self.process_right_content_scroll(screen)
         elif self.current_state == PresentState.REWARD_CLAIM:
             return self.process_reward_claim(screen)
-        print(f"!!! 알 수 없는 상태: {self.current_state} !!!")
+        log.error(f"!!! 알 수 없는 상태: {self.current_state} !!!")
         return False
 
     def run(self):
         """모든 화면에서 Daily Present 처리 (DP1 로직 기반 - 상태 초기화 위치 등)"""
-        print("Daily Present 처리 시작...")
+        log.info("Daily Present 처리 시작...")
         countdown_time = 5
         for i in range(countdown_time, 0, -1):
-            print(f"시작까지 {i}초...")
-            time.sleep(1)
+            log.info(f"시작까지 {i}초...")
+            clock.sleep(1)
 
         try:
             # 화면 처리 루프 시작 전 초기화 (index는 여기서)
             self.current_screen_index = 0
             while self.current_screen_index < len(self.screens):
                 # 키보드 중단 체크 ('p' 키)
-                if keyboard.is_pressed('p'):
-                    print("사용자에 의해 중단됨 ('p' 키 입력)")
+                if inputs.is_pressed('p'):
+                    log.info("사용자에 의해 중단됨 ('p' 키 입력)")
                     break
 
                 screen = self.screens[self.current_screen_index]
-                print(f"\n--- 화면 {screen.screen_id} 처리 시작 --- (상태: {self.current_state.name})")
+                log.info(f"\n--- 화면 {screen.screen_id} 처리 시작 --- (상태: {self.current_state.name})")
 
                 # 상태 처리
                 result = self.process_current_state(screen)
@@ -522,7 +522,7 @@ class DailyPresent:
                     pass
                 else:
                     # 실패 또는 화면 처리 완료 시 (False 반환 시): 다음 화면으로 넘어감
-                    print(f"화면 {screen.screen_id} 처리 완료 또는 실패 감지. 다음 화면으로 이동.")
+                    log.info(f"화면 {screen.screen_id} 처리 완료 또는 실패 감지. 다음 화면으로 이동.")
                     self.current_screen_index += 1
                     self.current_state = PresentState.MAIN_SCREEN # 다음 화면은 항상 메인부터
 
@@ -530,27 +530,26 @@ class DailyPresent:
                     # >> 다음 화면 처리를 위한 상태 변수 초기화 (DP1 위치) <<
                     # ================================================
                     if self.current_screen_index < len(self.screens): # 다음 화면이 있을 경우에만 초기화
-                        print(f"  -> 다음 화면({self.screens[self.current_screen_index].screen_id})을 위해 상태 변수 초기화")
+                        log.info(f"  -> 다음 화면({self.screens[self.current_screen_index].screen_id})을 위해 상태 변수 초기화")
                         self.left_scroll_attempts = 0
                         self.last_clicked_left_dot_pos = None # DP1 스타일 초기화
                         self.right_scroll_needed = False      # DP1 스타일 초기화
                         self.current_item_right_scroll_attempts = 0 # DP1 스타일 초기화
                     # ================================================
 
-                time.sleep(0.3) # 메인 루프 지연 (DP1 값)
+                clock.sleep(0.3) # 메인 루프 지연 (DP1 값)
 
             # while 루프 정상 종료 시
             if self.current_screen_index >= len(self.screens):
-                 print("\n--- 모든 화면의 Daily Present 처리 완료 ---")
+                 log.info("\n--- 모든 화면의 Daily Present 처리 완료 ---")
 
         # 예외 처리 (DP1/DP2 동일)
         except KeyboardInterrupt:
-            print("키보드 인터럽트로 중단됨")
+            log.info("키보드 인터럽트로 중단됨")
         except Exception as e:
-            print(f"에러 발생: {e}")
-            traceback.print_exc()
+            log.exception(f"에러 발생: {e}")
         finally:
-            print("Daily Present 처리 종료")
+            log.info("Daily Present 처리 종료")
 
 # main 실행 부분은 기존 DP2의 main.py를 그대로 사용하면 됩니다.
 # 이 파일은 클래스 정의만 포함합니다.
\ No newline at end of file
@@ -3,6 +3,9 @@ import os
 from pathlib import Path
 import time
 from Orchestrator.Raven2.utils.screen_utils import TaskScreenPreparer
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 # --- 경로 설정 시작 ---
 main_py_path = Path(__file__).resolve()
@@ -15,11 +18,11 @@ try:
     # opener.py 위치에 따라 경로 수정 필요
     from Orchestrator.Raven2.Mail_opener.src.core.opener import MailOpener
 except ImportError as e:
-    print(f"Error importing MailOpener: {e}")
+    log.error(f"Error importing MailOpener: {e}")
     sys.exit(1)
 
 if __name__ == "__main__":
-    print("Starting MO2 (Raven2 Mail Opener)...")
+    log.info("Starting MO2 (Raven2 Mail Opener)...")
     preparer = TaskScreenPreparer()
     preparer.prepare_all_screens()
 
@@ -42,7 +45,7 @@ if __name__ == "__main__":
         required_keys = ['mail_icon', 'notice_tab', 'envelope', 'collect_all', 'confirm']
         for key in required_keys:
             if key not in config:
-                print(f"Error: Key '{key}' missing in screen_configs for screen '{config['id']}'")
+                log.error(f"Key '{key}' missing in screen_configs for screen '{config['id']}'")
                 all_exist = False
                 break
 
@@ -50,7 +53,7 @@ if __name__ == "__main__":
             path = template_base_path / config[key]
             paths[key] = str(path)
             if not path.exists():
-                print(f"WARN: Template not found for {config['id']} - {key}: '{path}'")
+                log.warning(f"Template not found for {config['id']} - {key}: '{path}'")
                 all_exist = False
                 # break # 템플릿 없으면 추가하지 않으려면 주석 해제
 
@@ -69,21 +72,19 @@ if __name__ == "__main__":
             envelope=paths['envelope'],
             confirm=paths['confirm']
         )
-        print(f"Added screen config for {config['id']}")
+        log.info(f"Added screen config for {config['id']}")
 
     countdown_time = 5
-    print(f"--- MO2 will start in {countdown_time} seconds. Prepare RAVEN2 screens. ---")
+    log.info(f"--- MO2 will start in {countdown_time} seconds. Prepare RAVEN2 screens. ---")
     for i in range(countdown_time, 0, -1):
-        print(f"{i}...")
+        log.info(f"{i}...")
         time.sleep(1)
 
-    print("Running Raven2 mail opening process...")
+    log.info("Running Raven2 mail opening process...")
     try:
         mo.run()
-        print("MO2 process completed successfully.")
+        log.info("MO2 process completed successfully.")
         sys.exit(0)
     except Exception as e:
-        print(f"An error occurred during MO2 execution: {e}")
-        import traceback
-        traceback.print_exc()
+        log.exception(f"An error occurred during MO2 execution: {e}")
         sys.exit(1)
\ No newline at end of file
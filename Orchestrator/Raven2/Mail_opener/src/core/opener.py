@@ -1,14 +1,16 @@
 from dataclasses import dataclass
 import cv2
 import numpy as np
-import pyautogui
-import keyboard
-import time
 from typing import List
 from dataclasses import dataclass
-from pymsgbox import confirm
 
 from Orchestrator.Raven2.utils.screen_info import SCREEN_REGIONS, FIXED_UI_COORDS
+from Orchestrator.src.utils.wait_utils import wait_for
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 @dataclass
@@ -37,7 +39,7 @@ class MailOpener:
     def find_and_click(self, screen: Screen, template_path: str) -> bool:
         """템플릿 매칭으로 요소를 찾아 클릭 (고정 좌표 대안 포함)"""
         try:
-            screenshot = pyautogui.screenshot(region=screen.region)
+            screenshot = inputs.screenshot(region=screen.region)
             template = cv2.imread(template_path)
 
             if template is None:
@@ -54,7 +56,7 @@ class MailOpener:
                 center_x = screen.region[0] + max_loc[0] + template_w // 2
                 center_y = screen.region[1] + max_loc[1] + template_h // 2
 
-                pyautogui.click(
+                inputs.click(
                     center_x + np.random.randint(-2, 3),
                     center_y + np.random.randint(-2, 3)
                 )
@@ -63,7 +65,7 @@ class MailOpener:
             return False
 
         except Exception as e:
-            print(f"Error in find_and_click: {e}")
+            log.error(f"Error in find_and_click: {e}")
             return False
 
     def find_and_click_with_fallback(self, screen: Screen, template_path: str, coord_key: str = None) -> bool:
@@ -74,97 +76,94 @@ class MailOpener:
 
         # 2차: 고정 좌표 시도 (coord_key가 있을 경우)
         if coord_key and self.click_fixed_coord(screen, coord_key):
-            print(f"Template failed, used fixed coords for {coord_key} on {screen.screen_id}")
+            log.info(f"Template failed, used fixed coords for {coord_key} on {screen.screen_id}")
             return True
 
-        print(f"Both template and fixed coords failed for {coord_key or 'unknown'} on {screen.screen_id}")
+        log.info(f"Both template and fixed coords failed for {coord_key or 'unknown'} on {screen.screen_id}")
         return False
 
     def find_envelope_with_retry(self, screen: Screen, max_attempts: int = 8) -> bool:
-        """봉투 찾기 (재시도 로직)"""
-        for attempt in range(max_attempts):
-            if self.find_and_click(screen, screen.envelope):
-                print(f"Envelope found on attempt {attempt + 1}")
-                return True
-
-            if attempt < max_attempts - 1:  # 마지막 시도가 아니면
-                print(f"Envelope attempt {attempt + 1}/{max_attempts} failed, retrying...")
-                time.sleep(0.5)
+        """봉투 찾기 (재시도 로직) - 기존 max_attempts × 0.5초 구간 안에서 등장 즉시 클릭"""
+        timeout = (max_attempts - 1) * 0.5
+        if wait_for(lambda: self.find_and_click(screen, screen.envelope), timeout=timeout,
+                    label=f"R2.{screen.screen_id}.ENVELOPE"):
+            log.info(f"Envelope found on {screen.screen_id}")
+            return True
 
-        print(f"No envelope found after {max_attempts} attempts on {screen.screen_id}")
+        log.info(f"No envelope found within {timeout:.1f}s on {screen.screen_id}")
         return False
 
     def process_screen(self, screen: Screen):
         """한 화면의 메일 수집 처리 (수정된 버전)"""
-        print(f"Processing screen: {screen.screen_id} for Raven2 Mail")
+        log.info(f"Processing screen: {screen.screen_id} for Raven2 Mail")
 
         # 1. 메인 메뉴 버튼 클릭 (고정 좌표만 사용)
-        print("Clicking main menu button...")
+        log.info("Clicking main menu button...")
         if not self.click_fixed_coord(screen, 'main_menu_button'):
-            print(f"Failed to click main menu on {screen.screen_id}. Aborting.")
+            log.error(f"Failed to click main menu on {screen.screen_id}. Aborting.")
             return
-        time.sleep(1.0)
+        clock.sleep(1.0)
 
         # 2. 메일 아이콘 클릭 (템플릿 + 고정 좌표 대안)
         if not self.find_and_click_with_fallback(screen, screen.mail_icon, 'mail_icon'):
-            print(f"Mail icon not found on {screen.screen_id}. Aborting.")
+            log.info(f"Mail icon not found on {screen.screen_id}. Aborting.")
             return
-        time.sleep(1.0)
+        clock.sleep(1.0)
 
         # 3. "공지" 탭 클릭 (템플릿 + 고정 좌표 대안)
         if not self.find_and_click_with_fallback(screen, screen.notice_tab, 'notice_tab'):
-            print(f"'Notice' tab not found on {screen.screen_id}. Aborting.")
-            keyboard.press_and_release('esc')
+            log.info(f"'Notice' tab not found on {screen.screen_id}. Aborting.")
+            inputs.key_press('esc')
             return
-        time.sleep(0.5)
-        print("Entered Mailbox and selected 'Notice' tab.")
+        clock.sleep(0.5)
+        log.info("Entered Mailbox and selected 'Notice' tab.")
 
         # 4. 반복 구간: 봉투 처리 (재시도 로직)
         mail_processed_count = 0
         max_attempts = 15
-        print("Starting envelope processing loop...")
+        log.info("Starting envelope processing loop...")
 
         for attempt in range(max_attempts):
-            print(f"Loop {attempt + 1}/{max_attempts}: Searching for envelope...")
+            log.info(f"Loop {attempt + 1}/{max_attempts}: Searching for envelope...")
 
             # 4-1. 편지 봉투 찾기 (재시도 포함)
             if self.find_envelope_with_retry(screen, max_attempts=3):
-                print("  Envelope found and clicked.")
-                time.sleep(0.7)
+                log.info("  Envelope found and clicked.")
+                clock.sleep(0.7)
 
                 # 4-2. 모두 받기 버튼 클릭
                 if self.find_and_click(screen, screen.collect_all):
-                    print("    Collect All button clicked.")
-                    time.sleep(0.7)
+                    log.info("    Collect All button clicked.")
+                    clock.sleep(0.7)
 
                     # 4-3. 확인 버튼 클릭
                     if self.find_and_click(screen, screen.confirm):
-                        print("      Confirm button clicked.")
+                        log.info("      Confirm button clicked.")
                         mail_processed_count += 1
-                        print("        Waiting 0.7s and pressing ESC...")
-                        time.sleep(0.8)
-                        keyboard.press_and_release('esc')
-                        time.sleep(0.8)
+                        log.info("        Waiting 0.7s and pressing ESC...")
+                        clock.sleep(0.8)
+                        inputs.key_press('esc')
+                        clock.sleep(0.8)
                         continue
                     else:
-                        print(
+                        log.error(
                             f"      Error: Confirm button not found after Collect All on {screen.screen_id}. Stopping.")
                         break
                 else:
-                    print(
+                    log.error(
                         f"    Error: Collect All button not found after clicking envelope on {screen.screen_id}. Stopping.")
                     break
             else:
                 # 더 이상 편지 봉투가 없으면 루프 종료
-                print(f"  No more envelopes found on attempt {attempt + 1}.")
+                log.info(f"  No more envelopes found on attempt {attempt + 1}.")
                 break
         else:
-            print(f"Warning: Reached max attempts ({max_attempts}). Ending loop.")
+            log.warning(f"Reached max attempts ({max_attempts}). Ending loop.")
 
         # 5. 최종 나가기
-        print(f"Finishing mail processing for {screen.screen_id}. Processed {mail_processed_count} items. Exiting...")
-        keyboard.press_and_release('esc')
-        print("Exited mail screen.")
+        log.info(f"Finishing mail processing for {screen.screen_id}. Processed {mail_processed_count} items. Exiting...")
+        inputs.key_press('esc')
+        log.info("Exited mail screen.")
 
     def click_fixed_coord(self, screen: Screen, coord_key: str) -> bool:
         """screen_info에 정의된 고정 좌표를 클릭"""
@@ -175,8 +174,8 @@ class MailOpener:
 
             # 해당 화면의 고정 UI 좌표 정보 가져오기
             if screen.screen_id not in FIXED_UI_COORDS or coord_key not in FIXED_UI_COORDS[screen.screen_id]:
-                print(
-                    f"Error: Fixed coordinate '{coord_key}' not defined for screen '{screen.screen_id}' in screen_info.py")
+                log.error(
+                    f"Fixed coordinate '{coord_key}' not defined for screen '{screen.screen_id}' in screen_info.py")
                 return False
 
             relative_coords = FIXED_UI_COORDS[screen.screen_id][coord_key]  # 예: (550, 50)
@@ -189,19 +188,19 @@ class MailOpener:
             # 계산된 절대 좌표 클릭 (약간의 랜덤 오프셋 추가 가능)
             click_x = absolute_x + np.random.randint(-1, 2)
             click_y = absolute_y + np.random.randint(-1, 2)
-            pyautogui.click(click_x, click_y)
-            print(f"Clicked fixed coord '{coord_key}' for screen {screen.screen_id} at ({click_x}, {click_y})")
+            inputs.click(click_x, click_y)
+            log.info(f"Clicked fixed coord '{coord_key}' for screen {screen.screen_id} at ({click_x}, {click_y})")
             return True
 
         except Exception as e:
-            print(f"Error in click_fixed_coord: {e}")
+            log.error(f"Error in click_fixed_coord: {e}")
             return False
 
     def run(self):
         """모든 화면 처리"""
         for screen in self.screens:
             self.process_screen(screen)
-            time.sleep(0.5)  # 화면 간 딜레이
+            clock.sleep(0.5)  # 화면 간 딜레이
 
     # opener.py (MO2 용, process_screen 수정)
 
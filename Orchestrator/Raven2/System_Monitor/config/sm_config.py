@@ -9,6 +9,9 @@ SM1 v3 리모델링 설정 (제너레이터 '상황반장' 아키텍처)
 
 from enum import Enum, auto
 from typing import Generator, Dict, Any, Optional
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 # =============================================================================
@@ -43,7 +46,7 @@ def policy_connection_error(screen: dict) -> Generator[Dict[str, Any], Any, None
     [상황반장: 연결 오류]
     v1의 'detect_and_click' (retry 3회) 로직을 번역합니다.
     """
-    print(f"INFO: [{screen['screen_id']}] 상황반장: '연결 오류' 접수. 3회 확인 시도.")
+    log.info(f"[{screen['screen_id']}] 상황반장: '연결 오류' 접수. 3회 확인 시도.")
 
     # v1의 'retry_config': max_attempts: 3, retry_delay: 2.5
     for attempt in range(1, 4):  # 1, 2, 3
@@ -54,7 +57,7 @@ def policy_connection_error(screen: dict) -> Generator[Dict[str, Any], Any, None
         }
 
         if pos:
-            print(f"INFO: [{screen['screen_id']}] 연결 오류 확인 버튼 클릭 성공.")
+            log.info(f"[{screen['screen_id']}] 연결 오류 확인 버튼 클릭 성공.")
             return  # 성공! 제너레이터 종료 (-> 'complete' 전이)
 
         # 실패 시 2.5초 대기 후 다음 시도
@@ -69,7 +72,7 @@ def policy_client_crashed(screen: dict) -> Generator[Dict[str, Any], Any, None]:
     [상황반장: 클라이언트 크래시]
     APP_ICON 클릭 후 실제 실행 여부(아이콘 소멸 여부)를 검증하는 로직 추가
     """
-    print(f"INFO: [{screen['screen_id']}] 상황반장: '클라이언트 크래시' 접수. 3회 재시작 시도.")
+    log.info(f"[{screen['screen_id']}] 상황반장: '클라이언트 크래시' 접수. 3회 재시작 시도.")
 
     # v1의 'retry_config': max_attempts: 3
     for attempt in range(1, 4):
@@ -80,7 +83,7 @@ def policy_client_crashed(screen: dict) -> Generator[Dict[str, Any], Any, None]:
         }
 
         if pos:
-            print(f"INFO: [{screen['screen_id']}] 앱 아이콘 클릭 시도({attempt}). 10초 후 실행 여부 검증...")
+            log.info(f"[{screen['screen_id']}] 앱 아이콘 클릭 시도({attempt}). 10초 후 실행 여부 검증...")
 
             # 2. 10초 대기 (앱이 실행되어 화면을 덮거나 아이콘이 사라질 시간)
             yield {'operation': 'wait_duration', 'duration': 10.0}
@@ -95,11 +98,11 @@ def policy_client_crashed(screen: dict) -> Generator[Dict[str, Any], Any, None]:
 
             if not still_there:
                 # 아이콘을 못 찾음 -> 게임 창이 떴거나 아이콘이 사라짐 -> 성공!
-                print(f"INFO: [{screen['screen_id']}] 앱 실행 확인됨 (아이콘 사라짐).")
+                log.info(f"[{screen['screen_id']}] 앱 실행 확인됨 (아이콘 사라짐).")
                 return  # 성공적으로 제너레이터 종료 -> RESTARTING_APP 상태로 전이
 
             # 아이콘이 여전히 있음 -> 클릭이 씹혔거나 실행 실패 -> 루프 계속(재시도)
-            print(f"WARN: [{screen['screen_id']}] 앱 아이콘이 여전히 화면에 있습니다. 클릭 실패로 간주하고 재시도합니다.")
+            log.warning(f"[{screen['screen_id']}] 앱 아이콘이 여전히 화면에 있습니다. 클릭 실패로 간주하고 재시도합니다.")
 
         # 클릭 실패 또는 검증 실패 시 잠시 대기 후 재시도
         yield {'operation': 'wait_duration', 'duration': 2.0}
@@ -113,13 +116,13 @@ def policy_restarting_app(screen: dict) -> Generator[Dict[str, Any], Any, None]:
     [상황반장: 앱 재시작 대기]
     v1의 'time_based_wait' (expected_duration: 30.0) 로직을 번역합니다.
     """
-    print(f"INFO: [{screen['screen_id']}] 상황반장: '앱 재시작' 대기 (30초).")
+    log.info(f"[{screen['screen_id']}] 상황반장: '앱 재시작' 대기 (30초).")
 
     # v1의 'expected_duration': 30.0
     yield {'operation': 'wait_duration', 'duration': 30.0}
 
     # 30초 대기 후, 제너레이터가 정상 종료 (-> 'complete' 전이)
-    print(f"INFO: [{screen['screen_id']}] 앱 재시작 시간 경과. 'LOGIN_REQUIRED'로 이동.")
+    log.info(f"[{screen['screen_id']}] 앱 재시작 시간 경과. 'LOGIN_REQUIRED'로 이동.")
 
 
 def policy_logging_in(screen: dict) -> Generator[Dict[str, Any], Any, None]:
@@ -127,12 +130,12 @@ def policy_logging_in(screen: dict) -> Generator[Dict[str, Any], Any, None]:
     [상황반장: 로그인 진행 중]
     v1의 'time_based_wait' (expected_duration: 15.0) 로직을 번역합니다.
     """
-    print(f"INFO: [{screen['screen_id']}] 상황반장: '로그인' 대기 (15초).")
+    log.info(f"[{screen['screen_id']}] 상황반장: '로그인' 대기 (15초).")
 
     # v1의 'expected_duration': 15.0
     yield {'operation': 'wait_duration', 'duration': 15.0}
 
-    print(f"INFO: [{screen['screen_id']}] 로그인 시간 경과. 'RETURNING_TO_GAME'으로 이동.")
+    log.info(f"[{screen['screen_id']}] 로그인 시간 경과. 'RETURNING_TO_GAME'으로 이동.")
 
 
 def policy_returning_to_game(screen: dict) -> Generator[Dict[str, Any], Any, None]:
@@ -140,12 +143,12 @@ def policy_returning_to_game(screen: dict) -> Generator[Dict[str, Any], Any, Non
     [상황반장: 게임 복귀 중]
     v1의 'time_based_wait' (expected_duration: 15.0) 로직을 번역합니다.
     """
-    print(f"INFO: [{screen['screen_id']}] 상황반장: '게임 복귀' 대기 (15초).")
+    log.info(f"[{screen['screen_id']}] 상황반장: '게임 복귀' 대기 (15초).")
 
     # v1의 'expected_duration': 15.0
     yield {'operation': 'wait_duration', 'duration': 15.0}
 
-    print(f"INFO: [{screen['screen_id']}] 게임 복귀 시간 경과. 'NORMAL'로 이동.")
+    log.info(f"[{screen['screen_id']}] 게임 복귀 시간 경과. 'NORMAL'로 이동.")
 
 
 # System_Monitor/config/sm_config.py
@@ -158,7 +161,7 @@ def policy_login_required(screen: dict) -> Generator[Dict[str, Any], Any, None]:
     2. 로그인 버튼 등장 대기
     3. 로그인 버튼 클릭
     """
-    print(f"INFO: [{screen['screen_id']}] 상황반장: '로그인 시퀀스' 시작 (Raven2).")
+    log.info(f"[{screen['screen_id']}] 상황반장: '로그인 시퀀스' 시작 (Raven2).")
 
     # 최대 5회 시도 (단순 클릭이므로 10회까지 필요 없을 수 있음)
     for attempt in range(1, 6):
@@ -168,7 +171,7 @@ def policy_login_required(screen: dict) -> Generator[Dict[str, Any], Any, None]:
             # ---------------------------------------------------------
             # set_focus 명령은 monitor.py에서 해당 화면의 중앙을 클릭하도록 처리됨
             yield {'operation': 'set_focus'}
-            print(f"INFO: [{screen['screen_id']}] 화면 중앙 클릭 (Tap to Start).")
+            log.info(f"[{screen['screen_id']}] 화면 중앙 클릭 (Tap to Start).")
 
             # ---------------------------------------------------------
             # 2단계: 로그인 버튼 등장 대기
@@ -187,12 +190,12 @@ def policy_login_required(screen: dict) -> Generator[Dict[str, Any], Any, None]:
             }
 
             # 여기까지 오면 성공한 것임
-            print(f"INFO: [{screen['screen_id']}] 로그인 버튼 클릭 성공.")
+            log.info(f"[{screen['screen_id']}] 로그인 버튼 클릭 성공.")
             return  # 성공 시 제너레이터 종료 -> 'complete' 상태(LOGGING_IN)로 전이
 
         except Exception as e:
             # 버튼을 못 찾았거나 클릭 씹힘 등 문제 발생 시
-            print(f"WARN: [{screen['screen_id']}] 로그인 시도 {attempt} 실패 (재시도 합니다): {e}")
+            log.warning(f"[{screen['screen_id']}] 로그인 시도 {attempt} 실패 (재시도 합니다): {e}")
             # 잠시 호흡 고르고 다시 시도
             yield {'operation': 'wait_duration', 'duration': 2.0}
 
@@ -271,7 +274,17 @@ STATE_POLICY_MAP = {
 SM_CONFIG = {
     'timing': {
         'check_interval': 5.0,
-        'default_timeout': 60.0
+        'default_timeout': 60.0,
+        # 상태별 폴링 간격 (초). 없는 상태(NORMAL, SRM 담당 상태)는 check_interval
+        'state_intervals': {
+            SystemState.CONNECTION_ERROR: 1.0,
+            SystemState.CLIENT_CRASHED: 1.0,
+            SystemState.RESTARTING_APP: 2.0,
+            SystemState.LOGIN_REQUIRED: 1.0,
+            SystemState.LOGGING_IN: 1.0,
+            SystemState.RETURNING_TO_GAME: 1.0,
+        },
+        'poll_interval': 0.5  # 대기형 지시(wait_for_template) 중인 화면
     },
     'target_screens': {
         'included': ['S1', 'S2', 'S3', 'S4'],
@@ -334,27 +347,27 @@ def validate_config() -> bool:
         required_sections = ['timing', 'target_screens', 'io_policy', 'game_settings']
         for section in required_sections:
             if section not in SM_CONFIG:
-                print(f"오류: 필수 설정 섹션 '{section}'이 없습니다.")
+                log.error(f"오류: 필수 설정 섹션 '{section}'이 없습니다.")
                 return False
         if SM_CONFIG['timing']['check_interval'] <= 0:
-            print("오류: check_interval은 0보다 커야 합니다.")
+            log.error("오류: check_interval은 0보다 커야 합니다.")
             return False
         if not SM_CONFIG['target_screens']['included']:
-            print("오류: 대상 화면이 비어있습니다.")
+            log.error("오류: 대상 화면이 비어있습니다.")
             return False
 
-        print("✅ SM_CONFIG 유효성 검증 완료")
+        log.info("✅ SM_CONFIG 유효성 검증 완료")
 
         # [v3] 제너레이터 맵 검증
         if not STATE_POLICY_MAP or not DETECTION_POLICY_MAP:
-            print("오류: v3 정책 맵(STATE_POLICY_MAP, DETECTION_POLICY_MAP)이 비어있습니다.")
+            log.error("오류: v3 정책 맵(STATE_POLICY_MAP, DETECTION_POLICY_MAP)이 비어있습니다.")
             return False
 
-        print("✅ v3 제너레이터 정책 맵 로드됨")
+        log.info("✅ v3 제너레이터 정책 맵 로드됨")
         return True
 
     except Exception as e:
-        print(f"오류: 설정 검증 중 예외 발생 - {e}")
+        log.error(f"오류: 설정 검증 중 예외 발생 - {e}")
         return False
 
 
@@ -363,8 +376,8 @@ def validate_config() -> bool:
 # =============================================================================
 
 if __name__ == "__main__":
-    print("🎯 SM1 v3 '상황반장' 설정 테스트")
-    print("=" * 60)
+    log.info("🎯 SM1 v3 '상황반장' 설정 테스트")
+    log.info("=" * 60)
 
     config_valid = validate_config()
 
@@ -374,22 +387,22 @@ if __name__ == "__main__":
         #         ")
 
         # ✅ 수정된 부분 (들여쓰기 수정)
-        print("\n[v3 감지 전용 상태 (DetectOnly)]:")
+        log.info("\n[v3 감지 전용 상태 (DetectOnly)]:")
         for state, policy in get_detection_policy().items():
-            print(f"  - {state.name} (감지 템플릿: {len(policy.get('targets', []))}개)")
+            log.info(f"  - {state.name} (감지 템플릿: {len(policy.get('targets', []))}개)")
 
         # ❌ 잘못된 부분 (들여쓰기 한 칸 많음)
         #   print("\n[v3 상황반장 상태 (Generator)]:
         #         ")
 
         # ✅ 수정된 부분 (들여쓰기 수정)
-        print("\n[v3 상황반장 상태 (Generator)]:")
+        log.info("\n[v3 상황반장 상태 (Generator)]:")
         for state, policy in get_state_policies().items():
             gen_name = policy.get('generator', lambda: None).__name__
-            print(f"  - {state.name} -> {gen_name}")
+            log.info(f"  - {state.name} -> {gen_name}")
 
     else:
-        print("❌ 설정 검증 실패!")
+        log.error("❌ 설정 검증 실패!")
 
-    print("\n" + "=" * 60)
-    print("sm_config.py (v3) 테스트 완료")
\ No newline at end of file
+    log.info("\n" + "=" * 60)
+    log.info("sm_config.py (v3) 테스트 완료")
\ No newline at end of file
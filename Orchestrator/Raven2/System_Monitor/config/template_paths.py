@@ -7,6 +7,9 @@ SM2 템플릿 경로 정의
 """
 
 import os
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 # =============================================================================
 # 📁 중앙 템플릿 베이스 경로
@@ -114,64 +117,64 @@ def get_supported_screens() -> list:
 
 def verify_template_paths() -> bool:
     """모든 템플릿 파일이 존재하는지 검증합니다."""
-    print("SM2 템플릿 파일 존재 여부 검증 중...")
+    log.info("SM2 템플릿 파일 존재 여부 검증 중...")
 
     missing_files = []
     total_files = 0
 
     for screen_id, templates in TEMPLATES.items():
-        print(f"  화면 {screen_id} 검증 중...")
+        log.info(f"  화면 {screen_id} 검증 중...")
 
         for template_name, template_path in templates.items():
             total_files += 1
             if not os.path.exists(template_path):
                 missing_files.append(f"{screen_id}/{template_name}: {template_path}")
-                print(f"    ❌ {template_name}: 파일 없음")
+                log.error(f"    ❌ {template_name}: 파일 없음")
             else:
-                print(f"    ✅ {template_name}: 존재함")
+                log.info(f"    ✅ {template_name}: 존재함")
 
     if missing_files:
-        print(f"\n❌ {len(missing_files)}개 템플릿 파일이 누락되었습니다:")
+        log.error(f"\n❌ {len(missing_files)}개 템플릿 파일이 누락되었습니다:")
         for missing in missing_files:
-            print(f"  - {missing}")
-        print(f"\n📁 필요한 디렉토리 구조:")
-        print(f"  {BASE_TEMPLATE_PATH}/")
-        print(f"  └── RAVEN2/")
-        print(f"      └── SystemMonitor/")
-        print(f"          ├── S1/")
-        print(f"          ├── S2/")
-        print(f"          ├── S3/")
-        print(f"          └── S4/")
+            log.info(f"  - {missing}")
+        log.info(f"\n📁 필요한 디렉토리 구조:")
+        log.info(f"  {BASE_TEMPLATE_PATH}/")
+        log.info(f"  └── RAVEN2/")
+        log.info(f"      └── SystemMonitor/")
+        log.info(f"          ├── S1/")
+        log.info(f"          ├── S2/")
+        log.info(f"          ├── S3/")
+        log.info(f"          └── S4/")
         return False
 
-    print(f"\n✅ 모든 템플릿 파일이 존재합니다! (총 {total_files}개)")
+    log.info(f"\n✅ 모든 템플릿 파일이 존재합니다! (총 {total_files}개)")
     return True
 
 
 def create_template_directories():
     """템플릿 디렉토리 구조를 생성합니다."""
-    print("SM2 템플릿 디렉토리 구조 생성 중...")
+    log.info("SM2 템플릿 디렉토리 구조 생성 중...")
 
     # 베이스 디렉토리 생성
     os.makedirs(RAVEN2_SM_PATH, exist_ok=True)
-    print(f"✅ 베이스 디렉토리 생성: {RAVEN2_SM_PATH}")
+    log.info(f"✅ 베이스 디렉토리 생성: {RAVEN2_SM_PATH}")
 
     # 화면별 디렉토리 생성
     for screen_id, screen_path in SCREEN_TEMPLATE_PATHS.items():
         os.makedirs(screen_path, exist_ok=True)
-        print(f"✅ {screen_id} 디렉토리 생성: {screen_path}")
+        log.info(f"✅ {screen_id} 디렉토리 생성: {screen_path}")
 
-    print("\n📁 생성된 디렉토리 구조:")
-    print(f"  {RAVEN2_SM_PATH}/")
+    log.info("\n📁 생성된 디렉토리 구조:")
+    log.info(f"  {RAVEN2_SM_PATH}/")
     for screen_id in SCREEN_TEMPLATE_PATHS.keys():
-        print(f"  ├── {screen_id}/")
+        log.info(f"  ├── {screen_id}/")
 
-    print("\n📝 필요한 템플릿 파일들:")
+    log.info("\n📝 필요한 템플릿 파일들:")
     for screen_id in get_supported_screens():
-        print(f"  {screen_id}:")
+        log.info(f"  {screen_id}:")
         templates = get_all_templates_for_screen(screen_id)
         for template_name in templates.keys():
-            print(f"    - {template_name}")
+            log.info(f"    - {template_name}")
 
 
 # =============================================================================
@@ -180,24 +183,24 @@ def create_template_directories():
 
 def test_template_system():
     """템플릿 시스템 테스트"""
-    print("=" * 60)
-    print("SM2 템플릿 시스템 테스트")
-    print("=" * 60)
+    log.info("=" * 60)
+    log.info("SM2 템플릿 시스템 테스트")
+    log.info("=" * 60)
 
-    print(f"📁 베이스 경로: {BASE_TEMPLATE_PATH}")
-    print(f"📁 SM2 경로: {RAVEN2_SM_PATH}")
-    print(f"🖼️  지원 화면: {get_supported_screens()}")
-    print()
+    log.info(f"📁 베이스 경로: {BASE_TEMPLATE_PATH}")
+    log.info(f"📁 SM2 경로: {RAVEN2_SM_PATH}")
+    log.info(f"🖼️  지원 화면: {get_supported_screens()}")
+    log.info("")
 
     # 디렉토리 구조 생성
     create_template_directories()
-    print()
+    log.info("")
 
     # 파일 존재 여부 검증
     verify_template_paths()
 
-    print("\n" + "=" * 60)
-    print("SM2 템플릿 시스템 테스트 완료")
+    log.info("\n" + "=" * 60)
+    log.info("SM2 템플릿 시스템 테스트 완료")
 
 
 if __name__ == "__main__":
@@ -2,16 +2,22 @@
 
 import cv2
 import numpy as np
-import pyautogui
-import time
 import os
 
-def compare_images(screen_img_obj, template_img_obj, threshold=0.8):
+from Orchestrator.src.utils.signature_filter import SIGNATURE_FILTER, REJECT
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+def compare_images(screen_img_obj, template_img_obj, threshold=0.8, signature_key=None):
     """
     주어진 스크린샷 이미지 객체와 템플릿 이미지 객체를 비교합니다.
-    :param screen_img_obj: pyautogui.screenshot() 등으로 얻은 Pillow 이미지 또는 NumPy 배열
+    :param screen_img_obj: inputs.screenshot() 등으로 얻은 Pillow 이미지 또는 NumPy 배열
     :param template_img_obj: cv2.imread()로 로드한 템플릿 이미지 (NumPy 배열)
     :param threshold: 유사도 임계값 (0.0 ~ 1.0)
+    :param signature_key: 사전 필터 키 (위치가 고정된 템플릿만, 예: (screen_id, 템플릿 이름)), None이면 사전 필터 미사용
     :return: 임계값 이상이면 True, 아니면 False
     """
     try:
@@ -21,31 +27,37 @@ def compare_images(screen_img_obj, template_img_obj, threshold=0.8):
         else:
             template_gray = template_img_obj
 
+        decision = SIGNATURE_FILTER.admit(signature_key, screen_gray, template_gray)
+        if decision == REJECT:
+            return False
+
         result = cv2.matchTemplate(screen_gray, template_gray, cv2.TM_CCOEFF_NORMED)
-        _, max_val, _, _ = cv2.minMaxLoc(result)
+        _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        SIGNATURE_FILTER.observe(signature_key, decision, max_loc, max_val > threshold)
         return max_val > threshold
     except Exception as e:
-        print(f"Error in compare_images: {e}")
+        log.error(f"Error in compare_images: {e}")
         return False
 
 
-def return_ui_location(template_path, region=None, threshold=0.8, screenshot_img=None):
+def return_ui_location(template_path, region=None, threshold=0.8, screenshot_img=None, signature_key=None):
     """
     화면 전체 또는 지정된 영역에서 템플릿 이미지를 찾아 중심 좌표 (x, y)를 반환합니다.
     :param template_path: 찾을 템플릿 이미지 파일 경로
     :param region: 검색할 화면 영역 (x, y, width, height), None이면 전체 화면
     :param threshold: 유사도 임계값
     :param screenshot_img: Orchestrator가 제공한 캡쳐 이미지 (None이면 새로 캡쳐)
+    :param signature_key: 사전 필터 키 (위치가 고정된 템플릿만, 예: (screen_id, 템플릿 이름)), None이면 사전 필터 미사용
     :return: 찾은 이미지의 중심 좌표 (x, y) 튜플, 못 찾으면 None
     """
     if not os.path.exists(template_path):
-        print(f"Template file not found: {template_path}")
+        log.info(f"Template file not found: {template_path}")
         return None
 
     try:
         template_img = cv2.imread(template_path, 0)
         if template_img is None:
-            print(f"Failed to load template: {template_path}")
+            log.error(f"Failed to load template: {template_path}")
             return None
         template_h, template_w = template_img.shape[:2]
 
@@ -57,8 +69,13 @@ def return_ui_location(template_path, region=None, threshold=0.8, screenshot_img
 
         screen_gray = cv2.cvtColor(np.array(screen_img), cv2.COLOR_RGB2GRAY)
 
+        decision = SIGNATURE_FILTER.admit(signature_key, screen_gray, template_img)
+        if decision == REJECT:
+            return None
+
         result = cv2.matchTemplate(screen_gray, template_img, cv2.TM_CCOEFF_NORMED)
         _, max_val, _, max_loc = cv2.minMaxLoc(result)
+        SIGNATURE_FILTER.observe(signature_key, decision, max_loc, max_val >= threshold)
 
         if max_val >= threshold:
             center_x = max_loc[0] + template_w // 2
@@ -73,7 +90,7 @@ def return_ui_location(template_path, region=None, threshold=0.8, screenshot_img
         else:
             return None
     except Exception as e:
-        print(f"Error in return_ui_location: {e}")
+        log.error(f"Error in return_ui_location: {e}")
         return None
 
 # 이름 변경된 함수를 호출하도록 수정
@@ -108,10 +125,10 @@ def click_image(template_path, region=None, threshold=0.8, button='left', clicks
     location = return_ui_location(template_path, region, threshold, screenshot_img)
     if location:
         try:
-            pyautogui.click(location[0], location[1], clicks=clicks, interval=interval, button=button)
+            inputs.click(location[0], location[1], clicks=clicks, interval=interval, button=button)
             return True
         except Exception as e:
-            print(f"Error during click at {location}: {e}")
+            log.error(f"Error during click at {location}: {e}")
             return False
     else:
         return False
@@ -131,20 +148,20 @@ def set_focus(screen_id: str, delay_after: float = 0.2) -> bool:
         from Orchestrator.NightCrows.utils.screen_info import SCREEN_REGIONS
 
         if screen_id not in SCREEN_REGIONS:
-            print(f"Error: Screen ID '{screen_id}' not found in SCREEN_REGIONS.")
+            log.error(f"Screen ID '{screen_id}' not found in SCREEN_REGIONS.")
             return False
 
         region = SCREEN_REGIONS[screen_id]
         center_x = region[0] + region[2] // 2
         center_y = region[1] + region[3] // 2
 
-        pyautogui.click(center_x, center_y)
+        inputs.click(center_x, center_y)
         if delay_after > 0:
-            time.sleep(delay_after)
+            clock.sleep(delay_after)
 
-        print(f"Focus set on screen {screen_id} at ({center_x}, {center_y})")
+        log.info(f"Focus set on screen {screen_id} at ({center_x}, {center_y})")
         return True
 
     except Exception as e:
-        print(f"Error setting focus on screen {screen_id}: {e}")
+        log.error(f"Error setting focus on screen {screen_id}: {e}")
         return False
\ No newline at end of file
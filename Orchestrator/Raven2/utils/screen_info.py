@@ -9,6 +9,9 @@ SCREEN_REGIONS: Dict[str, Tuple[int, int, int, int]] = {
     'S5': (706, 362, 1210, 660)
 }
 
+# 배치 파일로 추가한 화면 → 따라 한 기존 화면 (템플릿 / 화면별 설정 조회용, src/core/screen_layout.py가 채움)
+SCREEN_ALIASES: Dict[str, str] = {}
+
 # 추가: 이벤트 UI 관련 영역 정보
 EVENT_UI_REGIONS: Dict[str, Dict[str, Tuple[int, int, int, int]]] = {
     'S1': {
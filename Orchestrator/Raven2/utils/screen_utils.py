@@ -2,12 +2,17 @@
 from typing import Dict
 import cv2
 import numpy as np
-import pyautogui
-import keyboard
-import time
 import random
-from .screen_info import SCREEN_REGIONS, FIXED_UI_COORDS
+from .screen_info import SCREEN_ALIASES, SCREEN_REGIONS, FIXED_UI_COORDS
 from .image_utils import set_focus, is_image_present
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.core.screen_layout import apply_configured_layout, screen_ids
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+SCREEN_INFO_MODULE = 'Orchestrator.Raven2.utils.screen_info'
 
 
 class TaskScreenPreparer:
@@ -15,6 +20,7 @@ class TaskScreenPreparer:
 
     def __init__(self, confidence_threshold: float = 0.85):
         self.confidence_threshold = confidence_threshold
+        apply_configured_layout(SCREEN_INFO_MODULE)  # 작업 프로세스에서도 배치 파일 반영
         # 화면별 X 버튼 템플릿
         self.close_x_templates = {
             'S1': r"C:\Users\yjy16\template\RAVEN2\close_x_s1.png",
@@ -25,28 +31,28 @@ class TaskScreenPreparer:
         }
 
     def prepare_all_screens(self):
-        """모든 화면(S1~S5) 정리 및 준비"""
-        print("TaskScreenPreparer: Preparing Raven2 screens for task execution...")
+        """모든 화면(배치의 S1~) 정리 및 준비"""
+        log.info("TaskScreenPreparer: Preparing Raven2 screens for task execution...")
 
-        for screen_id in ['S1', 'S2', 'S3', 'S4', 'S5']:
-            print(f"  Preparing screen {screen_id}...")
+        for screen_id in screen_ids(SCREEN_REGIONS):
+            log.info(f"  Preparing screen {screen_id}...")
             self._prepare_single_screen(screen_id)
-            time.sleep(0.3)  # 화면 간 딜레이
+            clock.sleep(0.3)  # 화면 간 딜레이
 
-        print("TaskScreenPreparer: All Raven2 screens prepared successfully")
+        log.info("TaskScreenPreparer: All Raven2 screens prepared successfully")
 
     def _prepare_single_screen(self, screen_id: str):
         try:
             # 1. 잠금 해제 버튼 클릭
             self._click_fixed_coord(screen_id, 'unlock_button')
-            time.sleep(0.3)
+            clock.sleep(0.3)
 
             # 2. 확인버튼 클릭 (기존 retreat_confirm_button 사용)
             self._click_fixed_coord(screen_id, 'retreat_confirm_button')
-            time.sleep(0.3)
+            clock.sleep(0.3)
 
         except Exception as e:
-            print(f"    Error preparing screen {screen_id}: {e}")
+            log.error(f"    Error preparing screen {screen_id}: {e}")
 
     def _click_fixed_coord(self, screen_id: str, coord_key: str):
         """FIXED_UI_COORDS에서 지정된 좌표를 클릭"""
@@ -61,18 +67,22 @@ class TaskScreenPreparer:
                 click_y = screen_region[1] + relative_coords[1]
 
                 # 클릭
-                pyautogui.click(click_x, click_y)
-                time.sleep(0.2)
-                print(f"    Clicked {coord_key} on {screen_id}")  # ← coord_key 출력
+                inputs.click(click_x, click_y)
+                clock.sleep(0.2)
+                log.info(f"    Clicked {coord_key} on {screen_id}")  # ← coord_key 출력
             else:
-                print(f"    Warning: {coord_key} coordinates not found for {screen_id}")  # ← coord_key 출력
+                log.warning(f"    Warning: {coord_key} coordinates not found for {screen_id}")  # ← coord_key 출력
 
         except Exception as e:
-            print(f"    Error clicking {coord_key} on {screen_id}: {e}")  # ← coord_key 출력
+            log.error(f"    Error clicking {coord_key} on {screen_id}: {e}")  # ← coord_key 출력
+
+    def _close_x_template(self, screen_id: str):
+        """화면의 X 버튼 템플릿 (배치 파일로 추가한 화면은 따라 한 화면의 것)"""
+        return self.close_x_templates.get(screen_id) or self.close_x_templates.get(SCREEN_ALIASES.get(screen_id))
 
     def _has_close_button(self, screen_id: str) -> bool:
         """X 버튼이 있는지 확인"""
-        template_path = self.close_x_templates.get(screen_id)
+        template_path = self._close_x_template(screen_id)
         if not template_path:
             return False
 
@@ -85,17 +95,17 @@ class TaskScreenPreparer:
     def _click_close_button(self, screen_id: str):
         """X 버튼 템플릿 찾아서 클릭"""
         screen_region = SCREEN_REGIONS[screen_id]
-        template_path = self.close_x_templates.get(screen_id)
+        template_path = self._close_x_template(screen_id)
 
         if not template_path:
-            print(f"    Warning: No close button template for {screen_id}")
+            log.warning(f"    Warning: No close button template for {screen_id}")
             return
 
         try:
-            print(f"    Found close button on {screen_id}, clicking...")
+            log.info(f"    Found close button on {screen_id}, clicking...")
 
             # X 버튼 위치 찾아서 클릭
-            screenshot = pyautogui.screenshot(region=screen_region)
+            screenshot = inputs.screenshot(region=screen_region)
             template = cv2.imread(template_path)
 
             if template is not None:
@@ -120,9 +130,9 @@ class TaskScreenPreparer:
                     click_y = center_y + random_offset_y
 
                     # X 버튼 클릭
-                    pyautogui.click(click_x, click_y)
-                    time.sleep(0.2)
-                    print(f"    Closed popup on {screen_id} at ({click_x}, {click_y})")
+                    inputs.click(click_x, click_y)
+                    clock.sleep(0.2)
+                    log.info(f"    Closed popup on {screen_id} at ({click_x}, {click_y})")
 
         except Exception as e:
-            print(f"    Error cleaning close button on {screen_id}: {e}")
\ No newline at end of file
+            log.error(f"    Error cleaning close button on {screen_id}: {e}")
\ No newline at end of file
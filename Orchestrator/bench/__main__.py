@@ -0,0 +1,61 @@
+# Orchestrator/bench/__main__.py
+# 오프라인 벤치마크 실행기 (Linux 포함, 실제 화면/입력 장치 불필요)
+#
+# 사용 예:
+#   python -m Orchestrator.bench                          # 결과 JSON을 stdout으로
+#   python -m Orchestrator.bench --out bench.json         # 파일로 저장
+#   python -m Orchestrator.bench --compare base.json      # 기준 결과와 비교 (느려지면 종료 코드 1)
+#   python -m Orchestrator.bench --only image_utils --repeat 200
+
+import argparse
+import sys
+from pathlib import Path
+
+from Orchestrator.bench.harness import (SyntheticScreen, TemplateDir, compare_results, install_headless,
+                                        measure, write_results)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Orchestrator offline benchmark suite")
+    parser.add_argument("--out", type=Path, default=None, help="Write JSON results to this file")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline JSON to compare medians against")
+    parser.add_argument("--threshold", type=float, default=1.10, help="Regression ratio for --compare")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed iterations per benchmark")
+    parser.add_argument("--only", default=None, help="Run only benchmarks whose name contains this text")
+    parser.add_argument("--seed", type=int, default=0, help="Synthetic screen seed")
+    args = parser.parse_args()
+
+    # 벤치마크 대상 모듈보다 먼저 헤드리스 환경 구성
+    screen = SyntheticScreen(seed=args.seed)
+    install_headless(screen)
+
+    from Orchestrator.src.utils.log import configure_logging
+    configure_logging(level="WARNING", stream=sys.stderr)
+
+    from Orchestrator.bench.cases import BENCHMARKS, OPS_PER_CALL, BenchContext
+
+    templates = TemplateDir()
+    ctx = BenchContext(screen, templates)
+    results = {}
+    try:
+        for name, setup in BENCHMARKS.items():
+            if args.only and args.only not in name:
+                continue
+            fn = setup(ctx)
+            results[name] = measure(fn, repeat=args.repeat, ops_per_call=OPS_PER_CALL.get(name, 1))
+            entry = results[name]
+            sys.stderr.write(f"{name:<55} median {entry['median_ms']:>9.3f} ms  "
+                             f"p95 {entry['p95_ms']:>9.3f} ms  {entry['ops_per_s']:>11.1f} ops/s\n")
+    finally:
+        for cleanup in ctx.cleanups:
+            cleanup()
+        templates.cleanup()
+
+    write_results(results, args.out)
+    if args.compare and not compare_results(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,237 @@
+# Orchestrator/bench/cases.py
+# 벤치마크 항목: 비전(템플릿 매칭, 화면 검사, 빨간 점 탐지, VD 판별) + IO 스케줄러 처리량 + 정책 실행기 디스패치
+#
+# 각 항목은 setup(ctx)를 받아 측정할 무인자 함수를 돌려주는 함수로 등록합니다.
+
+import threading
+from typing import Callable, Dict, List, Tuple
+
+import cv2
+
+from Orchestrator.bench.harness import SyntheticScreen, TemplateDir
+
+TEMPLATE_SIZE = (64, 32)  # (w, h) - 실제 UI 템플릿 크기 수준
+
+BENCHMARKS: Dict[str, Callable[['BenchContext'], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    def _register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return _register
+
+
+class BenchContext:
+    """합성 화면과 템플릿 폴더를 항목들이 공유"""
+
+    def __init__(self, screen: SyntheticScreen, templates: TemplateDir):
+        self.screen = screen
+        self.templates = templates
+        self.cleanups: List[Callable[[], None]] = []
+
+    def template_from_screen(self, name: str, xy: Tuple[int, int], size=TEMPLATE_SIZE) -> str:
+        """화면의 xy 위치를 잘라 템플릿으로 저장 (히트 케이스)"""
+        x, y = xy
+        w, h = size
+        return self.templates.save(name, self.screen.frame[y:y + h, x:x + w])
+
+    def template_absent(self, name: str, size=TEMPLATE_SIZE) -> str:
+        """화면에 없는 템플릿 저장 (미스 케이스 - 실제 모니터링에서 대부분의 호출)"""
+        return self.templates.save(name, self.screen.random_patch(size))
+
+
+def _reset_prefilter():
+    from Orchestrator.src.utils.signature_filter import SIGNATURE_FILTER
+    SIGNATURE_FILTER.reset()
+
+
+# =============================================================================
+# 🖼️ image_utils
+# =============================================================================
+@benchmark("image_utils.compare_images.hit")
+def _compare_images_hit(ctx: BenchContext):
+    from Orchestrator.NightCrows.utils import image_utils
+    from Orchestrator.NightCrows.utils.screen_info import SCREEN_REGIONS
+    region = SCREEN_REGIONS['S5']
+    template = cv2.imread(ctx.template_from_screen("cmp_hit", (region[0] + 300, region[1] + 200)))
+    frame = ctx.screen.crop(region)
+    _reset_prefilter()
+    return lambda: image_utils.compare_images(frame, template, threshold=0.85, signature_key=('S5', 'HIT'))
+
+
+@benchmark("image_utils.compare_images.miss")
+def _compare_images_miss(ctx: BenchContext):
+    from Orchestrator.NightCrows.utils import image_utils
+    from Orchestrator.NightCrows.utils.screen_info import SCREEN_REGIONS
+    template = cv2.imread(ctx.template_absent("cmp_miss"))
+    frame = ctx.screen.crop(SCREEN_REGIONS['S5'])
+    _reset_prefilter()
+    return lambda: image_utils.compare_images(frame, template, threshold=0.85, signature_key=('S5', 'MISS'))
+
+
+@benchmark("image_utils.return_ui_location.hit")
+def _return_ui_location_hit(ctx: BenchContext):
+    from Orchestrator.NightCrows.utils import image_utils
+    from Orchestrator.NightCrows.utils.screen_info import SCREEN_REGIONS
+    region = SCREEN_REGIONS['S5']
+    path = ctx.template_from_screen("loc_hit", (region[0] + 500, region[1] + 100))
+    frame = ctx.screen.crop(region)
+    _reset_prefilter()
+    return lambda: image_utils.return_ui_location(path, region, 0.85, frame)
+
+
+@benchmark("image_utils.return_ui_location.miss")
+def _return_ui_location_miss(ctx: BenchContext):
+    from Orchestrator.NightCrows.utils import image_utils
+    from Orchestrator.NightCrows.utils.screen_info import SCREEN_REGIONS
+    region = SCREEN_REGIONS['S5']
+    path = ctx.template_absent("loc_miss")
+    frame = ctx.screen.crop(region)
+    _reset_prefilter()
+    return lambda: image_utils.return_ui_location(path, region, 0.85, frame)
+
+
+# =============================================================================
+# 🔍 S1–S5 전체 검사 1회
+# =============================================================================
+@benchmark("detection_pass.nightcrows.S1-S5")
+def _nightcrows_detection_pass(ctx: BenchContext):
+    """NC CombatMonitor 한 틱의 화면 검사 (DEAD / HOSTILE 1샘플 / ARENA, 전부 미스 = 평상시)"""
+    from Orchestrator.NightCrows.utils import image_utils
+    from Orchestrator.NightCrows.utils.screen_info import SCREEN_REGIONS
+    templates = {key: cv2.imread(ctx.template_absent(f"nc_{key.lower()}")) for key in ('DEAD', 'HOSTILE', 'ARENA')}
+    screens = sorted(SCREEN_REGIONS.items())
+    _reset_prefilter()
+
+    def _pass():
+        for screen_id, region in screens:
+            frame = ctx.screen.screenshot(region)
+            for key, template in templates.items():
+                image_utils.compare_images(frame, template, threshold=0.85, signature_key=(screen_id, key))
+    return _pass
+
+
+def _raven2_status_pass(ctx: BenchContext):
+    """Raven2 CombatMonitor.check_status를 S1–S5에 대해 실행 (캡처 1회 + 템플릿 3종)"""
+    from Orchestrator.src.core.io_scheduler import IOScheduler
+    from Orchestrator.Raven2.Combat_Monitor.src.monitor import CombatMonitor
+    from Orchestrator.Raven2.utils.screen_info import SCREEN_REGIONS
+
+    class _Orchestrator:
+        io_scheduler = IOScheduler()
+
+        @staticmethod
+        def capture_screen_safely(screen_id):
+            return ctx.screen.screenshot(SCREEN_REGIONS[screen_id])
+
+    paths = {key: ctx.template_absent(f"r2_{key.lower()}")
+             for key in ('DEAD_TEMPLATE', 'ABNORMAL_TEMPLATE', 'AWAKE_TEMPLATE')}
+    monitor = CombatMonitor(monitor_id="BENCH", config={'frame_max_age': 0.0}, vd_name="BENCH",
+                            orchestrator=_Orchestrator, io_scheduler=_Orchestrator.io_scheduler)
+    monitor._get_template_path_from_key = lambda key, window_id: paths.get(key)
+    for screen_id, region in sorted(SCREEN_REGIONS.items()):
+        monitor.add_screen(screen_id, region)
+    _reset_prefilter()
+
+    def _pass():
+        for screen in monitor.screens:
+            monitor.check_status(screen)
+    return _pass
+
+
+@benchmark("detection_pass.raven2.S1-S5")
+def _raven2_detection_pass(ctx: BenchContext):
+    """Raven2 CombatMonitor.check_status를 S1–S5에 대해 실행 (캡처 1회 + 템플릿 3종, 스레드 안 매칭)"""
+    return _raven2_status_pass(ctx)
+
+
+@benchmark("detection_pass.raven2.S1-S5.pool")
+def _raven2_detection_pass_pool(ctx: BenchContext):
+    """위와 같은 검사를 탐지 작업 프로세스 2개로 (링 버퍼 복사 + 왕복 포함, 화면당 요청 1회)"""
+    from Orchestrator.src.core.detection_pool import DETECTION_POOL
+    DETECTION_POOL.configure({'workers': 2})
+    if not DETECTION_POOL.start():
+        raise RuntimeError("detection pool did not start")
+    ctx.cleanups.append(DETECTION_POOL.stop)
+    return _raven2_status_pass(ctx)
+
+
+# =============================================================================
+# 🔴 Daily Present 빨간 점 탐지
+# =============================================================================
+@benchmark("daily_present.find_all_red_dots_with_blob_detector")
+def _blob_detector(ctx: BenchContext):
+    from Orchestrator.NightCrows.Daily_Present.src.core.daily_present import DailyPresent
+    from Orchestrator.NightCrows.utils.screen_info import EVENT_UI_REGIONS
+    region = EVENT_UI_REGIONS['S1']['left_menu']
+    x, y, w, h = region
+    for i in range(3):
+        ctx.screen.draw_red_dot((x + w // 2, y + 40 + i * 70))
+    present = DailyPresent()
+    return lambda: present.find_all_red_dots_with_blob_detector(region, 'S1')
+
+
+# =============================================================================
+# 🖥️ VDManager.get_current_vd
+# =============================================================================
+@benchmark("vd_manager.get_current_vd")
+def _get_current_vd(ctx: BenchContext):
+    from Orchestrator.src.core.vd_manager import VDManager
+    manager = VDManager()
+    tx, ty, _, _ = manager.taskbar_region
+    ctx.screen.paste(ctx.screen.random_patch((32, 32)), (tx + 600, ty + 4))
+    first, *others = manager.icons
+    manager.icons[first] = ctx.template_from_screen("vd_game1", (tx + 600, ty + 4), size=(32, 32))
+    for i, vd in enumerate(others, start=2):
+        manager.icons[vd] = ctx.template_absent(f"vd_game{i}", size=(32, 32))
+    return manager.get_current_vd
+
+
+# =============================================================================
+# ⏱️ IOScheduler 처리량 (no-op 액션)
+# =============================================================================
+IO_BATCH = 500
+
+
+@benchmark("io_scheduler.noop_batch_500")
+def _io_scheduler_throughput(ctx: BenchContext):
+    from Orchestrator.src.core.io_scheduler import IOScheduler, Priority
+    scheduler = IOScheduler()
+    stop_event = threading.Event()
+    scheduler.start(stop_event)
+    ctx.cleanups.append(stop_event.set)
+    priorities: List[Priority] = list(Priority)
+
+    def _batch():
+        for i in range(IO_BATCH):
+            scheduler.request("BENCH", f"S{i % 5 + 1}", lambda: None, priorities[i % len(priorities)])
+        scheduler.queue.join()
+    return _batch
+
+
+# =============================================================================
+# 🧾 정책 실행기 (instruction_vm)
+# =============================================================================
+VM_STEPS = 1000
+
+
+@benchmark("instruction_vm.step_1000")
+def _instruction_vm_dispatch(ctx: BenchContext):
+    from Orchestrator.src.core.instruction_vm import OpcodeTable, PolicyRunner
+    table = OpcodeTable("BENCH")
+    table.register('check', lambda runner, inst: inst['value'], required=('value',))
+
+    def _policy(screen):
+        for i in range(VM_STEPS // 2):
+            yield {'operation': 'check', 'value': i}
+            yield {'operation': 'wait_duration', 'duration': 0.0}
+
+    def _run():
+        runner = PolicyRunner(table, _policy(None))
+        for tick in range(VM_STEPS + 1):
+            runner.step(float(tick))
+    return _run
+
+
+OPS_PER_CALL = {"io_scheduler.noop_batch_500": IO_BATCH, "instruction_vm.step_1000": VM_STEPS}
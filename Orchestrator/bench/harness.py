@@ -0,0 +1,160 @@
+# Orchestrator/bench/harness.py
+# 오프라인 벤치마크 공통 도구: 헤드리스 실행 환경, 합성 화면/템플릿, 타이밍, JSON 결과 비교
+
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import cv2
+import numpy as np
+
+SCREEN_SIZE = (1920, 1080)
+
+
+# =============================================================================
+# 합성 화면
+# =============================================================================
+class SyntheticScreen:
+    """pyautogui.screenshot() 대신 합성 프레임(RGB ndarray)을 돌려주는 가상 화면"""
+
+    def __init__(self, seed: int = 0, size: Tuple[int, int] = SCREEN_SIZE):
+        self.rng = np.random.default_rng(seed)
+        width, height = size
+        # 게임 화면처럼 완만한 그라데이션 + 잡음 (순수 잡음보다 매칭 점수 분포가 현실적)
+        base = cv2.resize(self.rng.integers(0, 256, (height // 16, width // 16, 3), dtype=np.uint8),
+                          (width, height), interpolation=cv2.INTER_CUBIC)
+        noise = self.rng.integers(-12, 13, (height, width, 3))
+        self.frame = np.clip(base.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+    def screenshot(self, region: Optional[Tuple[int, int, int, int]] = None) -> np.ndarray:
+        if region is None:
+            return self.frame.copy()
+        x, y, w, h = region
+        return self.frame[y:y + h, x:x + w].copy()
+
+    def crop(self, region: Tuple[int, int, int, int]) -> np.ndarray:
+        return self.screenshot(region)
+
+    def random_patch(self, size: Tuple[int, int]) -> np.ndarray:
+        """화면에 없는 무늬의 패치 (미스 케이스용 템플릿)"""
+        w, h = size
+        return self.rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+
+    def paste(self, patch: np.ndarray, xy: Tuple[int, int]):
+        x, y = xy
+        h, w = patch.shape[:2]
+        self.frame[y:y + h, x:x + w] = patch
+
+    def draw_red_dot(self, center: Tuple[int, int], radius: int = 4):
+        cv2.circle(self.frame, center, radius, (230, 20, 20), -1)  # RGB 빨간 점
+
+
+class TemplateDir:
+    """합성 템플릿을 임시 폴더에 PNG로 저장 (image_utils는 경로로 템플릿을 읽음)"""
+
+    def __init__(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="orch_bench_")
+        self.path = Path(self._tmp.name)
+
+    def save(self, name: str, rgb_patch: np.ndarray) -> str:
+        file_path = self.path / f"{name}.png"
+        cv2.imwrite(str(file_path), cv2.cvtColor(rgb_patch, cv2.COLOR_RGB2BGR))
+        return str(file_path)
+
+    def cleanup(self):
+        self._tmp.cleanup()
+
+
+# =============================================================================
+# 헤드리스 실행 환경
+# =============================================================================
+def install_headless(screen: SyntheticScreen):
+    """입력 백엔드를 FakeBackend로 교체하고 화면 캡처를 합성 화면에 연결 (실제 입력/화면 불필요)"""
+    from Orchestrator.src.core.input_backend import FakeBackend, set_backend
+    backend = FakeBackend(screen_size=SCREEN_SIZE, frame_source=screen.screenshot)
+    set_backend(backend)
+    return backend
+
+
+# =============================================================================
+# 타이밍
+# =============================================================================
+def measure(fn: Callable[[], Any], repeat: int = 50, warmup: int = 3, ops_per_call: int = 1) -> Dict[str, float]:
+    """fn을 repeat회 실행해 호출당 시간 통계(ms)를 반환"""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    total_s = sum(samples) / 1000
+    return {
+        'repeat': repeat,
+        'mean_ms': statistics.fmean(samples),
+        'median_ms': statistics.median(samples),
+        'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        'min_ms': samples[0],
+        'stdev_ms': statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        'ops_per_s': (repeat * ops_per_call) / total_s if total_s > 0 else 0.0,
+    }
+
+
+# =============================================================================
+# 결과 저장 / 비교
+# =============================================================================
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=Path(__file__).resolve().parent, timeout=5).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def environment_info() -> Dict[str, Any]:
+    return {
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'opencv': cv2.__version__,
+    }
+
+
+def write_results(results: Dict[str, Dict[str, float]], out_path: Optional[Path]) -> Dict[str, Any]:
+    document = {'meta': environment_info(), 'results': results}
+    text = json.dumps(document, indent=2, ensure_ascii=False)
+    if out_path:
+        Path(out_path).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return document
+
+
+def compare_results(current: Dict[str, Dict[str, float]], baseline_path: Path,
+                    threshold: float = 1.10) -> bool:
+    """기준 JSON과 median 비교. threshold 배 이상 느려진 항목이 있으면 False"""
+    baseline = json.loads(Path(baseline_path).read_text(encoding="utf-8"))
+    base_results = baseline.get('results', {})
+    ok = True
+    sys.stderr.write(f"\n=== compare vs {baseline_path} (commit {baseline.get('meta', {}).get('commit')}) ===\n")
+    for name, entry in current.items():
+        base = base_results.get(name)
+        if not base or not base.get('median_ms'):
+            sys.stderr.write(f"  {name:<40} (new)\n")
+            continue
+        ratio = entry['median_ms'] / base['median_ms']
+        flag = "REGRESSION" if ratio >= threshold else ("faster" if ratio <= 1 / threshold else "")
+        if ratio >= threshold:
+            ok = False
+        sys.stderr.write(f"  {name:<40} {base['median_ms']:>9.3f} → {entry['median_ms']:>9.3f} ms "
+                         f"(x{ratio:.2f}) {flag}\n")
+    return ok
@@ -0,0 +1,111 @@
+# Orchestrator/bench/importtime.py
+# import 시간 추적: 새 프로세스에서 python -X importtime 으로 모듈별 import 시간을 재고 예산/이전 결과와 비교
+#
+# 사용 예:
+#   python -m Orchestrator.bench.importtime                            # 결과 JSON을 stdout으로
+#   python -m Orchestrator.bench.importtime --out importtime.json      # 파일로 저장 (커밋해서 추적)
+#   python -m Orchestrator.bench.importtime --compare importtime.json  # 이전 결과 대비 느려지면 종료 코드 1
+#   python -m Orchestrator.bench.importtime --top 30                   # self 시간 상위 모듈 30개 출력
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from Orchestrator.bench.harness import compare_results, write_results
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# 시작 경로(main.py)에서 import되는 모듈 + 지연 로딩되는 모니터 모듈
+TARGETS = [
+    'Orchestrator.src.core.orchestrator',
+    'Orchestrator.NightCrows.Combat_Monitor.monitor',
+    'Orchestrator.NightCrows.System_Monitor.src.core.monitor',
+    'Orchestrator.Raven2.Combat_Monitor.src.monitor',
+    'Orchestrator.Raven2.System_Monitor.src.core.monitor',
+]
+
+
+def run_importtime(module: str) -> List[Tuple[str, int, int, int]]:
+    """새 인터프리터에서 module을 import하고 (모듈, self_us, cumulative_us, 깊이) 목록 반환"""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          capture_output=True, text=True, cwd=PROJECT_ROOT, timeout=120)
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+            rows.append((name.strip(), int(self_us), int(cumulative_us), (len(name) - len(name.lstrip())) // 2))
+        except ValueError:
+            continue
+    return rows
+
+
+def measure_import(module: str, repeat: int) -> Dict:
+    totals = []
+    last_rows: List[Tuple[str, int, int, int]] = []
+    for _ in range(repeat):
+        last_rows = run_importtime(module)
+        target = next((r for r in reversed(last_rows) if r[0] == module), None)
+        totals.append((target[2] if target else sum(r[1] for r in last_rows)) / 1000)
+    totals.sort()
+    top_level = sorted((r for r in last_rows if r[3] <= 1 and r[0] != module), key=lambda r: -r[2])
+    return {
+        'repeat': repeat,
+        'mean_ms': statistics.fmean(totals),
+        'median_ms': statistics.median(totals),
+        'min_ms': totals[0],
+        'max_ms': totals[-1],
+        'modules': len(last_rows),
+        'top_self_ms': {r[0]: r[1] / 1000 for r in sorted(last_rows, key=lambda r: -r[1])[:15]},
+        'direct_imports_ms': {r[0]: r[2] / 1000 for r in top_level[:15]},
+    }
+
+
+def _default_budget() -> Optional[float]:
+    try:
+        from Orchestrator.src.utils.config import STARTUP_CONFIG
+        return STARTUP_CONFIG.get('import_budget_ms')
+    except ImportError:
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Track module import time (python -X importtime)")
+    parser.add_argument("--module", action="append", default=None, help="Module to measure (repeatable)")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreter runs per module")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="Budget for the orchestrator import (default STARTUP_CONFIG['import_budget_ms'])")
+    parser.add_argument("--top", type=int, default=10, help="Print the N slowest modules by self time")
+    parser.add_argument("--out", type=Path, default=None, help="Write JSON results to this file")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline JSON to compare medians against")
+    parser.add_argument("--threshold", type=float, default=1.20, help="Regression ratio for --compare")
+    args = parser.parse_args()
+
+    results = {}
+    for module in args.module or TARGETS:
+        entry = measure_import(module, args.repeat)
+        results[f"import {module}"] = entry
+        sys.stderr.write(f"import {module:<60} median {entry['median_ms']:>8.1f} ms  ({entry['modules']} modules)\n")
+        for name, ms in list(entry['top_self_ms'].items())[:args.top]:
+            sys.stderr.write(f"    {ms:>8.1f} ms  {name}\n")
+
+    write_results(results, args.out)
+    ok = True
+    budget = args.budget_ms if args.budget_ms is not None else _default_budget()
+    main_entry = results.get(f"import {TARGETS[0]}")
+    if budget and main_entry and main_entry['median_ms'] > budget:
+        sys.stderr.write(f"\nImport budget exceeded: {main_entry['median_ms']:.0f}ms > {budget:.0f}ms\n")
+        ok = False
+    if args.compare and not compare_results(results, args.compare, args.threshold):
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
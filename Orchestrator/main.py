@@ -6,20 +6,23 @@ current_dir = Path(__file__).parent  # Orchestrator 폴더
 project_root = current_dir.parent    # Inputlogger 폴더 (프로젝트 루트)
 sys.path.insert(0, str(project_root))
 
-# 이제 절대 경로로 임포트
-from Orchestrator.src.core.orchestrator import Orchestrator
+# 이제 절대 경로로 임포트 (시작 시간 계측기를 가장 먼저)
+from Orchestrator.src.utils.profiler import STARTUP
+
+with STARTUP.phase("import Orchestrator.src.core.orchestrator"):
+    from Orchestrator.src.core.orchestrator import Orchestrator
 
 if __name__ == "__main__":
     print("Starting Orchestrator System...")
     print(f"Project Root (estimated): {current_dir}")
 
-    # 타임 슬라이스 시간 설정 (분 단위)
-    vd1_minutes = 3
-    vd2_minutes = 3
+    # 타임 슬라이스 시간 설정 (분 단위, VD별로 다르게: {'VD1': 3, 'VD2': 5}, 생략 시 GAMES_CONFIG의 slice_min)
+    slice_minutes = 3
 
     orchestrator = None
     try:
-        orchestrator = Orchestrator(vd1_slice_min=vd1_minutes, vd2_slice_min=vd2_minutes)
+        with STARTUP.phase("Orchestrator.__init__"):
+            orchestrator = Orchestrator(slice_min=slice_minutes)
         orchestrator.run_orchestration_loop()
     except Exception as e:
         print(f"An error occurred during Orchestrator execution: {e}")
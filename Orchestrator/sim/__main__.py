@@ -0,0 +1,87 @@
+# Orchestrator/sim/__main__.py
+# 합성 화면 시뮬레이터로 실제 모니터를 돌려 감지→조치 지연과 처리량을 측정 (실제 화면/입력 장치 불필요)
+#
+# 사용 예:
+#   python -m Orchestrator.sim --game nightcrows --scenario deaths --speed 10
+#   python -m Orchestrator.sim --game raven2 --scenario disconnect --monitors sm --out sim.json
+#   python -m Orchestrator.sim --game nightcrows --scenario-file my_scenario.json
+#   python -m Orchestrator.sim --game nightcrows --scenario deaths --record logs/sessions
+#   python -m Orchestrator.sim --game raven2 --scenario deaths --runtime both   # 스레드 vs asyncio 비교
+#   python -m Orchestrator.sim --game nightcrows --scenario deaths --restart-at 60 (--cold)  # 웜/콜드 재시작 비교
+#   python -m Orchestrator.sim --game raven2 --scenario deaths --detection both   # 스레드 안 매칭 vs 탐지 작업 프로세스
+#   python -m Orchestrator.sim --list
+#
+# 하루 단위 시간 분할/예약 작업 시뮬레이션은 python -m Orchestrator.sim.day
+# 화면 수(S1~S12) 확장성 벤치마크는 python -m Orchestrator.sim.scaling
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run monitors against a synthetic game screen")
+    parser.add_argument("--game", choices=("nightcrows", "raven2"), default="nightcrows")
+    parser.add_argument("--scenario", default="deaths", help="Built-in scenario name")
+    parser.add_argument("--scenario-file", type=Path, default=None, help="JSON scenario file")
+    parser.add_argument("--speed", type=float, default=10.0, help="Simulated seconds per wall second")
+    parser.add_argument("--monitors", default="srm,sm", help="Comma-separated: srm, sm")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=None, help="Write JSON report to this file")
+    parser.add_argument("--record", type=Path, default=None, help="Record the run as a replayable session here")
+    parser.add_argument("--runtime", choices=("threads", "asyncio", "both"), default="threads",
+                        help="Monitor runtime model (both: run each and report side by side)")
+    parser.add_argument("--restart-at", type=float, default=None,
+                        help="Restart the monitors at this simulated second (checkpoint → warm restart)")
+    parser.add_argument("--cold", action="store_true", help="With --restart-at: restart without the checkpoint")
+    parser.add_argument("--detection", choices=("thread", "pool", "both"), default="thread",
+                        help="Template matching in the monitor threads or in detection worker processes")
+    parser.add_argument("--detection-workers", type=int, default=2, help="Worker processes for --detection pool")
+    parser.add_argument("--log-level", default="WARNING")
+    parser.add_argument("--list", action="store_true", help="List built-in scenarios")
+    args = parser.parse_args()
+
+    from Orchestrator.src.utils.log import configure_logging
+    configure_logging(level=args.log_level, stream=sys.stderr)
+
+    from Orchestrator.sim.runner import run_simulation
+    from Orchestrator.sim.scenarios import SCENARIOS, load_scenario
+
+    if args.list:
+        for game, scenarios in SCENARIOS.items():
+            for name, scenario in scenarios.items():
+                print(f"{game:<12}{name:<14}{scenario.duration:>6g}s  {scenario.description}")
+        return 0
+
+    if args.scenario_file:
+        scenario = load_scenario(args.scenario_file)
+    else:
+        scenario = SCENARIOS[args.game].get(args.scenario)
+        if scenario is None:
+            parser.error(f"Unknown scenario '{args.scenario}' for {args.game}")
+
+    kinds = [kind.strip() for kind in args.monitors.split(",") if kind.strip()]
+    runtimes = ("threads", "asyncio") if args.runtime == "both" else (args.runtime,)
+    detections = ("thread", "pool") if args.detection == "both" else (args.detection,)
+    variants = [(runtime, detection) for runtime in runtimes for detection in detections]
+    reports = {
+        (runtime if len(detections) == 1 else f"{runtime}/{detection}" if len(runtimes) > 1 else detection):
+            run_simulation(args.game, scenario, speed=args.speed, kinds=kinds, seed=args.seed,
+                           record_dir=args.record, runtime=runtime, restart_at=args.restart_at,
+                           warm=not args.cold,
+                           detection_workers=args.detection_workers if detection == "pool" else 0).to_dict()
+        for runtime, detection in variants
+    }
+
+    result = next(iter(reports.values())) if len(variants) == 1 else reports
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
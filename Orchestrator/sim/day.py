@@ -0,0 +1,248 @@
+# Orchestrator/sim/day.py
+# 가상 시간으로 실제 Orchestrator 메인 루프를 돌려 하루치 시간 분할 / 예약 작업 / VD 전환을 몇 분 안에 재현
+# (용량·커버리지 분석용. 입력은 FakeBackend로 기록만 되고, 예약 작업 프로세스는 가정한 소요 시간만큼 대기로 대체)
+#
+# 사용 예:
+#   python -m Orchestrator.sim.day                              # 04:50부터 24시간, x720 (약 2분)
+#   python -m Orchestrator.sim.day --start 11:55 --hours 1 --slice-min 5
+#   python -m Orchestrator.sim.day --speed 1440 --out day.json
+#   python -m Orchestrator.sim.day --compare-early-yield          # 조기 양보 끔/켬 커버리지 비교
+#       (--monitors 없이는 모니터가 없어 항상 "조용한" VD로 보므로 양보 효과의 상한)
+
+import argparse
+import datetime
+import json
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from Orchestrator.src.core.clock import ScaledClock, clock, set_clock
+from Orchestrator.src.core.coverage import COVERAGE
+from Orchestrator.src.core.game_registry import desktop_names
+from Orchestrator.src.core.input_backend import FakeBackend, set_backend
+from Orchestrator.src.core.orchestrator import ActiveState, Orchestrator
+from Orchestrator.src.core.vd_manager import VDManager, VirtualDesktop
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+# 예약 작업 소요 시간 가정 (가상 초)
+TASK_DURATIONS: Dict[str, float] = {'DP1': 240.0, 'DP2': 240.0, 'MO1': 90.0, 'MO2': 90.0}
+
+
+class _SimVDManager(VDManager):
+    """작업 표시줄 대신 마지막으로 전환한 VD를 현재 VD로 보고, 전환 클릭/대기 순서는 실제와 동일하게 수행"""
+
+    def __init__(self):
+        super().__init__()
+        self.current = VirtualDesktop.OTHER
+
+    def get_current_vd(self) -> VirtualDesktop:
+        return self.current
+
+    def switch_to(self, target_vd: VirtualDesktop):
+        super().switch_to(target_vd)
+        if target_vd != VirtualDesktop.OTHER:
+            self.current = target_vd
+
+
+class SimDayOrchestrator(Orchestrator):
+    """실제 Orchestrator에서 VD 관리와 작업 프로세스 실행만 가상으로 바꾸고, 포커스/작업 이력을 기록"""
+
+    def __init__(self, slice_min: float = 3, task_durations: Optional[Dict[str, float]] = None,
+                 with_monitors: bool = False, early_yield: Optional[bool] = None):
+        self.with_monitors = with_monitors
+        self.task_durations = dict(TASK_DURATIONS if task_durations is None else task_durations)
+        self.focus_log: List[Tuple[float, str, str]] = []  # (시각, VD, ActiveState)
+        self.task_log: List[Dict] = []
+        super().__init__(slice_min=slice_min)
+        self.vd_manager = _SimVDManager()
+        if early_yield is not None:
+            self.early_yield['enabled'] = early_yield
+
+    def _create_checkpoint(self):
+        return None  # 실제 logs/checkpoint.json을 읽거나 덮어쓰지 않음
+
+    def _export_coverage(self):
+        pass  # 화면별 커버리지는 리포트(screen_coverage)에 포함
+
+    def _initialize_components(self, vd):
+        if self.with_monitors:
+            super()._initialize_components(vd)
+
+    def request_scheduled_task(self, task_key, target_vd, repeat=False):
+        self.task_log.append({'key': task_key, 'vd': target_vd.name, 'scheduled': clock.time(),
+                              'started': None, 'finished': None})
+        return super().request_scheduled_task(task_key, target_vd, repeat=repeat)
+
+    def _run_task_process(self, task_key, task_main_py):
+        entry = next((e for e in reversed(self.task_log) if e['key'] == task_key and e['started'] is None), None)
+        if entry is None:
+            entry = {'key': task_key, 'vd': None, 'scheduled': None, 'started': None, 'finished': None}
+            self.task_log.append(entry)
+        entry['started'] = clock.time()
+        clock.sleep(self.task_durations.get(task_key, 60.0))
+        entry['finished'] = clock.time()
+
+    def set_focus(self, vd_to_focus, new_state):
+        super().set_focus(vd_to_focus, new_state)
+        if not self.focus_log or self.focus_log[-1][1:] != (vd_to_focus.name, new_state.name):
+            self.focus_log.append((clock.time(), vd_to_focus.name, new_state.name))
+
+
+# =============================================================================
+# 리포트
+# =============================================================================
+@dataclass
+class DayReport:
+    start: float
+    end: float
+    speed: float
+    wall_duration: float
+    slice_min: float
+    focus_log: List[Tuple[float, str, str]] = field(default_factory=list)
+    task_log: List[Dict] = field(default_factory=list)
+    input_counts: Dict[str, int] = field(default_factory=dict)
+    screen_coverage: Dict = field(default_factory=dict)  # COVERAGE.snapshot() (--monitors일 때만 틱이 있음)
+    switch_counts: Dict[str, int] = field(default_factory=dict)  # 전환 사유별 횟수 (slice / early_yield / forced)
+
+    def _monitoring_windows(self, vd: str) -> List[Tuple[float, float]]:
+        """해당 VD를 모니터링한 [시작, 끝) 구간들"""
+        windows = []
+        marks = self.focus_log + [(self.end, None, None)]
+        for (t, mark_vd, state), (t_next, _, _) in zip(marks, marks[1:]):
+            if mark_vd == vd and state == ActiveState.MONITORING.name:
+                windows.append((t, min(t_next, self.end)))
+        return windows
+
+    def to_dict(self) -> Dict:
+        def _clock_str(t):
+            return None if t is None else datetime.datetime.fromtimestamp(t).strftime('%H:%M:%S')
+
+        span = self.end - self.start
+        coverage = {}
+        for vd in desktop_names():
+            windows = self._monitoring_windows(vd)
+            covered = sum(b - a for a, b in windows)
+            edges = [self.start] + [x for w in windows for x in w] + [self.end]
+            blind = [b - a for a, b in zip(edges[::2], edges[1::2]) if b - a > 0]
+            coverage[vd] = {
+                'monitored_fraction': round(covered / span, 4) if span else 0.0,
+                'monitoring_windows': len(windows),
+                'blind_windows': len(blind),
+                'blind_max_s': round(max(blind), 1) if blind else 0.0,
+                'blind_mean_s': round(sum(blind) / len(blind), 1) if blind else 0.0,
+            }
+        switches = sum(1 for a, b in zip(self.focus_log, self.focus_log[1:]) if a[1] != b[1])
+        return {
+            'start': _clock_str(self.start),
+            'sim_hours': round(span / 3600, 2),
+            'speed': self.speed,
+            'wall_duration_s': round(self.wall_duration, 1),
+            'slice_min': self.slice_min,
+            'vd_switches': switches,
+            'switch_reasons': self.switch_counts,
+            'coverage': coverage,
+            'tasks': [
+                {
+                    'key': e['key'],
+                    'scheduled': _clock_str(e['scheduled']),
+                    'started': _clock_str(e['started']),
+                    'finished': _clock_str(e['finished']),
+                    'start_delay_s': None if e['scheduled'] is None or e['started'] is None
+                    else round(e['started'] - e['scheduled'], 1),
+                }
+                for e in self.task_log
+            ],
+            'input_counts': self.input_counts,
+            'screen_coverage': self.screen_coverage,
+        }
+
+
+def run_day(speed: float = 720.0, start: str = "04:50", hours: float = 24.0, slice_min: float = 3,
+            task_durations: Optional[Dict[str, float]] = None, with_monitors: bool = False,
+            start_vd: Optional[str] = None, early_yield: Optional[bool] = None) -> DayReport:
+    """가상 시계(start 시각부터 speed 배속)를 설치하고 Orchestrator 메인 루프를 hours 시간 동안 실행"""
+    start_dt = datetime.datetime.combine(datetime.date.today(), datetime.time.fromisoformat(start))
+    previous_clock = set_clock(ScaledClock(speed, start=start_dt))
+    backend = FakeBackend()
+    previous_backend = set_backend(backend)
+    wall_start = time.perf_counter()
+    try:
+        orchestrator = SimDayOrchestrator(slice_min=slice_min, task_durations=task_durations,
+                                          with_monitors=with_monitors, early_yield=early_yield)
+        day_start = clock.time()
+        day_end = day_start + hours * 3600
+        thread = threading.Thread(target=orchestrator.run_orchestration_loop, args=(start_vd,),
+                                  name="SimDay-Main", daemon=True)
+        thread.start()
+        while thread.is_alive() and clock.time() < day_end:
+            time.sleep(0.05)
+        orchestrator.stop()
+        thread.join(timeout=60.0)
+        end = min(clock.time(), day_end)
+    finally:
+        wall_duration = time.perf_counter() - wall_start
+        set_backend(previous_backend)
+        set_clock(previous_clock)
+
+    return DayReport(start=day_start, end=end, speed=speed, wall_duration=wall_duration, slice_min=slice_min,
+                     focus_log=orchestrator.focus_log, task_log=orchestrator.task_log,
+                     input_counts=dict(backend.counts),
+                     screen_coverage=COVERAGE.snapshot(end) if with_monitors else {},
+                     switch_counts=dict(orchestrator.switch_counts))
+
+
+def compare_early_yield(**kwargs) -> Dict:
+    """같은 조건으로 조기 양보 끔/켬 하루를 돌려 VD별 커버리지 / 사각 구간 변화를 비교"""
+    reports = {}
+    for label, enabled in (('baseline', False), ('early_yield', True)):
+        reports[label] = run_day(early_yield=enabled, **kwargs).to_dict()
+    delta = {}
+    for vd, after in reports['early_yield']['coverage'].items():
+        before = reports['baseline']['coverage'][vd]
+        delta[vd] = {key: round(after[key] - before[key], 4)
+                     for key in ('monitored_fraction', 'blind_windows', 'blind_max_s', 'blind_mean_s')}
+    return {**reports, 'delta': delta}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Run the orchestrator main loop for a simulated day")
+    parser.add_argument("--speed", type=float, default=720.0, help="Simulated seconds per wall second")
+    parser.add_argument("--start", default="04:50", help="Simulated start time (HH:MM)")
+    parser.add_argument("--hours", type=float, default=24.0)
+    parser.add_argument("--slice-min", type=float, default=3, help="Time slice per VD (minutes)")
+    parser.add_argument("--start-vd", choices=desktop_names(), default=None)
+    parser.add_argument("--monitors", action="store_true",
+                        help="Also run the real monitors (CPU cost is inflated by --speed)")
+    parser.add_argument("--early-yield", choices=("on", "off"), default=None,
+                        help="Override SWITCH_CONFIG['early_yield']['enabled']")
+    parser.add_argument("--compare-early-yield", action="store_true",
+                        help="Run the day with early yield off and on and report the coverage delta")
+    parser.add_argument("--out", type=Path, default=None, help="Write JSON report to this file")
+    parser.add_argument("--log-level", default="WARNING")
+    args = parser.parse_args()
+
+    from Orchestrator.src.utils.log import configure_logging
+    configure_logging(level=args.log_level, stream=sys.stderr)
+
+    kwargs = dict(speed=args.speed, start=args.start, hours=args.hours, slice_min=args.slice_min,
+                  with_monitors=args.monitors, start_vd=args.start_vd)
+    if args.compare_early_yield:
+        result = compare_early_yield(**kwargs)
+    else:
+        early_yield = None if args.early_yield is None else args.early_yield == "on"
+        result = run_day(early_yield=early_yield, **kwargs).to_dict()
+    text = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.out:
+        args.out.write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
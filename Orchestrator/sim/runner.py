@@ -0,0 +1,337 @@
+# Orchestrator/sim/runner.py
+# 시뮬레이터 위에서 실제 CombatMonitor / SystemMonitor를 실행하고 감지·조치 지연을 집계
+
+import tempfile
+import threading
+import time
+
+try:
+    import resource  # 문맥 전환 수 (Windows에는 없음)
+except ImportError:
+    resource = None
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from Orchestrator.sim.scenarios import GAMES, GameSpec
+from Orchestrator.sim.world import GameScreenSim, Scenario, SimIncident, TemplateBank
+from Orchestrator.src.core.async_runtime import AsyncMonitorRuntime
+from Orchestrator.src.core.checkpoint import CheckpointManager
+from Orchestrator.src.core.clock import ScaledClock, clock, set_clock
+from Orchestrator.src.core.detection_pool import DETECTION_POOL
+from Orchestrator.src.core.game_registry import build_monitor, game_for_vd, load_component
+from Orchestrator.src.core.input_backend import FakeBackend, inputs, set_backend
+from Orchestrator.src.core.io_scheduler import IOScheduler
+from Orchestrator.src.core.session_recorder import SessionRecorder
+from Orchestrator.src.core.shared_state_store import SharedStateStore
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+class SimOrchestrator:
+    """모니터가 사용하는 Orchestrator 인터페이스만 제공 (io_scheduler / 캡처 / 오류 보고)"""
+
+    def __init__(self, regions: Dict[str, tuple], vd: str = 'VD1', recorder: Optional[SessionRecorder] = None,
+                 io_scheduler: Optional[IOScheduler] = None):
+        self.io_scheduler = io_scheduler if io_scheduler is not None else IOScheduler()
+        self.screen_regions = regions
+        self.vd = vd
+        self.recorder = recorder
+        self.capture_lock = threading.Lock()
+        self.system_errors: List[tuple] = []
+
+    def capture_screen_safely(self, screen_id: str):
+        region = self.screen_regions.get(screen_id)
+        if region is None:
+            log.error(f"[Sim] Screen region not found for {screen_id}")
+            return None
+        with self.capture_lock:
+            frame = inputs.screenshot(region=region)
+        if self.recorder is not None:
+            self.recorder.record_frame(self.vd, screen_id, region, frame)
+        return frame
+
+    def report_system_error(self, monitor_id: str, screen_id: str) -> bool:
+        self.system_errors.append((time.perf_counter(), monitor_id, screen_id))
+        return False  # 시뮬레이터에서는 항상 실제 오류로 취급
+
+
+@dataclass
+class SimReport:
+    game: str
+    scenario: str
+    speed: float
+    sim_duration: float
+    wall_duration: float
+    frames: int
+    inputs: int
+    input_counts: Dict[str, int]
+    transitions: int
+    incidents: List[SimIncident] = field(default_factory=list)
+    runtime: str = 'threads'
+    threads_peak: int = 0
+    context_switches: Optional[int] = None
+    tick_rates: Dict[str, Dict] = field(default_factory=dict)  # 모니터 → 상태 → 유효 폴링 주기
+    restart: Optional[Dict] = None  # restart_at 사용 시 {'at_sim_s', 'mode', 'steady_state_s'}
+    screens: int = 0
+    tick_latency: Dict[str, Dict] = field(default_factory=dict)  # 모니터 → 틱 하나 소요 (실제 ms) 분포
+    io_wait: Dict[str, float] = field(default_factory=dict)  # IO 대기열 대기 (가상 초) 분포
+    cpu_percent: Optional[float] = None  # 프로세스 CPU 시간 / 실제 경과 (100 = 코어 하나, 탐지 작업 프로세스 포함)
+    detection: Optional[Dict] = None  # detection_workers 사용 시 DETECTION_POOL.snapshot()
+
+    def to_dict(self) -> Dict:
+        def _delta(end, start):
+            return None if end is None else round(end - start, 3)
+        return {
+            'game': self.game,
+            'scenario': self.scenario,
+            'speed': self.speed,
+            'runtime': self.runtime,
+            'threads_peak': self.threads_peak,
+            'context_switches': self.context_switches,
+            'sim_duration_s': round(self.sim_duration, 1),
+            'wall_duration_s': round(self.wall_duration, 2),
+            'frames': self.frames,
+            'frames_per_wall_s': round(self.frames / self.wall_duration, 1) if self.wall_duration else 0.0,
+            'inputs': self.inputs,
+            'input_counts': self.input_counts,
+            'transitions': self.transitions,
+            'tick_rates': self.tick_rates,
+            'screens': self.screens,
+            'tick_latency': self.tick_latency,
+            'io_wait': self.io_wait,
+            'cpu_percent': self.cpu_percent,
+            'detection': self.detection,
+            'restart': self.restart,
+            'incidents': [
+                {
+                    'screen': i.screen,
+                    'key': i.key,
+                    'shown_at_sim_s': round(i.shown_sim, 2),
+                    'detected_state': i.detected_state,
+                    'detect_sim_s': _delta(i.detected_sim, i.shown_sim),
+                    'detect_wall_s': _delta(i.detected_wall, i.shown_wall),
+                    'resolve_sim_s': _delta(i.resolved_sim, i.shown_sim),
+                    'resolve_wall_s': _delta(i.resolved_wall, i.shown_wall),
+                }
+                for i in self.incidents
+            ],
+        }
+
+
+def _build_monitors(spec: GameSpec, orchestrator: SimOrchestrator, store: SharedStateStore,
+                    kinds: Sequence[str]) -> Dict[str, object]:
+    """오케스트레이터와 같은 방식으로 모니터 생성 (게임 레지스트리, import는 필요할 때만)"""
+    game = game_for_vd(spec.vd)
+    if game is None:
+        raise ValueError(f"No game registered for {spec.vd} (GAMES_CONFIG)")
+    monitors: Dict[str, object] = {}
+    for entry in game.monitors:
+        if entry.kind not in kinds:
+            continue
+        factory = load_component(entry)
+        if factory is None:
+            raise ImportError(f"Cannot import {entry.component[0]}.{entry.component[1]}")
+        monitors[entry.monitor_id] = build_monitor(game, entry, factory, orchestrator=orchestrator,
+                                                   io_scheduler=orchestrator.io_scheduler, shared_states=store,
+                                                   regions=spec.regions)
+    return monitors
+
+
+def _distribution(values: Sequence[float], scale: float = 1.0, digits: int = 3) -> Dict[str, float]:
+    """{n, p50, p90, max} (values × scale)"""
+    if not values:
+        return {'n': 0, 'p50': 0.0, 'p90': 0.0, 'max': 0.0}
+    ordered = sorted(values)
+
+    def _at(q):
+        return round(ordered[min(len(ordered) - 1, int(q * len(ordered)))] * scale, digits)
+    return {'n': len(ordered), 'p50': _at(0.5), 'p90': _at(0.9), 'max': round(ordered[-1] * scale, digits)}
+
+
+def _watch_ticks(monitors: Dict[str, object], durations: Dict[str, List[float]]):
+    """틱마다 소요 시간(가상 초) 기록 - TickScheduler.on_tick은 틱이 끝난 직후 (키, 틱 시작 시각)으로 호출"""
+    for monitor_id, monitor in monitors.items():
+        ticks = getattr(monitor, 'ticks', None)
+        if ticks is not None:
+            samples = durations.setdefault(monitor_id, [])
+            ticks.on_tick = lambda key, started, samples=samples: samples.append(clock.time() - started)
+
+
+def _context_switches() -> Optional[int]:
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_nvcsw + usage.ru_nivcsw
+
+
+def run_simulation(game: str, scenario: Scenario, speed: float = 10.0, kinds: Sequence[str] = ('srm', 'sm'),
+                   seed: int = 0, record_dir: Optional[Path] = None, runtime: str = 'threads',
+                   executor_workers: int = 2, restart_at: Optional[float] = None, warm: bool = True,
+                   detection_workers: int = 0) -> SimReport:
+    """
+    시나리오를 speed 배속으로 재생하면서 실제 모니터 스레드와 IOScheduler를 돌립니다.
+    ScaledClock(speed)을 설치해 모니터·IOScheduler·시나리오가 같은 가상 시간으로 돌고,
+    캡처/입력은 FakeBackend가 시뮬레이터로 연결합니다.
+    record_dir를 주면 실제 세션과 같은 형식으로 기록합니다 (session_replay 검증용).
+    runtime='asyncio'면 오케스트레이터의 asyncio 모드와 같이 AsyncMonitorRuntime으로 모니터를 실행합니다.
+    restart_at(가상 초)을 주면 그 시점에 체크포인트를 저장하고 모니터와 공유 상태를 새로 만들어 재시작합니다
+    (warm=False면 체크포인트를 쓰지 않음). 재시작 → 모든 화면 정상 상태까지 시간을 report.restart에 기록합니다.
+    detection_workers > 0이면 템플릿 매칭을 그 수만큼의 탐지 작업 프로세스(DETECTION_POOL)로 보냅니다.
+    """
+    spec = GAMES[game]
+    previous_clock = set_clock(ScaledClock(speed))
+    bank = TemplateBank(seed=seed)
+    restore_templates = bank.install(spec.registries)
+    world = GameScreenSim(spec.regions, bank, scenario, rules=spec.rules, incident_keys=spec.incident_keys,
+                          seed=seed)
+    backend = FakeBackend(screen_size=world.screen_size, frame_source=world.frame)
+    backend.add_listener(world.on_input)
+    previous_backend = set_backend(backend)
+
+    transitions = []
+
+    def _new_store() -> SharedStateStore:
+        new_store = SharedStateStore(spec.vd)
+        new_store.subscribe(lambda new, old: transitions.append(new))
+        new_store.subscribe(world.on_state_change)
+        return new_store
+
+    store = _new_store()
+
+    recorder = SessionRecorder(root=record_dir) if record_dir else None
+    async_runtime = AsyncMonitorRuntime(executor_workers) if runtime == 'asyncio' else None
+    orchestrator = SimOrchestrator(spec.regions, vd=spec.vd, recorder=recorder,
+                                   io_scheduler=async_runtime.io_scheduler if async_runtime else None)
+    if recorder is not None:
+        recorder.attach(orchestrator.io_scheduler, {spec.vd: store})
+        recorder.start()
+    stop_event = threading.Event()  # IO 스케줄러
+    monitor_stop = threading.Event()  # 현재 모니터 세대 (재시작 시 교체)
+    handles: List = []  # threading.Thread 또는 MonitorTaskHandle
+    restart = None
+    checkpoint: Optional[CheckpointManager] = None
+    checkpoint_dir = tempfile.TemporaryDirectory(prefix="sim_checkpoint_") if restart_at is not None else None
+    wall_start = time.perf_counter()
+    threads_peak = 0
+    switches_start = _context_switches()
+    monitors: Dict[str, object] = {}
+    tick_durations: Dict[str, List[float]] = {}
+    io_waits: List[float] = []
+    orchestrator.io_scheduler.add_observer(
+        lambda component, screen_id, priority, wait_ms, run_ms, ok: io_waits.append(wait_ms / 1000.0))
+    detection = None
+    if detection_workers > 0:
+        DETECTION_POOL.configure({'workers': detection_workers})
+        DETECTION_POOL.start(slot_bytes=max(w * h * 4 for _, _, w, h in spec.regions.values()))
+        DETECTION_POOL.reset_stats()
+    cpu_start = time.process_time()
+    try:
+        monitors = _build_monitors(spec, orchestrator, store, kinds)
+        _watch_ticks(monitors, tick_durations)
+        log.info(f"[Sim] {game}/{scenario.name}: {len(monitors)} monitors, x{speed:g}, "
+                 f"{scenario.duration:g}s simulated")
+
+        def _start_monitors():
+            for monitor_id, monitor in monitors.items():
+                if async_runtime is not None:
+                    handles.append(async_runtime.start_monitor(monitor_id, monitor, monitor_stop))
+                    continue
+                thread = threading.Thread(target=monitor.run_loop, args=(monitor_stop,), name=f"Sim-{monitor_id}",
+                                          daemon=True)
+                thread.start()
+                handles.append(thread)
+
+        def _stop_monitors():
+            monitor_stop.set()
+            store.wake_waiters()  # SM은 공유 상태 변경을 기다리며 잠듦 (wait_for_change)
+            for handle in handles:
+                handle.join(timeout=10.0)
+            handles.clear()
+
+        orchestrator.io_scheduler.start(stop_event)
+        world.reset_clock()
+        wall_start = time.perf_counter()
+        _start_monitors()
+
+        while world.now() < scenario.duration:
+            time.sleep(0.05)
+            world.poll()  # 모니터가 캡처하지 않는 동안에도 시나리오 진행
+            threads_peak = max(threads_peak, threading.active_count())
+            if restart is None and restart_at is not None and world.now() >= restart_at:
+                # 프로세스 재시작 흉내: 체크포인트 저장 → 공유 상태/모니터 새로 생성 → (웜) 복원 → 시작
+                _stop_monitors()
+                saver = CheckpointManager(path=Path(checkpoint_dir.name) / "checkpoint.json")
+                saver.attach_store(spec.vd, store)
+                for monitor_id, monitor in monitors.items():
+                    saver.register_monitor(monitor_id, monitor)
+                saver.save()
+                store = _new_store()
+                monitors = _build_monitors(spec, orchestrator, store, kinds)
+                _watch_ticks(monitors, tick_durations)
+                checkpoint = CheckpointManager(path=saver.path)
+                checkpoint.attach_store(spec.vd, store)
+                if warm:
+                    checkpoint.load()
+                for monitor_id, monitor in monitors.items():
+                    checkpoint.restore(monitor_id, monitor, spec.vd)
+                monitor_stop = threading.Event()
+                checkpoint.watch_steady_state(spec.vd, store, monitors.values())
+                _start_monitors()
+                restart = {'at_sim_s': round(world.now(), 1), 'mode': checkpoint.steady_state[spec.vd]['mode'],
+                           'steady_state_s': None}
+            if checkpoint is not None and restart['steady_state_s'] is None:
+                checkpoint.poll_steady_state()
+                seconds = checkpoint.steady_state[spec.vd]['seconds']
+                if seconds is not None:
+                    restart['steady_state_s'] = round(seconds, 2)
+    finally:
+        stop_event.set()
+        monitor_stop.set()
+        store.wake_waiters()
+        for handle in handles:
+            handle.join(timeout=10.0)
+        wall_duration = time.perf_counter() - wall_start
+        cpu_seconds = time.process_time() - cpu_start
+        if DETECTION_POOL.running:
+            detection = DETECTION_POOL.snapshot()
+            cpu_seconds += detection['worker_cpu_s']  # 작업 프로세스 준비 이후
+            DETECTION_POOL.stop()
+        sim_duration = world.now()  # 시계를 되돌리기 전에 (가상 시간 기준)
+        switches_end = _context_switches()
+        if async_runtime is not None:
+            async_runtime.stop()
+        if recorder is not None:
+            recorder.stop()
+        set_backend(previous_backend)
+        restore_templates()
+        bank.cleanup()
+        if checkpoint_dir is not None:
+            checkpoint_dir.cleanup()
+        set_clock(previous_clock)
+
+    return SimReport(
+        game=game,
+        scenario=scenario.name,
+        speed=speed,
+        sim_duration=sim_duration,
+        wall_duration=wall_duration,
+        frames=world.frames_served,
+        inputs=world.inputs_seen,
+        input_counts=dict(backend.counts),
+        transitions=len(transitions),
+        incidents=world.incidents,
+        runtime=runtime,
+        threads_peak=threads_peak,
+        context_switches=None if switches_start is None else switches_end - switches_start,
+        tick_rates={monitor_id: monitor.ticks.snapshot() for monitor_id, monitor in monitors.items()
+                    if hasattr(monitor, 'ticks')},
+        restart=restart,
+        screens=len(spec.regions),
+        tick_latency={monitor_id: _distribution(samples, scale=1000.0 / speed, digits=2)
+                      for monitor_id, samples in tick_durations.items()},
+        io_wait=_distribution(io_waits),
+        cpu_percent=round(100.0 * cpu_seconds / wall_duration, 1) if wall_duration else None,
+        detection=detection,
+    )
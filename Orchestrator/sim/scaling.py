@@ -0,0 +1,132 @@
+# Orchestrator/sim/scaling.py
+# 화면 수 확장성 벤치마크 - VD 하나의 클라이언트를 S1~S5에서 8~12개로 늘릴 때 틱 지연 / IO 대기 / CPU 변화
+#
+# 화면 N개마다:
+#   - grid_layout(N)으로 배치 (기존 화면 크기 그대로, 1920x1080 모니터를 필요한 만큼 가로로 이어 붙임)
+#   - 모든 화면에 시차를 두고 사망 → 실제 모니터(SRM / SM)로 감지·조치
+#   - 틱 하나 소요 (실제 ms) / IO 대기열 대기 (가상 초) / 유효 폴링 비율 / CPU / 감지·조치 지연
+#
+# 사용 예:
+#   python -m Orchestrator.sim.scaling --game nightcrows --screens 5,8,10,12
+#   python -m Orchestrator.sim.scaling --game raven2 --screens 5,12 --runtime asyncio --out scaling.json
+#   python -m Orchestrator.sim.scaling --game raven2 --screens 5,10 --detection-workers 2   # 탐지 작업 프로세스
+#
+# 유효 폴링 비율(keep_up): 선언된 틱 간격 합 / 실제 틱 간격 합 - 1.0이면 모든 화면을 선언한 주기대로 확인,
+# 낮아질수록 화면이 많아 틱이 밀리는 중 (io_wait p90과 함께 보면 캡처/입력 경합인지 CPU인지 구분)
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from Orchestrator.sim.runner import run_simulation
+from Orchestrator.sim.scenarios import GAMES
+from Orchestrator.sim.world import Scenario, ScenarioEvent
+from Orchestrator.src.core.game_registry import game_for_vd
+from Orchestrator.src.core.screen_layout import apply_layout, displays_for, grid_layout, screen_ids
+
+# 게임별 사망 표시 요소 (시나리오 'deaths'와 같음)
+DEATH_KEYS = {
+    'nightcrows': ('DEAD', 'REVIVE_BUTTON'),
+    'raven2': ('DEAD_TEMPLATE', 'DEATH_RETURN_BUTTON'),
+}
+
+
+def scaling_scenario(game: str, screens: Sequence[str], stagger: float = 5.0, settle: float = 60.0) -> Scenario:
+    """화면마다 stagger초 간격으로 사망 한 번 (마지막 사망 후 settle초까지)"""
+    events = [ScenarioEvent(at=20.0 + i * stagger, screen=screen_id, show=DEATH_KEYS[game])
+              for i, screen_id in enumerate(screens)]
+    return Scenario(name=f"scaling_{len(screens)}", duration=events[-1].at + settle, events=events,
+                    description=f"Staggered deaths on {len(screens)} screens")
+
+
+def _keep_up(tick_rates: Dict[str, Dict]) -> float:
+    """선언된 틱 간격 합 / 실제 틱 간격 합 (모든 모니터·상태)"""
+    declared = actual = 0.0
+    for labels in tick_rates.values():
+        for entry in labels.values():
+            declared += entry['ticks'] * entry['declared_s']
+            actual += entry['ticks'] * entry['avg_interval_s']
+    return round(min(1.0, declared / actual), 3) if actual else 0.0
+
+
+def run_scaling(game: str, counts: Sequence[int], speed: float = 5.0, runtime: str = 'threads',
+                like: Sequence[str] = ('S2',), seed: int = 0, detection_workers: int = 0) -> List[Dict]:
+    """화면 수마다 run_simulation → 요약 목록"""
+    spec = GAMES[game]
+    entry = game_for_vd(spec.vd)
+    _, _, cell_w, cell_h = spec.regions[like[0]]
+    results = []
+    for count in counts:
+        layout = grid_layout(count, displays_for(count, (cell_w, cell_h)), like=like, cell=(cell_w, cell_h))
+        restore = apply_layout(entry, layout)
+        try:
+            scenario = scaling_scenario(game, screen_ids(spec.regions))
+            report = run_simulation(game, scenario, speed=speed, seed=seed, runtime=runtime,
+                                    detection_workers=detection_workers)
+        finally:
+            restore()
+        detect = sorted(i.detected_sim - i.shown_sim for i in report.incidents if i.detected_sim is not None)
+        resolve = sorted(i.resolved_sim - i.shown_sim for i in report.incidents if i.resolved_sim is not None)
+        results.append({
+            'screens': report.screens,
+            'tick_latency_ms': report.tick_latency,
+            'io_wait_s': report.io_wait,
+            'keep_up': _keep_up(report.tick_rates),
+            'cpu_percent': report.cpu_percent,
+            'frames_per_wall_s': round(report.frames / report.wall_duration, 1) if report.wall_duration else 0.0,
+            'incidents': len(report.incidents),
+            'detected': len(detect),
+            'resolved': len(resolve),
+            'detect_max_s': round(detect[-1], 2) if detect else None,
+            'resolve_max_s': round(resolve[-1], 2) if resolve else None,
+        })
+    return results
+
+
+def _print_table(results: List[Dict]):
+    print(f"{'screens':>7} {'tick p50/p90/max ms':>22} {'io_wait p90/max s':>18} {'keep_up':>7} {'cpu%':>6} "
+          f"{'detected':>9} {'detect max':>10} {'resolve max':>11}")
+    for r in results:
+        ticks = [v for v in r['tick_latency_ms'].values() if v['n']]
+        p50 = max((v['p50'] for v in ticks), default=0.0)
+        p90 = max((v['p90'] for v in ticks), default=0.0)
+        worst = max((v['max'] for v in ticks), default=0.0)
+        io_wait = f"{r['io_wait_s']['p90']:.2f}/{r['io_wait_s']['max']:.2f}"
+        detected = f"{r['detected']}/{r['incidents']}"
+        detect_max = '-' if r['detect_max_s'] is None else r['detect_max_s']
+        resolve_max = '-' if r['resolve_max_s'] is None else r['resolve_max_s']
+        print(f"{r['screens']:>7} {f'{p50:.1f}/{p90:.1f}/{worst:.1f}':>22} {io_wait:>18} {r['keep_up']:>7.3f} "
+              f"{r['cpu_percent'] or 0:>6.1f} {detected:>9} {detect_max:>10} {resolve_max:>11}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark monitors as the number of screens per VD grows")
+    parser.add_argument("--game", choices=tuple(GAMES), default="nightcrows")
+    parser.add_argument("--screens", default="5,8,10,12", help="Comma-separated screen counts")
+    parser.add_argument("--like", default="S2", help="Comma-separated existing screens new screens copy")
+    parser.add_argument("--speed", type=float, default=5.0, help="Simulated seconds per wall second")
+    parser.add_argument("--runtime", choices=("threads", "asyncio"), default="threads")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--detection-workers", type=int, default=0,
+                        help="Match templates in this many worker processes (0: in the monitor threads)")
+    parser.add_argument("--out", type=Path, default=None, help="Write JSON results to this file")
+    parser.add_argument("--log-level", default="ERROR")
+    args = parser.parse_args()
+
+    from Orchestrator.src.utils.log import configure_logging
+    configure_logging(level=args.log_level, stream=sys.stderr)
+
+    counts = [int(n) for n in args.screens.split(",") if n.strip()]
+    like = [s.strip() for s in args.like.split(",") if s.strip()]
+    results = run_scaling(args.game, counts, speed=args.speed, runtime=args.runtime, like=like, seed=args.seed,
+                          detection_workers=args.detection_workers)
+    _print_table(results)
+    if args.out:
+        args.out.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
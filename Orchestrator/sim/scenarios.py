@@ -0,0 +1,125 @@
+# Orchestrator/sim/scenarios.py
+# 게임별 시뮬레이션 사양(화면 배치, 템플릿 레지스트리, 입력 반응 규칙)과 스크립트 시나리오
+#
+# 시나리오는 SCENARIOS에 등록하며, JSON 파일({"name", "duration", "events": [...]})로도 불러올 수 있습니다.
+
+import importlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+from Orchestrator.sim.world import ReactionRule, Scenario, ScenarioEvent
+from Orchestrator.src.core.session_recorder import TEMPLATE_REGISTRIES
+
+
+@dataclass
+class GameSpec:
+    name: str
+    vd: str
+    screen_info_module: str
+    registries: Sequence[Tuple[str, str]]  # (모듈, dict 속성명) - TemplateBank.install 대상
+    rules: Sequence[ReactionRule]
+    incident_keys: Sequence[str]  # 감지/조치 지연을 측정할 이상 요소
+    monitors: Dict[str, str] = field(default_factory=dict)  # 'srm'/'sm' → 모니터 ID
+
+    @property
+    def regions(self) -> Dict[str, Tuple[int, int, int, int]]:
+        return importlib.import_module(self.screen_info_module).SCREEN_REGIONS
+
+
+# =============================================================================
+# 🎮 게임 사양
+# =============================================================================
+GAMES: Dict[str, GameSpec] = {
+    'nightcrows': GameSpec(
+        name='nightcrows',
+        vd='VD1',
+        screen_info_module='Orchestrator.NightCrows.utils.screen_info',
+        registries=TEMPLATE_REGISTRIES['VD1'],
+        rules=[
+            # 사망: REVIVE_BUTTON 클릭 → 사망 표시 해제, 묘지 선택 UI 표시
+            ReactionRule('REVIVE_BUTTON', hide=('DEAD', 'REVIVE_BUTTON'), show=('GRAVEYARD',), delay=0.5),
+            ReactionRule('GRAVEYARD', hide=('GRAVEYARD',)),
+            ReactionRule('esc', on='key', hide=('GRAVEYARD',)),
+            # 연결 끊김 팝업: 확인 버튼 클릭 → 팝업 닫힘
+            ReactionRule('CONNECTION_CONFIRM_BUTTON', hide=('CONNECTION_CONFIRM_BUTTON',)),
+        ],
+        incident_keys=('DEAD', 'HOSTILE', 'CONNECTION_CONFIRM_BUTTON'),
+        monitors={'srm': 'SRM1', 'sm': 'SM1'},
+    ),
+    'raven2': GameSpec(
+        name='raven2',
+        vd='VD2',
+        screen_info_module='Orchestrator.Raven2.utils.screen_info',
+        registries=TEMPLATE_REGISTRIES['VD2'],
+        rules=[
+            # 사망: 귀환 버튼 클릭 → 사망 표시 해제, 잠시 뒤 마을 UI 표시
+            ReactionRule('DEATH_RETURN_BUTTON', hide=('DEAD_TEMPLATE', 'DEATH_RETURN_BUTTON'),
+                         show=('TOWN_UI_TEMPLATE',), delay=2.0),
+            ReactionRule('CONNECTION_CONFIRM_BUTTON', hide=('CONNECTION_CONFIRM_BUTTON',)),
+        ],
+        incident_keys=('DEAD_TEMPLATE', 'ABNORMAL_TEMPLATE', 'CONNECTION_CONFIRM_BUTTON'),
+        monitors={'srm': 'SRM2', 'sm': 'SM2'},
+    ),
+}
+
+
+# =============================================================================
+# 📜 시나리오
+# =============================================================================
+SCENARIOS: Dict[str, Dict[str, Scenario]] = {
+    'nightcrows': {
+        'deaths': Scenario(
+            name='deaths',
+            duration=150.0,
+            description="S3, S5 사망 → 부활 클릭으로 해제 / S2 적대 10초",
+            events=[
+                ScenarioEvent(at=30.0, screen='S3', show=('DEAD', 'REVIVE_BUTTON')),
+                ScenarioEvent(at=60.0, screen='S2', show=('HOSTILE',), hold=10.0),
+                ScenarioEvent(at=90.0, screen='S5', show=('DEAD', 'REVIVE_BUTTON')),
+            ],
+        ),
+        'disconnect': Scenario(
+            name='disconnect',
+            duration=90.0,
+            description="S1, S4 연결 끊김 팝업 → 확인 클릭으로 해제",
+            events=[
+                ScenarioEvent(at=15.0, screen='S1', show=('CONNECTION_CONFIRM_BUTTON',)),
+                ScenarioEvent(at=50.0, screen='S4', show=('CONNECTION_CONFIRM_BUTTON',)),
+            ],
+        ),
+    },
+    'raven2': {
+        'deaths': Scenario(
+            name='deaths',
+            duration=120.0,
+            description="S2, S4 사망 → 귀환 클릭 후 마을 UI",
+            events=[
+                ScenarioEvent(at=10.0, screen='S1', show=('AWAKE_TEMPLATE',)),
+                ScenarioEvent(at=20.0, screen='S2', show=('DEAD_TEMPLATE', 'DEATH_RETURN_BUTTON')),
+                ScenarioEvent(at=60.0, screen='S4', show=('DEAD_TEMPLATE', 'DEATH_RETURN_BUTTON')),
+            ],
+        ),
+        'disconnect': Scenario(
+            name='disconnect',
+            duration=90.0,
+            description="S2 연결 끊김 팝업 → 확인 클릭으로 해제",
+            events=[
+                ScenarioEvent(at=15.0, screen='S2', show=('CONNECTION_CONFIRM_BUTTON',)),
+            ],
+        ),
+    },
+}
+
+
+def load_scenario(path: Path) -> Scenario:
+    """JSON 시나리오 파일 로드"""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    events: List[ScenarioEvent] = [
+        ScenarioEvent(at=float(e['at']), screen=e['screen'], show=tuple(e.get('show', ())),
+                      hide=tuple(e.get('hide', ())), hold=e.get('hold'))
+        for e in data.get('events', [])
+    ]
+    return Scenario(name=data.get('name', Path(path).stem), duration=float(data['duration']),
+                    events=events, description=data.get('description', ''))
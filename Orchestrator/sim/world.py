@@ -0,0 +1,344 @@
+# Orchestrator/sim/world.py
+# 합성 게임 화면 시뮬레이터: 등록된 템플릿을 배경 위에 합성해 화면(S1~) 프레임을 만들고,
+# 시나리오 이벤트와 입력(FakeBackend 리스너)에 반응해 화면 요소를 켜고 끔
+#
+# - TemplateBank: 템플릿 레지스트리(TEMPLATES 등)의 모든 키에 대해 합성 템플릿 PNG를 만들고 경로를 교체
+# - GameScreenSim: 화면별 요소 배치/표시 상태를 관리하고 frame(region)으로 캡처를 공급
+
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.session_recorder import override_template_paths
+from Orchestrator.src.core.transition_journal import BASELINE_STATES
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+SCREEN_SIZE = (1920, 1080)
+TEMPLATE_SIZE = (48, 24)  # (w, h)
+CELL_PITCH = (60, 36)  # 요소 배치 격자 간격 (템플릿끼리 겹치지 않도록)
+# 감지로 보지 않는 전이 대상 (정상 상태 + 모니터 시작 시 초기화)
+IDLE_STATES = BASELINE_STATES + ('INITIALIZING',)
+
+Region = Tuple[int, int, int, int]
+
+
+# =============================================================================
+# 합성 템플릿
+# =============================================================================
+class TemplateBank:
+    """
+    (화면, 키) 별로 서로 구분되는 합성 템플릿을 만들어 임시 폴더에 저장.
+    install()은 게임 모듈의 템플릿 레지스트리 dict 값을 이 경로로 바꾸고, 되돌리는 함수를 반환합니다.
+    같은 게임의 CM/SM이 같은 (화면, 키)를 쓰면 같은 템플릿을 공유합니다.
+    """
+
+    def __init__(self, seed: int = 0, size: Tuple[int, int] = TEMPLATE_SIZE):
+        self.seed = seed
+        self.size = size
+        self._tmp = tempfile.TemporaryDirectory(prefix="orch_sim_")
+        self.path = Path(self._tmp.name)
+        self.patches: Dict[Tuple[str, str], np.ndarray] = {}
+        self.files: Dict[Tuple[str, str], str] = {}
+
+    def patch(self, screen_id: str, key: str) -> np.ndarray:
+        """(화면, 키)의 RGB 템플릿 (없으면 생성)"""
+        ident = (screen_id, key)
+        if ident not in self.patches:
+            rng = np.random.default_rng([self.seed, len(self.patches)])
+            w, h = self.size
+            self.patches[ident] = rng.integers(0, 256, (h, w, 3), dtype=np.uint8)
+        return self.patches[ident]
+
+    def file(self, screen_id: str, key: str) -> str:
+        ident = (screen_id, key)
+        if ident not in self.files:
+            file_path = self.path / f"{screen_id}_{key}.png"
+            cv2.imwrite(str(file_path), cv2.cvtColor(self.patch(screen_id, key), cv2.COLOR_RGB2BGR))
+            self.files[ident] = str(file_path)
+        return self.files[ident]
+
+    def install(self, registries: Iterable[Tuple[str, str]]) -> Callable[[], None]:
+        """
+        registries: (모듈 경로, dict 속성명) 목록 (session_recorder.TEMPLATE_REGISTRIES 참고).
+        반환값을 호출하면 원래 경로로 복원됩니다.
+        """
+        return override_template_paths(registries, lambda screen_id, key, original: self.file(screen_id, key))
+
+    def keys_for(self, screen_id: str) -> List[str]:
+        return sorted(key for sid, key in self.patches if sid == screen_id)
+
+    def cleanup(self):
+        self._tmp.cleanup()
+
+
+# =============================================================================
+# 시나리오 / 반응 규칙
+# =============================================================================
+@dataclass
+class ScenarioEvent:
+    """시나리오 시각(at, 시뮬레이션 초)에 화면 요소를 표시/제거. hold가 있으면 그 시간 뒤 자동 제거"""
+    at: float
+    screen: str
+    show: Sequence[str] = ()
+    hide: Sequence[str] = ()
+    hold: Optional[float] = None
+
+
+@dataclass
+class ReactionRule:
+    """
+    입력에 대한 화면 반응.
+    - on='click': 요소 trigger가 보이는 상태에서 그 영역을 클릭하면 발동
+    - on='key':   trigger 키(예: 'esc')가 해당 화면(마지막 클릭 화면)에 입력되면 발동
+    발동 시 hide를 즉시 제거하고, delay 뒤 show를 표시합니다.
+    """
+    trigger: str
+    on: str = 'click'
+    hide: Sequence[str] = ()
+    show: Sequence[str] = ()
+    delay: float = 0.0
+
+
+@dataclass
+class Scenario:
+    name: str
+    duration: float  # 시뮬레이션 초
+    events: List[ScenarioEvent] = field(default_factory=list)
+    description: str = ""
+
+
+@dataclass
+class SimIncident:
+    """시나리오가 띄운 이상 요소 하나의 감지/조치 기록 (시뮬레이션 초 / 실제 초)"""
+    screen: str
+    key: str
+    shown_sim: float
+    shown_wall: float
+    detected_state: Optional[str] = None
+    detected_sim: Optional[float] = None
+    detected_wall: Optional[float] = None
+    resolved_sim: Optional[float] = None
+    resolved_wall: Optional[float] = None
+
+
+# =============================================================================
+# 화면 시뮬레이터
+# =============================================================================
+class GameScreenSim:
+    """
+    한 VD(게임)의 데스크톱 화면. FakeBackend(frame_source=sim.frame)에 연결하고
+    backend.add_listener(sim.on_input)으로 입력에 반응시킵니다.
+    시뮬레이션 시간은 현재 시계(clock) 기준입니다 (runner가 ScaledClock을 설치하면 가속).
+    """
+
+    def __init__(self, regions: Dict[str, Region], bank: TemplateBank, scenario: Scenario,
+                 rules: Sequence[ReactionRule] = (), incident_keys: Iterable[str] = (),
+                 seed: int = 0, screen_size: Optional[Tuple[int, int]] = None):
+        self.regions = dict(regions)
+        self.bank = bank
+        self.scenario = scenario
+        self.rules = list(rules)
+        self.incident_keys = set(incident_keys)
+        # 기본: 모든 화면을 담는 크기 (최소 SCREEN_SIZE, 여러 모니터 배치면 더 넓게)
+        self.screen_size = screen_size or (
+            max([SCREEN_SIZE[0]] + [x + w for x, _, w, _ in self.regions.values()]),
+            max([SCREEN_SIZE[1]] + [y + h for _, y, _, h in self.regions.values()]))
+
+        self._lock = threading.RLock()
+        self._background = self._make_background(seed)
+        self._frame = self._background.copy()
+        self._dirty = True
+        self._layout: Dict[str, Dict[str, Tuple[int, int]]] = {sid: {} for sid in self.regions}
+        self.visible: Dict[str, set] = {sid: set() for sid in self.regions}
+        self._pending: List[Tuple[float, str, str, bool]] = sorted(
+            [(e.at, e.screen, key, True) for e in scenario.events for key in e.show] +
+            [(e.at, e.screen, key, False) for e in scenario.events for key in e.hide] +
+            [(e.at + e.hold, e.screen, key, False) for e in scenario.events if e.hold for key in e.show]
+        )
+        self.incidents: List[SimIncident] = []
+        self._open_incidents: Dict[Tuple[str, str], SimIncident] = {}
+        self._mouse_pressed = False
+        self.focus_screen: Optional[str] = None
+        self.frames_served = 0
+        self.inputs_seen = 0
+        self._t0 = clock.monotonic()
+
+    # --- 시간 ---
+    def now(self) -> float:
+        """시뮬레이션 시각 (초)"""
+        return clock.monotonic() - self._t0
+
+    def reset_clock(self):
+        self._t0 = clock.monotonic()
+
+    # --- 배치 / 렌더링 ---
+    def _make_background(self, seed: int) -> np.ndarray:
+        rng = np.random.default_rng(seed)
+        width, height = self.screen_size
+        base = cv2.resize(rng.integers(0, 256, (height // 16, width // 16, 3), dtype=np.uint8),
+                          (width, height), interpolation=cv2.INTER_CUBIC)
+        noise = rng.integers(-12, 13, (height, width, 3))
+        return np.clip(base.astype(np.int16) + noise, 0, 255).astype(np.uint8)
+
+    def position(self, screen_id: str, key: str) -> Tuple[int, int]:
+        """요소의 절대 좌상단 좌표. 화면 영역 안 격자에 등록 순서대로 고정 배치"""
+        layout = self._layout[screen_id]
+        if key not in layout:
+            x, y, w, h = self.regions[screen_id]
+            pitch_x, pitch_y = CELL_PITCH
+            columns = max(1, (w - 8) // pitch_x)
+            rows = max(1, (h - 8) // pitch_y)
+            index = len(layout) % (columns * rows)
+            layout[key] = (x + 4 + (index % columns) * pitch_x, y + 4 + (index // columns) * pitch_y)
+        return layout[key]
+
+    def bbox(self, screen_id: str, key: str) -> Region:
+        x, y = self.position(screen_id, key)
+        w, h = self.bank.size
+        return (x, y, w, h)
+
+    def _render(self):
+        frame = self._background.copy()
+        for screen_id, keys in self.visible.items():
+            for key in sorted(keys):
+                x, y = self.position(screen_id, key)
+                patch = self.bank.patch(screen_id, key)
+                h, w = patch.shape[:2]
+                frame[y:y + h, x:x + w] = patch
+        self._frame = frame
+        self._dirty = False
+
+    def poll(self):
+        """현재 시각까지의 시나리오 이벤트 반영"""
+        with self._lock:
+            self._advance()
+
+    def frame(self, region: Optional[Region] = None) -> np.ndarray:
+        """FakeBackend.frame_source - 현재 시각까지의 시나리오를 반영한 RGB 프레임"""
+        with self._lock:
+            self._advance()
+            if self._dirty:
+                self._render()
+            self.frames_served += 1
+            if region is None:
+                return self._frame.copy()
+            x, y, w, h = region
+            return self._frame[y:y + h, x:x + w].copy()
+
+    # --- 상태 변경 ---
+    def show(self, screen_id: str, key: str):
+        with self._lock:
+            if key in self.visible[screen_id]:
+                return
+            self.position(screen_id, key)
+            self.visible[screen_id].add(key)
+            self._dirty = True
+            if key in self.incident_keys and (screen_id, key) not in self._open_incidents:
+                incident = SimIncident(screen_id, key, self.now(), time.perf_counter())
+                self.incidents.append(incident)
+                self._open_incidents[(screen_id, key)] = incident
+            log.debug(f"[Sim] {screen_id}: show {key}", screen_id=screen_id, key=key)
+
+    def hide(self, screen_id: str, key: str):
+        with self._lock:
+            if key not in self.visible[screen_id]:
+                return
+            self.visible[screen_id].discard(key)
+            self._dirty = True
+            incident = self._open_incidents.pop((screen_id, key), None)
+            if incident:
+                incident.resolved_sim = self.now()
+                incident.resolved_wall = time.perf_counter()
+            log.debug(f"[Sim] {screen_id}: hide {key}", screen_id=screen_id, key=key)
+
+    def _advance(self):
+        now = self.now()
+        while self._pending and self._pending[0][0] <= now:
+            _, screen_id, key, visible = self._pending.pop(0)
+            if screen_id not in self.regions:
+                continue
+            (self.show if visible else self.hide)(screen_id, key)
+
+    def _schedule(self, delay: float, screen_id: str, keys: Sequence[str]):
+        at = self.now() + delay
+        for key in keys:
+            self._pending.append((at, screen_id, key, True))
+        self._pending.sort()
+
+    # --- 입력 반응 ---
+    def screen_at(self, x: int, y: int) -> Optional[str]:
+        for screen_id, (rx, ry, rw, rh) in self.regions.items():
+            if rx <= x < rx + rw and ry <= y < ry + rh:
+                return screen_id
+        return None
+
+    def on_input(self, event):
+        """FakeBackend 리스너. click / (mouse_down → mouse_up) / key_press 에 반응"""
+        with self._lock:
+            self.inputs_seen += 1
+            self._advance()
+            kind = event.kind
+            if kind == 'mouse_down':
+                self._mouse_pressed = True
+                return
+            if kind == 'mouse_up':
+                if not self._mouse_pressed:
+                    return  # IOScheduler의 '손 털기' mouse_up
+                self._mouse_pressed = False
+                kind = 'click'
+            if kind == 'click' and event.x is not None:
+                self._on_click(event.x, event.y)
+            elif kind in ('key_press', 'key_up') and event.key:
+                self._on_key(str(event.key).lower())
+
+    def _on_click(self, x: int, y: int):
+        screen_id = self.screen_at(x, y)
+        if screen_id is None:
+            return
+        self.focus_screen = screen_id
+        for key in list(self.visible[screen_id]):
+            bx, by, bw, bh = self.bbox(screen_id, key)
+            if bx <= x < bx + bw and by <= y < by + bh:
+                self._fire(screen_id, 'click', key)
+
+    def _on_key(self, key: str):
+        if self.focus_screen:
+            self._fire(self.focus_screen, 'key', key)
+
+    def _fire(self, screen_id: str, on: str, trigger: str):
+        for rule in self.rules:
+            if rule.on != on or rule.trigger.lower() != trigger.lower():
+                continue
+            if on == 'click' and rule.trigger not in self.visible[screen_id]:
+                continue
+            log.debug(f"[Sim] {screen_id}: {on} {trigger} → hide {list(rule.hide)} show {list(rule.show)}")
+            for key in rule.hide:
+                self.hide(screen_id, key)
+            if rule.show:
+                if rule.delay > 0:
+                    self._schedule(rule.delay, screen_id, rule.show)
+                else:
+                    for key in rule.show:
+                        self.show(screen_id, key)
+
+    # --- 모니터 상태 관찰 ---
+    def on_state_change(self, new_record, old_record):
+        """SharedStateStore.subscribe 콜백. 열린 이상 요소 이후 첫 비정상 상태 전이를 감지 시점으로 기록"""
+        state_name = getattr(new_record.state, 'name', str(new_record.state))
+        if state_name in IDLE_STATES:
+            return
+        with self._lock:
+            for (screen_id, _), incident in self._open_incidents.items():
+                if screen_id == new_record.screen_id and incident.detected_sim is None:
+                    incident.detected_state = state_name
+                    incident.detected_sim = self.now()
+                    incident.detected_wall = time.perf_counter()
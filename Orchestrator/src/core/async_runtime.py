@@ -0,0 +1,249 @@
+# Orchestrator/src/core/async_runtime.py
+# asyncio 단일 이벤트 루프 런타임 (선택, RUNTIME_CONFIG['mode'] = 'asyncio')
+#
+# 스레드 모델: VD마다 SRM 스레드 + SM 스레드 + IOScheduler 워커 + FocusMonitor + 메인 루프가 각자 sleep 폴링
+# asyncio 모델: 이벤트 루프 스레드 하나에서 화면마다 코루틴 하나가 tick_screen → 대기를 반복
+#   - 틱(캡처 + 템플릿 매칭 + 정책 한 단계)은 작은 스레드 풀(executor)로 넘겨 루프를 막지 않음
+#     (cv2 매칭은 GIL을 놓으므로 executor_workers 만큼 병렬)
+#   - 같은 화면의 틱은 항상 순서대로 하나씩 (화면 상태를 동시에 만지지 않음)
+#   - IO는 asyncio 우선순위 큐 → 전용 IO 스레드 하나에서 순서대로 실행 (IOScheduler와 같은 lock/관찰자)
+#
+# 화면별 틱을 지원하는 모니터 (screen_keys / tick_screen / tick_interval):
+#   NightCrows SM, Raven2 SM, Raven2 SRM (제너레이터 정책)
+#   next_tick_interval(key)가 있으면 화면마다 상태별 폴링 간격으로 대기 (tick_scheduler, 통계는 monitor.ticks)
+#   apply_warm_start()가 있으면 코루틴 시작 전에 한 번 호출 (checkpoint)
+# 그 외 모니터(NightCrows SRM - v1 단계 실행기)는 기존처럼 run_loop 전용 스레드로 실행됩니다.
+#
+# 비교: python -m Orchestrator.sim --game raven2 --scenario deaths --runtime both
+
+import asyncio
+import concurrent.futures
+import itertools
+import threading
+from typing import Dict, Optional
+
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.io_scheduler import IOScheduler, Priority
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+ERROR_BACKOFF = 5.0  # 틱 예외 후 대기 (기존 run_loop와 동일)
+
+
+def supports_screen_ticks(monitor) -> bool:
+    return all(hasattr(monitor, name) for name in ('screen_keys', 'tick_screen', 'tick_interval'))
+
+
+# =============================================================================
+# IO: asyncio 우선순위 큐
+# =============================================================================
+class AsyncIOScheduler(IOScheduler):
+    """
+    IOScheduler와 같은 인터페이스(request / start / lock / add_observer).
+    요청은 어느 스레드에서든 가능하고, 이벤트 루프의 우선순위 큐에 들어가 IO 스레드 하나에서 순서대로 실행됩니다.
+    """
+
+    def __init__(self, runtime: 'AsyncMonitorRuntime'):
+        super().__init__()
+        self.runtime = runtime
+        self._async_queue: Optional[asyncio.PriorityQueue] = None
+        self._seq = itertools.count()  # 같은 우선순위·시각이면 요청 순서
+        self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="AsyncIO-IO")
+        self._consumer: Optional[concurrent.futures.Future] = None
+
+    def request(self, component: str, screen_id: str, action: callable, priority: Priority = Priority.NORMAL):
+        item = (priority.value, clock.time(), component, screen_id, action)
+        self.runtime.loop.call_soon_threadsafe(self._put, item)
+
+    def _put(self, item):
+        if self._async_queue is None:
+            self._async_queue = asyncio.PriorityQueue()
+        self._async_queue.put_nowait((item[0], item[1], next(self._seq), item))
+
+    def start(self, stop_event):
+        self.stop_event = stop_event
+        self.runtime.start()
+        self._consumer = self.runtime.submit(self._consume())
+
+    def restart_worker(self):
+        """워치독 재시작: 멈춘 IO 스레드는 버리고 새 lock / IO 스레드 / 소비자 코루틴으로 교체"""
+        self.lock = threading.Lock()
+        stuck, self._io_executor = self._io_executor, concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="AsyncIO-IO")
+        stuck.shutdown(wait=False)
+        if self._consumer is not None:
+            self._consumer.cancel()
+        self._consumer = self.runtime.submit(self._consume())
+
+    async def _consume(self):
+        if self._async_queue is None:
+            self._async_queue = asyncio.PriorityQueue()
+        loop = asyncio.get_running_loop()
+        while not self.stop_event.is_set():
+            try:
+                _, _, _, item = await asyncio.wait_for(self._async_queue.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                continue
+            try:
+                await loop.run_in_executor(self._io_executor, self._execute, item)
+            except Exception as e:
+                log.error(f"!!! CRITICAL: [IO] Async consumer error: {e}")
+            finally:
+                self._async_queue.task_done()
+
+    def shutdown(self):
+        self._io_executor.shutdown(wait=False)
+
+
+# =============================================================================
+# 모니터 작업 핸들 (오케스트레이터의 active_monitors에서 스레드처럼 사용)
+# =============================================================================
+class MonitorTaskHandle:
+    """모니터 하나의 화면별 코루틴 묶음. is_alive() / join(timeout) 은 threading.Thread와 같은 의미"""
+
+    def __init__(self, runtime: 'AsyncMonitorRuntime', monitor_key: str, monitor, stop_event: threading.Event):
+        self.runtime = runtime
+        self.name = monitor_key
+        self.monitor = monitor
+        self.stop_event = stop_event
+        self._wake: Optional[asyncio.Event] = None
+        self._future: Optional[concurrent.futures.Future] = None
+
+    def start(self):
+        self._future = self.runtime.submit(self._run())
+
+    def is_alive(self) -> bool:
+        return self._future is not None and not self._future.done()
+
+    def join(self, timeout: Optional[float] = None):
+        """stop_event가 설정된 뒤 호출: 대기 중인 코루틴을 깨우고 진행 중인 틱이 끝날 때까지 대기"""
+        if self._future is None:
+            return
+        if self._wake is not None:
+            self.runtime.loop.call_soon_threadsafe(self._wake.set)
+        try:
+            self._future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            pass
+        except Exception as e:
+            log.error(f"[AsyncRuntime] {self.name} ended with error: {e}")
+
+    async def _run(self):
+        self._wake = asyncio.Event()
+        keys = list(self.monitor.screen_keys())
+        loop = asyncio.get_running_loop()
+        warm_start = getattr(self.monitor, 'apply_warm_start', None)
+        if warm_start is not None:
+            await loop.run_in_executor(self.runtime.executor, warm_start)  # 체크포인트 복원 (화면 확인 포함)
+        ticks = getattr(self.monitor, 'ticks', None)
+        if ticks is not None:
+            ticks.reset(keys, clock.time())  # 통계용 화면 등록 (대기는 코루틴이 직접)
+        log.info(f"[AsyncRuntime] {self.name}: {len(keys)} screen coroutines started")
+        await asyncio.gather(*(self._screen_loop(key) for key in keys))
+        log.info(f"[AsyncRuntime] {self.name}: stopped")
+
+    async def _screen_loop(self, key):
+        loop = asyncio.get_running_loop()
+        monitor = self.monitor
+        next_interval = getattr(monitor, 'next_tick_interval', None)
+        while not self.stop_event.is_set():
+            delay = monitor.tick_interval
+            started = clock.time()
+            try:
+                await loop.run_in_executor(self.runtime.executor, monitor.tick_screen, key)
+                if next_interval is not None:
+                    interval, label, declared = next_interval(key)
+                    monitor.ticks.record(key, started, interval, label, declared)
+                    delay = max(0.0, started + interval - clock.time())  # 틱 시작 기준 데드라인까지
+            except Exception as e:
+                log.error(f"[{self.name}] Screen {key} tick exception: {e}")
+                handler = getattr(monitor, 'handle_tick_error', None)
+                if handler is not None:
+                    await loop.run_in_executor(self.runtime.executor, handler, e)
+                delay = ERROR_BACKOFF
+            await self._sleep(delay)
+
+    async def _sleep(self, seconds: float):
+        """시계 기준 seconds 대기. 중지 요청 시 즉시 깨어남"""
+        if self.stop_event.is_set():
+            return
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=clock.to_wall(seconds))
+        except asyncio.TimeoutError:
+            pass
+
+
+# =============================================================================
+# 런타임
+# =============================================================================
+class AsyncMonitorRuntime:
+    """이벤트 루프 스레드 하나 + 틱용 executor + IO 스레드 하나"""
+
+    def __init__(self, executor_workers: int = 2):
+        self.loop = asyncio.new_event_loop()
+        self.executor_workers = max(1, executor_workers)
+        self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.executor_workers,
+                                                              thread_name_prefix="AsyncTick")
+        self.io_scheduler = AsyncIOScheduler(self)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'AsyncMonitorRuntime':
+        return cls(executor_workers=config.get('executor_workers', 2))
+
+    def start(self):
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run_loop, name="AsyncRuntime-Loop", daemon=True)
+            self._thread.start()
+            log.info(f"[AsyncRuntime] Event loop started (tick workers={self.executor_workers})")
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coroutine) -> concurrent.futures.Future:
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def start_monitor(self, monitor_key: str, monitor, stop_event: threading.Event):
+        """
+        화면별 코루틴으로 모니터 시작. 화면별 틱을 지원하지 않는 모니터는 run_loop 전용 스레드로 실행.
+        반환값은 is_alive()/join()을 가진 핸들 (threading.Thread 또는 MonitorTaskHandle)
+        """
+        if not supports_screen_ticks(monitor):
+            log.info(f"[AsyncRuntime] {monitor_key}: no per-screen ticks, running run_loop in a thread")
+            thread = threading.Thread(target=monitor.run_loop, args=(stop_event,), name=f"Monitor-{monitor_key}",
+                                      daemon=True)
+            thread.start()
+            return thread
+        self.start()
+        handle = MonitorTaskHandle(self, monitor_key, monitor, stop_event)
+        handle.start()
+        return handle
+
+    async def _cancel_tasks(self):
+        """남은 코루틴(IO 소비자 등) 취소"""
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stop(self):
+        """이벤트 루프 / executor 종료 (모니터 핸들은 먼저 join 할 것)"""
+        if self._thread is None:
+            return
+        try:
+            self.submit(self._cancel_tasks()).result(timeout=5.0)
+        except Exception as e:
+            log.warning(f"[AsyncRuntime] Task cancel error: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5.0)
+        self._thread = None
+        if not self.loop.is_running():
+            self.loop.close()
+        self.executor.shutdown(wait=False)
+        self.io_scheduler.shutdown()
+        log.info("[AsyncRuntime] Event loop stopped")
@@ -0,0 +1,229 @@
+# Orchestrator/src/core/checkpoint.py
+# 체크포인트 / 웜 리스타트 - 공유 상태와 모니터 진행 상황을 주기적으로 디스크에 저장하고 재시작 시 복원
+#
+# 저장 내용 (JSON, 원자적 교체):
+#   - VD별 공유 상태: 화면 → "ScreenState.DEAD" / "SystemState.LOGGING_IN" + 상태 진입 시각
+#   - 모니터별 진행 상황: checkpoint_state()가 돌려주는 dict
+#       (NightCrows SRM: location_flag / current_wp / death_count / 화면별 policy_step 등,
+#        제너레이터 모니터: 정책 상태는 공유 상태로 충분 - 재시작 시 선행 대기에 이미 흐른 시간을 credit으로 반영)
+#
+# 복원 흐름:
+#   1. 시작 시 load() - max_age보다 오래된 체크포인트는 무시 (콜드 스타트)
+#   2. 모니터 생성 직후 restore(monitor_id, monitor, vd) → monitor.restore_checkpoint(data, states, saved_at)
+#      (모니터는 보관만 하고)
+#   3. 모니터 시작 시 monitor.apply_warm_start() - 화면을 한 번 확인(시각적 일관성 검사)한 뒤 적용,
+#      맞지 않는 화면은 초기 상태로 시작
+#   4. watch_steady_state() + poll_steady_state() - 시작부터 모든 화면을 한 번 이상 확인했고
+#      모두 정상 상태(NORMAL/SLEEP/AWAKE)가 될 때까지의 시간 측정
+#
+# 모니터 인터페이스 (선택): checkpoint_state() / restore_checkpoint(data, states, saved_at) / apply_warm_start()
+
+import json
+import os
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple, Type
+
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.shared_state_store import SharedStateStore
+from Orchestrator.src.core.transition_journal import BASELINE_STATES
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_CHECKPOINT_PATH = Path(__file__).resolve().parents[2] / "logs" / "checkpoint.json"
+FORMAT_VERSION = 1
+
+
+def encode_state(state: Any) -> Optional[str]:
+    """Enum 상태 → "클래스명.이름" (Enum이 아니면 None)"""
+    if not isinstance(state, Enum):
+        return None
+    return f"{type(state).__name__}.{state.name}"
+
+
+def decode_state(value: Optional[str], enum_cls: Type[Enum]) -> Optional[Enum]:
+    """"클래스명.이름" → enum_cls 멤버 (다른 Enum 종류이거나 없는 이름이면 None)"""
+    if not value or '.' not in value:
+        return None
+    cls_name, name = value.split('.', 1)
+    if cls_name != enum_cls.__name__:
+        return None
+    return enum_cls.__members__.get(name)
+
+
+def restored_states(states: Dict[str, Tuple[str, float]], enum_cls: Type[Enum]) -> Dict[str, Tuple[Enum, float]]:
+    """체크포인트 공유 상태 중 enum_cls 종류만 (화면 → (상태, 진입 시각))"""
+    result = {}
+    for screen_id, (value, since) in states.items():
+        state = decode_state(value, enum_cls)
+        if state is not None:
+            result[screen_id] = (state, since)
+    return result
+
+
+class CheckpointManager:
+    """체크포인트 저장(백그라운드 주기) / 로드 / 모니터 복원 / 정상 상태 도달 시간 측정"""
+
+    def __init__(self, path: Optional[Path] = None, interval: float = 10.0, max_age: float = 600.0):
+        self.path = Path(path) if path else DEFAULT_CHECKPOINT_PATH
+        self.interval = interval
+        self.max_age = max_age
+        self._stores: Dict[str, SharedStateStore] = {}
+        self._monitors: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._loaded: Optional[Dict] = None
+        self._last_written: Optional[str] = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.restored_vds = set()  # 웜 리스타트 데이터를 받은 VD
+        self.steady_state: Dict[str, Dict[str, Any]] = {}  # VD → {'mode', 'seconds'}
+        self._watches: Dict[str, Tuple[float, SharedStateStore, list]] = {}  # VD → (시작, 저장소, 모니터들)
+
+    @classmethod
+    def from_config(cls) -> Optional['CheckpointManager']:
+        try:
+            from Orchestrator.src.utils.config import CHECKPOINT_CONFIG
+        except ImportError:
+            CHECKPOINT_CONFIG = {}
+        if not CHECKPOINT_CONFIG.get('enabled', True):
+            return None
+        return cls(path=CHECKPOINT_CONFIG.get('path'), interval=CHECKPOINT_CONFIG.get('interval', 10.0),
+                   max_age=CHECKPOINT_CONFIG.get('max_age', 600.0))
+
+    # =========================================================================
+    # 등록 / 저장
+    # =========================================================================
+    def attach_store(self, vd: str, store: SharedStateStore):
+        self._stores[vd] = store
+
+    def register_monitor(self, monitor_id: str, monitor):
+        if hasattr(monitor, 'checkpoint_state'):
+            with self._lock:
+                self._monitors[monitor_id] = monitor
+
+    def snapshot(self) -> Dict:
+        stores = {}
+        for vd, store in self._stores.items():
+            states = {}
+            for screen_id in store.keys():
+                record = store.get_record(screen_id)
+                encoded = encode_state(record.state) if record else None
+                if encoded:
+                    states[screen_id] = [encoded, record.timestamp]
+            if states:
+                stores[vd] = states
+        with self._lock:
+            monitors = dict(self._monitors)
+        monitor_data = {}
+        for monitor_id, monitor in monitors.items():
+            try:
+                monitor_data[monitor_id] = monitor.checkpoint_state()
+            except Exception as e:
+                log.warning(f"[Checkpoint] {monitor_id} checkpoint_state failed: {e}")
+        return {'version': FORMAT_VERSION, 'saved_at': clock.time(), 'stores': stores, 'monitors': monitor_data}
+
+    def save(self) -> bool:
+        """현재 상태를 파일로 저장 (내용이 같으면 건너뜀). 임시 파일에 쓰고 교체하므로 중간에 죽어도 이전 파일 유지"""
+        data = self.snapshot()
+        body = json.dumps({k: v for k, v in data.items() if k != 'saved_at'}, sort_keys=True, ensure_ascii=False)
+        if body == self._last_written:
+            return False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+            os.replace(tmp, self.path)
+        except OSError as e:
+            log.warning(f"[Checkpoint] Save failed ({self.path}): {e}")
+            return False
+        self._last_written = body
+        return True
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="Checkpoint", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not clock.wait(self._stop, self.interval):
+            self.save()
+
+    def stop(self):
+        """주기 저장 중지 + 마지막 저장"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        self.save()
+
+    # =========================================================================
+    # 로드 / 복원
+    # =========================================================================
+    def load(self) -> Optional[Dict]:
+        """체크포인트 파일 로드. 없거나 깨졌거나 max_age보다 오래됐으면 None (콜드 스타트)"""
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            log.warning(f"[Checkpoint] Ignoring unreadable checkpoint {self.path}: {e}")
+            return None
+        if data.get('version') != FORMAT_VERSION:
+            log.info(f"[Checkpoint] Ignoring checkpoint with format {data.get('version')}")
+            return None
+        age = clock.time() - data.get('saved_at', 0.0)
+        if age > self.max_age:
+            log.info(f"[Checkpoint] Checkpoint is {age:.0f}s old (> {self.max_age:.0f}s). Cold start.")
+            return None
+        self._loaded = data
+        log.info(f"[Checkpoint] Loaded checkpoint ({age:.0f}s old): "
+                 f"{', '.join(sorted(data.get('stores', {}))) or 'no screens'}")
+        return data
+
+    def restore(self, monitor_id: str, monitor, vd: str) -> bool:
+        """로드한 체크포인트를 모니터에 전달 (적용은 모니터 시작 시 apply_warm_start). 전달했으면 True"""
+        self.register_monitor(monitor_id, monitor)
+        if self._loaded is None or not hasattr(monitor, 'restore_checkpoint'):
+            return False
+        states = {screen_id: tuple(entry) for screen_id, entry in self._loaded.get('stores', {}).get(vd, {}).items()}
+        data = self._loaded.get('monitors', {}).get(monitor_id, {})
+        if not states and not data:
+            return False
+        monitor.restore_checkpoint(data, states, self._loaded['saved_at'])
+        self.restored_vds.add(vd)
+        return True
+
+    # =========================================================================
+    # 정상 상태 도달 시간
+    # =========================================================================
+    def watch_steady_state(self, vd: str, store: SharedStateStore, monitors: Iterable[Any]):
+        """
+        VD의 첫 모니터 시작 시 호출: 지금부터 모니터들이 모든 화면을 한 번 이상 확인했고
+        모든 화면이 정상 상태(BASELINE_STATES)가 될 때까지의 시간을 한 번 측정 (poll_steady_state에서 판정)
+        """
+        if vd in self.steady_state:
+            return
+        mode = 'warm' if vd in self.restored_vds else 'cold'
+        self.steady_state[vd] = {'mode': mode, 'seconds': None}
+        self._watches[vd] = (clock.time(), store, [m for m in monitors if m is not None and hasattr(m, 'ticks')])
+
+    @property
+    def watching(self) -> bool:
+        """정상 상태 도달을 측정 중인 VD가 있는지 (있으면 메인 루프가 주기적으로 poll_steady_state)"""
+        return bool(self._watches)
+
+    def poll_steady_state(self):
+        """측정 중인 VD의 정상 상태 도달 여부 확인 (오케스트레이터 메인 루프에서 주기적으로 호출)"""
+        for vd, (started, store, monitors) in list(self._watches.items()):
+            if not all(m.ticks.ticked_all_since(started) for m in monitors):
+                continue
+            if not all(getattr(state, 'name', None) in BASELINE_STATES for state in store.values()):
+                continue
+            entry = self.steady_state[vd]
+            entry['seconds'] = clock.time() - started
+            del self._watches[vd]
+            log.info(f"[Checkpoint] {vd} reached steady state in {entry['seconds']:.1f}s ({entry['mode']} start)")
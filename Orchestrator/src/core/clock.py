@@ -0,0 +1,124 @@
+# Orchestrator/src/core/clock.py
+# 시계 추상화 - Orchestrator / IOScheduler / 모니터 / 예약 작업의 "대기·타임스탬프" 단일 통로
+#
+# - SystemClock: 실제 시간 (기본값, 기존 time.time / time.sleep / Event.wait 와 동일)
+# - ScaledClock: speed 배속 가상 시간 (시뮬레이터 / 용량·커버리지 분석용, 예: 하루 = 86400/speed 초)
+#
+# 사용 예:
+#   from Orchestrator.src.core.clock import clock
+#   started = clock.time()
+#   clock.sleep(0.5)
+#   if clock.wait(stop_event, 1.0): ...
+#
+# 주의: 비용 측정(time.perf_counter)은 실제 CPU/벽시계 비용을 재는 것이므로 시계 대상이 아닙니다.
+
+import datetime
+import threading
+import time
+from typing import Optional, Union
+
+# =============================================================================
+# 인터페이스 / 실제 시간
+# =============================================================================
+class SystemClock:
+    """실제 시간"""
+
+    name = "system"
+    speed = 1.0
+
+    def time(self) -> float:
+        return time.time()
+
+    def monotonic(self) -> float:
+        return time.monotonic()
+
+    def now(self, tz: Optional[datetime.tzinfo] = None) -> datetime.datetime:
+        return datetime.datetime.fromtimestamp(self.time(), tz)
+
+    def sleep(self, seconds: float):
+        time.sleep(seconds)
+
+    def wait(self, event: threading.Event, timeout: Optional[float] = None) -> bool:
+        """event.wait(timeout) - timeout은 이 시계 기준 초"""
+        return event.wait(timeout)
+
+    def to_wall(self, seconds: float) -> float:
+        """이 시계 기준 시간 → 실제 대기 시간"""
+        return seconds / self.speed
+
+
+# =============================================================================
+# 가상 시간
+# =============================================================================
+class ScaledClock(SystemClock):
+    """
+    speed 배속 가상 시간. time()은 start부터 (경과 실제 시간 × speed)만큼 흐르고, sleep/wait는 1/speed로 줄어듭니다.
+    advance()로 한가한 구간을 건너뛸 수 있습니다 (예: 다음 예약 작업 직전까지).
+    실제 연산(템플릿 매칭 등)에 걸린 시간도 speed 배로 늘어나 보이므로, speed가 클수록 연산 비용이 과대평가됩니다.
+    """
+
+    name = "scaled"
+
+    def __init__(self, speed: float = 1.0, start: Union[None, float, datetime.datetime] = None):
+        if speed <= 0:
+            raise ValueError(f"speed must be positive: {speed}")
+        self.speed = float(speed)
+        if isinstance(start, datetime.datetime):
+            start = start.timestamp()
+        self._origin = time.time() if start is None else float(start)
+        self._wall_origin = time.monotonic()
+        self._offset = 0.0  # advance() 누적
+        self._lock = threading.Lock()
+
+    def elapsed(self) -> float:
+        """시작 이후 흐른 가상 시간 (초)"""
+        with self._lock:
+            return (time.monotonic() - self._wall_origin) * self.speed + self._offset
+
+    def time(self) -> float:
+        return self._origin + self.elapsed()
+
+    def monotonic(self) -> float:
+        return self.elapsed()
+
+    def sleep(self, seconds: float):
+        if seconds > 0:
+            time.sleep(seconds / self.speed)
+
+    def wait(self, event: threading.Event, timeout: Optional[float] = None) -> bool:
+        return event.wait(None if timeout is None else max(0.0, timeout) / self.speed)
+
+    def advance(self, seconds: float):
+        """가상 시간을 즉시 앞으로 이동"""
+        if seconds > 0:
+            with self._lock:
+                self._offset += seconds
+
+
+# =============================================================================
+# 현재 시계 선택
+# =============================================================================
+_clock: SystemClock = SystemClock()
+_clock_lock = threading.Lock()
+
+
+def get_clock() -> SystemClock:
+    return _clock
+
+
+def set_clock(new_clock: SystemClock) -> SystemClock:
+    """시계 교체 (시뮬레이터/분석용). 이전 시계를 반환"""
+    global _clock
+    with _clock_lock:
+        previous, _clock = _clock, new_clock
+    return previous
+
+
+class _ClockProxy:
+    """호출 시점의 시계로 위임 (모듈 import 후 set_clock으로 교체해도 반영됨)"""
+
+    def __getattr__(self, name: str):
+        return getattr(_clock, name)
+
+
+clock = _ClockProxy()
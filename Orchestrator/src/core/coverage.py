@@ -0,0 +1,259 @@
+# Orchestrator/src/core/coverage.py
+# 화면별 모니터링 커버리지 / 사각 구간(blind window) 측정 - VD 시간 분할 설정을 데이터로 조정하기 위한 지표
+#
+# - 커버리지: 화면마다 "최근 horizon초 안에 모니터 틱이 있었던" 시간의 비율
+#       틱 하나가 [틱 시각, 틱 시각 + horizon] 을 덮는다고 보고 그 합집합 / 측정 시간
+# - 사각 구간: 덮이지 않은 구간의 길이 분포 (다른 VD의 시간 분할 + 전환 대기, _execute_task 중 등)
+#       개수 / p50 / p90 / 최대 / 버킷별 히스토그램 + 현재 열려 있는 사각 구간
+# - 도착 시 이상(DEAD on arrival): 사각 구간 직후(닫는 틱 중 또는 arrival_window초 이내)에
+#   정상 상태(NORMAL/SLEEP/AWAKE)가 아닌 상태로 바뀐 화면 - 보지 못하는 동안 생긴 사건
+#
+# 입력:
+#   - 틱: 모니터의 TickScheduler.on_tick (스레드 / asyncio 런타임 모두) → tick(vd, 화면, 틱 시작 시각)
+#   - 상태 변경: SharedStateStore.subscribe
+# 조회: logs/profiler.cmd 에 'coverage report' / 'coverage reset' / 'coverage export'
+#       (export: logs/coverage.json, 오케스트레이터 종료 시에도 기록)
+#       가상 시간 하루: python -m Orchestrator.sim.day --monitors --slice-min 5 --out day.json (screen_coverage)
+
+import functools
+import json
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Optional, Sequence
+
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.shared_state_store import SharedStateStore
+from Orchestrator.src.core.transition_journal import BASELINE_STATES
+from Orchestrator.src.utils.log import get_logger
+from Orchestrator.src.utils.profiler import register_command
+
+log = get_logger(__name__)
+
+DEFAULT_EXPORT_PATH = Path(__file__).resolve().parents[2] / "logs" / "coverage.json"
+DEFAULT_BUCKETS = (5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1800.0)
+
+
+class _ScreenCoverage:
+    """화면 하나의 덮인 구간 / 사각 구간 / 도착 시 이상 기록"""
+
+    __slots__ = ('covered', 'segment_start', 'covered_until', 'ticks', 'blind', 'arrival_until',
+                 'arrival_counted_at', 'arrivals', 'arrival_blind')
+
+    def __init__(self, started: float, history: int):
+        self.covered = 0.0  # 닫힌 덮인 구간 합 (초)
+        self.segment_start = started  # 현재 덮인 구간 시작
+        self.covered_until = started  # 현재 덮인 구간 끝 (마지막 틱 + horizon)
+        self.ticks = 0
+        self.blind: Deque[float] = deque(maxlen=history)  # 닫힌 사각 구간 길이 (초)
+        self.arrival_until = 0.0  # 사각 구간을 닫은 틱 후 이 시각까지의 이상 상태는 도착 시 이상
+        self.arrival_counted_at: Optional[float] = None  # 이미 집계한 사각 구간의 시작 (구간당 한 번만)
+        self.arrivals: Dict[str, int] = {}  # 상태 → 도착 시 이상 수
+        self.arrival_blind: Deque[float] = deque(maxlen=history)  # 도착 시 이상 직전 사각 구간 길이
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class CoverageTracker:
+    """VD → 화면 → 커버리지 (스레드 안전, 모니터 틱 경로에서는 잠금 + 몇 번의 비교만)"""
+
+    def __init__(self, horizon: float = 5.0, arrival_window: Optional[float] = None,
+                 buckets: Iterable[float] = DEFAULT_BUCKETS, history: int = 2000,
+                 ignored_states: Iterable[str] = ('INITIALIZING',)):
+        self.horizon = horizon
+        self.arrival_window = arrival_window
+        self.ignored_states = frozenset(ignored_states)
+        self.buckets = tuple(buckets)
+        self.history = history
+        self.export_path = DEFAULT_EXPORT_PATH
+        self._lock = threading.Lock()
+        self._started: Optional[float] = None
+        self._screens: Dict[str, Dict[str, _ScreenCoverage]] = {}
+
+    def configure(self, config: Dict):
+        for key in ('horizon', 'arrival_window', 'history'):
+            if key in config:
+                setattr(self, key, config[key])
+        if 'buckets' in config:
+            self.buckets = tuple(config['buckets'])
+        if 'ignored_states' in config:
+            self.ignored_states = frozenset(config['ignored_states'])
+        if config.get('export_path'):
+            self.export_path = Path(config['export_path'])
+
+    # =========================================================================
+    # 등록
+    # =========================================================================
+    def start(self, now: Optional[float] = None):
+        """측정 시작 (이전 기록 삭제). 시작 후 첫 틱까지도 사각 구간으로 집계"""
+        with self._lock:
+            self._started = clock.time() if now is None else now
+            self._screens.clear()
+
+    def attach_store(self, vd: str, store: SharedStateStore):
+        """상태 변경 구독 (도착 시 이상 판정)"""
+        store.subscribe(functools.partial(self._on_state_change, vd))
+
+    def attach(self, vd: str, monitors: Iterable, screen_ids: Iterable[str] = ()):
+        """모니터들의 틱을 vd 화면의 틱으로 기록 (재호출해도 같은 결과). screen_ids는 아직 틱이 없어도 집계할 화면"""
+        for monitor in monitors:
+            ticks = getattr(monitor, 'ticks', None)
+            if ticks is not None:
+                ticks.on_tick = functools.partial(self.tick, vd)
+        with self._lock:
+            if self._started is not None:
+                for screen_id in screen_ids:
+                    self._screen(vd, screen_id)
+
+    def _screen(self, vd: str, screen_id: str) -> _ScreenCoverage:
+        screens = self._screens.setdefault(vd, {})
+        entry = screens.get(screen_id)
+        if entry is None:
+            entry = screens[screen_id] = _ScreenCoverage(self._started, self.history)
+        return entry
+
+    # =========================================================================
+    # 기록 (Hot path)
+    # =========================================================================
+    def tick(self, vd: str, screen_id: str, now: float):
+        """모니터가 화면 하나를 확인함 (now: 틱 시작 시각)"""
+        with self._lock:
+            if self._started is None:
+                return
+            entry = self._screen(vd, screen_id)
+            entry.ticks += 1
+            if now > entry.covered_until:
+                entry.covered += entry.covered_until - entry.segment_start
+                entry.blind.append(now - entry.covered_until)
+                entry.segment_start = now
+                if entry.arrival_counted_at == entry.covered_until:
+                    entry.arrival_until = 0.0  # 이 틱 도중에 이미 집계
+                else:
+                    entry.arrival_until = now + (self.horizon if self.arrival_window is None
+                                                 else self.arrival_window)
+            entry.covered_until = max(entry.covered_until, now + self.horizon)
+
+    def _on_state_change(self, vd: str, new_record, old_record):
+        state = getattr(new_record.state, 'name', str(new_record.state))
+        if old_record is None or state in BASELINE_STATES or state in self.ignored_states:
+            return  # 최초 등록 / 모니터 자체의 (재)시작 상태는 감지한 사건이 아님
+        with self._lock:
+            if self._started is None:
+                return
+            entry = self._screen(vd, new_record.screen_id)
+            ts = new_record.timestamp
+            if ts > entry.covered_until:
+                # 사각 구간을 닫는 틱 도중 (틱 기록은 틱이 끝난 뒤)
+                if entry.arrival_counted_at == entry.covered_until:
+                    return
+                blind = ts - entry.covered_until
+                entry.arrival_counted_at = entry.covered_until
+            elif ts <= entry.arrival_until and entry.blind:
+                blind = entry.blind[-1]
+                entry.arrival_until = 0.0
+            else:
+                return
+            entry.arrivals[state] = entry.arrivals.get(state, 0) + 1
+            entry.arrival_blind.append(blind)
+
+    # =========================================================================
+    # 조회 / 내보내기
+    # =========================================================================
+    def _summarize(self, entry: _ScreenCoverage, now: float) -> Dict:
+        elapsed = max(0.0, now - self._started)
+        covered = entry.covered + max(0.0, min(now, entry.covered_until) - entry.segment_start)
+        blind = list(entry.blind)
+        histogram = {}
+        for length in blind:
+            bucket = next((f"<={b:g}s" for b in self.buckets if length <= b), f">{self.buckets[-1]:g}s")
+            histogram[bucket] = histogram.get(bucket, 0) + 1
+        return {
+            'coverage': round(min(1.0, covered / elapsed), 4) if elapsed else 0.0,
+            'ticks': entry.ticks,
+            'blind_windows': len(blind),
+            'blind_p50_s': round(_percentile(blind, 0.5), 1),
+            'blind_p90_s': round(_percentile(blind, 0.9), 1),
+            'blind_max_s': round(max(blind), 1) if blind else 0.0,
+            'blind_total_s': round(sum(blind), 1),
+            'blind_open_s': round(max(0.0, now - entry.covered_until), 1),
+            'blind_histogram': histogram,
+            'arrivals': dict(entry.arrivals),
+            'arrival_blind_p50_s': round(_percentile(list(entry.arrival_blind), 0.5), 1),
+        }
+
+    def snapshot(self, now: Optional[float] = None) -> Dict:
+        """{'horizon_s', 'elapsed_s', 'vds': VD → {'screens': 화면 → 지표, 평균 / 합계}}"""
+        now = clock.time() if now is None else now
+        with self._lock:
+            if self._started is None:
+                return {}
+            vds = {vd: {screen_id: self._summarize(entry, now) for screen_id, entry in sorted(screens.items())}
+                   for vd, screens in sorted(self._screens.items())}
+            elapsed = now - self._started
+        result = {'horizon_s': self.horizon, 'elapsed_s': round(elapsed, 1), 'vds': {}}
+        for vd, screens in vds.items():
+            entries = list(screens.values())
+            arrivals: Dict[str, int] = {}
+            for entry in entries:
+                for state, count in entry['arrivals'].items():
+                    arrivals[state] = arrivals.get(state, 0) + count
+            result['vds'][vd] = {
+                'coverage_mean': round(sum(e['coverage'] for e in entries) / len(entries), 4) if entries else 0.0,
+                'coverage_min': min((e['coverage'] for e in entries), default=0.0),
+                'blind_max_s': max((e['blind_max_s'] for e in entries), default=0.0),
+                'arrivals': arrivals,
+                'screens': screens,
+            }
+        return result
+
+    def reset_stats(self):
+        self.start()
+
+    def print_report(self):
+        data = self.snapshot()
+        if not data:
+            log.info("[Coverage] Not started")
+            return
+        log.info(f"[Coverage] {data['elapsed_s']:.0f}s measured, horizon {data['horizon_s']:g}s")
+        for vd, summary in data['vds'].items():
+            for screen_id, entry in summary['screens'].items():
+                arrivals = ', '.join(f"{s}={n}" for s, n in sorted(entry['arrivals'].items())) or '-'
+                log.info(f"[Coverage] {vd} {screen_id:<4} coverage={entry['coverage'] * 100:5.1f}% "
+                         f"blind n={entry['blind_windows']:<4} p50={entry['blind_p50_s']:>6.1f}s "
+                         f"p90={entry['blind_p90_s']:>6.1f}s max={entry['blind_max_s']:>7.1f}s "
+                         f"open={entry['blind_open_s']:>6.1f}s on_arrival: {arrivals}")
+
+    def export(self, path: Optional[Path] = None) -> Optional[Path]:
+        """snapshot()을 JSON으로 저장 (시간 분할 설정 비교용)"""
+        data = self.snapshot()
+        if not data:
+            return None
+        path = Path(path) if path else self.export_path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+        except OSError as e:
+            log.warning(f"[Coverage] Export failed ({path}): {e}")
+            return None
+        log.info(f"[Coverage] Exported to {path}")
+        return path
+
+
+def _load_config() -> Dict:
+    try:
+        from Orchestrator.src.utils.config import COVERAGE_CONFIG
+        return COVERAGE_CONFIG
+    except ImportError:
+        return {}
+
+
+COVERAGE = CoverageTracker()
+COVERAGE.configure(_load_config())
+register_command('coverage report', COVERAGE.print_report)
+register_command('coverage reset', COVERAGE.reset_stats)
+register_command('coverage export', lambda: COVERAGE.export())
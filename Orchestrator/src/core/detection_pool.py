@@ -0,0 +1,415 @@
+# Orchestrator/src/core/detection_pool.py
+# 다중 프로세스 템플릿 탐지 - 공유 메모리 프레임 링 버퍼 + 탐지 작업 프로세스 풀
+#
+# 화면 5개 × 템플릿 여러 개의 매칭(cvtColor / matchTemplate / minMaxLoc와 그 사이의 파이썬 코드)이
+# 모니터 스레드에서 정책 코드 / IO와 GIL을 두고 경합하는 것을 줄이기 위한 실험 모드.
+# 측정상 스레드 안 매칭보다 이득이 없어 시뮬레이션 / 벤치에서만 시작 (오케스트레이터는 시작하지 않음 → 모니터는 항상 스레드 안에서 매칭)
+#
+# - 생산자: 모니터 틱이 캡처한 프레임을 FrameRing(multiprocessing.shared_memory)의 슬롯에 한 번 복사
+#       같은 프레임 객체로 다시 요청하면(같은 틱의 여러 검사) 슬롯을 재사용
+# - 작업 프로세스: 링을 붙여(attach) 슬롯을 numpy 뷰로 바로 읽고(복사 없음) 요청받은 템플릿 묶음(battery)을 매칭,
+#       템플릿 → (점수, 화면 기준 중심 좌표)만 돌려줌. 템플릿은 프로세스별로 캐시
+#       화면마다 작업 프로세스를 고정 배정 (화면 키 순서대로 돌아가며) → 템플릿 캐시 재사용
+# - 슬롯 덮어쓰기 감지: 슬롯 헤더의 순번을 매칭 전후로 비교, 바뀌었으면 결과 버림
+# - 결과를 못 받으면(미시작 / 프레임이 슬롯보다 큼 / 덮어씀 / 시간 초과 / 작업 프로세스 종료) None
+#       → 호출한 모니터가 기존처럼 스레드 안에서 매칭 (사전 필터 SIGNATURE_FILTER는 스레드 경로에서만 사용)
+#
+# 사용 예 (모니터 코드):
+#   scores = DETECTION_POOL.match((self.vd_name, screen_id), frame, [('DEAD', dead_path), ('HOSTILE', hostile_path)])
+#   if scores is not None:
+#       dead = scores.get('DEAD', (0.0, None))[0] >= self.confidence
+# 비교: python -m Orchestrator.sim --game raven2 --scenario deaths --detection both
+#       python -m Orchestrator.bench --only detection_pass
+
+import itertools
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeout
+from multiprocessing import shared_memory
+from typing import Deque, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+Battery = Sequence[Tuple[str, str]]  # (템플릿 키, 템플릿 경로)
+Scores = Dict[str, Tuple[float, Tuple[int, int]]]  # 템플릿 키 → (점수, 프레임 기준 중심 좌표)
+
+HEADER_FIELDS = 4  # 슬롯 헤더: 순번, 높이, 너비, 채널
+WRITING = -1  # 쓰는 중인 슬롯의 순번
+
+
+class FrameRing:
+    """
+    공유 메모리 프레임 링 버퍼. name 없이 만들면 생성(생산자), name을 주면 붙기(작업 프로세스).
+    [헤더 slots × 4 (int64)][슬롯 0][슬롯 1]...
+    """
+
+    def __init__(self, slots: int, slot_bytes: int, name: Optional[str] = None):
+        self.slots = slots
+        self.slot_bytes = slot_bytes
+        header_bytes = slots * HEADER_FIELDS * 8
+        self._owner = name is None
+        self._shm = shared_memory.SharedMemory(name=name, create=self._owner, size=header_bytes + slots * slot_bytes)
+        self.header = np.ndarray((slots, HEADER_FIELDS), dtype=np.int64, buffer=self._shm.buf)
+        self._data = np.ndarray((slots, slot_bytes), dtype=np.uint8, buffer=self._shm.buf, offset=header_bytes)
+        if self._owner:
+            self.header.fill(0)
+        self._lock = threading.Lock()
+        self._next_slot = 0
+        self._seq = itertools.count(1)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def write(self, frame: np.ndarray) -> Optional[Tuple[int, int]]:
+        """프레임을 다음 슬롯에 복사 → (슬롯, 순번). 슬롯보다 크면 None (생산자 스레드들이 공유)"""
+        if frame.nbytes > self.slot_bytes:
+            return None
+        height, width = frame.shape[:2]
+        channels = frame.shape[2] if frame.ndim == 3 else 1
+        with self._lock:
+            slot = self._next_slot
+            self._next_slot = (slot + 1) % self.slots
+            seq = next(self._seq)
+            header = self.header[slot]
+            header[0] = WRITING
+            self._data[slot, :frame.nbytes] = np.ascontiguousarray(frame, dtype=np.uint8).reshape(-1)
+            header[1:] = (height, width, channels)
+            header[0] = seq
+        return slot, seq
+
+    def view(self, slot: int, seq: int) -> Optional[np.ndarray]:
+        """슬롯의 프레임 (복사 없는 뷰). 이미 덮어썼으면 None"""
+        seq_now, height, width, channels = (int(v) for v in self.header[slot])
+        if seq_now != seq:
+            return None
+        frame = self._data[slot, :height * width * channels]
+        return frame.reshape((height, width) if channels == 1 else (height, width, channels))
+
+    def valid(self, slot: int, seq: int) -> bool:
+        return int(self.header[slot, 0]) == seq
+
+    def close(self):
+        # numpy 뷰가 buf를 잡고 있으면 close가 실패하므로 먼저 해제
+        self.header = None
+        self._data = None
+        self._shm.close()
+        if self._owner:
+            self._shm.unlink()
+
+
+# =============================================================================
+# 작업 프로세스
+# =============================================================================
+def _to_gray(frame: np.ndarray) -> np.ndarray:
+    if frame.ndim == 2:
+        return frame
+    if frame.shape[2] == 4:
+        return cv2.cvtColor(frame, cv2.COLOR_RGBA2GRAY)
+    return cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)  # inputs.screenshot()은 RGB
+
+
+def _worker_main(index: int, ring_name: str, slots: int, slot_bytes: int, requests, results):
+    """
+    탐지 작업 프로세스: (요청 ID, 슬롯, 순번, 템플릿 묶음) → (요청 ID, 작업 번호, 점수 | None, 매칭 초, CPU 초).
+    준비되면 요청 ID None으로 한 번 보고 (시작 시 CPU 기준값)
+    """
+    ring = FrameRing(slots, slot_bytes, name=ring_name)
+    templates: Dict[str, Optional[np.ndarray]] = {}
+    try:
+        results.put((None, index, None, 0.0, time.process_time()))
+        while True:
+            message = requests.get()
+            if message is None:
+                break
+            request_id, slot, seq, battery = message
+            started = time.perf_counter()
+            scores: Optional[Scores] = None
+            frame = ring.view(slot, seq)
+            if frame is not None:
+                gray = _to_gray(frame)
+                scores = {}
+                for key, path in battery:
+                    if path not in templates:
+                        templates[path] = cv2.imread(path, cv2.IMREAD_GRAYSCALE)
+                    template = templates[path]
+                    if template is None or template.shape[0] > gray.shape[0] or template.shape[1] > gray.shape[1]:
+                        continue
+                    result = cv2.matchTemplate(gray, template, cv2.TM_CCOEFF_NORMED)
+                    _, max_val, _, max_loc = cv2.minMaxLoc(result)
+                    scores[key] = (float(max_val),
+                                   (max_loc[0] + template.shape[1] // 2, max_loc[1] + template.shape[0] // 2))
+                del gray, frame
+                if not ring.valid(slot, seq):
+                    scores = None  # 매칭 도중 생산자가 슬롯을 덮어씀
+            results.put((request_id, index, scores, time.perf_counter() - started, time.process_time()))
+    except (KeyboardInterrupt, EOFError, OSError):
+        pass  # 콘솔 Ctrl+C / 부모 종료
+    finally:
+        ring.close()
+
+
+# =============================================================================
+# 풀 (모니터 프로세스 쪽)
+# =============================================================================
+class DetectionPool:
+    """프레임 링 + 탐지 작업 프로세스들 + 결과 수집 스레드 (match는 여러 모니터 스레드에서 동시에 호출 가능)"""
+
+    FALLBACK_REASONS = ('oversize', 'no_worker', 'timeout', 'stale')
+
+    def __init__(self, workers: int = 2, slots: int = 16, timeout: float = 2.0,
+                 history: int = 2000):
+        self.workers = workers
+        self.slots = slots
+        self.timeout = timeout
+        self.history = history
+        self._lock = threading.Lock()
+        self._ring: Optional[FrameRing] = None
+        self._processes: List = []
+        self._requests: List = []
+        self._results = None
+        self._collector: Optional[threading.Thread] = None
+        self._pending: Dict[int, Future] = {}
+        self._request_ids = itertools.count()
+        self._assignment: Dict[Hashable, int] = {}  # 화면 키 → 작업 번호
+        self._published: Dict[Hashable, Tuple[object, int, int]] = {}  # 화면 키 → (프레임, 슬롯, 순번)
+        self._dead_logged = set()
+        self._ready = threading.Semaphore(0)
+        self._cpu_base: Dict[int, float] = {}  # 작업 번호 → 준비(또는 통계 초기화) 시점 CPU 초 (import 등 시작 비용 제외)
+        self._worker_cpu: Dict[int, float] = {}  # 작업 번호 → 마지막으로 보고된 CPU 초
+        self._reset_counters()
+
+    def configure(self, config: Dict):
+        for key in ('workers', 'slots', 'timeout', 'history'):
+            if key in config:
+                setattr(self, key, config[key])
+
+    def _reset_counters(self):
+        self._requests_total = 0
+        self._frames_published = 0
+        self._fallbacks: Dict[str, int] = {reason: 0 for reason in self.FALLBACK_REASONS}
+        self._round_trip: Deque[float] = deque(maxlen=self.history)
+        self._match_total = 0.0
+        self._worker_requests: Dict[int, int] = {}
+
+    @property
+    def running(self) -> bool:
+        return self._ring is not None
+
+    # =========================================================================
+    # 시작 / 중지
+    # =========================================================================
+    def start(self, slot_bytes: Optional[int] = None, ready_timeout: float = 30.0) -> bool:
+        """
+        작업 프로세스 시작, 모두 준비될 때까지 대기 (slot_bytes: 슬롯 크기, 기본은 등록된 게임 화면 중 가장 큰 RGBA 프레임)
+        """
+        if self.running:
+            return True
+        if slot_bytes is None:
+            from Orchestrator.src.core.game_registry import GAMES
+            slot_bytes = max((w * h * 4 for game in GAMES for _, _, w, h in game.regions.values()), default=0)
+        if not slot_bytes or self.workers < 1:
+            log.warning("[Detection] No screens or workers configured - detection stays in-thread")
+            return False
+        context = multiprocessing.get_context('spawn')  # Windows와 같은 방식 (fork 시 모니터 스레드 상태 복제 방지)
+        try:
+            ring = FrameRing(self.slots, slot_bytes)
+        except OSError as e:
+            log.error(f"[Detection] Shared memory unavailable ({e}) - detection stays in-thread")
+            return False
+        self._results = context.Queue()
+        self._requests = [context.Queue() for _ in range(self.workers)]
+        self._processes = [
+            context.Process(target=_worker_main, args=(index, ring.name, self.slots, slot_bytes, requests, self._results),
+                            name=f"Detection-{index}", daemon=True)
+            for index, requests in enumerate(self._requests)
+        ]
+        for process in self._processes:
+            process.start()
+        self._collector = threading.Thread(target=self._collect, name="DetectionCollector", daemon=True)
+        self._collector.start()
+        deadline = time.monotonic() + ready_timeout
+        for _ in self._processes:
+            if not self._ready.acquire(timeout=max(0.0, deadline - time.monotonic())):
+                log.warning(f"[Detection] Workers not ready after {ready_timeout:g}s - requests will queue")
+                break
+        self._ring = ring
+        log.info(f"[Detection] {self.workers} worker process(es), {self.slots} slots × {slot_bytes / 1e6:.1f} MB")
+        return True
+
+    def stop(self):
+        ring = self._ring
+        if ring is None:
+            return
+        self._ring = None
+        for requests in self._requests:
+            requests.put(None)
+        for process in self._processes:
+            process.join(timeout=5.0)
+            if process.is_alive():
+                process.terminate()
+        self._results.put(None)
+        self._collector.join(timeout=5.0)
+        with self._lock:
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._published.clear()
+            self._assignment.clear()
+        ring.close()
+        self._processes = []
+        self._requests = []
+        self._dead_logged.clear()
+        self._ready = threading.Semaphore(0)
+        self._cpu_base.clear()
+        self._worker_cpu.clear()
+        log.info("[Detection] Worker processes stopped")
+
+    def _collect(self):
+        while True:
+            try:
+                message = self._results.get()
+            except (EOFError, OSError):
+                return
+            if message is None:
+                return
+            request_id, index, scores, match_s, cpu_s = message
+            if request_id is None:
+                with self._lock:
+                    self._cpu_base[index] = cpu_s
+                    self._worker_cpu[index] = cpu_s
+                self._ready.release()
+                continue
+            with self._lock:
+                future = self._pending.pop(request_id, None)
+                self._match_total += match_s
+                self._worker_requests[index] = self._worker_requests.get(index, 0) + 1
+                self._worker_cpu[index] = cpu_s
+            if future is not None:
+                future.set_result(scores)
+
+    # =========================================================================
+    # 매칭 (모니터 스레드)
+    # =========================================================================
+    def _worker_for(self, screen_key: Hashable) -> Optional[int]:
+        index = self._assignment.setdefault(screen_key, len(self._assignment) % len(self._processes))
+        if self._processes[index].is_alive():
+            return index
+        if index not in self._dead_logged:
+            self._dead_logged.add(index)
+            log.error(f"[Detection] Worker {index} exited (code {self._processes[index].exitcode}) - "
+                      f"reassigning its screens")
+        alive = [i for i, process in enumerate(self._processes) if process.is_alive()]
+        if not alive:
+            return None
+        index = self._assignment[screen_key] = alive[hash(screen_key) % len(alive)]
+        return index
+
+    def _fallback(self, reason: str) -> None:
+        with self._lock:
+            self._fallbacks[reason] += 1
+        return None
+
+    def match(self, screen_key: Hashable, frame, battery: Battery, timeout: Optional[float] = None) -> Optional[Scores]:
+        """
+        frame(캡처 이미지)에서 battery의 템플릿들을 작업 프로세스로 매칭 → 템플릿 키 → (점수, 프레임 기준 중심 좌표).
+        템플릿을 읽지 못했거나 프레임보다 크면 결과에서 빠짐. 작업 프로세스를 쓸 수 없으면 None (스레드 안에서 매칭)
+        """
+        ring = self._ring
+        if ring is None:
+            return None
+        started = time.perf_counter()
+        with self._lock:
+            self._requests_total += 1
+            index = self._worker_for(screen_key)
+            published = self._published.get(screen_key)
+        if index is None:
+            return self._fallback('no_worker')
+        if published is not None and published[0] is frame and ring.valid(published[1], published[2]):
+            slot, seq = published[1], published[2]
+        else:
+            written = ring.write(np.asarray(frame))
+            if written is None:
+                return self._fallback('oversize')
+            slot, seq = written
+            with self._lock:
+                self._published[screen_key] = (frame, slot, seq)
+                self._frames_published += 1
+        future: Future = Future()
+        with self._lock:
+            request_id = next(self._request_ids)
+            self._pending[request_id] = future
+        self._requests[index].put((request_id, slot, seq, [tuple(entry) for entry in battery]))
+        try:
+            scores = future.result(timeout=self.timeout if timeout is None else timeout)
+        except FutureTimeout:
+            with self._lock:
+                self._pending.pop(request_id, None)
+            return self._fallback('timeout')
+        if scores is None:
+            return self._fallback('stale')
+        with self._lock:
+            self._round_trip.append(time.perf_counter() - started)
+        return scores
+
+    # =========================================================================
+    # 조회
+    # =========================================================================
+    def snapshot(self) -> Dict:
+        """{requests, frames_published, fallbacks, round_trip_ms p50/p90/max, match_ms_avg, worker_requests, worker_cpu_s}"""
+        with self._lock:
+            round_trip = sorted(self._round_trip)
+            completed = sum(self._worker_requests.values())
+
+            def _at(q):
+                return round(round_trip[min(len(round_trip) - 1, int(q * len(round_trip)))] * 1000, 2) \
+                    if round_trip else 0.0
+            return {
+                'running': self.running,
+                'workers': len(self._processes),
+                'requests': self._requests_total,
+                'frames_published': self._frames_published,
+                'fallbacks': dict(self._fallbacks),
+                'round_trip_ms': {'p50': _at(0.5), 'p90': _at(0.9),
+                                  'max': round(round_trip[-1] * 1000, 2) if round_trip else 0.0},
+                'match_ms_avg': round(self._match_total / completed * 1000, 3) if completed else 0.0,
+                'worker_requests': dict(self._worker_requests),
+                'worker_cpu_s': round(sum(cpu - self._cpu_base.get(index, 0.0)
+                                          for index, cpu in self._worker_cpu.items()), 3),
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._reset_counters()
+            self._cpu_base = dict(self._worker_cpu)
+
+    def print_report(self):
+        data = self.snapshot()
+        if not data['running']:
+            log.info("[Detection] Not running (in-thread detection)")
+            return
+        fallbacks = ', '.join(f"{reason}={n}" for reason, n in data['fallbacks'].items() if n) or '-'
+        log.info(f"[Detection] {data['workers']} workers, {data['requests']} requests, "
+                 f"{data['frames_published']} frames published, worker CPU {data['worker_cpu_s']:.1f}s")
+        log.info(f"[Detection] round trip p50={data['round_trip_ms']['p50']:.2f}ms "
+                 f"p90={data['round_trip_ms']['p90']:.2f}ms max={data['round_trip_ms']['max']:.2f}ms, "
+                 f"match avg={data['match_ms_avg']:.2f}ms, fallbacks: {fallbacks}")
+
+
+def _load_config() -> Dict:
+    try:
+        from Orchestrator.src.utils.config import DETECTION_CONFIG
+        return DETECTION_CONFIG
+    except ImportError:
+        return {}
+
+
+DETECTION_POOL = DetectionPool()
+DETECTION_POOL.configure(_load_config())
@@ -1,7 +1,9 @@
 import threading
-import time
-import win32gui
-import win32process
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class FocusMonitor:
@@ -23,29 +25,23 @@ class FocusMonitor:
             self._stop_event.clear()
             self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
             self._thread.start()
-            print("INFO: [FocusMonitor] Started tracking active window.")
+            log.info("[FocusMonitor] Started tracking active window.")
 
     def stop(self):
         """감시 종료"""
         if self._thread and self._thread.is_alive():
             self._stop_event.set()
             self._thread.join(timeout=2.0)
-            print("INFO: [FocusMonitor] Stopped.")
+            log.info("[FocusMonitor] Stopped.")
 
     def _monitor_loop(self):
         while not self._stop_event.is_set():
             try:
                 # 1. 현재 활성 창 핸들(HWND) 가져오기
-                current_hwnd = win32gui.GetForegroundWindow()
+                current_hwnd, title = inputs.foreground_window()
 
                 # 2. 포커스가 바뀌었는지 확인
                 if current_hwnd != self._last_hwnd:
-                    # 창 제목 가져오기
-                    title = win32gui.GetWindowText(current_hwnd)
-
-                    # (선택) 프로세스 ID 가져오기
-                    # _, pid = win32process.GetWindowThreadProcessId(current_hwnd)
-
                     # 로그 출력 (식별하기 쉽게 매핑된 이름이 있으면 사용)
                     # 예: "[Focus Changed] Old: S1 -> New: Chrome"
                     #print(f"👀 [Focus Changed] '{self._last_title}' -> '{title}' (HWND: {current_hwnd})") <<< "나중에 살리기!!"
@@ -53,8 +49,8 @@ class FocusMonitor:
                     self._last_hwnd = current_hwnd
                     self._last_title = title
 
-                time.sleep(0.2)  # 0.2초마다 체크 (부하 거의 없음)
+                clock.sleep(0.2)  # 0.2초마다 체크 (부하 거의 없음)
 
             except Exception as e:
-                print(f"WARN: [FocusMonitor] Error: {e}")
-                time.sleep(1)
\ No newline at end of file
+                log.warning(f"[FocusMonitor] Error: {e}")
+                clock.sleep(1)
\ No newline at end of file
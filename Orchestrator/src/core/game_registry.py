@@ -0,0 +1,189 @@
+# Orchestrator/src/core/game_registry.py
+# 게임 레지스트리 - 게임마다 VD / 화면 배치 / 모니터 / 템플릿 / 예약 작업 / VD 전환 정보를 선언 (config의 GAMES_CONFIG)
+#
+# 오케스트레이터와 VDManager는 게임 이름이나 VD 개수를 직접 알지 않고 이 레지스트리만 봅니다.
+#   - VirtualDesktop: 등록된 VD + OTHER (src/core/vd_manager.py)
+#   - 모니터 생성: build_monitor() - 오케스트레이터 / 시뮬레이터(sim/runner.py)가 같은 방식으로 생성
+#   - 시간 분할: 등록 순서대로, 가장 오래 못 본 VD부터 (src/core/orchestrator.py)
+#   - 예약 작업: tasks → JobScheduler (SCHEDULE_CONFIG는 catch_up / grace / jitter 기본값만)
+#
+# 게임 추가: GAMES_CONFIG에 항목 하나 (VD 이름, 작업 보기의 VD 위치, 작업 표시줄 아이콘, 모니터 컴포넌트 ...)
+# 화면 추가/이동: 게임의 'layout' 배치 파일 (src/core/screen_layout.py)
+
+import importlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from Orchestrator.src.core.screen_layout import apply_configured_layout, screen_ids
+from Orchestrator.src.utils.log import get_logger
+from Orchestrator.src.utils.profiler import STARTUP
+
+log = get_logger(__name__)
+
+ORCHESTRATOR_ROOT = Path(__file__).resolve().parents[2]
+MONITOR_KINDS = ('srm', 'sm')
+# 공유 상태 Enum 타입 → 그 상태를 쓰는 모니터 종류 (SRM: ScreenState, SM: SystemState)
+STATE_KIND_MONITORS = {'ScreenState': 'srm', 'SystemState': 'sm'}
+
+
+@dataclass
+class MonitorEntry:
+    key: str  # 오케스트레이터 active_monitors 키 (예: 'srm1')
+    monitor_id: str  # 예: 'SRM1'
+    kind: str  # 'srm': 화면별 전투 모니터 (add_screen으로 화면 등록) / 'sm': 시스템 모니터 (팩토리)
+    component: Tuple[str, str]  # (모듈, 클래스 또는 팩토리) - 해당 VD를 처음 사용할 때 import
+    config: Optional[Dict[str, Any]] = None  # srm 생성자 config
+    screen_options: Dict[str, Dict[str, Any]] = field(default_factory=dict)  # 화면 → add_screen 추가 인자
+
+
+@dataclass
+class TaskEntry:
+    key: str  # 예: 'DP1'
+    main: Path  # 작업 main.py (별도 프로세스로 실행)
+    at: Tuple[str, ...]  # 매일 실행 시각 "HH:MM"
+    options: Dict[str, Any] = field(default_factory=dict)  # catch_up / grace / jitter 재지정
+
+
+@dataclass
+class GameEntry:
+    name: str
+    vd: str  # VirtualDesktop 이름
+    screen_info_module: str  # SCREEN_REGIONS를 가진 모듈
+    screens: Tuple[str, ...]  # 모니터링할 화면 (비우면 배치의 모든 화면)
+    monitors: Tuple[MonitorEntry, ...]
+    templates: Tuple[Tuple[str, str], ...]  # (모듈, dict 속성명) - 세션 기록 / 시뮬레이터 템플릿 레지스트리
+    tasks: Tuple[TaskEntry, ...]
+    taskbar_icon: str  # 현재 VD 판별용 작업 표시줄 아이콘
+    task_view_position: Tuple[int, int]  # 작업 보기(Win+Tab) 화면의 VD 썸네일 클릭 위치
+    slice_min: float = 3.0  # 기본 시간 분할 (분)
+    safe_states: Tuple[str, ...] = ()  # SM 오류 보고를 무시할 SRM 상태 (스스로 처리 중)
+    layout: Optional[Path] = None  # 배치 파일 (JSON) - 화면 추가/이동
+
+    @property
+    def regions(self) -> Dict[str, Tuple[int, int, int, int]]:
+        apply_configured_layout(self.screen_info_module)
+        return importlib.import_module(self.screen_info_module).SCREEN_REGIONS
+
+    @property
+    def screen_ids(self) -> List[str]:
+        """모니터링할 화면 (screens를 지정하지 않았으면 배치의 모든 화면, 자연 정렬)"""
+        regions = self.regions
+        return [s for s in self.screens if s in regions] if self.screens else screen_ids(regions)
+
+    def monitor(self, kind: str) -> Optional[MonitorEntry]:
+        return next((m for m in self.monitors if m.kind == kind), None)
+
+    def state_owners(self) -> Dict[str, str]:
+        """상태 Enum 타입 이름 → 그 상태를 쓰는 모니터 ID (예: {'ScreenState': 'SRM1', 'SystemState': 'SM1'})"""
+        owners = {}
+        for state_kind, kind in STATE_KIND_MONITORS.items():
+            monitor = self.monitor(kind)
+            if monitor is not None:
+                owners[state_kind] = monitor.monitor_id
+        return owners
+
+
+def parse_game(config: Dict[str, Any]) -> GameEntry:
+    """GAMES_CONFIG 항목 하나 → GameEntry"""
+    monitors = []
+    for entry in config.get('monitors', []):
+        if entry['kind'] not in MONITOR_KINDS:
+            raise ValueError(f"[Games] {config['name']}: unknown monitor kind {entry['kind']!r}")
+        monitors.append(MonitorEntry(key=entry['key'], monitor_id=entry['id'], kind=entry['kind'],
+                                     component=tuple(entry['component']), config=entry.get('config'),
+                                     screen_options=dict(entry.get('screen_options', {}))))
+    tasks = []
+    for entry in config.get('tasks', []):
+        at = entry['at'] if isinstance(entry['at'], (list, tuple)) else [entry['at']]
+        options = {k: entry[k] for k in ('catch_up', 'grace', 'jitter') if k in entry}
+        tasks.append(TaskEntry(key=entry['task'], main=ORCHESTRATOR_ROOT / entry['main'], at=tuple(at),
+                               options=options))
+    return GameEntry(
+        name=config['name'],
+        vd=config['vd'],
+        screen_info_module=config['screen_info'],
+        screens=tuple(config.get('screens', ())),
+        monitors=tuple(monitors),
+        templates=tuple(tuple(t) for t in config.get('templates', ())),
+        tasks=tuple(tasks),
+        taskbar_icon=config.get('taskbar_icon', ''),
+        task_view_position=tuple(config['task_view_position']),
+        slice_min=config.get('slice_min', 3.0),
+        safe_states=tuple(config.get('safe_states', ())),
+        layout=ORCHESTRATOR_ROOT / config['layout'] if config.get('layout') else None,
+    )
+
+
+def load_games(config: Optional[Sequence[Dict[str, Any]]] = None) -> List[GameEntry]:
+    """GAMES_CONFIG → GameEntry 목록 (VD / 모니터 키·ID / 작업 키 중복 검사)"""
+    if config is None:
+        try:
+            from Orchestrator.src.utils.config import GAMES_CONFIG as config
+        except ImportError:
+            config = []
+    games = [parse_game(entry) for entry in config]
+    for label, values in (('VD', [g.vd for g in games]),
+                          ('monitor key', [m.key for g in games for m in g.monitors]),
+                          ('monitor id', [m.monitor_id for g in games for m in g.monitors]),
+                          ('task', [t.key for g in games for t in g.tasks])):
+        duplicates = sorted({v for v in values if values.count(v) > 1})
+        if duplicates:
+            raise ValueError(f"[Games] Duplicate {label}: {', '.join(duplicates)}")
+    if any(g.vd == 'OTHER' for g in games):
+        raise ValueError("[Games] 'OTHER' is reserved")
+    return games
+
+
+GAMES: List[GameEntry] = load_games()
+
+
+def desktop_names() -> List[str]:
+    """등록된 VD 이름 (등록 순서)"""
+    return [game.vd for game in GAMES]
+
+
+def game_for_vd(vd) -> Optional[GameEntry]:
+    """VD(VirtualDesktop 또는 이름)의 게임"""
+    name = getattr(vd, 'name', vd)
+    return next((game for game in GAMES if game.vd == name), None)
+
+
+def template_registries() -> Dict[str, List[Tuple[str, str]]]:
+    """VD 이름 → 템플릿 레지스트리 (세션 기록 템플릿 사본 / 시뮬레이터 템플릿 설치)"""
+    return {game.vd: list(game.templates) for game in GAMES}
+
+
+# =============================================================================
+# 모니터 생성
+# =============================================================================
+def load_component(monitor: MonitorEntry):
+    """모니터 클래스/팩토리 import (실패 시 None)"""
+    module_name, attr = monitor.component
+    try:
+        with STARTUP.phase(f"import {module_name}"):
+            module = importlib.import_module(module_name)
+        log.info(f"Successfully imported {module_name}.{attr} ({monitor.monitor_id})")
+        return getattr(module, attr)
+    except ImportError as e:
+        log.error(f"Failed to import {module_name}.{attr} ({monitor.monitor_id}): {e}")
+        return None
+
+
+def build_monitor(game: GameEntry, monitor: MonitorEntry, factory, orchestrator, io_scheduler, shared_states,
+                  regions: Optional[Dict[str, Tuple[int, int, int, int]]] = None):
+    """
+    모니터 인스턴스 생성 (factory: load_component 결과).
+    srm은 regions(기본 game.regions)의 화면 중 game.screen_ids를 등록합니다 (regions를 주면 그 화면 전부).
+    """
+    if monitor.kind == 'sm':
+        return factory(monitor.monitor_id, game.vd, orchestrator=orchestrator, shared_states=shared_states)
+
+    instance = factory(monitor_id=monitor.monitor_id, config=dict(monitor.config) if monitor.config else None,
+                       vd_name=game.vd, orchestrator=orchestrator, io_scheduler=io_scheduler,
+                       shared_states=shared_states)
+    screens = game.screen_ids if regions is None else screen_ids(regions)
+    regions = game.regions if regions is None else regions
+    for screen_id in screens:
+        instance.add_screen(screen_id, regions[screen_id], **monitor.screen_options.get(screen_id, {}))
+    return instance
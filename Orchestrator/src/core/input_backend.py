@@ -0,0 +1,409 @@
+# Orchestrator/src/core/input_backend.py
+# 입력/플랫폼 백엔드 - 모든 마우스·키보드·화면 캡처·포그라운드 창 조회의 단일 통로
+#
+# - WindowsBackend: 실제 입력 (pyautogui / keyboard / win32api). 기존 호출과 동일한 라이브러리를 그대로 사용
+# - FakeBackend: 입력을 기록만 하고 즉시 반환 (Linux 샌드박스 부하 테스트, 시뮬레이터, 리플레이용)
+#
+# 사용 예:
+#   from Orchestrator.src.core.input_backend import inputs
+#   inputs.click(x, y)
+#   inputs.key_press('esc')
+#
+# 백엔드 선택: PLATFORM_CONFIG['input_backend'] ('auto' / 'windows' / 'fake')
+#             환경 변수 ORCH_INPUT_BACKEND 가 있으면 우선 적용. auto = Windows면 windows, 그 외 fake
+
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+# 가상 키 코드 (VDManager 데스크톱 전환용)
+VK_CONTROL = 0x11
+VK_LWIN = 0x5B
+
+Region = Tuple[int, int, int, int]
+
+
+def _split_xy(x, y):
+    """pyautogui처럼 click((x, y)) 형태도 허용"""
+    if isinstance(x, (tuple, list)) and y is None:
+        return x[0], x[1]
+    return x, y
+
+
+# =============================================================================
+# 인터페이스
+# =============================================================================
+class InputBackend:
+    """입력/플랫폼 백엔드 인터페이스. 좌표는 전체 화면 절대 좌표"""
+
+    name = "base"
+
+    # --- 마우스 ---
+    def click(self, x=None, y=None, button: str = 'left', clicks: int = 1, interval: float = 0.0):
+        raise NotImplementedError
+
+    def mouse_down(self, x=None, y=None, button: str = 'left'):
+        raise NotImplementedError
+
+    def mouse_up(self, x=None, y=None, button: str = 'left'):
+        raise NotImplementedError
+
+    def move_to(self, x, y=None, duration: float = 0.0):
+        raise NotImplementedError
+
+    def move_rel(self, dx: int, dy: int, duration: float = 0.0):
+        raise NotImplementedError
+
+    def drag_to(self, x: int, y: int, duration: float = 0.0, button: str = 'left'):
+        raise NotImplementedError
+
+    def scroll(self, amount: int, x: Optional[int] = None, y: Optional[int] = None):
+        raise NotImplementedError
+
+    def raw_mouse_down(self):
+        """현재 커서 위치에서 저수준(mouse_event) 왼쪽 버튼 누름"""
+        raise NotImplementedError
+
+    def raw_mouse_up(self):
+        raise NotImplementedError
+
+    def raw_click(self, x: int, y: int):
+        """SetCursorPos + mouse_event 왼쪽 클릭"""
+        raise NotImplementedError
+
+    # --- 키보드 (keyboard 라이브러리: 스캔 코드 주입) ---
+    def key_press(self, key: str):
+        raise NotImplementedError
+
+    def key_down(self, key: str):
+        raise NotImplementedError
+
+    def key_up(self, key: str):
+        raise NotImplementedError
+
+    def is_pressed(self, hotkey: str) -> bool:
+        raise NotImplementedError
+
+    # --- 키보드 (pyautogui: 가상 키 코드 주입) ---
+    def vkey_down(self, key: str):
+        raise NotImplementedError
+
+    def vkey_up(self, key: str):
+        raise NotImplementedError
+
+    def write(self, text: str, interval: float = 0.0):
+        raise NotImplementedError
+
+    def vk_event(self, vk_code: int, key_up: bool = False):
+        """win32 keybd_event (Ctrl+Win+방향키 등 조합키용)"""
+        raise NotImplementedError
+
+    # --- 화면 / 창 ---
+    def screenshot(self, region: Optional[Region] = None):
+        raise NotImplementedError
+
+    def pixel_matches_color(self, x: int, y: int, color: Tuple[int, int, int], tolerance: int = 0) -> bool:
+        raise NotImplementedError
+
+    def foreground_window(self) -> Tuple[int, str]:
+        """(hwnd, 창 제목)"""
+        raise NotImplementedError
+
+
+# =============================================================================
+# Windows (실제 입력)
+# =============================================================================
+class WindowsBackend(InputBackend):
+    name = "windows"
+
+    def __init__(self):
+        import pyautogui
+        import keyboard
+        import win32api
+        import win32con
+        import win32gui
+        self._pyautogui = pyautogui
+        self._keyboard = keyboard
+        self._win32api = win32api
+        self._win32con = win32con
+        self._win32gui = win32gui
+
+    def click(self, x=None, y=None, button='left', clicks=1, interval=0.0):
+        x, y = _split_xy(x, y)
+        self._pyautogui.click(x, y, clicks=clicks, interval=interval, button=button)
+
+    def mouse_down(self, x=None, y=None, button='left'):
+        self._pyautogui.mouseDown(x, y, button=button)
+
+    def mouse_up(self, x=None, y=None, button='left'):
+        self._pyautogui.mouseUp(x, y, button=button)
+
+    def move_to(self, x, y=None, duration=0.0):
+        x, y = _split_xy(x, y)
+        self._pyautogui.moveTo(x, y, duration=duration)
+
+    def move_rel(self, dx, dy, duration=0.0):
+        self._pyautogui.moveRel(dx, dy, duration=duration)
+
+    def drag_to(self, x, y, duration=0.0, button='left'):
+        self._pyautogui.dragTo(x, y, duration=duration, button=button, tween=self._pyautogui.easeOutQuad)
+
+    def scroll(self, amount, x=None, y=None):
+        self._pyautogui.scroll(amount, x=x, y=y)
+
+    def raw_mouse_down(self):
+        self._win32api.mouse_event(self._win32con.MOUSEEVENTF_LEFTDOWN, 0, 0)
+
+    def raw_mouse_up(self):
+        self._win32api.mouse_event(self._win32con.MOUSEEVENTF_LEFTUP, 0, 0)
+
+    def raw_click(self, x, y):
+        self._win32api.SetCursorPos((x, y))
+        self.raw_mouse_down()
+        self.raw_mouse_up()
+
+    def key_press(self, key):
+        self._keyboard.press_and_release(key)
+
+    def key_down(self, key):
+        self._keyboard.press(key)
+
+    def key_up(self, key):
+        self._keyboard.release(key)
+
+    def is_pressed(self, hotkey):
+        return self._keyboard.is_pressed(hotkey)
+
+    def vkey_down(self, key):
+        self._pyautogui.keyDown(key)
+
+    def vkey_up(self, key):
+        self._pyautogui.keyUp(key)
+
+    def write(self, text, interval=0.0):
+        self._pyautogui.write(text, interval=interval)
+
+    def vk_event(self, vk_code, key_up=False):
+        flags = self._win32con.KEYEVENTF_KEYUP if key_up else 0
+        self._win32api.keybd_event(vk_code, 0, flags, 0)
+
+    def screenshot(self, region=None):
+        if region is None:
+            return self._pyautogui.screenshot()
+        return self._pyautogui.screenshot(region=region)
+
+    def pixel_matches_color(self, x, y, color, tolerance=0):
+        return self._pyautogui.pixelMatchesColor(x, y, color, tolerance=tolerance)
+
+    def foreground_window(self):
+        hwnd = self._win32gui.GetForegroundWindow()
+        return hwnd, self._win32gui.GetWindowText(hwnd)
+
+
+# =============================================================================
+# Fake (기록 전용)
+# =============================================================================
+@dataclass
+class InputEvent:
+    """FakeBackend가 기록하는 입력 이벤트"""
+    ts: float
+    kind: str  # 'click', 'mouse_down', 'key_press', 'vk_event', ...
+    x: Optional[int] = None
+    y: Optional[int] = None
+    key: Optional[str] = None
+    button: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+
+class FakeBackend(InputBackend):
+    """
+    입력을 기록만 하는 백엔드. 모든 호출은 대기 없이 즉시 반환됩니다.
+    - frame_source(region) → RGB ndarray: 화면 캡처 공급자 (없으면 검은 화면)
+    - add_listener(callback): 입력 이벤트마다 callback(event) 호출 (시뮬레이터 연동)
+    """
+
+    name = "fake"
+
+    def __init__(self, screen_size: Tuple[int, int] = (1920, 1080), max_events: int = 100_000,
+                 frame_source: Optional[Callable[[Optional[Region]], Any]] = None):
+        self.screen_size = screen_size
+        self.frame_source = frame_source
+        self.events: Deque[InputEvent] = deque(maxlen=max_events)
+        self.counts: Counter = Counter()
+        self.cursor = (0, 0)
+        self.held_keys = set()
+        self.held_buttons = set()
+        self.foreground = (0, "")
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[InputEvent], None]] = []
+
+    # --- 기록 ---
+    def _record(self, kind: str, x=None, y=None, key=None, button=None, **extra) -> InputEvent:
+        if x is not None and y is not None:
+            self.cursor = (int(x), int(y))
+        event = InputEvent(ts=time.time(), kind=kind, x=self.cursor[0] if x is None else int(x),
+                           y=self.cursor[1] if y is None else int(y), key=key, button=button, extra=extra)
+        with self._lock:
+            self.events.append(event)
+            self.counts[kind] += 1
+            listeners = list(self._listeners)
+        for callback in listeners:
+            try:
+                callback(event)
+            except Exception as e:
+                log.warning(f"[FakeBackend] Listener error: {e}")
+        return event
+
+    def add_listener(self, callback: Callable[[InputEvent], None]):
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[InputEvent], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def clear(self):
+        with self._lock:
+            self.events.clear()
+            self.counts.clear()
+
+    # --- 마우스 ---
+    def click(self, x=None, y=None, button='left', clicks=1, interval=0.0):
+        x, y = _split_xy(x, y)
+        self._record('click', x, y, button=button, clicks=clicks)
+
+    def mouse_down(self, x=None, y=None, button='left'):
+        self.held_buttons.add(button)
+        self._record('mouse_down', x, y, button=button)
+
+    def mouse_up(self, x=None, y=None, button='left'):
+        self.held_buttons.discard(button)
+        self._record('mouse_up', x, y, button=button)
+
+    def move_to(self, x, y=None, duration=0.0):
+        x, y = _split_xy(x, y)
+        self._record('move_to', x, y, duration=duration)
+
+    def move_rel(self, dx, dy, duration=0.0):
+        self._record('move_to', self.cursor[0] + dx, self.cursor[1] + dy, duration=duration)
+
+    def drag_to(self, x, y, duration=0.0, button='left'):
+        start = self.cursor
+        self._record('drag', x, y, button=button, start=start, duration=duration)
+
+    def scroll(self, amount, x=None, y=None):
+        self._record('scroll', x, y, amount=amount)
+
+    def raw_mouse_down(self):
+        self.held_buttons.add('left')
+        self._record('mouse_down', button='left', raw=True)
+
+    def raw_mouse_up(self):
+        self.held_buttons.discard('left')
+        self._record('mouse_up', button='left', raw=True)
+
+    def raw_click(self, x, y):
+        self._record('click', x, y, button='left', raw=True)
+
+    # --- 키보드 ---
+    def key_press(self, key):
+        self._record('key_press', key=key)
+
+    def key_down(self, key):
+        self.held_keys.add(key)
+        self._record('key_down', key=key)
+
+    def key_up(self, key):
+        self.held_keys.discard(key)
+        self._record('key_up', key=key)
+
+    def is_pressed(self, hotkey):
+        return all(part in self.held_keys for part in hotkey.split('+'))
+
+    def vkey_down(self, key):
+        self.held_keys.add(key)
+        self._record('key_down', key=key, virtual=True)
+
+    def vkey_up(self, key):
+        self.held_keys.discard(key)
+        self._record('key_up', key=key, virtual=True)
+
+    def write(self, text, interval=0.0):
+        self._record('write', key=text)
+
+    def vk_event(self, vk_code, key_up=False):
+        self._record('vk_event', key=hex(vk_code), key_up=key_up)
+
+    # --- 화면 / 창 ---
+    def screenshot(self, region=None):
+        if self.frame_source is not None:
+            return self.frame_source(region)
+        import numpy as np
+        width, height = (region[2], region[3]) if region else self.screen_size
+        return np.zeros((height, width, 3), dtype=np.uint8)
+
+    def pixel_matches_color(self, x, y, color, tolerance=0):
+        frame = self.screenshot((x, y, 1, 1))
+        pixel = frame[0, 0][:3]
+        return all(abs(int(p) - int(c)) <= tolerance for p, c in zip(pixel, color[:3]))
+
+    def foreground_window(self):
+        return self.foreground
+
+
+# =============================================================================
+# 백엔드 선택
+# =============================================================================
+_backend: Optional[InputBackend] = None
+_backend_lock = threading.Lock()
+
+
+def _create_default_backend() -> InputBackend:
+    choice = os.environ.get("ORCH_INPUT_BACKEND")
+    if not choice:
+        try:
+            from Orchestrator.src.utils.config import PLATFORM_CONFIG
+            choice = PLATFORM_CONFIG.get('input_backend', 'auto')
+        except ImportError:
+            choice = 'auto'
+    if choice == 'auto':
+        choice = 'windows' if sys.platform == 'win32' else 'fake'
+
+    if choice == 'windows':
+        return WindowsBackend()
+    log.info(f"[InputBackend] Using FakeBackend (platform={sys.platform}) - inputs are recorded, not sent")
+    return FakeBackend()
+
+
+def get_backend() -> InputBackend:
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                _backend = _create_default_backend()
+    return _backend
+
+
+def set_backend(backend: InputBackend) -> InputBackend:
+    """백엔드 교체 (시뮬레이터/리플레이/테스트용). 이전 백엔드를 반환"""
+    global _backend
+    with _backend_lock:
+        previous, _backend = _backend, backend
+    return previous
+
+
+class _BackendProxy:
+    """호출 시점의 백엔드로 위임 (모듈 import 후 set_backend로 교체해도 반영됨)"""
+
+    def __getattr__(self, name: str):
+        return getattr(get_backend(), name)
+
+
+inputs = _BackendProxy()
@@ -0,0 +1,321 @@
+# Orchestrator/src/core/instruction_vm.py
+# 제너레이터 정책('상황반장') 공용 실행기 - 등록된 opcode 테이블 + 사전 검증된 지시 객체 + 단일 대기/타임아웃 구현
+#
+# - OpcodeTable: 모니터별 opcode → 처리기 등록표. 지시서(dict)는 yield 시점에 한 번만 검증/변환(Instruction)되고
+#                대기 중 재실행은 처리기를 바로 호출합니다 (매 틱 dict 재해석 없음)
+# - PolicyRunner: 화면 하나의 제너레이터 실행 상태 (대기 중 지시, 시작 시각, 마지막 결과)
+#       * 처리기가 PENDING을 반환하면 다음 틱에 같은 지시를 다시 실행
+#       * 처리기/타임아웃 예외는 제너레이터로 throw → 제너레이터가 처리하면 계속, 아니면 FAILED
+# - OpcodeStats: opcode별 실행 수 / 오류 / 타임아웃 / 처리기 실행 시간 / 완료까지 걸린 시간(시계 기준)
+#       profiler 제어 명령 'ops report' / 'ops reset' 으로 조회
+# - 대기형 지시(poll=True)와 wait_duration은 next_interval()로 다음 틱 시각을 알려줌 (tick_scheduler)
+# - credit: 재시작(체크포인트 복원) 시 이미 흐른 시간. 다른 지시가 실행되기 전의 선행 wait_duration에서 차감
+#           (예: 게임 로딩 15초 대기를 재시작 후 처음부터 다시 기다리지 않음)
+#
+# 사용 예 (모니터 코드):
+#   self.opcodes = OpcodeTable(self.monitor_id)
+#   self.opcodes.register('click', self._op_click, required=('template_name',))
+#   self.opcodes.register('wait_for_template', self._op_wait_for_template, required=('template_name',),
+#                         poll=True, timeout=5.0, optional=True)
+#   runner = PolicyRunner(self.opcodes, policy['generator'](screen_obj), ctx=screen_obj)
+#   result = runner.step(clock.time())   # StepResult.RUNNING / COMPLETE / FAILED
+
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Dict, Generator, Mapping, Optional, Tuple
+
+from Orchestrator.src.utils.log import get_logger
+from Orchestrator.src.utils.profiler import register_command
+
+log = get_logger(__name__)
+
+PENDING = object()  # 처리기 반환값: 아직 완료되지 않음 (다음 틱에 같은 지시 재실행)
+
+
+class InstructionError(Exception):
+    """지시서 검증 실패 (알 수 없는 opcode / 필수 인자 누락)"""
+
+
+class InstructionTimeout(Exception):
+    """대기형 지시의 타임아웃"""
+
+
+# =============================================================================
+# 지시 / opcode 테이블
+# =============================================================================
+@dataclass(frozen=True)
+class OpSpec:
+    name: str
+    handler: Callable[['PolicyRunner', 'Instruction'], Any]
+    required: Tuple[str, ...] = ()
+    defaults: Mapping[str, Any] = field(default_factory=dict)
+    poll: bool = False  # 화면을 계속 확인하며 기다리는 지시 (빠른 틱 필요)
+
+
+@dataclass(frozen=True)
+class Instruction:
+    """검증된 지시. 기존 지시서 dict처럼 inst['key'] / inst.get('key')로 인자를 읽을 수 있음"""
+    op: str
+    args: Mapping[str, Any]
+    spec: OpSpec
+
+    def __getitem__(self, key: str) -> Any:
+        return self.args[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.args.get(key, default)
+
+
+class OpcodeStats:
+    """opcode별 실행 통계 (스레드 안전)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        # op → [실행 수, 완료 수, 오류 수, 타임아웃 수, 처리기 누적 초, 처리기 최대 초, 완료 지연 누적 초, 완료 지연 최대 초]
+        self._stats: Dict[str, list] = {}
+
+    def record(self, op: str, exec_s: float, latency_s: Optional[float] = None, error: Optional[BaseException] = None):
+        with self._lock:
+            entry = self._stats.get(op)
+            if entry is None:
+                entry = self._stats[op] = [0, 0, 0, 0, 0.0, 0.0, 0.0, 0.0]
+            entry[0] += 1
+            entry[4] += exec_s
+            if exec_s > entry[5]:
+                entry[5] = exec_s
+            if error is not None:
+                entry[3 if isinstance(error, InstructionTimeout) else 2] += 1
+            elif latency_s is not None:
+                entry[1] += 1
+                entry[6] += latency_s
+                if latency_s > entry[7]:
+                    entry[7] = latency_s
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """op → {executions, completed, errors, timeouts, exec_avg_ms, exec_max_ms, latency_avg_s, latency_max_s}"""
+        with self._lock:
+            items = [(op, list(entry)) for op, entry in self._stats.items()]
+        return {
+            op: {
+                'executions': runs,
+                'completed': done,
+                'errors': errors,
+                'timeouts': timeouts,
+                'exec_avg_ms': exec_total / runs * 1000 if runs else 0.0,
+                'exec_max_ms': exec_max * 1000,
+                'latency_avg_s': latency_total / done if done else 0.0,
+                'latency_max_s': latency_max,
+            }
+            for op, (runs, done, errors, timeouts, exec_total, exec_max, latency_total, latency_max) in sorted(items)
+        }
+
+
+_STATS: Dict[str, OpcodeStats] = {}
+_stats_lock = threading.Lock()
+
+
+def opcode_stats() -> Dict[str, Dict[str, Dict[str, float]]]:
+    """테이블 이름 → op → 통계"""
+    with _stats_lock:
+        tables = list(_STATS.values())
+    return {stats.name: stats.snapshot() for stats in tables}
+
+
+def reset_opcode_stats():
+    with _stats_lock:
+        tables = list(_STATS.values())
+    for stats in tables:
+        stats.reset()
+
+
+def print_opcode_report():
+    for table_name, ops in opcode_stats().items():
+        for op, entry in ops.items():
+            log.info(f"[VM] {table_name:<6}{op:<24}n={entry['executions']:<7} done={entry['completed']:<6}"
+                     f"err={entry['errors']:<4} timeout={entry['timeouts']:<4}"
+                     f"exec avg={entry['exec_avg_ms']:>7.2f}ms max={entry['exec_max_ms']:>7.1f}ms "
+                     f"latency avg={entry['latency_avg_s']:>6.2f}s max={entry['latency_max_s']:>6.1f}s")
+
+
+register_command('ops report', print_opcode_report)
+register_command('ops reset', reset_opcode_stats)
+
+
+class OpcodeTable:
+    """opcode → 처리기 등록표. 모든 테이블은 기본으로 'wait_duration'을 가짐"""
+
+    def __init__(self, name: str, validate: Optional[Callable[[Mapping[str, Any]], None]] = None):
+        self.name = name
+        self._validate = validate  # 테이블 공통 추가 검증 (예: target_screen 확인), 실패 시 InstructionError
+        self._specs: Dict[str, OpSpec] = {}
+        self.stats = OpcodeStats(name)
+        with _stats_lock:
+            _STATS[name] = self.stats
+        self.register('wait_duration', _op_wait_duration, duration=1.0)
+
+    def register(self, op: str, handler: Callable[['PolicyRunner', Instruction], Any],
+                 required: Tuple[str, ...] = (), poll: bool = False, **defaults):
+        """op 처리기 등록. handler(runner, inst)는 결과값 또는 PENDING을 반환. poll=True면 대기형 지시"""
+        self._specs[op] = OpSpec(op, handler, tuple(required), dict(defaults), poll)
+
+    def __contains__(self, op: object) -> bool:
+        return op in self._specs
+
+    @property
+    def ops(self) -> Tuple[str, ...]:
+        return tuple(self._specs)
+
+    def compile(self, raw: Mapping[str, Any]) -> Instruction:
+        """지시서 dict → Instruction (기본값 채움 + 필수 인자 검증)"""
+        op = raw.get('operation')
+        spec = self._specs.get(op)
+        if spec is None:
+            raise InstructionError(f"[{self.name}] 알 수 없는 지시어: {op}")
+        missing = [key for key in spec.required if raw.get(key) is None]
+        if missing:
+            raise InstructionError(f"[{self.name}] '{op}' 지시에 필수 인자 누락: {missing}")
+        if self._validate is not None:
+            self._validate(raw)
+        args = dict(spec.defaults)
+        args.update(raw)
+        return Instruction(op, args, spec)
+
+
+# =============================================================================
+# 실행기
+# =============================================================================
+class StepResult(Enum):
+    RUNNING = "running"
+    COMPLETE = "complete"  # 제너레이터 정상 종료 → transitions['complete']
+    FAILED = "failed"  # 처리되지 않은 예외 → transitions['fail'] (runner.error)
+
+
+class PolicyRunner:
+    """
+    화면 하나의 제너레이터 정책 실행 상태.
+    step()은 틱마다 한 번 호출되며, 대기 중인 지시가 없으면 제너레이터에서 다음 지시를 받아 바로 실행합니다.
+    (틱당 최대 한 개의 지시가 완료됨 - 기존 SM/SRM 실행기와 동일)
+    """
+
+    __slots__ = ('table', 'generator', 'ctx', 'pending', 'started', 'now', 'last_result', 'error', 'credit')
+
+    def __init__(self, table: OpcodeTable, generator: Generator[Mapping[str, Any], Any, None], ctx: Any = None,
+                 credit: float = 0.0):
+        self.table = table
+        self.generator = generator
+        self.ctx = ctx  # 처리기에 넘길 화면 객체 (SM: screen dict, SRM: CombatScreenInfo)
+        self.pending: Optional[Instruction] = None
+        self.started = 0.0  # 대기 중 지시를 처음 실행한 시각
+        self.now = 0.0
+        self.last_result: Any = None
+        self.error: Optional[BaseException] = None
+        self.credit = max(0.0, credit)  # 선행 wait_duration에 쓸 수 있는 이미 흐른 시간 (초)
+
+    # -------------------------------------------------------------------------
+    # 처리기용 헬퍼
+    # -------------------------------------------------------------------------
+    @property
+    def elapsed(self) -> float:
+        """현재 지시를 시작한 뒤 흐른 시간 (시계 기준 초)"""
+        return self.now - self.started
+
+    def poll(self, value: Any, timeout: Optional[float], optional: bool = False, timeout_value: Any = None,
+             what: str = "") -> Any:
+        """
+        대기형 지시의 공통 처리: value가 참이면 완료(value), timeout(초)이 지나면
+        optional이면 timeout_value로 완료, 아니면 InstructionTimeout. 그 외에는 PENDING.
+        timeout이 None/0 이하면 무한 대기.
+        """
+        if value:
+            return value
+        if timeout is not None and timeout > 0 and self.elapsed >= timeout:
+            if optional:
+                return timeout_value
+            raise InstructionTimeout(f"{what or self.pending.op} timed out after {timeout}s")
+        return PENDING
+
+    def next_interval(self, interval: float, poll_interval: float) -> Tuple[float, bool]:
+        """
+        다음 틱까지의 간격 (상태 간격 interval 기준):
+        대기형 지시 중이면 poll_interval 이하, wait_duration이면 끝나는 시각까지만. (간격, 대기형 지시 중 여부)
+        """
+        inst = self.pending
+        if inst is None:
+            return interval, False
+        if inst.spec.poll:
+            return min(interval, poll_interval), True
+        if inst.op == 'wait_duration':
+            return max(0.0, min(interval, inst['duration'] - self.elapsed - self.credit)), False
+        return interval, False
+
+    # -------------------------------------------------------------------------
+    # 실행
+    # -------------------------------------------------------------------------
+    def step(self, now: float) -> StepResult:
+        self.now = now
+        try:
+            if self.pending is None:
+                self._load(self.generator.send(self.last_result))
+                self.last_result = None
+            self._execute()
+        except StopIteration:
+            return StepResult.COMPLETE
+        except Exception as e:
+            self.error = e
+            self.close()
+            return StepResult.FAILED
+        return StepResult.RUNNING
+
+    def _load(self, raw: Optional[Mapping[str, Any]]):
+        """yield된 지시서를 검증해 대기 지시로 설정 (검증 실패는 제너레이터로 throw)"""
+        while True:
+            try:
+                self.pending = self.table.compile(raw) if raw else None
+                self.started = self.now
+                return
+            except InstructionError as e:
+                log.warning(f"{e}. Throwing to generator...")
+                raw = self.generator.throw(e)
+
+    def _execute(self):
+        inst = self.pending
+        if inst is None:  # 빈 지시 (yield None) → 결과 None으로 즉시 완료
+            return
+        start = time.perf_counter()
+        try:
+            result = inst.spec.handler(self, inst)
+        except Exception as e:
+            self.table.stats.record(inst.op, time.perf_counter() - start, error=e)
+            log.warning(f"[{self.table.name}] Instruction '{inst.op}' failed: {e}. Throwing to generator...")
+            self.pending = None
+            self._load(self.generator.throw(e))  # 제너레이터가 처리하면 복구 지시를 다음 틱부터 실행
+            return
+        exec_s = time.perf_counter() - start
+        if inst.op != 'wait_duration':
+            self.credit = 0.0  # 입력/확인 지시 이후의 대기는 실제로 기다림
+        if result is PENDING:
+            self.table.stats.record(inst.op, exec_s)
+            return
+        if inst.op == 'wait_duration' and self.credit:
+            self.credit = max(0.0, self.credit + self.elapsed - inst['duration'])
+        self.table.stats.record(inst.op, exec_s, latency_s=self.elapsed)
+        self.pending = None
+        self.last_result = result
+
+    def close(self):
+        try:
+            self.generator.close()
+        except Exception as e:
+            log.warning(f"[{self.table.name}] Generator close error: {e}")
+        self.pending = None
+
+
+def _op_wait_duration(runner: PolicyRunner, inst: Instruction) -> Any:
+    return None if runner.elapsed + runner.credit >= inst['duration'] else PENDING
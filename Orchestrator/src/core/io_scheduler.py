@@ -2,9 +2,13 @@
 
 import threading
 import queue
-import time  # time.time()을 위해 import 추가
-import traceback  # 오류 로깅을 위해 import 추가
 from enum import Enum
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.core.watchdog import IO_WORKER, WATCHDOG
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class Priority(Enum):
@@ -21,16 +25,22 @@ class IOScheduler:
         self.lock = threading.Lock()
         self.worker_thread = None
         self.stop_event = None
+        self._generation = 0  # 워치독 재시작 시 증가 (이전 워커는 현재 작업이 끝나면 종료)
+        # 액션 실행 후 호출되는 관찰자 (component, screen_id, priority, wait_ms, run_ms, ok) - 세션 기록 등
+        self.observers = []
+
+    def add_observer(self, callback):
+        self.observers.append(callback)
 
     def request(self, component: str, screen_id: str, action: callable, priority: Priority = Priority.NORMAL):
         """
         IO 작업을 요청합니다.
         action은 실행할 함수 또는 lambda여야 합니다.
         """
-        # (priority.value, time.time(), ...)으로 우선순위 큐에 삽입
+        # (priority.value, clock.time(), ...)으로 우선순위 큐에 삽입
         self.queue.put((
             priority.value,
-            time.time(),  # 동일 우선순위 시, 먼저 온 순서(Timestamp)
+            clock.time(),  # 동일 우선순위 시, 먼저 온 순서(Timestamp)
             component,
             screen_id,
             action  # <- 여기에 람다식이 통째로 전달됩니다.
@@ -39,42 +49,29 @@ class IOScheduler:
     def start(self, stop_event):
         """워커 스레드 시작"""
         self.stop_event = stop_event
-        self.worker_thread = threading.Thread(target=self._worker, daemon=True)  # 데몬 스레드로 변경
+        self.worker_thread = threading.Thread(target=self._worker, args=(self._generation,),
+                                              daemon=True)  # 데몬 스레드로 변경
         self.worker_thread.start()
 
-    def _worker(self):
+    def restart_worker(self):
+        """
+        워치독 재시작: 멈춘 워커는 버리고 새 lock + 새 워커로 교체.
+        멈춘 액션은 이전 lock을 잡고 있으므로 새 lock으로 바꿔야 다음 IO가 진행됨
+        """
+        self._generation += 1
+        self.lock = threading.Lock()
+        self.start(self.stop_event)
+
+    def _worker(self, generation: int = 0):
         """
         IO 실행 전용 워커 스레드.
         큐에서 작업을 하나씩 꺼내 lock을 잡고 순차적으로 실행합니다.
         """
-        while not self.stop_event.is_set():
+        while not self.stop_event.is_set() and generation == self._generation:
             try:
                 # 1. 큐에서 작업 가져오기 (작업이 없으면 1초 대기)
                 item = self.queue.get(timeout=1.0)
-                priority_val, timestamp, component, screen_id, action_lambda = item
-
-                # 2. ★★★ IO Lock 잡기 (이 순간 다른 IO는 모두 대기) ★★★
-                with self.lock:
-                    print(f"--- [IO START] ({component}/{screen_id}, P:{priority_val}) ---")
-
-                    # 3. ★★★ 전달받은 람다(action) 실행 ★★★
-                    try:
-                        # ✅ [핵심 수정] 안전장치: 작업 시작 전 '손 털기'
-                        # 이전 작업이 마우스를 누른 채로 끝났을 경우를 대비해 강제로 뗍니다.
-                        # (좌표 이동 없이 현재 위치에서 버튼만 뗌)
-                        import pyautogui
-                        pyautogui.mouseUp(button='left')
-
-                        # 실제 작업 실행
-                        action_lambda()
-
-                        print(f"--- [IO END]   ({component}/{screen_id}) ---")
-
-                    except Exception as e:
-                        # !!! 중요 !!!
-                        # 람다 실행 중 에러가 나도 스케줄러는 죽지 않아야 합니다.
-                        print(f"!!! ERROR: [IO] Action failed for {component}/{screen_id}: {e}")
-                        traceback.print_exc()  # 상세 에러 로그 출력
+                self._execute(item)
 
                 # 작업 큐 비우기 (필요시)
                 self.queue.task_done()
@@ -84,5 +81,43 @@ class IOScheduler:
                 continue
             except Exception as e:
                 # 스케줄러 루프 자체의 심각한 오류
-                print(f"!!! CRITICAL: [IO] Worker loop error: {e}")
-                time.sleep(1)  # 루프 재시도 전 잠시 대기
\ No newline at end of file
+                log.error(f"!!! CRITICAL: [IO] Worker loop error: {e}")
+                clock.sleep(1)  # 루프 재시도 전 잠시 대기
+
+    def _execute(self, item):
+        """작업 하나를 IO lock 안에서 실행하고 관찰자에게 알림 (스레드/asyncio 런타임 공용)"""
+        priority_val, timestamp, component, screen_id, action_lambda = item
+
+        # 2. ★★★ IO Lock 잡기 (이 순간 다른 IO는 모두 대기) ★★★
+        with self.lock, WATCHDOG.activity(IO_WORKER, f"{component}/{screen_id}"):
+            log.debug("--- [IO START] ---", component=component, screen_id=screen_id, priority=priority_val)
+            io_start = clock.time()
+
+            # 3. ★★★ 전달받은 람다(action) 실행 ★★★
+            ok = True
+            try:
+                # ✅ [핵심 수정] 안전장치: 작업 시작 전 '손 털기'
+                # 이전 작업이 마우스를 누른 채로 끝났을 경우를 대비해 강제로 뗍니다.
+                # (좌표 이동 없이 현재 위치에서 버튼만 뗌)
+                inputs.mouse_up(button='left')
+
+                # 실제 작업 실행
+                action_lambda()
+
+                log.info("[IO] Action done", component=component, screen_id=screen_id,
+                         priority=priority_val, wait_ms=int((io_start - timestamp) * 1000),
+                         run_ms=int((clock.time() - io_start) * 1000))
+
+            except Exception as e:
+                # !!! 중요 !!!
+                # 람다 실행 중 에러가 나도 스케줄러는 죽지 않아야 합니다.
+                log.exception(f"!!! ERROR: [IO] Action failed: {e}", component=component,
+                              screen_id=screen_id)  # 상세 에러 로그 출력 (traceback 포함)
+                ok = False
+
+            for observer in self.observers:
+                try:
+                    observer(component, screen_id, priority_val, int((io_start - timestamp) * 1000),
+                             int((clock.time() - io_start) * 1000), ok)
+                except Exception as e:
+                    log.warning(f"[IO] Observer failed: {e}")
@@ -0,0 +1,163 @@
+# Orchestrator/src/core/job_scheduler.py
+# 예약 작업 타이머 힙 - schedule 라이브러리의 1초 폴링(run_pending) 대체
+#
+# - 작업마다 다음 실행 시각(시계 기준 timestamp)을 heap에 넣고, 메인 루프는 가장 이른 작업까지 기다렸다가 run_due()
+#       wake.wait(jobs.next_due() - clock.time())   (작업 사이에는 깨어나지 않음, 다른 이유로 깨우려면 이벤트를 set)
+# - 메인 루프가 다른 일(_execute_task 등)로 막혀 있었거나 PC가 절전/일시정지됐다 돌아오면, 놓친 실행을 정책대로 처리
+#       catch_up = 'run_once' : 몇 번을 놓쳤든 한 번만 늦게 실행 (기본)
+#                  'run_all'  : 놓친 횟수만큼 콜백을 모두 호출 (오케스트레이터는 대기 중인 같은 작업의 실행 횟수로 누적)
+#                  'skip'     : grace초 이내로 늦은 경우만 실행, 그보다 늦었으면 버림
+# - jitter: 매 실행 시각에 0~jitter초를 무작위로 더함 (여러 작업이 같은 시각에 몰리지 않도록)
+# - 작업은 config의 GAMES_CONFIG 게임별 tasks에 선언 (오케스트레이터 setup_schedule)
+#
+# 시계는 clock 모듈 기준이므로 ScaledClock(가상 시간)에서도 그대로 동작합니다 (python -m Orchestrator.sim.day).
+
+import datetime
+import heapq
+import itertools
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+CATCH_UP_POLICIES = ('run_once', 'run_all', 'skip')
+
+
+class DailyJob:
+    """매일 at 시각에 실행되는 작업 하나 + 실행 통계"""
+
+    __slots__ = ('name', 'at', 'callback', 'jitter', 'catch_up', 'grace', 'next_nominal', 'due',
+                 'runs', 'missed', 'late_total', 'late_max')
+
+    def __init__(self, name: str, at: datetime.time, callback: Callable[[], None], jitter: float = 0.0,
+                 catch_up: str = 'run_once', grace: float = 300.0):
+        if catch_up not in CATCH_UP_POLICIES:
+            raise ValueError(f"[Jobs] {name}: unknown catch_up policy {catch_up!r} (expected {CATCH_UP_POLICIES})")
+        self.name = name
+        self.at = at
+        self.callback = callback
+        self.jitter = max(0.0, jitter)
+        self.catch_up = catch_up
+        self.grace = grace
+        self.next_nominal = 0.0  # 다음 정시 실행 시각 (jitter 제외)
+        self.due = 0.0  # 실제로 깨울 시각 (jitter 포함)
+        self.runs = 0
+        self.missed = 0
+        self.late_total = 0.0
+        self.late_max = 0.0
+
+    def occurrence_after(self, t: float) -> float:
+        """t 이후(초과) 첫 정시 실행 시각"""
+        day = datetime.datetime.fromtimestamp(t).date()
+        candidate = datetime.datetime.combine(day, self.at).timestamp()
+        if candidate <= t:
+            candidate = datetime.datetime.combine(day + datetime.timedelta(days=1), self.at).timestamp()
+        return candidate
+
+
+def parse_at(value: str) -> datetime.time:
+    """"HH:MM" 또는 "HH:MM:SS" → datetime.time"""
+    try:
+        return datetime.time.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"[Jobs] Invalid time {value!r} (expected HH:MM)") from None
+
+
+class JobScheduler:
+    """매일 반복 작업의 타이머 힙 (메인 루프 스레드에서 사용)"""
+
+    def __init__(self, seed: Optional[int] = None):
+        self._heap: List[Tuple[float, int, DailyJob]] = []
+        self._seq = itertools.count()
+        self._jobs: List[DailyJob] = []
+        self._random = random.Random(seed)
+
+    def add_daily(self, name: str, at: str, callback: Callable[[], None], jitter: float = 0.0,
+                  catch_up: str = 'run_once', grace: float = 300.0, now: Optional[float] = None) -> DailyJob:
+        job = DailyJob(name, parse_at(at), callback, jitter=jitter, catch_up=catch_up, grace=grace)
+        self._jobs.append(job)
+        self._arm(job, job.occurrence_after(clock.time() if now is None else now))
+        return job
+
+    def _arm(self, job: DailyJob, nominal: float):
+        job.next_nominal = nominal
+        job.due = nominal + (self._random.uniform(0.0, job.jitter) if job.jitter else 0.0)
+        heapq.heappush(self._heap, (job.due, next(self._seq), job))
+
+    def clear(self):
+        self._heap.clear()
+        self._jobs.clear()
+
+    @property
+    def jobs(self) -> List[DailyJob]:
+        return list(self._jobs)
+
+    def next_due(self) -> Optional[float]:
+        """가장 이른 작업의 실행 시각 (작업이 없으면 None)"""
+        return self._heap[0][0] if self._heap else None
+
+    def time_until_next(self, now: Optional[float] = None, default: Optional[float] = None) -> Optional[float]:
+        """가장 이른 작업까지 남은 시간 (default가 있으면 그 이하로 자름, 작업이 없으면 default)"""
+        if not self._heap:
+            return default
+        remaining = max(0.0, self._heap[0][0] - (clock.time() if now is None else now))
+        return remaining if default is None else min(default, remaining)
+
+    def run_due(self, now: Optional[float] = None) -> int:
+        """실행 시각이 지난 작업 실행 (놓친 실행은 catch_up 정책대로). 실행한 횟수 반환"""
+        now = clock.time() if now is None else now
+        fired = 0
+        while self._heap and self._heap[0][0] <= now:
+            _, _, job = heapq.heappop(self._heap)
+            # 놓친 정시 실행들 (보통 하나, 메인 루프가 오래 막혔거나 절전 후에는 여러 개)
+            occurrences = [job.next_nominal]
+            while True:
+                following = job.occurrence_after(occurrences[-1])
+                if following > now:
+                    break
+                occurrences.append(following)
+            if job.catch_up == 'run_all':
+                runs = occurrences
+            elif job.catch_up == 'skip':
+                runs = [t for t in occurrences if now - t <= job.grace + job.jitter][-1:]
+            else:
+                runs = occurrences[:1]
+            skipped = len(occurrences) - len(runs)
+            offset = job.due - job.next_nominal  # jitter
+            if skipped or now - job.due > 1.0:
+                log.warning(f"[Jobs] {job.name}: {now - job.due:.0f}s late, {len(occurrences)} due, "
+                            f"running {len(runs)} ({job.catch_up})")
+            for nominal in runs:
+                late = now - (nominal + offset)
+                fired += 1
+                job.runs += 1
+                job.late_total += late
+                job.late_max = max(job.late_max, late)
+                try:
+                    job.callback()
+                except Exception as e:
+                    log.error(f"[Jobs] {job.name} failed: {e}")
+            job.missed += skipped
+            self._arm(job, job.occurrence_after(now))
+        return fired
+
+    def describe(self) -> List[str]:
+        """다음 실행 예정 (로그용)"""
+        return [f"{job.name} @ {job.at.strftime('%H:%M')} → "
+                f"{datetime.datetime.fromtimestamp(job.due).strftime('%m-%d %H:%M:%S')}"
+                for job in sorted(self._jobs, key=lambda j: j.due)]
+
+    def stats(self) -> Dict[str, Dict]:
+        """작업 → {runs, missed, late_avg_s, late_max_s}"""
+        return {
+            job.name: {
+                'runs': job.runs,
+                'missed': job.missed,
+                'late_avg_s': round(job.late_total / job.runs, 3) if job.runs else 0.0,
+                'late_max_s': round(job.late_max, 3),
+            }
+            for job in self._jobs
+        }
@@ -1,142 +1,171 @@
+import functools
 import threading
-import time
-from operator import truediv
 
-import schedule
+import collections
 import enum
 import queue
 import subprocess
-import numpy as np
 import sys
-from pathlib import Path
-import pyautogui
-import os
 from .io_scheduler import IOScheduler, Priority
-# [수정] Raven2용 ScreenState 추가 (별칭 사용)
-from Orchestrator.NightCrows.Combat_Monitor.config.srm_config import ScreenState as NC_ScreenState
-from Orchestrator.Raven2.Combat_Monitor.src.models.screen_info import ScreenState as R2_ScreenState
+from .shared_state_store import SharedStateStore
+from .transition_journal import BASELINE_STATES, TransitionJournal
+from .session_recorder import SessionRecorder
+from .checkpoint import CheckpointManager
+from .watchdog import IO_WORKER, WATCHDOG
+from .job_scheduler import JobScheduler
+from .coverage import COVERAGE
+from .game_registry import GAMES, build_monitor, load_component
 from .focus_monitor import FocusMonitor
+from . import instruction_vm, tick_scheduler  # noqa: F401 - 모니터 로딩 전에도 제어 파일 명령(ops / ticks) 등록
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.input_backend import inputs
+from Orchestrator.src.utils.log import get_logger
+from Orchestrator.src.utils.profiler import PROFILER, SAMPLER, STARTUP, start_control_watcher
+from Orchestrator.src.utils.wait_utils import WAIT_STATS
+
+log = get_logger(__name__)
 
 try:
     # VDManager 임포트 시도
     from .vd_manager import VDManager, VirtualDesktop
 except ImportError:
-    print("오류: VDManager를 'core.vd_manager'에서 임포트할 수 없습니다.")
-    print("PYTHONPATH 또는 프로젝트 구조를 확인하세요.")
+    log.error("오류: VDManager를 'core.vd_manager'에서 임포트할 수 없습니다.")
+    log.info("PYTHONPATH 또는 프로젝트 구조를 확인하세요.")
 
 
     # 임시 플레이스홀더 (테스트용)
-    class VirtualDesktop(enum.Enum):
-        VD1 = "VD1"
-        VD2 = "VD2"
-        OTHER = "OTHER"
+    VirtualDesktop = enum.Enum('VirtualDesktop', [(g.vd, g.vd) for g in GAMES] + [('OTHER', 'OTHER')])
 
 
     class VDManager:
-        def get_current_vd(self): return VirtualDesktop.VD1
+        def get_current_vd(self): return next(iter(VirtualDesktop))
 
-        def switch_to(self, target_vd): print(f"Switching to {target_vd.name}")
+        def switch_to(self, target_vd): log.info(f"Switching to {target_vd.name}")
 
-# 실제 SRM 컴포넌트 임포트
 try:
-    from Orchestrator.NightCrows.Combat_Monitor.monitor import CombatMonitor as NightCrowsCombatMonitor
-
-    print("INFO: Successfully imported NightCrows CombatMonitor (SRM1)")
-except ImportError as e:
-    print(f"ERROR: Failed to import NightCrows CombatMonitor: {e}")
-    NightCrowsCombatMonitor = None
+    from Orchestrator.src.utils.config import STARTUP_CONFIG
+except ImportError:
+    STARTUP_CONFIG = {}
 
 try:
-    from Orchestrator.Raven2.Combat_Monitor.src.monitor import CombatMonitor as Raven2CombatMonitor
-
-    print("INFO: Successfully imported Raven2 CombatMonitor (SRM2)")
-except ImportError as e:
-    print(f"ERROR: Failed to import Raven2 CombatMonitor: {e}")
-    Raven2CombatMonitor = None
+    from Orchestrator.src.utils.config import RUNTIME_CONFIG
+except ImportError:
+    RUNTIME_CONFIG = {}
 
-# SystemMonitor 컴포넌트 임포트 추가
 try:
-    from Orchestrator.NightCrows.System_Monitor.src.core.monitor import create_system_monitor
-
-    print("INFO: Successfully imported NightCrows SystemMonitor (SM1)")
-except ImportError as e:
-    print(f"ERROR: Failed to import NightCrows SystemMonitor: {e}")
-    create_system_monitor = None
+    from Orchestrator.src.utils.config import SCHEDULE_CONFIG
+except ImportError:
+    SCHEDULE_CONFIG = {}
 
 try:
-    from Orchestrator.Raven2.System_Monitor.src.core.monitor import \
-        create_system_monitor as create_system_monitor_raven2
-
-    print("INFO: Successfully imported Raven2 SystemMonitor (SM2)")
-except ImportError as e:
-    print(f"ERROR: Failed to import Raven2 SystemMonitor: {e}")
-    create_system_monitor_raven2 = None
-
-# BaseMonitor 제거 - None 체크로 대체
-
+    from Orchestrator.src.utils.config import SWITCH_CONFIG
+except ImportError:
+    SWITCH_CONFIG = {}
 
-# 각 컴포넌트의 main.py 경로
-COMPONENT_PATHS = {
-    "DP1": Path("NightCrows/Daily_Present/main.py"),
-    "MO1": Path("NightCrows/Mail_opener/main.py"),
-    "DP2": Path("Raven2/Daily_Present/main.py"),
-    "MO2": Path("Raven2/Mail_opener/main.py"),
-}
+MAX_SWITCH_DELAY = 900.0  # 시간 분할 만료 후 위험 상태로 전환을 미룰 수 있는 최대 시간 (15분, 넘으면 강제 전환)
+IO_BUSY_LOG_INTERVAL = 10.0  # IO가 계속 바쁠 때 진행 상황 로그 주기
 
 
 class ActiveState(enum.Enum):
-    MONITORING_VD1 = 1
-    MONITORING_VD2 = 2
-    EXECUTING_TASK_VD1 = 3
-    EXECUTING_TASK_VD2 = 4
-    SWITCHING = 5
+    """오케스트레이터 상태 (대상 VD는 current_focus, 값은 저장되지 않고 로그에는 이름만 씀)"""
     IDLE = 0
+    MONITORING = 1
+    EXECUTING_TASK = 2
+    SWITCHING = 3
 
 
 class Orchestrator:
-    def __init__(self, vd1_slice_min=3, vd2_slice_min=3):
-        print("Initializing Orchestrator...")
-        self.start_time = time.time()  # 전체 실행 시간 추적
+    def __init__(self, slice_min=None):
+        """
+        :param slice_min: VD별 시간 분할 (분). 숫자면 모든 VD 공통, dict면 VD 이름 → 분,
+                          지정하지 않은 VD는 GAMES_CONFIG의 slice_min
+        """
+        log.info("Initializing Orchestrator...")
+        self.start_time = clock.time()  # 전체 실행 시간 추적
 
         try:
             self.vd_manager = VDManager()
-            print("VDManager initialized.")
+            log.info("VDManager initialized.")
         except Exception as e:
-            print(f"Failed to initialize VDManager: {e}")
+            log.error(f"Failed to initialize VDManager: {e}")
             self.vd_manager = None
-        self.io_scheduler = IOScheduler()  # ← 추가
+        # 모니터 실행 런타임 (RUNTIME_CONFIG['mode']): 'threads'(기존) 또는 'asyncio'(이벤트 루프 하나)
+        self.async_runtime = None
+        if RUNTIME_CONFIG.get('mode', 'threads') == 'asyncio':
+            from .async_runtime import AsyncMonitorRuntime
+            self.async_runtime = AsyncMonitorRuntime.from_config(RUNTIME_CONFIG)
+            self.io_scheduler = self.async_runtime.io_scheduler
+            log.info("Monitor runtime: asyncio (single event loop)")
+        else:
+            self.io_scheduler = IOScheduler()  # ← 추가
+        self.io_scheduler.add_observer(self._on_io_done)
         self.active_monitors = {}
+        self._monitor_lock = threading.RLock()  # active_monitors 시작/중지/워치독 재시작 직렬화
         self.current_focus = None
         self.active_state = ActiveState.IDLE
         self.monitor_event_queue = queue.Queue()
-        self.vd1_slice_duration = vd1_slice_min * 60
-        self.vd2_slice_duration = vd2_slice_min * 60
-        self.last_focus_switch_time = time.time()
-        self.pending_scheduled_task = None
+        # 게임 레지스트리 (GAMES_CONFIG): VD → 게임, 등록 순서가 시간 분할의 기본 순서
+        self.games = {VirtualDesktop[game.vd]: game for game in GAMES}
+        self.slice_durations = {}
+        for vd, game in self.games.items():
+            minutes = slice_min.get(vd.name, game.slice_min) if isinstance(slice_min, dict) else slice_min
+            self.slice_durations[vd] = (game.slice_min if minutes is None else minutes) * 60
+        self.last_focus_switch_time = clock.time()
+        # 조기 양보 (SWITCH_CONFIG['early_yield']): 현재 VD가 한동안 조용하고 다른 VD를 오래 못 봤으면 남은 시간 분할을 양보
+        self.early_yield = dict(SWITCH_CONFIG.get('early_yield', {}))
+        self.vd_left_at = {}  # VD → 마지막으로 모니터링을 멈춘 시각 (그 VD의 사각 시간 시작)
+        self.last_io_at = 0.0  # 마지막 IO 액션 완료 시각
+        self.switch_counts = collections.Counter()  # 전환 사유별 횟수 (slice / early_yield / forced)
+        # 실행 대기 중인 예약 작업 (순서대로, 같은 작업은 하나만 - catch_up='run_all'이면 'runs'에 횟수 누적)
+        self.pending_scheduled_tasks = collections.deque()
+        self.jobs = JobScheduler()
         self.task_execution_lock = threading.Lock()
+        self.main_loop_stop = threading.Event()  # set() 시 메인 루프 종료 후 shutdown (stop() 사용)
+        # 메인 루프 깨우기: 다음 예약 작업 / 시간 분할 만료까지 잠들고, 그 사이 상태 변화·IO 완료·작업 요청·종료 시 즉시 깨움
+        self._wake = threading.Event()
         self.focus_monitor = FocusMonitor()
 
-        # 1. [신규] 공유 상태 저장소 생성 (화면 ID: 상태 Enum)
-        self.vd1_shared_states = {}  # SRM1 ←→ SM1
-        self.vd2_shared_states = {}  # SRM2 ←→ SM2
-
-        # 2. 하위 모듈 초기화 시 공유 저장소 주입
-        # --- Initialize Real SRM Components ---
-        self._initialize_srm_components()
-        self._initialize_sm_components()
-        print("Component initialization complete.")
+        # 1. 공유 상태 저장소 생성 (VD마다 하나: 화면 ID → 상태 Enum, 같은 VD의 SRM ←→ SM)
+        self.shared_states = {vd: SharedStateStore(vd.name) for vd in self.games}
+
+        # 상태 전이 저널 (JOURNAL_CONFIG: 모든 ScreenState/SystemState 전이를 백그라운드로 SQLite에 기록, 비활성이면 None)
+        self.transition_journal = TransitionJournal.from_config()
+        for vd, store in self.shared_states.items():
+            if self.transition_journal:
+                store.subscribe(self.transition_journal.on_state_change(vd.name, self.games[vd].state_owners()))
+            store.subscribe(self._on_state_change)
+            # 화면별 모니터링 커버리지 / 사각 구간 (COVERAGE_CONFIG, 측정은 메인 루프 시작부터)
+            COVERAGE.attach_store(vd.name, store)
+
+        # 세션 기록 (RECORDING_CONFIG / ORCH_RECORD_SESSION, 기본 비활성)
+        self.session_recorder = SessionRecorder.from_config()
+        if self.session_recorder:
+            self.session_recorder.attach(io_scheduler=self.io_scheduler,
+                                         stores={vd.name: store for vd, store in self.shared_states.items()})
+
+        # 체크포인트 (CHECKPOINT_CONFIG): 공유 상태 + 모니터 진행 상황 주기 저장, 최근 것이 있으면 웜 리스타트
+        self.checkpoint = self._create_checkpoint()
+        if self.checkpoint:
+            for vd, store in self.shared_states.items():
+                self.checkpoint.attach_store(vd.name, store)
+            self.checkpoint.load()
+
+        # 2. 하위 모듈 초기화 시 공유 저장소 주입 (모니터 키 → 인스턴스, 예: 'srm1')
+        # 지연 로딩이면 VD별 모니터는 첫 set_focus에서 VD 전환과 병행해 준비 (_prepare_vd_components)
+        self.monitors = {monitor.key: None for game in GAMES for monitor in game.monitors}
+        self.task_paths = {task.key: task.main for game in GAMES for task in game.tasks}
+        self._component_lock = threading.Lock()
+        self._prepared_vds = set()
+        if not STARTUP_CONFIG.get('lazy_components', True):
+            for vd in self.games:
+                self._prepare_vd_components(vd)
+            log.info("Component initialization complete.")
 
         self.setup_schedule()
         self.capture_lock = threading.Lock()
 
-        # 양쪽 게임의 SCREEN_REGIONS 로드
-        from Orchestrator.NightCrows.utils.screen_info import SCREEN_REGIONS as NC_REGIONS
-        from Orchestrator.Raven2.utils.screen_info import SCREEN_REGIONS as R2_REGIONS
-
-        self.screen_regions = {
-            VirtualDesktop.VD1: NC_REGIONS,
-            VirtualDesktop.VD2: R2_REGIONS
-        }
+        # 게임별 SCREEN_REGIONS 로드
+        self.screen_regions = {vd: game.regions for vd, game in self.games.items()}
 
     def capture_screen_safely(self, screen_id: str):
         """중앙집중식 화면 캡처 - PIL Image 반환"""
@@ -144,278 +173,366 @@ class Orchestrator:
             try:
                 regions = self.screen_regions.get(self.current_focus)
                 if not regions or screen_id not in regions:
-                    print(f"Error: Screen region not found for {screen_id} on {self.current_focus}")
+                    log.error(f"Screen region not found for {screen_id} on {self.current_focus}")
                     return None
 
                 region = regions[screen_id]
-                screenshot = pyautogui.screenshot(region=region)
+                screenshot = inputs.screenshot(region=region)
+                if self.session_recorder:
+                    self.session_recorder.record_frame(self.current_focus.name, screen_id, region, screenshot)
                 return screenshot  # ✅ PIL Image 그대로 반환
             except Exception as e:
-                print(f"Error capturing screen for {screen_id}: {e}")
+                log.error(f"Error capturing screen for {screen_id}: {e}")
                 return None
 
-    def _initialize_srm_components(self):
-        """실제 SRM 컴포넌트 초기화"""
-        # SRM1 (NightCrows)
-        if NightCrowsCombatMonitor:
-            try:
-                srm1_config = {'confidence': 0.85}
-                # [수정] shared_states 전달
-                self.srm1 = NightCrowsCombatMonitor(
-                    monitor_id="SRM1",
-                    config=srm1_config,
-                    vd_name="VD1",
-                    orchestrator=self,
-                    io_scheduler=self.io_scheduler,
-                    shared_states=self.vd1_shared_states
-                )
-
-                # 화면 정보 추가
-                from Orchestrator.NightCrows.utils.screen_info import SCREEN_REGIONS
-                for screen_id in ['S1', 'S2', 'S3', 'S4', 'S5']:
-                    if screen_id in SCREEN_REGIONS:
-                        self.srm1.add_screen(screen_id=screen_id, region=SCREEN_REGIONS[screen_id])
-
-                print(f"INFO: SRM1 initialized with {len(self.srm1.screens)} screens")
-            except Exception as e:
-                print(f"ERROR: Failed to initialize SRM1: {e}")
-                self.srm1 = None
-        else:
-            self.srm1 = None
-
-        # SRM2 (Raven2)
-        if Raven2CombatMonitor:
-            try:
-                # [수정] shared_states 전달
-                self.srm2 = Raven2CombatMonitor(
-                    orchestrator=self,
-                    io_scheduler=self.io_scheduler,
-                    shared_states=self.vd2_shared_states
-                )
-
-                # 화면 정보 추가
-                from Orchestrator.Raven2.utils.screen_info import SCREEN_REGIONS as RAVEN2_REGIONS
-                for screen_id in ['S1', 'S2', 'S3', 'S4', 'S5']:
-                    if screen_id in RAVEN2_REGIONS:
-                        # Raven2는 ratio 파라미터도 필요할 수 있음
-                        ratio = 1.4 if screen_id == 'S5' else 1.0
-                        self.srm2.add_screen(window_id=screen_id, region=RAVEN2_REGIONS[screen_id], ratio=ratio)
-
-                print(f"INFO: SRM2 initialized with {len(self.srm2.screens)} screens")
-            except Exception as e:
-                print(f"ERROR: Failed to initialize SRM2: {e}")
-                self.srm2 = None
-        else:
-            self.srm2 = None
-
-    def _initialize_sm_components(self):
-        """실제 SM 컴포넌트 초기화"""
-        # SM1 (NightCrows)
-        if create_system_monitor:
-            try:
-                # [수정] shared_states 전달
-                self.sm1 = create_system_monitor("SM1", "VD1", orchestrator=self, shared_states=self.vd1_shared_states)
-                print("INFO: SM1 initialized successfully")
-            except Exception as e:
-                print(f"ERROR: Failed to initialize SM1: {e}")
-                self.sm1 = None
-        else:
-            self.sm1 = None
-
-        # SM2 (Raven2)
-        if create_system_monitor_raven2:
-            try:
-                # [수정] shared_states 전달
-                self.sm2 = create_system_monitor_raven2("SM2", "VD2", orchestrator=self, shared_states=self.vd2_shared_states)
-                print("INFO: SM2 initialized successfully")
-            except Exception as e:
-                print(f"ERROR: Failed to initialize SM2: {e}")
-                self.sm2 = None
-        else:
-            self.sm2 = None
+    def _prepare_vd_components(self, vd):
+        """해당 VD의 SRM/SM을 최초 1회 import·생성 (템플릿 검증 포함). 진행 중이면 끝날 때까지 대기"""
+        if vd not in self.games:
+            return
+        with self._component_lock:
+            if vd in self._prepared_vds:
+                return
+            with STARTUP.phase(f"prepare {vd.name} components"):
+                self._initialize_components(vd)
+            self._prepared_vds.add(vd)
+
+    def _prepare_vd_components_async(self, vd):
+        """VD 전환 대기 시간 동안 백그라운드로 모니터 준비. 이미 준비됐으면 None"""
+        if vd in self._prepared_vds or vd not in self.games:
+            return None
+        thread = threading.Thread(target=self._prepare_vd_components, args=(vd,),
+                                  name=f"Prepare-{vd.name}", daemon=True)
+        thread.start()
+        return thread
+
+    def _initialize_components(self, vd):
+        """해당 VD 게임의 모니터 초기화 (GAMES_CONFIG의 monitors 순서대로, srm → sm)"""
+        game = self.games[vd]
+        for spec in game.monitors:
+            factory = load_component(spec)
+            monitor = None
+            if factory:
+                try:
+                    monitor = build_monitor(game, spec, factory, orchestrator=self, io_scheduler=self.io_scheduler,
+                                            shared_states=self.shared_states[vd])
+                    screens = getattr(monitor, 'screens', None)
+                    log.info(f"{spec.monitor_id} initialized" + (f" with {len(screens)} screens" if screens else ""))
+                    self._restore_checkpoint(spec.monitor_id, monitor, vd.name)
+                except Exception as e:
+                    log.error(f"Failed to initialize {spec.monitor_id}: {e}")
+                    monitor = None
+            self.monitors[spec.key] = monitor
+
+    def _vd_monitors(self, vd):
+        """VD 게임의 (모니터 키, 인스턴스) 목록"""
+        game = self.games.get(vd)
+        return [(spec.key, self.monitors.get(spec.key)) for spec in game.monitors] if game else []
+
+    def _create_checkpoint(self):
+        """CHECKPOINT_CONFIG 기반 체크포인트 관리자 (비활성이면 None)"""
+        return CheckpointManager.from_config()
+
+    def _export_coverage(self):
+        """종료 시 화면별 커버리지 / 사각 구간 지표 저장 (COVERAGE_CONFIG['export_path'])"""
+        COVERAGE.export()
+
+    def _restore_checkpoint(self, monitor_id, monitor, vd_name):
+        """체크포인트 저장 대상으로 등록하고, 로드한 체크포인트가 있으면 모니터에 전달 (적용은 모니터 시작 시)"""
+        if self.checkpoint and monitor is not None:
+            self.checkpoint.restore(monitor_id, monitor, vd_name)
 
     def setup_schedule(self):
-        print("Setting up schedule...")
-        # Daily Present (05:00 AM)
-        schedule.every().day.at("05:00").do(self.request_scheduled_task, task_key="DP1", target_vd=VirtualDesktop.VD1)
-        schedule.every().day.at("05:10").do(self.request_scheduled_task, task_key="DP2", target_vd=VirtualDesktop.VD2)
-
-        # Mail Opener (12:00 PM / 09:00 PM)
-        schedule.every().day.at("12:00").do(self.request_scheduled_task, task_key="MO1", target_vd=VirtualDesktop.VD1)
-        schedule.every().day.at("12:02").do(self.request_scheduled_task, task_key="MO2", target_vd=VirtualDesktop.VD2)
-        schedule.every().day.at("21:00").do(self.request_scheduled_task, task_key="MO1", target_vd=VirtualDesktop.VD1)
-        schedule.every().day.at("21:02").do(self.request_scheduled_task, task_key="MO2", target_vd=VirtualDesktop.VD2)
-
-        print("Schedule setup complete.")
-        print(f"Current scheduled jobs: {len(schedule.get_jobs())}")
-
-    def request_scheduled_task(self, task_key, target_vd):
-        """Scheduler가 호출하는 함수. 실제 실행은 메인 루프에 위임."""
-        if self.pending_scheduled_task:
-            print(f"Scheduler triggered for {task_key}, but another task is pending. Ignoring for now.")
+        """게임별 예약 작업(GAMES_CONFIG의 tasks)을 타이머 힙에 등록 (시각 판정은 주입된 시계 기준 - 가상 시간 시뮬레이션 지원)"""
+        log.info("Setting up schedule...")
+        for vd, game in self.games.items():
+            for task in game.tasks:
+                catch_up = task.options.get('catch_up', SCHEDULE_CONFIG.get('catch_up', 'run_once'))
+                callback = functools.partial(self.request_scheduled_task, task_key=task.key, target_vd=vd,
+                                             repeat=catch_up == 'run_all')
+                for at in task.at:
+                    self.jobs.add_daily(f"{task.key}@{at}", at, callback,
+                                        jitter=task.options.get('jitter', SCHEDULE_CONFIG.get('jitter', 0.0)),
+                                        catch_up=catch_up,
+                                        grace=task.options.get('grace', SCHEDULE_CONFIG.get('grace', 300.0)))
+
+        log.info("Schedule setup complete.")
+        log.info(f"Current scheduled jobs: {len(self.jobs.jobs)} ({'; '.join(self.jobs.describe())})")
+
+    def request_scheduled_task(self, task_key, target_vd, repeat=False):
+        """
+        Scheduler가 호출하는 함수. 실제 실행은 메인 루프에 위임 (대기열, 같은 작업이 이미 대기 중이면 무시)
+        :param repeat: True면 이미 대기 중인 같은 작업의 실행 횟수를 늘림 (catch_up='run_all'의 놓친 실행마다 한 번씩)
+        """
+        pending = next((task for task in self.pending_scheduled_tasks if task['key'] == task_key), None)
+        if pending is not None:
+            if repeat:
+                pending['runs'] += 1
+                log.info(f"Scheduler triggered for {task_key} again - it will run {pending['runs']} times.")
+            else:
+                log.info(f"Scheduler triggered for {task_key}, but it is already pending. Ignoring.")
             return
 
-        print(f"Scheduler triggered: Task '{task_key}' for {target_vd.name} is requested.")
-        self.pending_scheduled_task = {'key': task_key, 'vd': target_vd}
+        log.info(f"Scheduler triggered: Task '{task_key}' for {target_vd.name} is requested.")
+        self.pending_scheduled_tasks.append({'key': task_key, 'vd': target_vd, 'runs': 1})
+        self._wake.set()
 
     def _start_monitor_thread(self, monitor_key, monitor_instance):
         """모니터 스레드 시작 (중복 실행 방지 포함)"""
         # None 체크 추가
         if monitor_instance is None:
-            print(f"Skipping monitor thread start for {monitor_key}: instance is None")
+            log.info(f"Skipping monitor thread start for {monitor_key}: instance is None")
             return
 
-        if monitor_key in self.active_monitors and self.active_monitors[monitor_key]['thread'].is_alive():
-            return
+        with self._monitor_lock:
+            if monitor_key in self.active_monitors and self.active_monitors[monitor_key]['thread'].is_alive():
+                return
 
-        print(f"Starting monitor thread: {monitor_key}")
-        stop_event = threading.Event()
-        thread = threading.Thread(target=monitor_instance.run_loop, args=(stop_event,), daemon=True)
-        self.active_monitors[monitor_key] = {'thread': thread, 'stop_event': stop_event, 'instance': monitor_instance}
-        thread.start()
+            log.info(f"Starting monitor thread: {monitor_key}")
+            stop_event = threading.Event()
+            if self.async_runtime:
+                # 화면별 코루틴 (핸들은 스레드처럼 is_alive()/join() 지원)
+                thread = self.async_runtime.start_monitor(monitor_key, monitor_instance, stop_event)
+            else:
+                thread = threading.Thread(target=monitor_instance.run_loop, args=(stop_event,), daemon=True)
+                thread.start()
+            self.active_monitors[monitor_key] = {'thread': thread, 'stop_event': stop_event,
+                                                 'instance': monitor_instance}
+            # 틱이 예산을 넘겨 멈추면 워치독이 이 모니터를 재시작
+            WATCHDOG.register(getattr(monitor_instance, 'monitor_id', monitor_key),
+                              restart=lambda: self._restart_monitor_thread(monitor_key))
+
+    def _restart_monitor_thread(self, monitor_key):
+        """워치독 콜백: 멈춘 모니터 스레드는 stop_event만 설정하고 버린 뒤 같은 인스턴스로 새로 시작"""
+        with self._monitor_lock:
+            monitor_info = self.active_monitors.pop(monitor_key, None)
+            if monitor_info is None:
+                return  # 이미 중지됨 (VD 전환 등)
+            monitor_info['stop_event'].set()
+            log.warning(f"[Watchdog] Abandoning stalled monitor thread: {monitor_key}")
+            self._start_monitor_thread(monitor_key, monitor_info['instance'])
 
     def _stop_monitor_thread(self, monitor_key):
         """모니터 스레드 중지"""
-        if monitor_key in self.active_monitors:
-            monitor_info = self.active_monitors[monitor_key]
-            thread = monitor_info['thread']
-            stop_event = monitor_info['stop_event']
-            instance = monitor_info['instance']
-
-            if thread.is_alive():
-                print(f"Stopping monitor thread: {monitor_key}")
-                stop_event.set()
-                if hasattr(instance, 'stop'):
-                    try:
-                        instance.stop()
-                    except Exception as e:
-                        print(f"Error calling stop() for {monitor_key}: {e}")
-                thread.join(timeout=10)
+        with self._monitor_lock:
+            if monitor_key in self.active_monitors:
+                monitor_info = self.active_monitors[monitor_key]
+                thread = monitor_info['thread']
+                stop_event = monitor_info['stop_event']
+                instance = monitor_info['instance']
+                WATCHDOG.unregister(getattr(instance, 'monitor_id', monitor_key))  # 정상 중지는 재시작 대상 아님
+
                 if thread.is_alive():
-                    print(f"Warning: Monitor {monitor_key} did not stop gracefully after 10 seconds.")
-            del self.active_monitors[monitor_key]
+                    log.info(f"Stopping monitor thread: {monitor_key}")
+                    stop_event.set()
+                    if hasattr(instance, 'stop'):
+                        try:
+                            instance.stop()
+                        except Exception as e:
+                            log.error(f"Error calling stop() for {monitor_key}: {e}")
+                    thread.join(timeout=10)
+                    if thread.is_alive():
+                        log.warning(f"Monitor {monitor_key} did not stop gracefully after 10 seconds.")
+                del self.active_monitors[monitor_key]
 
     def set_focus(self, vd_to_focus, new_state):
         """VD 포커스 설정 및 관련 모니터 관리"""
         if self.current_focus == vd_to_focus and self.active_state == new_state:
             return
 
-        print(f"--- Setting focus: VD={vd_to_focus.name}, State={new_state.name} ---")
+        log.info(f"--- Setting focus: VD={vd_to_focus.name}, State={new_state.name} ---")
         previous_focus = self.current_focus
+        if self.active_state == ActiveState.MONITORING:
+            self.vd_left_at[previous_focus] = clock.time()
         self.active_state = ActiveState.SWITCHING
+        monitoring = new_state == ActiveState.MONITORING
+        if monitoring:
+            self._prepare_vd_components_async(vd_to_focus)  # 아래 VD 전환 대기와 병행
 
         # 1. 이전 포커스 VD의 모니터 중지 및 완전 종료 대기
         if previous_focus:
-            if previous_focus == VirtualDesktop.VD1:
-                self._stop_monitor_thread('srm1')
-                self._stop_monitor_thread('sm1')
-            elif previous_focus == VirtualDesktop.VD2:
-                self._stop_monitor_thread('srm2')
-                self._stop_monitor_thread('sm2')
+            for monitor_key, _ in self._vd_monitors(previous_focus):
+                self._stop_monitor_thread(monitor_key)
 
-            print("INFO: Waiting for monitor threads to fully terminate...")
-            time.sleep(3.0)  # 모니터 스레드 완전 종료 대기
+            log.info("Waiting for monitor threads to fully terminate...")
+            clock.sleep(3.0)  # 모니터 스레드 완전 종료 대기
 
         # 2. 깨끗한 환경에서 VD 전환
         if self.vd_manager:
             current_actual_vd = self.vd_manager.get_current_vd()
             if current_actual_vd != vd_to_focus and vd_to_focus != VirtualDesktop.OTHER:
-                print(f"Clean VD switch: {current_actual_vd.name} → {vd_to_focus.name}")
+                log.info(f"Clean VD switch: {current_actual_vd.name} → {vd_to_focus.name}")
                 self.vd_manager.switch_to(vd_to_focus)
-                time.sleep(2.0)  # VD 전환 완료 대기
+                clock.sleep(2.0)  # VD 전환 완료 대기
 
                 # VD 전환 성공 여부 확인
                 after_vd = self.vd_manager.get_current_vd()
                 if after_vd == vd_to_focus:
-                    print(f"SUCCESS: VD switch to {vd_to_focus.name} completed")
+                    log.info(f"SUCCESS: VD switch to {vd_to_focus.name} completed")
                 else:
-                    print(f"FAILED: VD switch failed. Still at {after_vd.name}")
+                    log.error(f"FAILED: VD switch failed. Still at {after_vd.name}")
             else:
-                time.sleep(0.5)
+                clock.sleep(0.5)
         else:
-            print("Warning: VDManager not available. Skipping VD switch.")
-            time.sleep(1)
+            log.warning("VDManager not available. Skipping VD switch.")
+            clock.sleep(1)
 
         self.current_focus = vd_to_focus
 
         # 3. 새 상태에 따른 모니터 시작
-        if new_state == ActiveState.MONITORING_VD1:
-            self._start_monitor_thread('srm1', self.srm1)
-            self._start_monitor_thread('sm1', self.sm1)
-        elif new_state == ActiveState.MONITORING_VD2:
-            self._start_monitor_thread('srm2', self.srm2)
-            self._start_monitor_thread('sm2', self.sm2)
+        if monitoring:
+            self._prepare_vd_components(vd_to_focus)  # 백그라운드 준비가 남아 있으면 완료 대기
+            monitors = [monitor for _, monitor in self._vd_monitors(vd_to_focus)]
+            COVERAGE.attach(vd_to_focus.name, monitors, self._get_shared_states(vd_to_focus).keys())
+            for monitor_key, monitor in self._vd_monitors(vd_to_focus):
+                self._start_monitor_thread(monitor_key, monitor)
+        if monitoring and self.checkpoint:
+            # 첫 모니터링 시작 → 모든 화면이 정상 상태가 될 때까지 시간 (웜/콜드 비교)
+            self.checkpoint.watch_steady_state(vd_to_focus.name, self._get_shared_states(vd_to_focus), monitors)
 
         self.active_state = new_state
-        self.last_focus_switch_time = time.time()
-        print(f"--- Focus set: VD={self.current_focus.name}, State={self.active_state.name} ---")
+        self.last_focus_switch_time = clock.time()
+        log.info(f"--- Focus set: VD={self.current_focus.name}, State={self.active_state.name} ---")
+        if monitoring:
+            STARTUP.finish("first monitoring")
 
     def _execute_task(self, task_info):
         """예약된 작업을 별도 프로세스로 실행"""
         task_key = task_info['key']
         target_vd = task_info['vd']
-        task_main_py = COMPONENT_PATHS.get(task_key)
+        task_main_py = self.task_paths.get(task_key)
 
         # 디버그 로그 추가
-        print(f"DEBUG: task_key = {task_key}")
-        print(f"DEBUG: task_main_py = {task_main_py}")
-        print(f"DEBUG: task_main_py.parent = {task_main_py.parent}")
-        print(f"DEBUG: task_main_py.exists() = {task_main_py.exists()}")
+        log.debug(f"task_key = {task_key}")
+        log.debug(f"task_main_py = {task_main_py}")
 
         if not task_main_py or not task_main_py.exists():
-            print(f"Error: main.py path not found or invalid for task '{task_key}': {task_main_py}")
-            new_monitoring_state = ActiveState.MONITORING_VD1 if target_vd == VirtualDesktop.VD1 else ActiveState.MONITORING_VD2
-            self.set_focus(target_vd, new_monitoring_state)
+            log.error(f"main.py path not found or invalid for task '{task_key}': {task_main_py}")
+            self.set_focus(target_vd, ActiveState.MONITORING)
             return
 
-        task_state = ActiveState.EXECUTING_TASK_VD1 if target_vd == VirtualDesktop.VD1 else ActiveState.EXECUTING_TASK_VD2
-        self.active_state = task_state
-        print(f"--- Executing Task: {task_key} on {target_vd.name} ---")
-        print(f"Running command: python \"{task_main_py}\"")
+        self.active_state = ActiveState.EXECUTING_TASK
+        log.info(f"--- Executing Task: {task_key} on {target_vd.name} ---")
+        log.info(f"Running command: python \"{task_main_py}\"")
 
-        start_time = time.time()
+        start_time = clock.time()
         try:
-            process = subprocess.run([sys.executable, str(task_main_py)],
-                                     check=True,
-                                     capture_output=True,
-                                     text=True,
-                                     encoding='utf-8'
-                                     )
-            print(f"Task '{task_key}' completed successfully.")
-            print(f"Output:\n{process.stdout}")
+            self._run_task_process(task_key, task_main_py)
         except FileNotFoundError:
-            print(f"Error: Python executable not found at '{sys.executable}'")
+            log.error(f"Python executable not found at '{sys.executable}'")
         except subprocess.CalledProcessError as e:
-            print(f"Error running task '{task_key}': Process returned non-zero exit code {e.returncode}")
-            print(f"Stderr:\n{e.stderr}")
+            log.error(f"Error running task '{task_key}': Process returned non-zero exit code {e.returncode}")
+            log.error(f"Stderr:\n{e.stderr}")
         except Exception as e:
-            print(f"An unexpected error occurred while running task '{task_key}': {e}")
-            import traceback
-            traceback.print_exc()
+            log.exception(f"An unexpected error occurred while running task '{task_key}': {e}")
         finally:
-            end_time = time.time()
-            print(f"Task '{task_key}' finished in {end_time - start_time:.2f} seconds.")
+            end_time = clock.time()
+            log.info(f"Task '{task_key}' finished in {end_time - start_time:.2f} seconds.")
 
             # next_task가 있는지 확인
             if hasattr(self, 'next_task') and self.next_task:
-                print(f"Executing next task: {self.next_task['key']}")
+                log.info(f"Executing next task: {self.next_task['key']}")
                 next_task_info = self.next_task
                 self.next_task = None  # 중복 실행 방지
 
                 # 즉시 다음 작업 실행
-                next_task_state = ActiveState.EXECUTING_TASK_VD1 if next_task_info[
-                                                                        'vd'] == VirtualDesktop.VD1 else ActiveState.EXECUTING_TASK_VD2
-                self.set_focus(next_task_info['vd'], next_task_state)
+                self.set_focus(next_task_info['vd'], ActiveState.EXECUTING_TASK)
                 self._execute_task(next_task_info)
             else:
                 # 기존 로직: 모니터링으로 복귀
-                new_monitoring_state = ActiveState.MONITORING_VD1 if target_vd == VirtualDesktop.VD1 else ActiveState.MONITORING_VD2
-                self.set_focus(target_vd, new_monitoring_state)
+                self.set_focus(target_vd, ActiveState.MONITORING)
+
+    def _run_task_process(self, task_key, task_main_py):
+        """작업 main.py를 별도 프로세스로 실행 (실패 시 예외는 _execute_task에서 처리)"""
+        process = subprocess.run([sys.executable, str(task_main_py)],
+                                 check=True,
+                                 capture_output=True,
+                                 text=True,
+                                 encoding='utf-8'
+                                 )
+        log.info(f"Task '{task_key}' completed successfully.")
+        log.info(f"Output:\n{process.stdout}")
+
+    def _on_io_done(self, component, screen_id, priority, wait_ms, run_ms, ok):
+        """IOScheduler observer: 조기 양보의 '조용함' 판정용 + IO가 끝났으니 메인 루프가 전환 여부를 다시 판단"""
+        self.last_io_at = clock.time()
+        self._wake.set()
+
+    def _on_state_change(self, new_record, old_record):
+        """공유 상태 구독: 화면 상태가 바뀌면 메인 루프가 전환 안전성 / 조기 양보를 다시 판단"""
+        self._wake.set()
+
+    def stop(self):
+        """메인 루프 종료 요청 (잠들어 있어도 즉시 깨어나 shutdown)"""
+        self.main_loop_stop.set()
+        self._wake.set()
+
+    def _next_vd(self, now: float):
+        """다음에 볼 VD: 현재 VD를 뺀 VD 중 가장 오래 못 본 VD (같으면 등록 순서). 게임이 하나면 None"""
+        candidates = [vd for vd in self.games if vd != self.current_focus]
+        if not candidates:
+            return None
+        return max(candidates, key=lambda vd: now - self.vd_left_at.get(vd, self.start_time))
+
+    def _early_yield_in(self, now: float, duration_on_current_vd: float, next_vd):
+        """
+        남은 시간 분할을 양보하고 next_vd로 가기까지 남은 시간 (SWITCH_CONFIG['early_yield'], 0 이하면 지금).
+        히스테리시스: 전환 후 min_dwell초는 머물고, 현재 VD의 모든 화면이 정상 상태(NORMAL/SLEEP/AWAKE)이며
+        IO가 없는 상태가 quiet_period초 이어져야 하고(사건이 생기면 처음부터), next_vd의 사각 시간이 other_blind_min초 이상.
+        비활성이거나 정상 상태가 아닌 화면이 있으면 None (상태가 바뀌면 메인 루프가 다시 계산)
+        """
+        cfg = self.early_yield
+        if next_vd is None or not cfg.get('enabled', False):
+            return None
+
+        quiet_since = max(self.last_focus_switch_time, self.last_io_at)
+        store = self._get_shared_states(self.current_focus)
+        for screen_id in store.keys():
+            record = store.get_record(screen_id)
+            if record is None:
+                continue
+            if getattr(record.state, 'name', None) not in BASELINE_STATES:
+                return None
+            quiet_since = max(quiet_since, record.timestamp)
+        return max(cfg.get('min_dwell', 60.0) - duration_on_current_vd,
+                   cfg.get('other_blind_min', 90.0) - (now - self.vd_left_at.get(next_vd, self.start_time)),
+                   cfg.get('quiet_period', 60.0) - (now - quiet_since))
+
+    def _early_yield_due(self, now: float, duration_on_current_vd: float, next_vd) -> bool:
+        """남은 시간 분할을 지금 양보할지 (_early_yield_in 참고)"""
+        remaining = self._early_yield_in(now, duration_on_current_vd, next_vd)
+        return remaining is not None and remaining <= 0
+
+    def _main_loop_timeout(self, now: float):
+        """
+        메인 루프가 다음에 스스로 깨어날 때까지의 시간: 다음 예약 작업 / 시간 분할 만료 / 조기 양보 / 최대 전환 지연 중
+        가장 이른 것 (그 사이의 상태 변화·IO 완료·작업 요청·종료는 _wake로 깨움). 깰 일이 없으면 None (무기한)
+        """
+        deadlines = []
+        due = self.jobs.next_due()
+        if due is not None:
+            deadlines.append(due - now)
+        if self.io_scheduler.lock.locked():
+            deadlines.append(IO_BUSY_LOG_INTERVAL)
+        if self.checkpoint and self.checkpoint.watching:
+            deadlines.append(1.0)  # 정상 상태 도달 확인 (모니터 틱 진행은 알림이 없음)
+        if self.active_state == ActiveState.MONITORING:
+            next_vd = self._next_vd(now)
+            if next_vd is not None:
+                duration_on_current_vd = now - self.last_focus_switch_time
+                slice_left = self.slice_durations.get(self.current_focus, 0) - duration_on_current_vd
+                # 만료 전이면 만료 시각, 만료 후 전환이 미뤄지는 중이면 강제 전환 시각
+                deadlines.append(slice_left if slice_left > 0 else slice_left + MAX_SWITCH_DELAY)
+                yield_in = self._early_yield_in(now, duration_on_current_vd, next_vd)
+                if yield_in is not None:
+                    deadlines.append(yield_in)
+        return max(0.0, min(deadlines)) if deadlines else None
 
     def _check_vd_switch_safety(self) -> bool:
         """현재 활성 SRM의 상태를 체크해서 VD 전환 가능 여부 판단"""
         try:
-            current_srm = self.srm1 if self.current_focus == VirtualDesktop.VD1 else self.srm2
+            game = self.games.get(self.current_focus)
+            srm_spec = game.monitor('srm') if game else None
+            current_srm = self.monitors.get(srm_spec.key) if srm_spec else None
 
             # None이거나 screens 속성이 없는 경우 항상 전환 허용
             if current_srm is None or not hasattr(current_srm, 'screens'):
@@ -424,38 +541,50 @@ class Orchestrator:
             # 위험한 상태들 정의
             critical_states = ['HOSTILE', 'DEAD', 'RECOVERING', 'RETURNING', 'BUYING_POTIONS']
 
-            # 위험 상태인 화면 개수 체크
+            # 위험 상태인 화면 개수 체크 (공유 상태 저장소의 일관된 스냅샷 사용)
             critical_count = 0
-            for screen in current_srm.screens:
-                # [수정] shared_states에서 상태 조회
-                screen_state = screen.current_state # 프로퍼티 사용
+            for screen_state in self._get_shared_states(self.current_focus).values():
                 if hasattr(screen_state, 'name') and screen_state.name in critical_states:
                     critical_count += 1
 
             if critical_count > 0:
-                print(f"INFO: VD switch delayed - {critical_count} screen(s) in critical state")
+                log.info(f"VD switch delayed - {critical_count} screen(s) in critical state")
                 return False
 
             return True
 
         except Exception as e:
-            print(f"WARN: Error checking VD switch safety: {e}. Allowing switch.")
+            log.warning(f"Error checking VD switch safety: {e}. Allowing switch.")
             return True
 
-    def run_orchestration_loop(self,start_vd: str = "VD1"):
+    def run_orchestration_loop(self, start_vd: str = None):
         """
         메인 오케스트레이션 루프
-        :param start_vd: 시작할 가상 데스크톱 ("VD1" or "VD2")
+        :param start_vd: 시작할 가상 데스크톱 이름 (기본: GAMES_CONFIG의 첫 VD)
         """
         if not self.vd_manager:
-            print("Critical Error: VDManager is not available. Orchestrator cannot run.")
+            log.error("Critical Error: VDManager is not available. Orchestrator cannot run.")
             return
 
         stop_event_for_io = threading.Event()
         self.io_scheduler.start(stop_event_for_io)
-
-        print(f"Orchestrator starting main loop... (Start Target: {start_vd})")
-        self.pending_scheduled_task = None
+        WATCHDOG.register(IO_WORKER, restart=self.io_scheduler.restart_worker)
+        WATCHDOG.start()
+        if self.transition_journal:
+            self.transition_journal.start()
+        if self.session_recorder:
+            self.session_recorder.start()
+        if self.checkpoint:
+            self.checkpoint.start()
+        COVERAGE.start()
+        # 프로파일러 제어 명령 (logs/profiler.cmd) - 메인 루프는 다음 할 일까지 잠들므로 별도 스레드
+        start_control_watcher(stop_event_for_io)
+
+        log.info(f"Orchestrator starting main loop... (Start Target: {start_vd})")
+        self.pending_scheduled_tasks.clear()
+        if not self.games:
+            log.error("Critical Error: No games registered (GAMES_CONFIG). Orchestrator cannot run.")
+            return
 
         # 로그 제어 변수들
         io_busy_logged = False
@@ -463,34 +592,36 @@ class Orchestrator:
         last_busy_log = None
 
         self.focus_monitor.start()
-        print(f"Orchestrator starting main loop... (Start Target: {start_vd})")
+        log.info(f"Orchestrator starting main loop... (Start Target: {start_vd})")
 
-        # 🚀 [수정됨] 시작 VD 분기 처리
-        if start_vd == "VD2":
-            print(">>> [TEST MODE] Starting immediately with VD2 (Raven2) <<<")
-            self.set_focus(VirtualDesktop.VD2, ActiveState.MONITORING_VD2)
-        else:
-            print(">>> Starting with VD1 (NightCrows) <<<")
-            self.set_focus(VirtualDesktop.VD1, ActiveState.MONITORING_VD1)
+        # 🚀 시작 VD (등록되지 않은 이름이면 첫 VD)
+        first_vd = next(iter(self.games))
+        start = next((vd for vd in self.games if vd.name == start_vd), first_vd)
+        log.info(f">>> Starting with {start.name} ({self.games[start].name}) <<<")
+        self.set_focus(start, ActiveState.MONITORING)
 
-        while True:
+        while not self.main_loop_stop.is_set():
             try:
-                # 1. 스케줄 확인 및 실행 요청 설정
-                schedule.run_pending()
+                self._wake.clear()  # 이번 판단 이후의 변화만 다음 대기를 깨움
+                if self.checkpoint:
+                    self.checkpoint.poll_steady_state()
+
+                # 1. 실행 시각이 된 예약 작업을 대기열에 (놓친 실행은 catch_up 정책대로)
+                self.jobs.run_due()
 
                 # 2. 요청된 예약 작업 처리 (최우선)
-                if self.pending_scheduled_task:
+                if self.pending_scheduled_tasks:
                     with self.task_execution_lock:
-                        if self.pending_scheduled_task:
-                            task_info = self.pending_scheduled_task
-                            self.pending_scheduled_task = None
+                        if self.pending_scheduled_tasks:
+                            task_info = self.pending_scheduled_tasks.popleft()
+                            if task_info.get('runs', 1) > 1:
+                                # catch_up='run_all'로 누적된 나머지 실행은 맨 앞에 남김 (다음 반복에서 바로 실행)
+                                self.pending_scheduled_tasks.appendleft(dict(task_info, runs=task_info['runs'] - 1))
 
-                            target_vd = task_info['vd']
-                            task_state = ActiveState.EXECUTING_TASK_VD1 if target_vd == VirtualDesktop.VD1 else ActiveState.EXECUTING_TASK_VD2
-                            self.set_focus(target_vd, task_state)
+                            self.set_focus(task_info['vd'], ActiveState.EXECUTING_TASK)
                             self._execute_task(task_info)
 
-                            time.sleep(1)
+                            clock.sleep(1)
                             continue
 
                 # 3. IO 작업 상태 체크
@@ -499,138 +630,149 @@ class Orchestrator:
                 if io_is_busy:
                     # IO 작업 시작 감지
                     if not io_busy_logged:
-                        io_busy_start = time.time()
+                        io_busy_start = clock.time()
                         last_busy_log = io_busy_start
-                        print(f"INFO: [Orchestrator] IO operations in progress - VD switch paused")
+                        log.info(f"[Orchestrator] IO operations in progress - VD switch paused")
                         io_busy_logged = True
 
-                    # 5초마다 진행 상황 요약
-                    now = time.time()
-                    if now - last_busy_log >= 10.0:
+                    # IO_BUSY_LOG_INTERVAL마다 진행 상황 요약
+                    now = clock.time()
+                    if now - last_busy_log >= IO_BUSY_LOG_INTERVAL:
                         elapsed = int(now - io_busy_start)
-                        print(f"INFO: [Orchestrator] IO still busy ({elapsed}s elapsed)")
+                        log.info(f"[Orchestrator] IO still busy ({elapsed}s elapsed)")
                         last_busy_log = now
 
                 else:
                     # IO 작업 완료 감지
                     if io_busy_logged:
-                        elapsed = time.time() - io_busy_start
-                        print(f"INFO: [Orchestrator] IO operations completed ({elapsed:.1f}s total)")
+                        elapsed = clock.time() - io_busy_start
+                        log.info(f"[Orchestrator] IO operations completed ({elapsed:.1f}s total)")
                         io_busy_logged = False
                         io_busy_start = None
 
                     # IO 작업이 없을 때만 시간 분할 로직 실행
-                    if self.active_state in [ActiveState.MONITORING_VD1, ActiveState.MONITORING_VD2]:
-                        now = time.time()
+                    if self.active_state == ActiveState.MONITORING:
+                        now = clock.time()
                         duration_on_current_vd = now - self.last_focus_switch_time
-                        switch_needed = False
-                        next_vd = None
-                        current_slice_duration = 0
-
-                        if self.active_state == ActiveState.MONITORING_VD1:
-                            current_slice_duration = self.vd1_slice_duration
-                            if duration_on_current_vd > current_slice_duration:
-                                switch_needed = True
-                                next_vd = VirtualDesktop.VD2
-                        elif self.active_state == ActiveState.MONITORING_VD2:
-                            current_slice_duration = self.vd2_slice_duration
-                            if duration_on_current_vd > current_slice_duration:
-                                switch_needed = True
-                                next_vd = VirtualDesktop.VD1
+                        current_slice_duration = self.slice_durations.get(self.current_focus, 0)
+                        next_vd = self._next_vd(now)  # 가장 오래 못 본 VD (게임이 하나면 None → 전환 없음)
+                        switch_needed = next_vd is not None and duration_on_current_vd >= current_slice_duration
+
+                        early_yield = False
+                        if not switch_needed and self._early_yield_due(now, duration_on_current_vd, next_vd):
+                            switch_needed = early_yield = True
 
                         if switch_needed:
                             # 게임 상황을 고려한 안전 체크
                             total_elapsed = now - self.start_time
                             safety_check = self._check_vd_switch_safety()
 
-                            if safety_check:
-                                print(f"INFO: [T+{total_elapsed:.0f}s] All screens in safe state - ready for VD switch")
+                            if safety_check and early_yield:
+                                # quiet_period 동안 이미 조용했으므로 카운트다운 없이 전환
+                                log.info(f"[T+{total_elapsed:.0f}s] {self.current_focus.name} quiet - yielding "
+                                         f"{current_slice_duration - duration_on_current_vd:.0f}s of its slice "
+                                         f"to {next_vd.name}")
+                                self.switch_counts['early_yield'] += 1
+                                self.set_focus(next_vd, ActiveState.MONITORING)
+                            elif safety_check:
+                                log.info(f"[T+{total_elapsed:.0f}s] All screens in safe state - ready for VD switch")
 
                                 # 카운트다운 시작
-                                print(f"INFO: Switching to {next_vd.name} in 5 seconds...")
+                                log.info(f"Switching to {next_vd.name} in 5 seconds...")
                                 for i in range(5, 0, -1):
-                                    print(f"      {i}...")
-                                    time.sleep(1)
+                                    log.info(f"      {i}...")
+                                    clock.sleep(1)
 
-                                print(
-                                    f"INFO: Time slice expired on {self.current_focus.name} after {duration_on_current_vd:.0f}s. Switching NOW to {next_vd.name}")
-                                next_state = ActiveState.MONITORING_VD1 if next_vd == VirtualDesktop.VD1 else ActiveState.MONITORING_VD2
-                                self.set_focus(next_vd, next_state)
+                                log.info(
+                                    f"Time slice expired on {self.current_focus.name} after {duration_on_current_vd:.0f}s. Switching NOW to {next_vd.name}")
+                                self.switch_counts['slice'] += 1
+                                self.set_focus(next_vd, ActiveState.MONITORING)
                             else:
-                                print(
-                                    f"INFO: [T+{total_elapsed:.0f}s] VD switch delayed - critical operations detected")
-                                # 최대 지연 시간 체크 (15분 추가 대기)
-                                max_delay = current_slice_duration + 900  # +15분
-                                if duration_on_current_vd > max_delay:
-                                    print(
-                                        f"WARN: [T+{total_elapsed:.0f}s] Max delay reached ({duration_on_current_vd:.0f}s). Force switching to {next_vd.name}")
-                                    next_state = ActiveState.MONITORING_VD1 if next_vd == VirtualDesktop.VD1 else ActiveState.MONITORING_VD2
-                                    self.set_focus(next_vd, next_state)
-
-                time.sleep(1)
+                                log.info(
+                                    f"[T+{total_elapsed:.0f}s] VD switch delayed - critical operations detected")
+                                # 화면 상태가 바뀌면 다시 판단 (아래 대기가 _wake로 깨어남), 최대 지연 시간 체크 (15분 추가 대기)
+                                max_delay = current_slice_duration + MAX_SWITCH_DELAY
+                                if duration_on_current_vd >= max_delay:
+                                    log.warning(
+                                        f"[T+{total_elapsed:.0f}s] Max delay reached ({duration_on_current_vd:.0f}s). Force switching to {next_vd.name}")
+                                    self.switch_counts['forced'] += 1
+                                    self.set_focus(next_vd, ActiveState.MONITORING)
+
+                # 다음 할 일(예약 작업 / 시간 분할 만료 / 조기 양보)까지 잠듦 - 상태 변화·IO 완료·작업 요청·stop()은 즉시 깨움
+                if not self.main_loop_stop.is_set():
+                    clock.wait(self._wake, self._main_loop_timeout(clock.time()))
 
             except KeyboardInterrupt:
-                print("KeyboardInterrupt received. Shutting down Orchestrator...")
+                log.info("KeyboardInterrupt received. Shutting down Orchestrator...")
                 stop_event_for_io.set()
                 break
             except Exception as e:
-                print(f"!!! Unhandled exception in main loop: {e} !!!")
-                import traceback
-                traceback.print_exc()
-                time.sleep(5)
+                log.exception(f"!!! Unhandled exception in main loop: {e} !!!")
+                clock.sleep(5)
 
+        stop_event_for_io.set()
         self.shutdown()
 
+    def _get_shared_states(self, vd) -> SharedStateStore:
+        """VD별 공유 상태 저장소 반환"""
+        return self.shared_states[vd]
+
     def request_io(self, component, screen_id, action, priority=Priority.NORMAL):
         """컴포넌트들이 호출할 IO 요청 메서드"""
         self.io_scheduler.request(component, screen_id, action, priority)
 
     def report_system_error(self, monitor_id: str, screen_id: str):
+        """
+        SM이 화면 오류를 보고. 같은 게임의 SRM이 스스로 처리 중인 상태(GAMES_CONFIG의 safe_states)면 무시(True),
+        아니면 SRM에 해당 화면 초기화를 지시(False)
+        """
         try:
-            # === [NightCrows: SRM1] ===
-            if monitor_id == "SM1" and self.srm1:
-                # [수정] 공유 상태를 직접 확인
-                srm_state = self.vd1_shared_states.get(screen_id)
-
-                if srm_state in [NC_ScreenState.BUYING_POTIONS, NC_ScreenState.RETURNING]:
-                    print(
-                        f"Orchestrator: SM1 reported error on {screen_id}, but SRM1 is in a 'safe' state ({srm_state.name}). Ignoring report.")
-                    return True
-
-                print(
-                    f"Orchestrator: SM1 reported a REAL error on {screen_id} (SRM State: {srm_state}). Forcing SRM1 to reset.")
-                self.srm1.force_reset_screen(screen_id)
+            vd, game = next(((vd, game) for vd, game in self.games.items()
+                             if any(m.monitor_id == monitor_id for m in game.monitors)), (None, None))
+            srm_spec = game.monitor('srm') if game else None
+            srm = self.monitors.get(srm_spec.key) if srm_spec else None
+            if srm is None:
                 return False
 
-            # === [Raven2: SRM2] ===
-            elif monitor_id == "SM2" and self.srm2:
-                # [수정] 공유 상태를 직접 확인
-                srm_state = self.vd2_shared_states.get(screen_id)
-
-                safe_states = [
-                    R2_ScreenState.SAFE_ZONE,
-                    R2_ScreenState.ABNORMAL
-                ]
-
-                if srm_state in safe_states:
-                    print(
-                        f"Orchestrator: SM2 reported error on {screen_id}, but SRM2 is in a 'safe' state ({srm_state.name}). Ignoring report.")
-                    return True
+            # 공유 상태를 직접 확인
+            srm_state = self.shared_states[vd].get(screen_id)
+            state_name = getattr(srm_state, 'name', None)
+            if state_name in game.safe_states:
+                log.info(
+                    f"Orchestrator: {monitor_id} reported error on {screen_id}, but {srm_spec.monitor_id} is in a 'safe' state ({state_name}). Ignoring report.")
+                return True
 
-                print(
-                    f"Orchestrator: SM2 reported error on {screen_id} (State: {srm_state}). Forcing SRM2 to reset screen.")
-                self.srm2.force_reset_screen(screen_id)
-                return False
+            log.info(
+                f"Orchestrator: {monitor_id} reported a REAL error on {screen_id} (SRM State: {srm_state}). Forcing {srm_spec.monitor_id} to reset.")
+            srm.force_reset_screen(screen_id)
+            return False
 
         except Exception as e:
-            print(f"ERROR: [Orchestrator] Failed during report_system_error handling: {e}")
+            log.error(f"[Orchestrator] Failed during report_system_error handling: {e}")
             return False
+
     def shutdown(self):
         """오케스트레이터 종료 시 정리 작업"""
         if self.focus_monitor:
             self.focus_monitor.stop()
-        print("Shutting down Orchestrator...")
+        log.info("Shutting down Orchestrator...")
         for key in list(self.active_monitors.keys()):
             self._stop_monitor_thread(key)
-        schedule.clear()
-        print("Orchestrator shutdown complete.")
\ No newline at end of file
+        self.jobs.clear()
+        if self.async_runtime:
+            self.async_runtime.stop()
+        if self.transition_journal:
+            self.transition_journal.stop()
+        if self.session_recorder:
+            self.session_recorder.stop()
+        if self.checkpoint:
+            self.checkpoint.stop()
+        self._export_coverage()
+        if self.switch_counts:
+            log.info(f"VD switches by reason: {dict(self.switch_counts)}")
+        WAIT_STATS.print_report()  # wait_for 라벨별 UI 등장 시간 (기록이 없으면 출력 없음)
+        WATCHDOG.stop()
+        SAMPLER.stop()
+        if PROFILER.enabled:
+            PROFILER.print_report()
+        log.info("Orchestrator shutdown complete.")
\ No newline at end of file
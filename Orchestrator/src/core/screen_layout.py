@@ -0,0 +1,182 @@
+# Orchestrator/src/core/screen_layout.py
+# 화면 배치(레이아웃)를 데이터로 - VD 하나에 S1~S5보다 많은 클라이언트 (큰 모니터 / 여러 모니터)
+#
+# 게임의 screen_info 모듈(SCREEN_REGIONS / FIXED_UI_COORDS / EVENT_UI_REGIONS)이 기본 배치이고,
+# 배치 파일(GAMES_CONFIG의 'layout', JSON)로 화면을 옮기거나 추가하거나 뺍니다:
+#   {"screens": {"S6": {"region": [1920, 0, 766, 346], "like": "S1"},
+#                "S2": {"region": [770, 0, 840, 378]}},
+#    "remove": ["S4"]}
+#   "replace": true 이면 screens에 없는 기존 화면은 모두 뺌
+# - like: 새 화면이 따라 할 기존 화면
+#       UI 좌표(FIXED_UI_COORDS, 화면 기준 상대 좌표)와 이벤트 UI 영역(절대 좌표)은 크기 비율로 옮겨 복사,
+#       화면별 템플릿 표(GAMES_CONFIG의 templates)와 add_screen 추가 인자(screen_options)는 그대로 복사
+#       템플릿은 같은 해상도에서만 맞으므로 like는 같은 크기의 화면으로 (다르면 경고)
+# - 기존 화면은 like와 관계없이 이동/크기 변경만 (자기 UI 좌표를 크기 비율로 옮김)
+# - 화면 순서는 자연 정렬 (S1, S2, ..., S10) - screen_ids()
+# - grid_layout(): N개 화면을 모니터(들)에 격자로 배치 (배치 파일 초안 / 확장성 벤치마크)
+#       python -m Orchestrator.sim.scaling --game nightcrows --screens 5,8,10,12
+
+import importlib
+import json
+import math
+import re
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+Region = Tuple[int, int, int, int]
+
+SCALE_TOLERANCE = 0.02  # like 화면과 크기가 이 비율 이상 다르면 템플릿 해상도 경고
+DEFAULT_DISPLAY: Region = (0, 0, 1920, 1080)
+
+_applied = set()  # 배치 파일을 적용한 screen_info 모듈
+
+
+def screen_sort_key(screen_id: str):
+    """'S10'이 'S2' 뒤에 오도록 숫자 부분을 정수로 비교"""
+    return [int(part) if part.isdigit() else part for part in re.split(r'(\d+)', screen_id)]
+
+
+def screen_ids(regions: Iterable[str]) -> List[str]:
+    """화면 ID 목록 (자연 정렬)"""
+    return sorted(regions, key=screen_sort_key)
+
+
+def load_layout(path: Path) -> Dict:
+    """배치 파일(JSON) 로드 + 형식 검사"""
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    for screen_id, entry in data.get('screens', {}).items():
+        region = entry.get('region')
+        if not isinstance(region, (list, tuple)) or len(region) != 4:
+            raise ValueError(f"[Layout] {path}: {screen_id} needs region [x, y, w, h]")
+    return data
+
+
+# =============================================================================
+# 적용
+# =============================================================================
+def _scale_region(region: Region, ref: Region, target: Region) -> Region:
+    """ref 화면 안의 절대 영역을 target 화면의 같은 상대 위치로"""
+    sx, sy = target[2] / ref[2], target[3] / ref[3]
+    x, y, w, h = region
+    return (target[0] + round((x - ref[0]) * sx), target[1] + round((y - ref[1]) * sy),
+            round(w * sx), round(h * sy))
+
+
+def apply_layout(game, layout: Dict) -> Callable[[], None]:
+    """
+    배치(dict)를 게임의 화면 표에 적용 (모듈 dict를 제자리에서 수정하므로 이미 import한 곳에도 반영).
+    반환된 함수를 호출하면 적용 전으로 복원됩니다 (벤치마크 / 시뮬레이터).
+    """
+    module = importlib.import_module(game.screen_info_module)
+    regions: Dict[str, Region] = module.SCREEN_REGIONS
+    coords: Dict[str, Dict] = getattr(module, 'FIXED_UI_COORDS', {})
+    event_regions: Dict[str, Dict] = getattr(module, 'EVENT_UI_REGIONS', {})
+    aliases: Dict[str, str] = getattr(module, 'SCREEN_ALIASES', {})
+    template_tables = [getattr(importlib.import_module(name), attr) for name, attr in game.templates]
+    option_tables = [monitor.screen_options for monitor in game.monitors]
+
+    saved = [(table, dict(table)) for table in [regions, coords, event_regions, aliases] + template_tables +
+             option_tables]
+
+    original = dict(regions)
+    source_coords = {screen_id: dict(entry) for screen_id, entry in coords.items()}
+    source_events = {screen_id: dict(entry) for screen_id, entry in event_regions.items()}
+    for screen_id, entry in layout.get('screens', {}).items():
+        region = tuple(int(v) for v in entry['region'])
+        # 기존 화면은 자기 자신을 기준으로 이동/크기 변경, 새 화면은 like를 복사
+        like = screen_id if screen_id in original else entry.get('like')
+        regions[screen_id] = region
+        if like is None:
+            continue
+        if like not in original:
+            raise ValueError(f"[Layout] {game.name}: {screen_id} is like unknown screen {like!r}")
+        ref = original[like]
+        sx, sy = region[2] / ref[2], region[3] / ref[3]
+        if abs(sx - 1.0) > SCALE_TOLERANCE or abs(sy - 1.0) > SCALE_TOLERANCE:
+            log.warning(f"[Layout] {game.name}: {screen_id} is {sx:.2f}x{sy:.2f} the size of {like} - "
+                        f"{like}'s templates may not match")
+        if like in source_coords:
+            coords[screen_id] = {key: (round(x * sx), round(y * sy)) for key, (x, y) in source_coords[like].items()}
+        if like in source_events:
+            event_regions[screen_id] = {key: _scale_region(r, ref, region) for key, r in source_events[like].items()}
+        if like == screen_id:
+            continue
+        for table in template_tables:
+            if like in table and screen_id not in table:
+                table[screen_id] = dict(table[like])
+        for options in option_tables:
+            if like in options and screen_id not in options:
+                options[screen_id] = dict(options[like])
+        aliases[screen_id] = aliases.get(like, like)
+
+    removed = list(layout.get('remove', []))
+    if layout.get('replace'):
+        removed += [screen_id for screen_id in original if screen_id not in layout.get('screens', {})]
+    # 화면별 표 모두에서 제거 (좌표 / 이벤트 영역 / 별칭 / 템플릿 / 모니터 화면 옵션 - 복원 대상과 같은 표들)
+    for screen_id in removed:
+        for table, _ in saved:
+            table.pop(screen_id, None)
+
+    def _restore():
+        for table, snapshot in saved:
+            table.clear()
+            table.update(snapshot)
+    return _restore
+
+
+def apply_configured_layout(screen_info_module: str):
+    """GAMES_CONFIG의 배치 파일을 해당 게임에 한 번만 적용 (오케스트레이터 / 작업 프로세스 모두)"""
+    if screen_info_module in _applied:
+        return
+    _applied.add(screen_info_module)
+    from Orchestrator.src.core.game_registry import GAMES
+    for game in GAMES:
+        if game.screen_info_module == screen_info_module and game.layout is not None:
+            apply_layout(game, load_layout(game.layout))
+            log.info(f"[Layout] {game.name}: applied {game.layout}")
+
+
+# =============================================================================
+# 격자 배치
+# =============================================================================
+def grid_layout(count: int, displays: Sequence[Region] = (DEFAULT_DISPLAY,), like: Sequence[str] = ('S2',),
+                cell: Optional[Tuple[int, int]] = None, prefix: str = 'S') -> Dict:
+    """
+    count개 화면(S1~)을 모니터들에 격자로 배치한 배치 dict (기존 배치를 대체, replace=True).
+    cell: 화면 크기 (w, h) - 주면 모니터마다 들어가는 만큼 왼쪽 위부터 채우고,
+          없으면 모니터마다 고르게 나눠 16:9에 가까운 격자로 채움
+    like: 새 화면이 따라 할 기존 화면 (순환 사용, 적용 시 기존 화면에는 무시됨)
+    """
+    if count < 1:
+        raise ValueError("[Layout] count must be >= 1")
+    regions: List[List[int]] = []
+    for index, (dx, dy, dw, dh) in enumerate(displays):
+        remaining = count - len(regions)
+        if remaining <= 0:
+            break
+        if cell is not None:
+            cell_w, cell_h = cell
+            cols, rows = dw // cell_w, dh // cell_h
+            n = min(remaining, cols * rows)
+        else:
+            n = math.ceil(remaining / (len(displays) - index))
+            cols = max(1, min(n, math.ceil(math.sqrt(n * dw / dh / (16 / 9)))))
+            rows = math.ceil(n / cols)
+            cell_w, cell_h = dw // cols, dh // rows
+        regions += [[dx + (i % cols) * cell_w, dy + (i // cols) * cell_h, cell_w, cell_h] for i in range(n)]
+    if len(regions) < count:
+        raise ValueError(f"[Layout] {count} screens do not fit on {len(displays)} display(s)")
+    screens = {f"{prefix}{n + 1}": {'region': region, 'like': like[n % len(like)]}
+               for n, region in enumerate(regions)}
+    return {'screens': screens, 'replace': True}
+
+
+def displays_for(count: int, cell: Tuple[int, int], display: Region = DEFAULT_DISPLAY) -> List[Region]:
+    """cell 크기 화면 count개를 담을 만큼 display를 가로로 이어 붙인 모니터 목록"""
+    per_display = max(1, (display[2] // cell[0]) * (display[3] // cell[1]))
+    return [(display[0] + i * display[2], display[1], display[2], display[3])
+            for i in range(math.ceil(count / per_display))]
@@ -0,0 +1,278 @@
+# Orchestrator/src/core/session_recorder.py
+# 실제 세션 기록기: 캡처 프레임(PNG 압축 + 해시 중복 제거), 입력/IO 액션, 상태 전이를 세션 폴더에 저장
+#
+# 세션 폴더 구조 (logs/sessions/session_<시각>/):
+#   manifest.json          기록 시작 정보 + 템플릿 스냅샷 목록
+#   events.jsonl           시간순 이벤트 (frame / input / io / transition)
+#   frames/<hash>.png      중복 제거된 프레임 (같은 화면이 반복되면 한 번만 저장)
+#   templates/<VD>/<screen>/<key>.png   기록 시점의 템플릿 사본 (오프라인 리플레이용)
+#
+# 활성화: RECORDING_CONFIG['enabled'] = True 또는 환경 변수 ORCH_RECORD_SESSION=1
+# 리플레이: python -m Orchestrator.src.core.session_replay <세션 폴더>
+
+import hashlib
+import importlib
+import json
+import numbers
+import os
+import queue
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.game_registry import template_registries
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_SESSIONS_DIR = Path(__file__).resolve().parents[2] / "logs" / "sessions"
+ARCHIVE_VERSION = 1
+
+# VD별 템플릿 레지스트리 (GAMES_CONFIG['templates']): (모듈, dict 속성명), dict 구조는 {screen_id: {key: path}}
+TEMPLATE_REGISTRIES: Dict[str, List[Tuple[str, str]]] = template_registries()
+
+# 기록할 입력 호출 (InputBackend 메서드명)
+RECORDED_INPUT_CALLS = frozenset({
+    'click', 'mouse_down', 'mouse_up', 'move_to', 'move_rel', 'drag_to', 'scroll',
+    'raw_mouse_down', 'raw_mouse_up', 'raw_click',
+    'key_press', 'key_down', 'key_up', 'vkey_down', 'vkey_up', 'write', 'vk_event',
+})
+
+
+def override_template_paths(registries: Iterable[Tuple[str, str]],
+                            resolve: Callable[[str, str, str], Optional[str]]) -> Callable[[], None]:
+    """
+    레지스트리의 템플릿 경로를 resolve(screen_id, key, original)의 결과로 교체 (None이면 유지).
+    반환된 함수를 호출하면 원래 경로로 복원됩니다.
+    """
+    saved: List[Tuple[dict, str, str]] = []
+    for module_name, attr in registries:
+        table = getattr(importlib.import_module(module_name), attr)
+        for screen_id, templates in table.items():
+            for key, original in list(templates.items()):
+                replacement = resolve(screen_id, key, original)
+                if replacement is not None:
+                    saved.append((templates, key, original))
+                    templates[key] = replacement
+
+    def _restore():
+        for templates, key, original in saved:
+            templates[key] = original
+    return _restore
+
+
+class _RecordingBackend:
+    """입력 백엔드 래퍼: 입력 호출을 기록한 뒤 원래 백엔드로 위임"""
+
+    def __init__(self, inner, recorder: 'SessionRecorder'):
+        self._inner = inner
+        self._recorder = recorder
+
+    def __getattr__(self, name: str):
+        target = getattr(self._inner, name)
+        if name not in RECORDED_INPUT_CALLS:
+            return target
+
+        def _recorded(*args, **kwargs):
+            self._recorder.record_input(name, args, kwargs)
+            return target(*args, **kwargs)
+        return _recorded
+
+
+class SessionRecorder:
+    """
+    세션 기록기. record_*()는 큐에 넣기만 하고 (캡처/IO 스레드 블로킹 없음),
+    해시 계산·PNG 인코딩·파일 쓰기는 백그라운드 writer가 처리합니다.
+    """
+
+    def __init__(self, root: Optional[Path] = None, min_frame_interval: float = 0.0,
+                 png_compression: int = 3, max_queue: int = 500, snapshot_templates: bool = True):
+        root = Path(root) if root else DEFAULT_SESSIONS_DIR
+        self.path = root / f"session_{time.strftime('%Y%m%d_%H%M%S')}"
+        self.min_frame_interval = min_frame_interval
+        self.png_compression = png_compression
+        self.snapshot_templates = snapshot_templates
+        self._queue: "queue.Queue[Tuple[str, Dict[str, Any], Any]]" = queue.Queue(maxsize=max_queue)
+        self._stop_event = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
+        self._last_frame_time: Dict[Tuple[str, str], float] = {}
+        self._seen_hashes = set()
+        self._previous_backend = None
+        self.frames_recorded = 0
+        self.frames_written = 0
+        self.dropped = 0
+
+    @classmethod
+    def from_config(cls) -> Optional['SessionRecorder']:
+        """RECORDING_CONFIG / ORCH_RECORD_SESSION 기준으로 생성 (비활성이면 None)"""
+        try:
+            from Orchestrator.src.utils.config import RECORDING_CONFIG
+        except ImportError:
+            RECORDING_CONFIG = {}
+        enabled = os.environ.get("ORCH_RECORD_SESSION", "").lower() in ("1", "true", "yes")
+        if not (enabled or RECORDING_CONFIG.get('enabled', False)):
+            return None
+        return cls(root=RECORDING_CONFIG.get('dir'),
+                   min_frame_interval=RECORDING_CONFIG.get('min_frame_interval', 0.0),
+                   png_compression=RECORDING_CONFIG.get('png_compression', 3),
+                   max_queue=RECORDING_CONFIG.get('max_queue', 500),
+                   snapshot_templates=RECORDING_CONFIG.get('snapshot_templates', True))
+
+    # =========================================================================
+    # 연결
+    # =========================================================================
+    def attach(self, io_scheduler=None, stores: Optional[Dict[str, Any]] = None, record_inputs: bool = True):
+        """IO 스케줄러 / 공유 상태 저장소 / 입력 백엔드에 기록 훅 연결"""
+        if io_scheduler is not None:
+            io_scheduler.add_observer(self.record_io)
+        for vd, store in (stores or {}).items():
+            store.subscribe(self.on_state_change(vd))
+        if record_inputs:
+            from Orchestrator.src.core.input_backend import get_backend, set_backend
+            self._previous_backend = set_backend(_RecordingBackend(get_backend(), self))
+
+    # =========================================================================
+    # 기록 (Hot path)
+    # =========================================================================
+    def _put(self, kind: str, fields: Dict[str, Any], payload: Any = None):
+        if self._stop_event.is_set():
+            return
+        try:
+            self._queue.put_nowait((kind, fields, payload))
+        except queue.Full:
+            self.dropped += 1
+
+    def record_frame(self, vd: str, screen_id: str, region, frame):
+        """캡처 직후 호출. min_frame_interval 안의 반복 캡처는 건너뜀"""
+        if frame is None:
+            return
+        now = clock.time()
+        key = (vd, screen_id)
+        if self.min_frame_interval and now - self._last_frame_time.get(key, 0.0) < self.min_frame_interval:
+            return
+        self._last_frame_time[key] = now
+        self.frames_recorded += 1
+        self._put('frame', {'t': now, 'vd': vd, 'screen': screen_id, 'region': list(region)}, frame)
+
+    def record_input(self, call: str, args: tuple, kwargs: dict):
+        self._put('input', {'t': clock.time(), 'call': call, 'args': [_jsonable(a) for a in args],
+                            'kwargs': {k: _jsonable(v) for k, v in kwargs.items()}})
+
+    def record_io(self, component: str, screen_id: str, priority: int, wait_ms: int, run_ms: int, ok: bool):
+        """IOScheduler observer"""
+        self._put('io', {'t': clock.time(), 'component': component, 'screen': screen_id, 'priority': priority,
+                         'wait_ms': wait_ms, 'run_ms': run_ms, 'ok': ok})
+
+    def on_state_change(self, vd: str):
+        """SharedStateStore.subscribe()에 넘길 콜백 생성"""
+        def _callback(new_record, old_record):
+            self._put('transition', {
+                't': new_record.timestamp,
+                'vd': vd,
+                'screen': new_record.screen_id,
+                'from': getattr(old_record.state, 'name', None) if old_record else None,
+                'to': getattr(new_record.state, 'name', str(new_record.state)),
+                'kind': type(new_record.state).__name__,
+                'source': new_record.source,
+                'reason': new_record.reason,
+            })
+        return _callback
+
+    # =========================================================================
+    # 백그라운드 writer
+    # =========================================================================
+    def start(self):
+        if self._writer_thread and self._writer_thread.is_alive():
+            return
+        (self.path / "frames").mkdir(parents=True, exist_ok=True)
+        manifest = {
+            'version': ARCHIVE_VERSION,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'min_frame_interval': self.min_frame_interval,
+            'templates': self._snapshot_templates() if self.snapshot_templates else {},
+        }
+        (self.path / "manifest.json").write_text(json.dumps(manifest, indent=2, ensure_ascii=False),
+                                                 encoding="utf-8")
+        self._stop_event.clear()
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="SessionRecorder", daemon=True)
+        self._writer_thread.start()
+        log.info(f"[SessionRecorder] Recording session to {self.path}")
+
+    def stop(self, timeout: float = 10.0):
+        self._stop_event.set()
+        if self._writer_thread:
+            self._writer_thread.join(timeout=timeout)
+            if self._writer_thread.is_alive():
+                log.warning("[SessionRecorder] Writer thread did not stop in time.")
+        if self._previous_backend is not None:
+            from Orchestrator.src.core.input_backend import set_backend
+            set_backend(self._previous_backend)
+            self._previous_backend = None
+        log.info(f"[SessionRecorder] Stopped. frames={self.frames_recorded} "
+                 f"(unique written={self.frames_written}), dropped={self.dropped} → {self.path}")
+
+    def _writer_loop(self):
+        with open(self.path / "events.jsonl", "a", encoding="utf-8") as events:
+            while not (self._stop_event.is_set() and self._queue.empty()):
+                try:
+                    kind, fields, payload = self._queue.get(timeout=0.5)
+                except queue.Empty:
+                    continue
+                try:
+                    if kind == 'frame':
+                        fields['hash'] = self._store_frame(payload)
+                    events.write(json.dumps({'type': kind, **fields}, ensure_ascii=False) + "\n")
+                except Exception as e:
+                    log.error(f"[SessionRecorder] Failed to write {kind} event: {e}")
+                if self._queue.empty():
+                    events.flush()
+
+    def _store_frame(self, frame) -> str:
+        import cv2
+        import numpy as np
+        rgb = np.ascontiguousarray(np.asarray(frame))
+        digest = hashlib.blake2b(rgb.tobytes(), digest_size=12)
+        digest.update(repr(rgb.shape).encode())
+        frame_hash = digest.hexdigest()
+        if frame_hash not in self._seen_hashes:
+            self._seen_hashes.add(frame_hash)
+            ok, encoded = cv2.imencode(".png", cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR),
+                                       [cv2.IMWRITE_PNG_COMPRESSION, self.png_compression])
+            if ok:
+                (self.path / "frames" / f"{frame_hash}.png").write_bytes(encoded.tobytes())
+                self.frames_written += 1
+        return frame_hash
+
+    def _snapshot_templates(self) -> Dict[str, Dict[str, Dict[str, str]]]:
+        """기록 시점의 템플릿 파일을 세션 폴더로 복사. {VD: {screen: {key: 상대 경로}}}"""
+        snapshot: Dict[str, Dict[str, Dict[str, str]]] = {}
+        for vd, registries in TEMPLATE_REGISTRIES.items():
+            def _copy(screen_id, key, original, vd=vd):
+                if not original or not os.path.exists(original):
+                    return None
+                relative = Path("templates") / vd / screen_id / f"{key}{Path(original).suffix or '.png'}"
+                if not (self.path / relative).exists():
+                    (self.path / relative).parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copyfile(original, self.path / relative)
+                snapshot.setdefault(vd, {}).setdefault(screen_id, {})[key] = relative.as_posix()
+                return None  # 경로는 바꾸지 않음
+            try:
+                override_template_paths(registries, _copy)
+            except Exception as e:
+                log.warning(f"[SessionRecorder] Template snapshot for {vd} failed: {e}")
+        return snapshot
+
+
+def _jsonable(value):
+    if isinstance(value, (str, bool)) or value is None:
+        return value
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        return float(value)
+    if isinstance(value, (tuple, list)):
+        return [_jsonable(v) for v in value]
+    return repr(value)
@@ -0,0 +1,349 @@
+# Orchestrator/src/core/session_replay.py
+# 기록된 세션(session_recorder)을 오프라인으로 재생: 프레임을 CombatMonitor / SystemMonitor에 최대 속도로 넣어
+# 감지 결정을 기록 당시 상태 전이와 비교하고, 프레임당 처리 비용을 측정
+#
+# 사용 예:
+#   python -m Orchestrator.src.core.session_replay logs/sessions/session_20250101_120000
+#   python -m Orchestrator.src.core.session_replay <세션> --vd VD1 --monitor srm --confidence 0.80
+#   python -m Orchestrator.src.core.session_replay <세션> --out replay.json
+
+import argparse
+import bisect
+import importlib
+import json
+import statistics
+import sys
+import time
+from collections import Counter, defaultdict
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from Orchestrator.src.core.game_registry import game_for_vd
+from Orchestrator.src.core.screen_layout import screen_sort_key
+from Orchestrator.src.core.session_recorder import TEMPLATE_REGISTRIES, override_template_paths
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_TOLERANCE = 1.5  # 프레임 직후 이 시간(초) 안의 전이를 그 프레임의 감지 결정으로 봄
+MAX_MISMATCHES = 50
+
+
+# =============================================================================
+# 세션 읽기
+# =============================================================================
+class SessionArchive:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.manifest = json.loads((self.path / "manifest.json").read_text(encoding="utf-8"))
+        self.frames: List[Dict[str, Any]] = []
+        self.transitions: List[Dict[str, Any]] = []
+        self.counts: Counter = Counter()
+        with open(self.path / "events.jsonl", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                event = json.loads(line)
+                self.counts[event['type']] += 1
+                if event['type'] == 'frame':
+                    self.frames.append(event)
+                elif event['type'] == 'transition':
+                    self.transitions.append(event)
+        self.frames.sort(key=lambda e: e['t'])
+        self.transitions.sort(key=lambda e: e['t'])
+        self._cache: Dict[str, Any] = {}
+
+    def load_frame(self, frame_hash: str):
+        """PNG → RGB ndarray (중복 프레임은 캐시 재사용)"""
+        frame = self._cache.get(frame_hash)
+        if frame is None:
+            import cv2
+            bgr = cv2.imread(str(self.path / "frames" / f"{frame_hash}.png"))
+            frame = None if bgr is None else cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
+            if len(self._cache) > 256:
+                self._cache.clear()
+            self._cache[frame_hash] = frame
+        return frame
+
+    def install_templates(self, vd: str) -> Callable[[], None]:
+        """기록 당시 템플릿 사본으로 레지스트리 경로 교체 (사본이 없는 키는 원래 경로 유지)"""
+        snapshot = self.manifest.get('templates', {}).get(vd, {})
+
+        def _resolve(screen_id, key, original):
+            relative = snapshot.get(screen_id, {}).get(key)
+            return str(self.path / relative) if relative else None
+        return override_template_paths(TEMPLATE_REGISTRIES[vd], _resolve)
+
+    def recorded_regions(self, vd: str) -> Dict[str, Tuple[int, int, int, int]]:
+        regions = {}
+        for event in self.frames:
+            if event['vd'] == vd and event['screen'] not in regions:
+                regions[event['screen']] = tuple(event['region'])
+        return regions
+
+
+class _Timeline:
+    """(VD, 화면)별 기록 상태 전이 조회"""
+
+    def __init__(self, transitions: List[Dict[str, Any]]):
+        self._by_screen: Dict[Tuple[str, str], List[Dict[str, Any]]] = defaultdict(list)
+        for event in transitions:
+            self._by_screen[(event['vd'], event['screen'])].append(event)
+        self._times = {key: [e['t'] for e in events] for key, events in self._by_screen.items()}
+
+    def decision(self, vd: str, screen_id: str, t: float, kind: str, tolerance: float,
+                 baseline: Optional[str] = None) -> Optional[str]:
+        """
+        프레임 시각 t의 기록 결정 (kind = 상태 Enum 이름, 모니터별 구분):
+        직후 tolerance 안에 같은 kind의 전이가 있으면 그 상태, 없으면 t 시점에 유효한 같은 kind 상태, 그것도 없으면 baseline.
+        """
+        events = self._by_screen.get((vd, screen_id), [])
+        index = bisect.bisect_right(self._times.get((vd, screen_id), []), t)
+        for event in events[index:]:
+            if event['t'] > t + tolerance:
+                break
+            if event.get('kind') == kind:
+                return event['to']
+        for event in reversed(events[:index]):
+            if event.get('kind') == kind:
+                return event['to']
+        return baseline
+
+
+# =============================================================================
+# 리플레이용 오케스트레이터 / 감지기
+# =============================================================================
+class _DroppingScheduler:
+    """IO 요청을 실행하지 않고 개수만 셈 (리플레이는 감지 결정만 평가)"""
+
+    def __init__(self):
+        self.requests = 0
+
+    def request(self, component, screen_id, action, priority=None):
+        self.requests += 1
+
+    def add_observer(self, callback):
+        pass
+
+
+class _ReplayOrchestrator:
+    def __init__(self, regions: Dict[str, Tuple[int, int, int, int]]):
+        self.io_scheduler = _DroppingScheduler()
+        self.screen_regions = regions
+        self.current: Dict[str, Any] = {}
+
+    def capture_screen_safely(self, screen_id: str):
+        return self.current.get(screen_id)
+
+    def report_system_error(self, monitor_id: str, screen_id: str) -> bool:
+        return False
+
+
+class _Detector:
+    """모니터 하나의 '한 프레임 감지 결정' 함수 + 비교 가능한 상태 집합"""
+
+    def __init__(self, name: str, kind: str, vocabulary: set, decide: Callable[[str], str],
+                 screens: set, baseline: Optional[str] = None):
+        self.name = name
+        self.kind = kind
+        self.baseline = baseline
+        self.vocabulary = vocabulary
+        self.decide = decide
+        self.screens = screens
+
+
+def _build_detectors(vd: str, kinds: List[str], orchestrator: _ReplayOrchestrator,
+                     confidence: Optional[float]) -> List[_Detector]:
+    from Orchestrator.src.core.shared_state_store import SharedStateStore
+    store = SharedStateStore(f"{vd}-replay")
+    regions = orchestrator.screen_regions
+    detectors: List[_Detector] = []
+
+    if 'srm' in kinds and vd == 'VD1':
+        from Orchestrator.NightCrows.Combat_Monitor.monitor import CharacterState, CombatMonitor
+        monitor = CombatMonitor(monitor_id="SRM1", config={'confidence': confidence or 0.85}, vd_name=vd,
+                                orchestrator=orchestrator, io_scheduler=orchestrator.io_scheduler,
+                                shared_states=store)
+        # 연속 샘플링은 실시간 개념이므로 리플레이에서는 프레임당 1회
+        monitor.HOSTILE_SAMPLE_COUNT = 1
+        monitor.HOSTILE_SAMPLE_INTERVAL = 0.0
+        for screen_id, region in sorted(regions.items(), key=lambda item: screen_sort_key(item[0])):
+            monitor.add_screen(screen_id, region)
+        screens = {s.screen_id: s for s in monitor.screens}
+        names = {CharacterState.NORMAL: 'NORMAL', CharacterState.DEAD: 'DEAD',
+                 CharacterState.HOSTILE_ENGAGE: 'HOSTILE'}
+        detectors.append(_Detector(
+            "SRM1", 'ScreenState', {'NORMAL', 'DEAD', 'HOSTILE'},
+            lambda screen_id, monitor=monitor, screens=screens:
+                names[monitor._get_character_state_on_screen(screens[screen_id])],
+            set(screens)))
+
+    if 'srm' in kinds and vd == 'VD2':
+        from Orchestrator.Raven2.Combat_Monitor.src.monitor import CombatMonitor
+        config = {'frame_max_age': 0.0}
+        if confidence:
+            config['confidence'] = confidence
+        monitor = CombatMonitor(monitor_id="SRM2", config=config, vd_name=vd, orchestrator=orchestrator,
+                                io_scheduler=orchestrator.io_scheduler, shared_states=store)
+        game = game_for_vd(vd)
+        srm_spec = game.monitor('srm') if game else None
+        screen_options = srm_spec.screen_options if srm_spec else {}
+        for screen_id, region in sorted(regions.items(), key=lambda item: screen_sort_key(item[0])):
+            monitor.add_screen(window_id=screen_id, region=region, **screen_options.get(screen_id, {}))
+        screens = {s.window_id: s for s in monitor.screens}
+        detectors.append(_Detector(
+            "SRM2", 'ScreenState', {'SLEEP', 'AWAKE', 'DEAD', 'ABNORMAL'},
+            lambda screen_id, monitor=monitor, screens=screens: monitor.check_status(screens[screen_id]).name,
+            set(screens)))
+
+    if 'sm' in kinds:
+        module_name = ('Orchestrator.NightCrows.System_Monitor.src.core.monitor' if vd == 'VD1'
+                       else 'Orchestrator.Raven2.System_Monitor.src.core.monitor')
+        sm_module = importlib.import_module(module_name)
+        monitor_id = "SM1" if vd == 'VD1' else "SM2"
+        try:
+            monitor = sm_module.create_system_monitor(monitor_id, vd, orchestrator=orchestrator,
+                                                      shared_states=store)
+        except Exception as e:
+            log.warning(f"[Replay] {monitor_id} unavailable (templates missing from session?): {e}")
+            monitor = None
+        if monitor is not None:
+            system_state = type(next(iter(monitor.detection_policy_map)))
+            targets = monitor.detection_policy_map.get(system_state.NORMAL, {}).get('targets', [])
+
+            def _decide_sm(screen_id, monitor=monitor, targets=targets):
+                screen_obj = monitor.screens[screen_id]
+                for target in targets:
+                    path = sm_module.get_template(screen_id, target['template_name'])
+                    if monitor._detect_template(screen_obj, template_path=path):
+                        return target['next_state'].name
+                return 'NORMAL'
+            detectors.append(_Detector(
+                monitor_id, system_state.__name__, {'NORMAL'} | {t['next_state'].name for t in targets},
+                _decide_sm, set(monitor.screens), baseline='NORMAL'))
+    return detectors
+
+
+# =============================================================================
+# 리플레이
+# =============================================================================
+def replay(archive: SessionArchive, vds: Optional[List[str]] = None, kinds: Optional[List[str]] = None,
+           confidence: Optional[float] = None, tolerance: float = DEFAULT_TOLERANCE,
+           limit: Optional[int] = None) -> Dict[str, Any]:
+    from Orchestrator.src.core.input_backend import FakeBackend, set_backend
+
+    kinds = kinds or ['srm', 'sm']
+    timeline = _Timeline(archive.transitions)
+    previous_backend = set_backend(FakeBackend())  # 리플레이 중 입력이 실제로 나가지 않도록
+    results: Dict[str, Any] = {}
+    try:
+        for vd in vds or sorted({f['vd'] for f in archive.frames}):
+            frames = [f for f in archive.frames if f['vd'] == vd][:limit]
+            if not frames:
+                continue
+            restore = archive.install_templates(vd)
+            try:
+                orchestrator = _ReplayOrchestrator(archive.recorded_regions(vd))
+                for detector in _build_detectors(vd, kinds, orchestrator, confidence):
+                    results[f"{vd}/{detector.name}"] = _replay_detector(
+                        archive, timeline, vd, frames, orchestrator, detector, tolerance)
+            finally:
+                restore()
+    finally:
+        set_backend(previous_backend)
+    return results
+
+
+def _replay_detector(archive: SessionArchive, timeline: _Timeline, vd: str, frames: List[Dict[str, Any]],
+                     orchestrator: _ReplayOrchestrator, detector: _Detector, tolerance: float) -> Dict[str, Any]:
+    confusion: Counter = Counter()
+    mismatches: List[Dict[str, Any]] = []
+    costs: List[float] = []
+    skipped = 0
+    for event in frames:
+        screen_id = event['screen']
+        if screen_id not in detector.screens:
+            continue
+        frame = archive.load_frame(event['hash'])
+        if frame is None:
+            skipped += 1
+            continue
+        orchestrator.current[screen_id] = frame
+
+        start = time.perf_counter()
+        decision = detector.decide(screen_id)
+        costs.append((time.perf_counter() - start) * 1000)
+
+        expected = timeline.decision(vd, screen_id, event['t'], detector.kind, tolerance, detector.baseline)
+        if expected not in detector.vocabulary:
+            skipped += 1  # 정책 실행 중 등 감지 결정과 비교할 수 없는 구간
+            continue
+        confusion[(expected, decision)] += 1
+        if expected != decision and len(mismatches) < MAX_MISMATCHES:
+            mismatches.append({'t': event['t'], 'screen': screen_id, 'recorded': expected,
+                               'replayed': decision, 'frame': event['hash']})
+
+    compared = sum(confusion.values())
+    agreed = sum(n for (expected, decision), n in confusion.items() if expected == decision)
+    costs.sort()
+    return {
+        'frames': len(costs),
+        'compared': compared,
+        'skipped': skipped,
+        'agreement': agreed / compared if compared else None,
+        'confusion': {f"{expected}->{decision}": n for (expected, decision), n in sorted(confusion.items())},
+        'mismatches': mismatches,
+        'cost_ms': {
+            'mean': statistics.fmean(costs) if costs else 0.0,
+            'median': statistics.median(costs) if costs else 0.0,
+            'p95': costs[min(len(costs) - 1, int(len(costs) * 0.95))] if costs else 0.0,
+            'max': costs[-1] if costs else 0.0,
+        },
+        'frames_per_s': len(costs) / (sum(costs) / 1000) if costs and sum(costs) > 0 else 0.0,
+    }
+
+
+def print_report(archive: SessionArchive, results: Dict[str, Any]):
+    print(f"=== Session replay: {archive.path} ===")
+    print(f"events: {dict(archive.counts)}, unique frames: "
+          f"{len(list((archive.path / 'frames').glob('*.png')))}")
+    for name, result in results.items():
+        agreement = result['agreement']
+        cost = result['cost_ms']
+        print(f"\n[{name}] frames={result['frames']} compared={result['compared']} skipped={result['skipped']} "
+              f"agreement={'n/a' if agreement is None else f'{agreement * 100:.1f}%'}")
+        print(f"  cost/frame: mean={cost['mean']:.2f}ms median={cost['median']:.2f}ms "
+              f"p95={cost['p95']:.2f}ms max={cost['max']:.2f}ms ({result['frames_per_s']:.0f} frames/s)")
+        for pair, count in result['confusion'].items():
+            print(f"  {pair:<40} {count:>7}")
+        for mismatch in result['mismatches'][:10]:
+            print(f"  ! t={mismatch['t']:.2f} {mismatch['screen']} recorded={mismatch['recorded']} "
+                  f"replayed={mismatch['replayed']} frame={mismatch['frame']}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay a recorded session through the monitors offline")
+    parser.add_argument("session", type=Path, help="Session directory (logs/sessions/session_...)")
+    parser.add_argument("--vd", action="append", default=None, help="Only replay this VD (repeatable)")
+    parser.add_argument("--monitor", choices=("srm", "sm", "all"), default="all")
+    parser.add_argument("--confidence", type=float, default=None, help="Override CombatMonitor confidence")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Seconds after a frame to attribute a recorded transition to it")
+    parser.add_argument("--limit", type=int, default=None, help="Replay at most N frames per VD")
+    parser.add_argument("--out", type=Path, default=None, help="Write JSON results to this file")
+    args = parser.parse_args()
+
+    from Orchestrator.src.utils.log import configure_logging
+    configure_logging(level="WARNING", stream=sys.stderr)
+
+    archive = SessionArchive(args.session)
+    kinds = ['srm', 'sm'] if args.monitor == 'all' else [args.monitor]
+    results = replay(archive, args.vd, kinds, args.confidence, args.tolerance, args.limit)
+    print_report(archive, results)
+    if args.out:
+        args.out.write_text(json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
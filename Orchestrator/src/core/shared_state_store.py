@@ -0,0 +1,211 @@
+# Orchestrator/src/core/shared_state_store.py
+# SRM ←→ SM ←→ Orchestrator 가 공유하는 화면 상태 저장소 (스레드 안전, 버전 관리)
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class StateRecord:
+    """화면 하나의 상태 기록"""
+    screen_id: str
+    state: Any
+    version: int  # 화면별 버전 (상태가 바뀔 때마다 +1)
+    timestamp: float  # 상태가 바뀐 시각 (clock.time())
+    source: Optional[str] = None  # 변경 주체 (예: 'SRM1', 'SM1')
+    reason: Optional[str] = None
+
+
+class SharedStateStore:
+    """
+    화면 ID → 상태 Enum 저장소.
+    기존 dict 인터페이스(store[id], store.get(id), id in store)를 그대로 지원하면서
+    compare-and-set, 화면별 버전/타임스탬프, 변경 대기(wait_for_change), 구독 콜백,
+    화면별 제한 길이 전이 이력을 제공합니다.
+    """
+
+    def __init__(self, name: str = "", history_size: int = 50):
+        self.name = name
+        self.history_size = history_size
+        self._cond = threading.Condition(threading.RLock())
+        self._records: Dict[str, StateRecord] = {}
+        self._history: Dict[str, Deque[StateRecord]] = {}
+        self._global_version = 0  # 저장소 전체 변경 횟수
+        self._subscribers: List[Callable[[StateRecord, Optional[StateRecord]], None]] = []
+
+    # =========================================================================
+    # dict 호환 인터페이스
+    # =========================================================================
+    def __getitem__(self, screen_id: str) -> Any:
+        with self._cond:
+            return self._records[screen_id].state
+
+    def __setitem__(self, screen_id: str, state: Any):
+        self.set(screen_id, state)
+
+    def __contains__(self, screen_id: object) -> bool:
+        with self._cond:
+            return screen_id in self._records
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._records)
+
+    def get(self, screen_id: str, default: Any = None) -> Any:
+        with self._cond:
+            record = self._records.get(screen_id)
+            return record.state if record else default
+
+    def keys(self) -> List[str]:
+        with self._cond:
+            return list(self._records.keys())
+
+    def items(self):
+        return self.snapshot().items()
+
+    def values(self):
+        return self.snapshot().values()
+
+    def setdefault(self, screen_id: str, state: Any, source: Optional[str] = None) -> Any:
+        """없을 때만 원자적으로 등록 (SRM/SM 중 먼저 등록한 쪽의 초기값 유지)"""
+        with self._cond:
+            record = self._records.get(screen_id)
+            if record is not None:
+                return record.state
+            new_record, old_record = self._apply(screen_id, state, source, "register")
+        self._notify(new_record, old_record)
+        return state
+
+    # =========================================================================
+    # 상태 변경
+    # =========================================================================
+    def set(self, screen_id: str, state: Any, source: Optional[str] = None,
+            reason: Optional[str] = None) -> StateRecord:
+        """무조건 상태 설정. 같은 상태면 버전을 올리지 않음"""
+        with self._cond:
+            record = self._records.get(screen_id)
+            if record is not None and record.state == state:
+                return record
+            new_record, old_record = self._apply(screen_id, state, source, reason)
+        self._notify(new_record, old_record)
+        return new_record
+
+    def compare_and_set(self, screen_id: str, expected: Any, state: Any, source: Optional[str] = None,
+                        reason: Optional[str] = None) -> bool:
+        """현재 상태가 expected일 때만 state로 전이. 성공하면 True"""
+        with self._cond:
+            record = self._records.get(screen_id)
+            current = record.state if record else None
+            if current != expected:
+                return False
+            if current == state:
+                return True
+            new_record, old_record = self._apply(screen_id, state, source, reason)
+        self._notify(new_record, old_record)
+        return True
+
+    def _apply(self, screen_id: str, state: Any, source: Optional[str], reason: Optional[str]):
+        """(lock 보유 상태에서 호출) 기록 갱신 + 이력 추가 + 대기자 깨우기"""
+        old_record = self._records.get(screen_id)
+        new_record = StateRecord(
+            screen_id=screen_id,
+            state=state,
+            version=(old_record.version + 1) if old_record else 1,
+            timestamp=clock.time(),
+            source=source,
+            reason=reason,
+        )
+        self._records[screen_id] = new_record
+        history = self._history.get(screen_id)
+        if history is None:
+            history = deque(maxlen=self.history_size)
+            self._history[screen_id] = history
+        history.append(new_record)
+        self._global_version += 1
+        self._cond.notify_all()
+        return new_record, old_record
+
+    def _notify(self, new_record: StateRecord, old_record: Optional[StateRecord]):
+        """구독자 콜백 호출 (lock 밖에서)"""
+        for callback in list(self._subscribers):
+            try:
+                callback(new_record, old_record)
+            except Exception as e:
+                log.warning(f"[SharedStateStore:{self.name}] Subscriber error: {e}")
+
+    # =========================================================================
+    # 조회 / 구독
+    # =========================================================================
+    @property
+    def global_version(self) -> int:
+        with self._cond:
+            return self._global_version
+
+    def get_record(self, screen_id: str) -> Optional[StateRecord]:
+        with self._cond:
+            return self._records.get(screen_id)
+
+    def version(self, screen_id: str) -> int:
+        with self._cond:
+            record = self._records.get(screen_id)
+            return record.version if record else 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """화면 ID → 상태 (일관된 시점의 복사본)"""
+        with self._cond:
+            return {screen_id: record.state for screen_id, record in self._records.items()}
+
+    def history(self, screen_id: str) -> List[StateRecord]:
+        with self._cond:
+            return list(self._history.get(screen_id, ()))
+
+    def wait_for_change(self, since_version: Optional[int] = None, timeout: Optional[float] = None,
+                        screen_ids: Optional[Iterable[str]] = None,
+                        stop_event: Optional[threading.Event] = None) -> Optional[int]:
+        """
+        since_version(전체 버전) 이후 변경이 생길 때까지 대기.
+        screen_ids를 주면 호출 이후 해당 화면의 변경에만 깨어남.
+        변경이 있으면 현재 전체 버전을, 타임아웃이거나 stop_event가 설정되면 None을 반환합니다.
+        (stop_event를 set한 쪽이 wake_waiters()를 호출해야 즉시 깨어남)
+        """
+        watched = set(screen_ids) if screen_ids else None
+        with self._cond:
+            if since_version is None:
+                since_version = self._global_version
+            start_versions = {sid: self.version(sid) for sid in watched} if watched else None
+
+            def _changed() -> bool:
+                if stop_event is not None and stop_event.is_set():
+                    return True
+                if self._global_version == since_version:
+                    return False
+                if watched is None:
+                    return True
+                return any(self.version(sid) != start_versions[sid] for sid in watched)
+
+            wall_timeout = None if timeout is None else clock.to_wall(timeout)  # timeout은 시계 기준 초
+            if self._cond.wait_for(_changed, timeout=wall_timeout):
+                return None if stop_event is not None and stop_event.is_set() else self._global_version
+            return None
+
+    def wake_waiters(self):
+        """wait_for_change 대기자들이 조건(stop_event)을 다시 확인하도록 깨움 - 상태는 바뀌지 않음"""
+        with self._cond:
+            self._cond.notify_all()
+
+    def subscribe(self, callback: Callable[[StateRecord, Optional[StateRecord]], None]):
+        """상태가 바뀔 때마다 callback(new_record, old_record) 호출"""
+        self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[StateRecord, Optional[StateRecord]], None]):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
@@ -0,0 +1,200 @@
+# Orchestrator/src/core/tick_scheduler.py
+# 화면별 데드라인 틱 스케줄러 - 상태마다 선언된 폴링 간격으로 화면별 다음 틱 시각을 관리
+#
+# - 모든 화면을 같은 주기로 도는 대신, 화면마다 "다음 틱 시각"을 heap에 넣고 가장 이른 화면만큼만 대기
+#   (HOSTILE / DEAD / 템플릿 대기 중인 화면은 촘촘히, NORMAL / SLEEP 화면은 느슨하게)
+# - 폴링 간격은 각 모니터 config의 timing['state_intervals'](상태 → 초)에 선언, 없는 상태는 모니터 기본 주기
+#   대기형 지시(wait_for_template 등) 중인 화면은 timing['poll_interval']로 당겨짐
+# - 상태(라벨)별 실제 틱 수 / 평균 간격 / 화면당 유효 폴링 주기(Hz)를 집계
+#       profiler 제어 명령 'ticks report' / 'ticks reset' 으로 조회
+#
+# 사용 예 (모니터 run_loop):
+#   ticks = self.ticks
+#   run = ticks.reset(self.screen_keys(), clock.time())
+#   while not stop_event.is_set():
+#       for key in ticks.pop_due(clock.time()):
+#           started = clock.time()
+#           self.tick_screen(key)
+#           if not ticks.schedule(key, started, *self.next_tick_interval(key), run=run):  # 틱 시작 + 상태별 간격
+#               return  # 워치독이 새 루프로 교체함 (멈췄다 풀려난 이전 루프)
+#       clock.wait(stop_event, ticks.time_until_next(clock.time()))
+#
+# reset()은 실행 세대 토큰(run)을 돌려주고, schedule(run=...)은 다른 세대의 요청을 무시(False)합니다.
+# 워치독이 같은 인스턴스로 루프를 다시 시작하면 새 루프의 reset으로 세대가 바뀌므로, 멈췄던 이전 루프가 나중에 풀려나도
+# 새 루프의 데드라인을 건드리지 못하고 종료합니다.
+# asyncio 런타임은 화면마다 코루틴이 직접 대기하므로 heap 없이 record()로 통계만 남깁니다.
+# on_tick(key, 틱 시작 시각)을 설정하면 틱마다 호출 (커버리지 측정, src/core/coverage.py)
+
+import heapq
+import itertools
+import threading
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from Orchestrator.src.utils.log import get_logger
+from Orchestrator.src.utils.profiler import register_command
+
+log = get_logger(__name__)
+
+MIN_INTERVAL = 0.05  # 폴링 간격 하한 (초)
+
+
+class TickScheduler:
+    """화면 키 → 다음 틱 시각(시계 기준) heap + 라벨별 폴링 통계 (스레드 안전)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._due: Dict[Hashable, float] = {}  # 키 → 유효한 데드라인 (heap의 오래된 항목은 무시)
+        self._seq = itertools.count()  # 같은 시각이면 등록 순서
+        self._last_tick: Dict[Hashable, Tuple[float, str]] = {}  # 키 → (마지막 틱 시각, 라벨)
+        self._keys: Tuple[Hashable, ...] = ()  # reset()으로 등록한 화면
+        self._run = 0  # 실행 세대 (reset마다 +1)
+        # 라벨 → [틱 수, 간격 누적 초, 간격 측정 수, 선언 간격 초]
+        self._stats: Dict[str, list] = {}
+        self.on_tick: Optional[Callable[[Hashable, float], None]] = None
+        with _registry_lock:
+            _SCHEDULERS[name] = self
+
+    # -------------------------------------------------------------------------
+    # 데드라인
+    # -------------------------------------------------------------------------
+    def reset(self, keys: Iterable[Hashable], now: float) -> int:
+        """모든 화면을 now에 바로 틱하도록 등록하고 새 실행 세대 토큰 반환 (schedule(run=...)에 전달)"""
+        with self._lock:
+            self._heap.clear()
+            self._due.clear()
+            self._last_tick.clear()
+            self._keys = tuple(keys)
+            for key in self._keys:
+                self._push(key, now)
+            self._run += 1
+            return self._run
+
+    def _push(self, key: Hashable, due: float):
+        self._due[key] = due
+        heapq.heappush(self._heap, (due, next(self._seq), key))
+
+    def wake(self, key: Hashable, now: float):
+        """다음 틱을 now로 당김 (다른 모니터가 상태를 바꾼 경우 등)"""
+        with self._lock:
+            if key in self._due and self._due[key] > now:
+                self._push(key, now)
+
+    def pop_due(self, now: float) -> List[Hashable]:
+        """데드라인이 지난 화면 키를 데드라인 순으로 꺼냄 (꺼낸 키는 schedule()로 다시 등록해야 함)"""
+        due_keys = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                due, _, key = heapq.heappop(self._heap)
+                if self._due.get(key) != due:
+                    continue  # wake()/schedule()로 대체된 항목
+                del self._due[key]
+                due_keys.append(key)
+        return due_keys
+
+    def time_until_next(self, now: float, default: float = 1.0) -> float:
+        """가장 이른 데드라인까지 남은 시간 (등록된 화면이 없으면 default)"""
+        with self._lock:
+            while self._heap and self._due.get(self._heap[0][2]) != self._heap[0][0]:
+                heapq.heappop(self._heap)
+            if not self._heap:
+                return default
+            return max(0.0, self._heap[0][0] - now)
+
+    def schedule(self, key: Hashable, now: float, interval: float, label: str, declared: Optional[float] = None,
+                 run: Optional[int] = None) -> bool:
+        """
+        방금 틱한 화면(key)을 now(틱 시작 시각) + interval에 다시 등록하고 label(보통 상태 이름)로 통계 기록.
+        틱이 interval보다 오래 걸렸으면 바로 다시 due (데드라인 순서라 다른 화면이 밀리지 않음)
+        declared는 상태에 선언된 간격 (보고용, 대기형 지시로 당겨진 경우 interval과 다를 수 있음)
+        run이 현재 실행 세대가 아니면(이후 reset됨) 아무것도 하지 않고 False
+        """
+        interval = max(MIN_INTERVAL, interval)
+        with self._lock:
+            if run is not None and run != self._run:
+                return False
+            self._push(key, now + interval)
+            self._record(key, now, interval, label, declared)
+        if self.on_tick is not None:
+            self.on_tick(key, now)
+        return True
+
+    def record(self, key: Hashable, now: float, interval: float, label: str, declared: Optional[float] = None):
+        """데드라인 등록 없이 통계만 기록 (화면별로 직접 대기하는 asyncio 런타임용)"""
+        with self._lock:
+            self._record(key, now, max(MIN_INTERVAL, interval), label, declared)
+        if self.on_tick is not None:
+            self.on_tick(key, now)
+
+    def _record(self, key: Hashable, now: float, interval: float, label: str, declared: Optional[float]):
+        entry = self._stats.get(label)
+        if entry is None:
+            entry = self._stats[label] = [0, 0.0, 0, declared if declared is not None else interval]
+        entry[0] += 1
+        previous = self._last_tick.get(key)
+        if previous is not None:
+            # 직전 틱부터의 간격은 직전 틱의 라벨에 귀속 (그 상태에서 실제로 기다린 시간)
+            prev_entry = self._stats.get(previous[1])
+            if prev_entry is not None:
+                prev_entry[1] += now - previous[0]
+                prev_entry[2] += 1
+        self._last_tick[key] = (now, label)
+
+    def ticked_all_since(self, since: float) -> bool:
+        """등록된 모든 화면이 since 이후 한 번 이상 틱했는지 (웜/콜드 스타트 후 정상 상태 판정용)"""
+        with self._lock:
+            return bool(self._keys) and all(
+                key in self._last_tick and self._last_tick[key][0] >= since for key in self._keys)
+
+    # -------------------------------------------------------------------------
+    # 통계
+    # -------------------------------------------------------------------------
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+            self._last_tick.clear()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """label → {ticks, declared_s, avg_interval_s, effective_hz}"""
+        with self._lock:
+            items = [(label, list(entry)) for label, entry in self._stats.items()]
+        result = {}
+        for label, (ticks, total, measured, declared) in sorted(items):
+            avg = total / measured if measured else 0.0
+            result[label] = {
+                'ticks': ticks,
+                'declared_s': round(declared, 3),
+                'avg_interval_s': round(avg, 3),
+                'effective_hz': round(1.0 / avg, 2) if avg > 0 else 0.0,
+            }
+        return result
+
+
+_SCHEDULERS: Dict[str, TickScheduler] = {}
+_registry_lock = threading.Lock()
+
+
+def tick_stats() -> Dict[str, Dict[str, Dict[str, float]]]:
+    """모니터 이름 → 라벨 → 폴링 통계"""
+    with _registry_lock:
+        schedulers = list(_SCHEDULERS.values())
+    return {scheduler.name: scheduler.snapshot() for scheduler in schedulers}
+
+
+def reset_tick_stats():
+    with _registry_lock:
+        schedulers = list(_SCHEDULERS.values())
+    for scheduler in schedulers:
+        scheduler.reset_stats()
+
+
+def print_tick_report():
+    for name, labels in tick_stats().items():
+        for label, entry in labels.items():
+            log.info(f"[Ticks] {name:<6}{label:<28}n={entry['ticks']:<7} declared={entry['declared_s']:>6.2f}s "
+                     f"avg={entry['avg_interval_s']:>6.2f}s rate={entry['effective_hz']:>6.2f}Hz/screen")
+
+
+register_command('ticks report', print_tick_report)
+register_command('ticks reset', reset_tick_stats)
@@ -0,0 +1,281 @@
+# Orchestrator/src/core/transition_journal.py
+# 상태 전이 저널 (SQLite, 백그라운드 기록) + 체류 시간/전이 행렬/복구 시간 리포트
+#
+# 사용 예 (리포트):
+#   python -m Orchestrator.src.core.transition_journal --hours 24
+#   python -m Orchestrator.src.core.transition_journal --db path/to/transitions.sqlite3 --vd VD1 --screen S3
+
+import argparse
+import queue
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[2] / "logs" / "transitions.sqlite3"
+
+# 복구 구간 계산 시 "정상"으로 보는 상태 (이 상태들을 벗어났다가 돌아오기까지가 복구 시간)
+BASELINE_STATES = ('NORMAL', 'SLEEP', 'AWAKE')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS transitions (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts          REAL NOT NULL,
+    vd          TEXT,
+    monitor     TEXT,
+    screen_id   TEXT NOT NULL,
+    from_state  TEXT,
+    to_state    TEXT NOT NULL,
+    state_kind  TEXT,
+    reason      TEXT,
+    duration    REAL
+);
+CREATE INDEX IF NOT EXISTS idx_transitions_screen_ts ON transitions (vd, screen_id, ts);
+"""
+
+
+@dataclass
+class TransitionEvent:
+    ts: float
+    vd: str
+    monitor: str
+    screen_id: str
+    from_state: Optional[str]
+    to_state: str
+    state_kind: str  # 'ScreenState' / 'SystemState'
+    reason: Optional[str]
+    duration: Optional[float]  # 이전 상태(from_state)에 머문 시간 (초)
+
+
+class TransitionJournal:
+    """
+    상태 전이를 append-only로 기록하는 저널.
+    record()는 큐에 넣기만 하고, 실제 SQLite 쓰기는 백그라운드 스레드가 묶음으로 처리합니다.
+    """
+
+    def __init__(self, db_path: Optional[Path] = None, flush_interval: float = 1.0, batch_size: int = 200):
+        self.db_path = Path(db_path) if db_path else DEFAULT_DB_PATH
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue: "queue.Queue[TransitionEvent]" = queue.Queue()
+        self._stop_event = threading.Event()
+        self._writer_thread: Optional[threading.Thread] = None
+        self.dropped = 0
+        self.written = 0
+
+    @classmethod
+    def from_config(cls) -> Optional['TransitionJournal']:
+        """JOURNAL_CONFIG 기반 저널 (비활성이면 None)"""
+        try:
+            from Orchestrator.src.utils.config import JOURNAL_CONFIG
+        except ImportError:
+            JOURNAL_CONFIG = {}
+        if not JOURNAL_CONFIG.get('enabled', True):
+            return None
+        return cls(db_path=JOURNAL_CONFIG.get('db_path'), flush_interval=JOURNAL_CONFIG.get('flush_interval', 1.0),
+                   batch_size=JOURNAL_CONFIG.get('batch_size', 200))
+
+    # =========================================================================
+    # 기록 (Hot path)
+    # =========================================================================
+    def record(self, event: TransitionEvent):
+        """모니터 스레드에서 호출. 블로킹 없음"""
+        if self._stop_event.is_set():
+            self.dropped += 1
+            return
+        self._queue.put_nowait(event)
+
+    def on_state_change(self, vd: str, owners: Optional[Dict[str, str]] = None):
+        """
+        SharedStateStore.subscribe()에 넘길 콜백 생성.
+        :param owners: 상태 Enum 타입 이름 → 모니터 ID (GameEntry.state_owners()) - 변경 주체(source)가 없는 기록에 사용
+        """
+        owners = dict(owners or {})
+
+        def _callback(new_record, old_record):
+            state = new_record.state
+            state_kind = type(state).__name__
+            monitor = new_record.source or owners.get(state_kind)
+            self.record(TransitionEvent(
+                ts=new_record.timestamp,
+                vd=vd,
+                monitor=monitor,
+                screen_id=new_record.screen_id,
+                from_state=getattr(old_record.state, 'name', str(old_record.state)) if old_record else None,
+                to_state=getattr(state, 'name', str(state)),
+                state_kind=state_kind,
+                reason=new_record.reason,
+                duration=(new_record.timestamp - old_record.timestamp) if old_record else None,
+            ))
+        return _callback
+
+    # =========================================================================
+    # 백그라운드 writer
+    # =========================================================================
+    def start(self):
+        if self._writer_thread and self._writer_thread.is_alive():
+            return
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._stop_event.clear()
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="TransitionJournal", daemon=True)
+        self._writer_thread.start()
+        log.info(f"[TransitionJournal] Writing transitions to {self.db_path}")
+
+    def stop(self, timeout: float = 5.0):
+        self._stop_event.set()
+        if self._writer_thread:
+            self._writer_thread.join(timeout=timeout)
+            if self._writer_thread.is_alive():
+                log.warning("[TransitionJournal] Writer thread did not stop in time.")
+        log.info(f"[TransitionJournal] Stopped. written={self.written}, dropped={self.dropped}")
+
+    def _writer_loop(self):
+        conn = sqlite3.connect(str(self.db_path))
+        try:
+            conn.executescript(_SCHEMA)
+            while not (self._stop_event.is_set() and self._queue.empty()):
+                batch = self._drain()
+                if batch:
+                    self._write_batch(conn, batch)
+        except Exception as e:
+            log.error(f"[TransitionJournal] Writer failed: {e}")
+        finally:
+            conn.close()
+
+    def _drain(self) -> List[TransitionEvent]:
+        batch = []
+        try:
+            batch.append(self._queue.get(timeout=self.flush_interval))
+            while len(batch) < self.batch_size:
+                batch.append(self._queue.get_nowait())
+        except queue.Empty:
+            pass
+        return batch
+
+    def _write_batch(self, conn: sqlite3.Connection, batch: List[TransitionEvent]):
+        conn.executemany(
+            "INSERT INTO transitions (ts, vd, monitor, screen_id, from_state, to_state, state_kind, reason, duration) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [(e.ts, e.vd, e.monitor, e.screen_id, e.from_state, e.to_state, e.state_kind, e.reason, e.duration)
+             for e in batch]
+        )
+        conn.commit()
+        self.written += len(batch)
+
+
+# =============================================================================
+# 📊 조회 / 리포트
+# =============================================================================
+def _fetch(conn: sqlite3.Connection, since: Optional[float], vd: Optional[str], screen_id: Optional[str]):
+    query = "SELECT ts, vd, monitor, screen_id, from_state, to_state, duration FROM transitions WHERE 1=1"
+    params: list = []
+    if since is not None:
+        query += " AND ts >= ?"
+        params.append(since)
+    if vd:
+        query += " AND vd = ?"
+        params.append(vd)
+    if screen_id:
+        query += " AND screen_id = ?"
+        params.append(screen_id)
+    query += " ORDER BY vd, screen_id, ts"
+    return conn.execute(query, params).fetchall()
+
+
+def dwell_times(rows) -> Dict[Tuple[str, str, str], Dict[str, float]]:
+    """(vd, screen, state) → {count, total, avg, max} (초). 전이 시점의 duration(이전 상태 체류 시간) 기준"""
+    result: Dict[Tuple[str, str, str], Dict[str, float]] = {}
+    for _, vd, _, screen_id, from_state, _, duration in rows:
+        if from_state is None or duration is None:
+            continue
+        entry = result.setdefault((vd, screen_id, from_state), {'count': 0, 'total': 0.0, 'max': 0.0})
+        entry['count'] += 1
+        entry['total'] += duration
+        entry['max'] = max(entry['max'], duration)
+    for entry in result.values():
+        entry['avg'] = entry['total'] / entry['count']
+    return result
+
+
+def transition_matrix(rows) -> Dict[str, Dict[Tuple[str, str], int]]:
+    """vd → {(from_state, to_state): count}"""
+    matrix: Dict[str, Dict[Tuple[str, str], int]] = defaultdict(lambda: defaultdict(int))
+    for _, vd, _, _, from_state, to_state, _ in rows:
+        if from_state is not None:
+            matrix[vd][(from_state, to_state)] += 1
+    return matrix
+
+
+def recovery_durations(rows) -> Dict[Tuple[str, str], List[float]]:
+    """
+    (vd, 최초 이상 상태) → 복구 소요 시간 리스트.
+    정상 상태(BASELINE_STATES)를 벗어난 시점부터 다시 정상 상태로 돌아온 시점까지.
+    """
+    result: Dict[Tuple[str, str], List[float]] = defaultdict(list)
+    open_incidents: Dict[Tuple[str, str], Tuple[float, str]] = {}
+    for ts, vd, _, screen_id, from_state, to_state, _ in rows:
+        key = (vd, screen_id)
+        if to_state in BASELINE_STATES:
+            incident = open_incidents.pop(key, None)
+            if incident:
+                result[(vd, incident[1])].append(ts - incident[0])
+        elif key not in open_incidents and (from_state is None or from_state in BASELINE_STATES):
+            open_incidents[key] = (ts, to_state)
+    return result
+
+
+def print_report(db_path: Path, hours: Optional[float] = None, vd: Optional[str] = None,
+                 screen_id: Optional[str] = None):
+    if not Path(db_path).exists():
+        print(f"Journal not found: {db_path}")
+        return
+
+    since = time.time() - hours * 3600 if hours else None
+    conn = sqlite3.connect(str(db_path))
+    try:
+        rows = _fetch(conn, since, vd, screen_id)
+    finally:
+        conn.close()
+
+    period = f"last {hours:g}h" if hours else "all time"
+    print(f"=== Transition journal report ({period}, {len(rows)} transitions) ===")
+
+    print("\n[Dwell time per state]")
+    print(f"{'VD':<5}{'Screen':<8}{'State':<22}{'Count':>7}{'Total(s)':>12}{'Avg(s)':>10}{'Max(s)':>10}")
+    for (r_vd, r_screen, state), entry in sorted(dwell_times(rows).items()):
+        print(f"{r_vd:<5}{r_screen:<8}{state:<22}{entry['count']:>7}{entry['total']:>12.1f}"
+              f"{entry['avg']:>10.1f}{entry['max']:>10.1f}")
+
+    print("\n[Transition matrix]")
+    for r_vd, counts in sorted(transition_matrix(rows).items()):
+        print(f"-- {r_vd}")
+        for (from_state, to_state), count in sorted(counts.items(), key=lambda kv: -kv[1]):
+            print(f"   {from_state:<22} → {to_state:<22} {count:>6}")
+
+    print("\n[Recovery durations]")
+    for (r_vd, incident_state), durations in sorted(recovery_durations(rows).items()):
+        durations.sort()
+        median = durations[len(durations) // 2]
+        print(f"{r_vd:<5}{incident_state:<22} n={len(durations):<5} median={median:.1f}s "
+              f"max={durations[-1]:.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="State transition journal report")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB_PATH, help="SQLite journal path")
+    parser.add_argument("--hours", type=float, default=None, help="Only include the last N hours")
+    parser.add_argument("--vd", default=None, help="Filter by VD (e.g. VD1)")
+    parser.add_argument("--screen", default=None, help="Filter by screen id (e.g. S3)")
+    args = parser.parse_args()
+    print_report(args.db, args.hours, args.vd, args.screen)
+
+
+if __name__ == "__main__":
+    main()
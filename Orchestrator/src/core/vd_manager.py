@@ -1,87 +1,86 @@
 import cv2
 import numpy as np
-import pyautogui
-import time
-import win32api
-import win32con
 from enum import Enum
 from ..utils.config import TASKBAR_CONFIG
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.core.game_registry import GAMES, desktop_names
+from Orchestrator.src.core.input_backend import inputs, VK_CONTROL, VK_LWIN
+from Orchestrator.src.utils.log import get_logger
 
+log = get_logger(__name__)
 
-class VirtualDesktop(Enum):
-    VD1 = "VD1"  # 게임1
-    VD2 = "VD2"  # 게임2
-    OTHER = "OTHER"
+
+# 게임 레지스트리(GAMES_CONFIG)에 등록된 VD (VD1 = 게임1, VD2 = 게임2, ...) + OTHER
+VirtualDesktop = Enum('VirtualDesktop', [(name, name) for name in desktop_names()] + [('OTHER', 'OTHER')],
+                      module=__name__)
 
 
 class VDManager:
     def __init__(self):
         self.taskbar_region = TASKBAR_CONFIG.region
-        self.game1_icon = TASKBAR_CONFIG.game1_icon
-        self.game2_icon = TASKBAR_CONFIG.game2_icon
         self.confidence_threshold = TASKBAR_CONFIG.confidence_threshold
+        # VD → 작업 표시줄 아이콘 / 작업 보기 화면의 VD 썸네일 위치 (게임 레지스트리)
+        self.icons = {VirtualDesktop[game.vd]: game.taskbar_icon for game in GAMES}
+        self.vd_positions = {VirtualDesktop[game.vd]: game.task_view_position for game in GAMES}
 
     # ✅ [추가] Moonlight 호환성을 위한 '꾹' 클릭 헬퍼
     def _atomic_click(self, x: int, y: int):
         """이동 -> 누름 -> 0.15초 대기 -> 뗌"""
         try:
-            pyautogui.moveTo(x, y)
-            pyautogui.mouseDown()
-            time.sleep(0.15)  # Moonlight가 신호를 놓치지 않도록 충분히 대기
-            pyautogui.mouseUp()
-            time.sleep(0.1)  # 동작 완료 대기
+            inputs.move_to(x, y)
+            inputs.mouse_down()
+            clock.sleep(0.15)  # Moonlight가 신호를 놓치지 않도록 충분히 대기
+            inputs.mouse_up()
+            clock.sleep(0.1)  # 동작 완료 대기
         except Exception as e:
-            print(f"Atomic Click Error: {e}")
+            log.error(f"Atomic Click Error: {e}")
 
     def get_current_vd(self) -> VirtualDesktop:
         # (기존 코드 동일)
         try:
-            taskbar = pyautogui.screenshot(region=self.taskbar_region)
+            taskbar = inputs.screenshot(region=self.taskbar_region)
             taskbar_cv = cv2.cvtColor(np.array(taskbar), cv2.COLOR_RGB2GRAY)
 
-            game1_template = cv2.imread(self.game1_icon, 0)
-            game1_result = cv2.matchTemplate(taskbar_cv, game1_template, cv2.TM_CCOEFF_NORMED)
-            game1_match = cv2.minMaxLoc(game1_result)[1]
-
-            game2_template = cv2.imread(self.game2_icon, 0)
-            game2_result = cv2.matchTemplate(taskbar_cv, game2_template, cv2.TM_CCOEFF_NORMED)
-            game2_match = cv2.minMaxLoc(game2_result)[1]
-
-            if game1_match > self.confidence_threshold:
-                return VirtualDesktop.VD1
-            elif game2_match > self.confidence_threshold:
-                return VirtualDesktop.VD2
-            else:
-                return VirtualDesktop.OTHER
+            # 가장 잘 맞는 게임 아이콘 (기준 미만이면 OTHER)
+            best_vd, best_match = VirtualDesktop.OTHER, self.confidence_threshold
+            for vd, icon in self.icons.items():
+                template = cv2.imread(icon, 0)
+                if template is None:
+                    continue
+                result = cv2.matchTemplate(taskbar_cv, template, cv2.TM_CCOEFF_NORMED)
+                match = cv2.minMaxLoc(result)[1]
+                if match > best_match:
+                    best_vd, best_match = vd, match
+            return best_vd
 
         except Exception as e:
-            print(f"VD 체크 중 에러 발생: {e}")
+            log.warning(f"VD 체크 중 에러 발생: {e}")
             return VirtualDesktop.OTHER
 
     def send_key_combination(self, ctrl=False, win=False, key_code=None):
         # (기존 코드 동일 - 키보드용이라 마우스 클릭엔 사용 안 함)
         try:
             if ctrl:
-                win32api.keybd_event(win32con.VK_CONTROL, 0, 0, 0)
+                inputs.vk_event(VK_CONTROL)
             if win:
-                win32api.keybd_event(win32con.VK_LWIN, 0, 0, 0)
+                inputs.vk_event(VK_LWIN)
             if key_code:
-                win32api.keybd_event(key_code, 0, 0, 0)
+                inputs.vk_event(key_code)
 
-            time.sleep(0.1)
+            clock.sleep(0.1)
 
             if key_code:
-                win32api.keybd_event(key_code, 0, win32con.KEYEVENTF_KEYUP, 0)
+                inputs.vk_event(key_code, key_up=True)
             if win:
-                win32api.keybd_event(win32con.VK_LWIN, 0, win32con.KEYEVENTF_KEYUP, 0)
+                inputs.vk_event(VK_LWIN, key_up=True)
             if ctrl:
-                win32api.keybd_event(win32con.VK_CONTROL, 0, win32con.KEYEVENTF_KEYUP, 0)
+                inputs.vk_event(VK_CONTROL, key_up=True)
 
         except Exception as e:
-            print(f"키 입력 오류: {e}")
+            log.error(f"키 입력 오류: {e}")
 
     def switch_to(self, target_vd: VirtualDesktop):
-        print(f"DEBUG: switch_to called - target: {target_vd.name}")
+        log.debug(f"switch_to called - target: {target_vd.name}")
 
         if target_vd == VirtualDesktop.OTHER:
             return
@@ -90,7 +89,7 @@ class VDManager:
         if current_vd == target_vd:
             return
 
-        print(f"DEBUG: Switching from {current_vd.name} to {target_vd.name}")
+        log.debug(f"Switching from {current_vd.name} to {target_vd.name}")
 
         # 1단계: 작업보기 버튼 클릭
         task_view_x = 351
@@ -99,18 +98,13 @@ class VDManager:
         # [수정] pyautogui.click -> self._atomic_click
         self._atomic_click(task_view_x, task_view_y)
 
-        time.sleep(1.0)  # 작업보기 UI 로딩 대기
+        clock.sleep(1.0)  # 작업보기 UI 로딩 대기
 
         # 2단계: 목표 VD 클릭
-        vd_positions = {
-            VirtualDesktop.VD1: (282, 63),
-            VirtualDesktop.VD2: (463, 63)
-        }
-
-        target_pos = vd_positions.get(target_vd)
+        target_pos = self.vd_positions.get(target_vd)
         if target_pos:
             # [수정] pyautogui.click -> self._atomic_click
             self._atomic_click(target_pos[0], target_pos[1])
 
-            time.sleep(1.5)  # VD 전환 완료 대기
-            print(f"DEBUG: VD switch completed to {target_vd.name}")
\ No newline at end of file
+            clock.sleep(1.5)  # VD 전환 완료 대기
+            log.debug(f"VD switch completed to {target_vd.name}")
\ No newline at end of file
@@ -0,0 +1,228 @@
+# Orchestrator/src/core/watchdog.py
+# 워치독 - 모니터 틱 / IO 액션 하트비트를 추적해 멈춘 작업을 찾고, 스택을 남기고, 작업자를 재시작
+#
+# - 하트비트: 틱 하나 / IO 액션 하나를 activity()로 감싸면 시작 시각과 실행 스레드를 기록
+#       with WATCHDOG.activity(self.monitor_id, screen_id):      # 예산은 WATCHDOG_CONFIG['tick_budget']
+#           self._handle_screen_state(screen)
+# - 감시 스레드(check_interval마다)가 예산을 넘긴 작업을 멈춤(stall)으로 판정:
+#       1) 멈춘 스레드의 현재 스택을 로그로 남김 (pyautogui 블로킹 호출, 끝나지 않는 while 등 위치 확인)
+#       2) 작업자에 재시작 콜백이 등록돼 있으면 재시작 (오케스트레이터: 모니터 스레드 교체, IO 워커 교체)
+#          연속 재시작은 backoff_base × 2^(n-1)초 간격 (최대 backoff_max), backoff_max 동안 멈춤이 없으면 초기화
+# - 파이썬 스레드는 강제로 죽일 수 없으므로 멈춘 스레드는 stop_event만 설정하고 버림 (데몬 스레드).
+#   나중에 호출이 끝나면 stop_event를 보고 스스로 종료
+# - 작업자별 멈춤 수 / 재시작 수 / 가장 긴 작업 시간 집계
+#       profiler 제어 명령 'watchdog report' / 'watchdog reset' 으로 조회
+
+import itertools
+import sys
+import threading
+import traceback
+from contextlib import contextmanager
+from typing import Callable, Dict, Optional
+
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.utils.log import get_logger
+from Orchestrator.src.utils.profiler import register_command
+
+log = get_logger(__name__)
+
+IO_WORKER = "IO"  # IO 스케줄러 작업자 이름
+
+
+class _Activity:
+    __slots__ = ('worker', 'label', 'started', 'budget', 'thread_id', 'thread_name', 'stalled')
+
+    def __init__(self, worker: str, label: str, started: float, budget: float):
+        self.worker = worker
+        self.label = label
+        self.started = started
+        self.budget = budget
+        thread = threading.current_thread()
+        self.thread_id = thread.ident
+        self.thread_name = thread.name
+        self.stalled = False
+
+
+class Watchdog:
+    """작업자(모니터 / IO)별 하트비트 추적 + 멈춤 감지 + 재시작 (스레드 안전)"""
+
+    def __init__(self, enabled: bool = True, check_interval: float = 1.0, tick_budget: float = 60.0,
+                 io_budget: float = 30.0, backoff_base: float = 5.0, backoff_max: float = 300.0):
+        self.enabled = enabled
+        self.check_interval = check_interval
+        self.tick_budget = tick_budget
+        self.io_budget = io_budget
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._lock = threading.Lock()
+        self._ids = itertools.count()
+        self._active: Dict[int, _Activity] = {}
+        self._restarts: Dict[str, Callable[[], None]] = {}  # 작업자 → 재시작 콜백
+        self._budgets: Dict[str, float] = {}  # 작업자 → 기본 예산 (등록 시 지정한 경우)
+        self._consecutive: Dict[str, int] = {}  # 작업자 → 연속 재시작 수
+        self._next_restart: Dict[str, float] = {}  # 작업자 → 다음 재시작 가능 시각
+        self._last_stall: Dict[str, float] = {}
+        # 작업자 → [멈춤 수, 재시작 수, 가장 긴 작업 초, 마지막 멈춤 라벨]
+        self._stats: Dict[str, list] = {}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def configure(self, config: Dict):
+        for key in ('enabled', 'check_interval', 'tick_budget', 'io_budget', 'backoff_base', 'backoff_max'):
+            if key in config:
+                setattr(self, key, config[key])
+
+    # =========================================================================
+    # 하트비트
+    # =========================================================================
+    @contextmanager
+    def activity(self, worker: str, label: str = "", budget: Optional[float] = None):
+        """작업 하나(틱 / IO 액션)의 시작~끝을 기록. 예산을 넘기면 감시 스레드가 멈춤으로 판정"""
+        if not self.enabled:
+            yield
+            return
+        if budget is None:
+            budget = self._budgets.get(worker, self.io_budget if worker == IO_WORKER else self.tick_budget)
+        entry = _Activity(worker, label, clock.time(), budget)
+        activity_id = next(self._ids)
+        with self._lock:
+            self._active[activity_id] = entry
+        try:
+            yield
+        finally:
+            elapsed = clock.time() - entry.started
+            with self._lock:
+                self._active.pop(activity_id, None)  # 재시작으로 버려진 작업이면 이미 없음
+                stats = self._stats_for(worker)
+                stats[2] = max(stats[2], elapsed)
+            if entry.stalled:
+                log.warning(f"[Watchdog] {worker} {label} finished after {elapsed:.1f}s (stalled)")
+
+    def register(self, worker: str, restart: Optional[Callable[[], None]] = None, budget: Optional[float] = None):
+        """작업자의 재시작 콜백 / 기본 예산 등록 (이미 있으면 교체)"""
+        with self._lock:
+            if restart is not None:
+                self._restarts[worker] = restart
+            if budget is not None:
+                self._budgets[worker] = budget
+
+    def unregister(self, worker: str):
+        """정상 중지된 작업자: 재시작 대상에서 제외하고 진행 중 작업 기록 삭제"""
+        with self._lock:
+            self._restarts.pop(worker, None)
+            for activity_id in [i for i, a in self._active.items() if a.worker == worker]:
+                del self._active[activity_id]
+
+    def _stats_for(self, worker: str) -> list:
+        stats = self._stats.get(worker)
+        if stats is None:
+            stats = self._stats[worker] = [0, 0, 0.0, ""]
+        return stats
+
+    # =========================================================================
+    # 감시 스레드
+    # =========================================================================
+    def start(self):
+        if not self.enabled or (self._thread is not None and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="Watchdog", daemon=True)
+        self._thread.start()
+        log.info(f"[Watchdog] Started (tick budget {self.tick_budget:g}s, IO budget {self.io_budget:g}s)")
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2.0)
+            self._thread = None
+
+    def _run(self):
+        while not clock.wait(self._stop, self.check_interval):
+            try:
+                self.check(clock.time())
+            except Exception as e:
+                log.error(f"[Watchdog] Check failed: {e}")
+
+    def check(self, now: float):
+        """예산을 넘긴 작업을 멈춤으로 판정하고 (백오프 허용 시) 작업자 재시작"""
+        with self._lock:
+            overdue = [a for a in self._active.values() if now - a.started > a.budget]
+            for worker, last in list(self._last_stall.items()):
+                if now - last > self.backoff_max:
+                    self._consecutive.pop(worker, None)  # 한동안 멈춤이 없었으면 백오프 초기화
+                    del self._last_stall[worker]
+        frames = sys._current_frames() if overdue else {}
+        for activity in overdue:
+            if not activity.stalled:
+                activity.stalled = True
+                self._report_stall(activity, now, frames.get(activity.thread_id))
+            self._maybe_restart(activity.worker, now)
+
+    def _report_stall(self, activity: _Activity, now: float, frame):
+        with self._lock:
+            stats = self._stats_for(activity.worker)
+            stats[0] += 1
+            stats[3] = activity.label
+            self._last_stall[activity.worker] = now
+        stack = ''.join(traceback.format_stack(frame)) if frame is not None else "  (thread already finished)\n"
+        log.warning(f"[Watchdog] STALL: {activity.worker} {activity.label} running {now - activity.started:.1f}s "
+                    f"(budget {activity.budget:g}s) on thread {activity.thread_name}\n{stack}")
+
+    def _maybe_restart(self, worker: str, now: float):
+        with self._lock:
+            restart = self._restarts.get(worker)
+            if restart is None or now < self._next_restart.get(worker, 0.0):
+                return
+            count = self._consecutive.get(worker, 0) + 1
+            self._consecutive[worker] = count
+            self._next_restart[worker] = now + min(self.backoff_max, self.backoff_base * 2 ** (count - 1))
+            # 멈춘 작업은 버림 (끝나면 스스로 기록을 지우려 하지만 이미 없음)
+            for activity_id in [i for i, a in self._active.items() if a.worker == worker]:
+                del self._active[activity_id]
+            self._stats_for(worker)[1] += 1
+        log.warning(f"[Watchdog] Restarting {worker} (restart #{count}, "
+                    f"next allowed in {self._next_restart[worker] - now:.0f}s)")
+        try:
+            restart()
+        except Exception as e:
+            log.error(f"[Watchdog] Restart of {worker} failed: {e}")
+
+    # =========================================================================
+    # 통계
+    # =========================================================================
+    def stats(self) -> Dict[str, Dict]:
+        """작업자 → {stalls, restarts, longest_s, last_stall, running}"""
+        now = clock.time()
+        with self._lock:
+            running = {}
+            for a in self._active.values():
+                running[a.worker] = max(running.get(a.worker, 0.0), now - a.started)
+            return {
+                worker: {'stalls': stalls, 'restarts': restarts, 'longest_s': round(longest, 3),
+                         'last_stall': last_label, 'running_s': round(running.get(worker, 0.0), 3)}
+                for worker, (stalls, restarts, longest, last_label) in sorted(self._stats.items())
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+    def print_report(self):
+        for worker, entry in self.stats().items():
+            log.info(f"[Watchdog] {worker:<6} stalls={entry['stalls']:<4} restarts={entry['restarts']:<4} "
+                     f"longest={entry['longest_s']:>7.2f}s running={entry['running_s']:>7.2f}s "
+                     f"last_stall={entry['last_stall'] or '-'}")
+
+
+def _load_config() -> Dict:
+    try:
+        from Orchestrator.src.utils.config import WATCHDOG_CONFIG
+        return WATCHDOG_CONFIG
+    except ImportError:
+        return {}
+
+
+WATCHDOG = Watchdog()
+WATCHDOG.configure(_load_config())
+register_command('watchdog report', WATCHDOG.print_report)
+register_command('watchdog reset', WATCHDOG.reset_stats)
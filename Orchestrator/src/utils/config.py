@@ -6,13 +6,192 @@ from typing import Tuple
 @dataclass
 class TaskbarConfig:
    region: Tuple[int, int, int, int]  # x, y, width, height 좌표
-   game1_icon: str  # 게임1 작업표시줄 아이콘 경로
-   game2_icon: str  # 게임2 작업표시줄 아이콘 경로
-   confidence_threshold: float = 0.85
+   confidence_threshold: float = 0.85  # 게임별 작업표시줄 아이콘은 GAMES_CONFIG['taskbar_icon']
 
 # 실제 값들은 외부에서 주입
 TASKBAR_CONFIG = TaskbarConfig(
    region=(0, 1040, 1920, 40),
-   game1_icon=r"C:\Users\yjy16\template\NightCrows\NC.png",
-   game2_icon=r"C:\Users\yjy16\template\RAVEN2\raven2.png",
-)
\ No newline at end of file
+)
+
+# 게임 레지스트리 (src/core/game_registry.py)
+# 게임마다 VD / 화면 / 모니터 / 템플릿 / 예약 작업 / VD 전환 위치를 선언. 목록 순서 = VD 순서 (시간 분할 순환)
+# 게임 추가: 항목 하나 (작업 보기 화면의 VD 썸네일 위치 task_view_position 확인)
+GAMES_CONFIG = [
+   {
+      'name': 'NightCrows',
+      'vd': 'VD1',
+      'screen_info': 'Orchestrator.NightCrows.utils.screen_info',  # SCREEN_REGIONS / FIXED_UI_COORDS / EVENT_UI_REGIONS
+      'layout': None,  # 배치 파일 (JSON, Orchestrator 기준 경로) - S6 이후 화면 추가 / 이동 (src/core/screen_layout.py)
+      # 'screens': ['S1', 'S2', 'S3', 'S4', 'S5'],  # 모니터링할 화면만 고를 때 (생략 시 배치의 모든 화면)
+      'monitors': [
+         {'key': 'srm1', 'id': 'SRM1', 'kind': 'srm',
+          'component': ('Orchestrator.NightCrows.Combat_Monitor.monitor', 'CombatMonitor'),
+          'config': {'confidence': 0.85}},
+         {'key': 'sm1', 'id': 'SM1', 'kind': 'sm',
+          'component': ('Orchestrator.NightCrows.System_Monitor.src.core.monitor', 'create_system_monitor')},
+      ],
+      'templates': [
+         ('Orchestrator.NightCrows.Combat_Monitor.config.template_paths', 'TEMPLATES'),
+         ('Orchestrator.NightCrows.System_Monitor.config.template_paths', 'TEMPLATES'),
+      ],
+      'tasks': [
+         {'task': 'DP1', 'main': 'NightCrows/Daily_Present/main.py', 'at': '05:00'},  # Daily Present
+         {'task': 'MO1', 'main': 'NightCrows/Mail_opener/main.py', 'at': ['12:00', '21:00']},  # Mail Opener
+      ],
+      'taskbar_icon': r"C:\Users\yjy16\template\NightCrows\NC.png",
+      'task_view_position': (282, 63),
+      'slice_min': 3,
+      'safe_states': ['BUYING_POTIONS', 'RETURNING'],  # SM 오류 보고를 무시할 SRM 상태
+   },
+   {
+      'name': 'Raven2',
+      'vd': 'VD2',
+      'screen_info': 'Orchestrator.Raven2.utils.screen_info',
+      'layout': None,
+      'monitors': [
+         {'key': 'srm2', 'id': 'SRM2', 'kind': 'srm',
+          'component': ('Orchestrator.Raven2.Combat_Monitor.src.monitor', 'CombatMonitor'),
+          'screen_options': {'S5': {'ratio': 1.4}}},
+         {'key': 'sm2', 'id': 'SM2', 'kind': 'sm',
+          'component': ('Orchestrator.Raven2.System_Monitor.src.core.monitor', 'create_system_monitor')},
+      ],
+      'templates': [
+         ('Orchestrator.Raven2.Combat_Monitor.src.config.template_paths', 'TEMPLATE_PATHS'),
+         ('Orchestrator.Raven2.System_Monitor.config.template_paths', 'TEMPLATES'),
+      ],
+      'tasks': [
+         {'task': 'DP2', 'main': 'Raven2/Daily_Present/main.py', 'at': '05:10'},
+         {'task': 'MO2', 'main': 'Raven2/Mail_opener/main.py', 'at': ['12:02', '21:02']},
+      ],
+      'taskbar_icon': r"C:\Users\yjy16\template\RAVEN2\raven2.png",
+      'task_view_position': (463, 63),
+      'slice_min': 3,
+      'safe_states': ['SAFE_ZONE', 'ABNORMAL'],
+   },
+]
+
+# 입력/플랫폼 백엔드 (src/core/input_backend.py)
+# 'auto': Windows면 실제 입력, 그 외(Linux 샌드박스 등)는 입력을 기록만 하는 fake
+# 환경 변수 ORCH_INPUT_BACKEND 로 덮어쓸 수 있음
+PLATFORM_CONFIG = {
+   'input_backend': 'auto',
+}
+
+# 로깅 설정 (src/utils/log.py)
+LOGGING_CONFIG = {
+   'level': 'INFO',
+   'module_levels': {
+      # 예: 'Orchestrator.NightCrows.Combat_Monitor.monitor': 'WARNING',
+   },
+   'rate_limit_window': 5.0,  # 같은 메시지 반복 억제 구간 (초)
+   'logfile': None,
+}
+
+# 프로파일링 설정 (src/utils/profiler.py)
+# 실행 중 제어: logs/profiler.cmd 파일에 'spans on' / 'spans report' / 'sample 30' 등을 기록
+PROFILING_CONFIG = {
+   'spans_enabled': False,  # 시작 시 구간 계측 활성화 여부
+   'sample_interval': 0.005,  # 스택 샘플링 간격 (초)
+}
+
+# 시작 시간 설정 (src/utils/profiler.py STARTUP, src/core/orchestrator.py)
+# import 추적: python -m Orchestrator.bench.importtime --out importtime.json (--compare 로 이전 결과와 비교)
+STARTUP_CONFIG = {
+   'lazy_components': True,  # 모니터 모듈 import/생성(템플릿 검증 포함)을 해당 VD 첫 사용 시 백그라운드로
+   'import_budget_ms': 1500,  # import 합계 예산 (초과 시 경고)
+   'startup_budget_ms': 10000,  # 프로세스 시작 → 첫 모니터링 시작 예산 (VD 전환 대기 포함)
+}
+
+# 상태 전이 저널 (src/core/transition_journal.py)
+# 모든 공유 상태 전이를 백그라운드로 SQLite에 기록. 리포트: python -m Orchestrator.src.core.transition_journal --hours 24
+JOURNAL_CONFIG = {
+   'enabled': True,
+   'db_path': None,  # None이면 Orchestrator/logs/transitions.sqlite3
+   'flush_interval': 1.0,  # 묶음 쓰기 최대 대기 (초)
+   'batch_size': 200,
+}
+
+# 세션 기록 설정 (src/core/session_recorder.py)
+# 환경 변수 ORCH_RECORD_SESSION=1 로도 활성화. 리플레이: python -m Orchestrator.src.core.session_replay <세션 폴더>
+RECORDING_CONFIG = {
+   'enabled': False,
+   'dir': None,  # None이면 Orchestrator/logs/sessions
+   'min_frame_interval': 0.0,  # 화면별 최소 기록 간격 (초). 0이면 모든 캡처 기록 (중복 프레임은 한 번만 저장)
+   'png_compression': 3,
+   'max_queue': 500,  # writer가 밀리면 초과분은 버림 (캡처 스레드 블로킹 방지)
+   'snapshot_templates': True,  # 기록 시작 시 템플릿 사본 저장 (오프라인 리플레이용)
+}
+
+# 모니터 실행 런타임 (src/core/orchestrator.py, src/core/async_runtime.py)
+# 'threads': 모니터마다 run_loop 스레드 + IOScheduler 워커 스레드 (기존)
+# 'asyncio': 이벤트 루프 하나에서 화면별 코루틴, 틱은 executor_workers 스레드 풀, IO는 asyncio 우선순위 큐
+# 비교: python -m Orchestrator.sim --game raven2 --scenario deaths --runtime both
+RUNTIME_CONFIG = {
+   'mode': 'threads',
+   'executor_workers': 2,  # asyncio 모드에서 캡처/템플릿 매칭을 실행할 스레드 수
+}
+
+# 체크포인트 / 웜 리스타트 (src/core/checkpoint.py)
+# 공유 상태 + 모니터 진행 상황(location_flag / current_wp / death_count / 정책 단계)을 주기적으로 저장,
+# 재시작 시 화면을 한 번 확인한 뒤 이어서 진행. 재시작 → 정상 상태 도달 시간은 로그 "[Checkpoint] ... steady state"
+# 비교: python -m Orchestrator.sim --game nightcrows --scenario deaths --restart-at 60 (--cold)
+CHECKPOINT_CONFIG = {
+   'enabled': True,
+   'path': None,  # None이면 Orchestrator/logs/checkpoint.json
+   'interval': 10.0,  # 저장 주기 (초, 내용이 바뀐 경우만 기록)
+   'max_age': 600.0,  # 이보다 오래된 체크포인트는 무시하고 콜드 스타트 (초)
+}
+
+# 워치독 (src/core/watchdog.py)
+# 모니터 틱 / IO 액션이 예산보다 오래 걸리면 멈춤으로 보고 스택을 로그에 남긴 뒤 해당 작업자를 재시작
+# 조회: logs/profiler.cmd 에 'watchdog report' / 'watchdog reset'
+WATCHDOG_CONFIG = {
+   'enabled': True,
+   'check_interval': 1.0,  # 감시 주기 (초)
+   'tick_budget': 60.0,  # 모니터 틱 하나의 최대 시간 (초, NightCrows SRM 시퀀스의 블로킹 대기 포함)
+   'io_budget': 30.0,  # IO 액션 하나의 최대 시간 (초)
+   'backoff_base': 5.0,  # 연속 재시작 간격: base × 2^(n-1)초
+   'backoff_max': 300.0,  # 재시작 간격 상한, 이 시간 동안 멈춤이 없으면 연속 횟수 초기화 (초)
+}
+
+# 예약 작업 (src/core/job_scheduler.py, src/core/orchestrator.py setup_schedule)
+# 작업 목록은 GAMES_CONFIG의 tasks (at: "HH:MM" 또는 목록). 작업별로 catch_up / grace / jitter 재지정 가능
+# catch_up - 'run_once': 놓친 실행은 한 번만 늦게 / 'run_all': 놓친 만큼 모두 / 'skip': grace초보다 늦으면 버림
+SCHEDULE_CONFIG = {
+   'catch_up': 'run_once',
+   'grace': 300.0,  # 'skip' 정책에서 허용하는 지각 (초)
+   'jitter': 0.0,  # 실행 시각에 더할 무작위 지연 상한 (초)
+}
+
+# 모니터링 커버리지 (src/core/coverage.py)
+# 화면별로 최근 horizon초 안에 틱이 있었던 시간 비율 + 사각 구간 길이 분포 + 사각 구간 직후 발견한 이상 상태
+# 조회: logs/profiler.cmd 에 'coverage report' / 'coverage reset' / 'coverage export' (종료 시 자동 export)
+COVERAGE_CONFIG = {
+   'horizon': 5.0,  # 틱 하나가 화면을 "보고 있다"고 인정하는 시간 (초, 상태별 폴링 간격보다 길게)
+   'arrival_window': None,  # 사각 구간 직후 이 시간 안의 이상 상태를 도착 시 이상으로 집계 (초, None이면 horizon)
+   'buckets': [5, 15, 30, 60, 120, 300, 600, 1800],  # 사각 구간 히스토그램 경계 (초)
+   'ignored_states': ['INITIALIZING'],  # 모니터 시작 시 스스로 설정하는 상태 (도착 시 이상에서 제외)
+   'export_path': None,  # None이면 Orchestrator/logs/coverage.json
+}
+
+# 다중 프로세스 템플릿 탐지 (src/core/detection_pool.py) - 시뮬레이션 / 벤치 전용, 오케스트레이터는 시작하지 않음
+# 캡처한 프레임을 공유 메모리 링 버퍼에 쓰고 탐지 작업 프로세스들이 템플릿 묶음을 매칭. 작업 프로세스를 쓸 수 없으면 스레드 안에서 매칭
+# 비교: python -m Orchestrator.sim --game raven2 --scenario deaths --detection both (틱 지연 / CPU)
+DETECTION_CONFIG = {
+   'workers': 2,  # 탐지 작업 프로세스 수 (화면은 작업 프로세스에 고정 배정)
+   'slots': 16,  # 링 버퍼 슬롯 수 (화면 수 × 2 이상 권장, 매칭 전에 덮어쓰면 결과를 버리고 스레드 안에서 매칭)
+   'timeout': 2.0,  # 결과 대기 상한 (초, 넘으면 스레드 안에서 매칭)
+}
+
+# VD 전환 정책 (src/core/orchestrator.py run_orchestration_loop)
+# early_yield: 현재 VD의 모든 화면이 정상 상태(NORMAL/SLEEP/AWAKE)이고 IO도 없이 quiet_period초가 지났고
+#              다른 VD를 other_blind_min초 이상 못 봤으면 시간 분할이 남아 있어도 전환
+# 비교: python -m Orchestrator.sim.day --compare-early-yield (커버리지 / 사각 구간 변화)
+SWITCH_CONFIG = {
+   'early_yield': {
+      'enabled': True,
+      'min_dwell': 60.0,  # 전환 후 최소 체류 (초) - 왕복 전환(thrashing) 방지
+      'quiet_period': 45.0,  # 이 시간 동안 사건(비정상 상태 / 상태 변경 / IO)이 없어야 양보 (초)
+      'other_blind_min': 90.0,  # 다른 VD의 사각 시간이 이 이상일 때만 양보 (초)
+   },
+}
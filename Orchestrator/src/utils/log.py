@@ -0,0 +1,321 @@
+# Orchestrator/src/utils/log.py
+# 비동기(큐 기반) 구조화 로깅 - print 대체
+#
+# - 호출 스레드는 큐에 넣기만 하고, 콘솔 출력은 백그라운드 리스너 스레드가 담당 (Windows 콘솔 지연 차단)
+# - 모듈별 레벨 (LOGGING_CONFIG['module_levels'] 또는 set_module_level)
+# - 같은 메시지(구조화 필드 포함) 반복은 rate_limit_window 동안 한 번만 출력하고 "(repeated N times)"로 요약
+#   억제된 횟수는 다음 같은 메시지에 붙이거나, 그 전에 window가 지나면(또는 flush_logging) 마지막 억제 레코드로 출력
+# - 구조화 필드: log.info("...", monitor_id="SRM1", screen_id="S3", state="DEAD")
+#
+# 벤치마크:  python -m Orchestrator.src.utils.log --bench
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+BASE_LOGGER_NAME = "Orchestrator"
+_RESERVED_KWARGS = ('exc_info', 'stack_info', 'stacklevel', 'extra')
+
+_config_lock = threading.Lock()
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_rate_filter: Optional['RateLimitFilter'] = None
+
+
+# =============================================================================
+# 포맷 / 필터
+# =============================================================================
+class _StructuredFormatter(logging.Formatter):
+    """'HH:MM:SS.mmm LEVEL message key=value ...' 형식"""
+
+    LEVEL_NAMES = {logging.WARNING: 'WARN', logging.CRITICAL: 'FATAL'}
+
+    def format(self, record: logging.LogRecord) -> str:
+        timestamp = time.strftime('%H:%M:%S', time.localtime(record.created))
+        level = self.LEVEL_NAMES.get(record.levelno, record.levelname)
+        line = f"{timestamp}.{int(record.msecs):03d} {level:<5} {record.getMessage()}"
+        fields = getattr(record, 'fields', None)
+        if fields:
+            line += "  " + " ".join(f"{key}={value}" for key, value in fields.items())
+        repeated = getattr(record, 'repeated', 0)
+        if repeated:
+            line += f"  (repeated {repeated} times)"
+        if record.exc_info:
+            line += "\n" + self.formatException(record.exc_info)
+        return line
+
+
+class _FastQueueHandler(logging.handlers.QueueHandler):
+    """호출 스레드에서는 포맷하지 않고 레코드만 큐에 넣음 (같은 프로세스 안에서만 사용)"""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    같은 (로거, 레벨, 메시지, 구조화 필드)가 window 초 안에 반복되면 억제하고 횟수만 센다.
+    억제 수는 다음 출력에 붙이고, 그 전에 window가 지나면 emit(보통 같은 핸들러의 handle)으로 요약 출력
+    """
+
+    def __init__(self, window: float = 5.0, emit: Optional[Callable[[logging.LogRecord], None]] = None):
+        super().__init__()
+        self.window = window
+        self.emit = emit
+        self._lock = threading.Lock()
+        self._last_emit: Dict[tuple, float] = {}
+        self._pending: Dict[tuple, list] = {}  # 키 → [마지막 억제 레코드, 억제 수]
+        self._timer: Optional[threading.Timer] = None
+
+    @staticmethod
+    def _key(record: logging.LogRecord) -> tuple:
+        fields = getattr(record, 'fields', None)
+        return (record.name, record.levelno, record.getMessage(),
+                tuple((key, str(value)) for key, value in fields.items()) if fields else ())
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.window <= 0 or getattr(record, 'rate_limit_summary', False):
+            return True
+        key = self._key(record)
+        with self._lock:
+            last = self._last_emit.get(key)
+            if last is not None and record.created - last < self.window:
+                entry = self._pending.get(key)
+                if entry is None:
+                    self._pending[key] = [record, 1]
+                else:
+                    entry[0] = record
+                    entry[1] += 1
+                if self._timer is None and self.emit is not None:
+                    self._timer = threading.Timer(self.window, self._on_timer)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return False
+            self._last_emit[key] = record.created
+            entry = self._pending.pop(key, None)
+            record.repeated = entry[1] if entry else 0
+            if len(self._last_emit) > 5000:
+                # 오래된 키 정리 (억제 수가 남은 키는 유지)
+                cutoff = record.created - self.window
+                self._last_emit = {k: t for k, t in self._last_emit.items() if t >= cutoff or k in self._pending}
+        return True
+
+    def _on_timer(self):
+        with self._lock:
+            self._timer = None
+        self.flush(now=time.time())
+        with self._lock:
+            if self._pending and self._timer is None:
+                self._timer = threading.Timer(self.window, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self, now: Optional[float] = None):
+        """남은 억제 수를 출력 (now를 주면 마지막 출력 후 window가 지난 것만)"""
+        due: List[logging.LogRecord] = []
+        with self._lock:
+            for key, (record, count) in list(self._pending.items()):
+                if now is None or now - self._last_emit.get(key, 0.0) >= self.window:
+                    del self._pending[key]
+                    self._last_emit[key] = record.created
+                    record.repeated = count
+                    record.rate_limit_summary = True
+                    due.append(record)
+        if self.emit is not None:
+            for record in due:
+                self.emit(record)
+
+
+# =============================================================================
+# 구조화 로거
+# =============================================================================
+class StructuredLogger(logging.LoggerAdapter):
+    """키워드 인자를 구조화 필드로 받는 로거. bind()로 고정 필드를 붙일 수 있음"""
+
+    def process(self, msg, kwargs):
+        fields = dict(self.extra) if self.extra else {}
+        for key in list(kwargs.keys()):
+            if key not in _RESERVED_KWARGS:
+                value = kwargs.pop(key)
+                fields[key] = getattr(value, 'name', value)  # Enum은 이름으로
+        if fields:
+            kwargs['extra'] = {**kwargs.get('extra', {}), 'fields': fields}
+        return msg, kwargs
+
+    def bind(self, **fields) -> 'StructuredLogger':
+        merged = dict(self.extra) if self.extra else {}
+        merged.update(fields)
+        return StructuredLogger(self.logger, merged)
+
+    def set_level(self, level):
+        self.logger.setLevel(level)
+
+
+def _qualify(name: str) -> str:
+    if name == BASE_LOGGER_NAME or name.startswith(BASE_LOGGER_NAME + "."):
+        return name
+    return f"{BASE_LOGGER_NAME}.{name}"
+
+
+def get_logger(name: str, **fields) -> StructuredLogger:
+    """모듈 로거 반환 (처음 호출 시 기본 설정으로 비동기 로깅 구성)"""
+    _ensure_configured()
+    return StructuredLogger(logging.getLogger(_qualify(name)), fields)
+
+
+# =============================================================================
+# 설정
+# =============================================================================
+def configure_logging(level: str = "INFO", module_levels: Optional[Dict[str, str]] = None,
+                      rate_limit_window: float = 5.0, stream=None, logfile: Optional[str] = None):
+    """큐 기반 로깅 구성 (재호출 시 기존 리스너를 교체)"""
+    global _listener, _queue_handler, _rate_filter
+
+    with _config_lock:
+        base = logging.getLogger(BASE_LOGGER_NAME)
+        if _listener is not None:
+            _listener.stop()
+            if _rate_filter is not None:
+                _rate_filter.flush()
+        if _queue_handler is not None:
+            base.removeHandler(_queue_handler)
+
+        formatter = _StructuredFormatter()
+        handlers = []
+
+        stream_handler = logging.StreamHandler(stream or sys.stdout)
+        stream_handler.setFormatter(formatter)
+        _rate_filter = RateLimitFilter(rate_limit_window, emit=stream_handler.handle)
+        stream_handler.addFilter(_rate_filter)
+        handlers.append(stream_handler)
+
+        if logfile:
+            file_handler = logging.FileHandler(logfile, encoding='utf-8')
+            file_handler.setFormatter(formatter)
+            handlers.append(file_handler)
+
+        log_queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        _queue_handler = _FastQueueHandler(log_queue)
+        base.addHandler(_queue_handler)
+        base.setLevel(level)
+        base.propagate = False
+
+        for module_name, module_level in (module_levels or {}).items():
+            logging.getLogger(_qualify(module_name)).setLevel(module_level)
+
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+
+
+def _ensure_configured():
+    if _listener is not None:
+        return
+    try:
+        from Orchestrator.src.utils.config import LOGGING_CONFIG
+    except ImportError:
+        LOGGING_CONFIG = {}
+    if _listener is None:
+        configure_logging(**LOGGING_CONFIG)
+
+
+def set_module_level(module_name: str, level: str):
+    """실행 중 모듈별 로그 레벨 변경"""
+    logging.getLogger(_qualify(module_name)).setLevel(level)
+
+
+def flush_logging():
+    """큐에 남은 로그와 억제 수를 모두 출력 (프로세스 종료 전)"""
+    with _config_lock:
+        if _listener is not None:
+            _listener.stop()  # 큐를 비울 때까지 대기
+            if _rate_filter is not None:
+                _rate_filter.flush()
+            _listener.start()
+
+
+def _shutdown_logging():
+    global _listener
+    with _config_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+            if _rate_filter is not None:
+                _rate_filter.flush()
+
+
+atexit.register(_shutdown_logging)
+
+
+# =============================================================================
+# 📊 벤치마크: 동기 print vs 큐 기반 로깅 (호출 스레드 기준 per-call 비용)
+# =============================================================================
+class _SlowConsole:
+    """Windows 콘솔처럼 write마다 지연이 있는 출력 스트림 (벤치마크용)"""
+
+    def __init__(self, delay_s: float):
+        self.delay_s = delay_s
+        self.lines = 0
+
+    def write(self, text: str):
+        self.lines += 1
+        if self.delay_s > 0:
+            time.sleep(self.delay_s)
+
+    def flush(self):
+        pass
+
+
+def run_benchmark(ticks: int = 500, lines_per_tick: int = 3, console_delay_ms: float = 0.5) -> Dict[str, Any]:
+    """
+    모니터 한 틱에서 로그 lines_per_tick줄을 남길 때 호출 스레드가 부담하는 시간 비교.
+    console_delay_ms: 콘솔 write 1회당 지연 (Windows 콘솔 가정)
+    """
+    message = "[SRM1] Screen S3: State changed: NORMAL -> HOSTILE"
+
+    console = _SlowConsole(console_delay_ms / 1000.0)
+    start = time.perf_counter()
+    for tick in range(ticks):
+        for line in range(lines_per_tick):
+            print(f"INFO: {message} #{tick}.{line}", file=console)
+    print_elapsed = time.perf_counter() - start
+
+    console = _SlowConsole(console_delay_ms / 1000.0)
+    configure_logging(stream=console, rate_limit_window=0)
+    log = get_logger("bench")
+    start = time.perf_counter()
+    for tick in range(ticks):
+        for line in range(lines_per_tick):
+            log.info(f"{message} #{tick}.{line}", monitor_id="SRM1", screen_id="S3")
+    log_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    flush_logging()
+    drain_elapsed = time.perf_counter() - start
+
+    result = {
+        'ticks': ticks,
+        'lines_per_tick': lines_per_tick,
+        'console_delay_ms': console_delay_ms,
+        'print_us_per_tick': print_elapsed / ticks * 1e6,
+        'log_us_per_tick': log_elapsed / ticks * 1e6,
+        'background_drain_s': drain_elapsed,
+    }
+    sys.stderr.write(
+        f"per tick ({lines_per_tick} lines, console {console_delay_ms}ms/write): "
+        f"print {result['print_us_per_tick']:.0f}us vs log {result['log_us_per_tick']:.0f}us (caller thread), "
+        f"background drain {drain_elapsed:.3f}s\n"
+    )
+    return result
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv:
+        run_benchmark()
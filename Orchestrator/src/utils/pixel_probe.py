@@ -0,0 +1,91 @@
+# Orchestrator/src/utils/pixel_probe.py
+# 캐시된 프레임에서 여러 픽셀을 한 번에 검사하는 배치 픽셀 프로브
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class PixelProbeSet:
+    """
+    한 화면의 FIXED_UI_COORDS(화면 기준 상대 좌표)를 한 번만 해석해 두고,
+    (coord_key, color, tolerance) 프로브 여러 개를 프레임에서 벡터 연산 한 번으로 검사합니다.
+    tolerance 의미는 pyautogui.pixelMatchesColor와 동일합니다 (채널별 |차이| <= tolerance).
+    """
+
+    def __init__(self, screen_id: str, coords: Dict[str, Any]):
+        self.screen_id = screen_id
+        # (x, y) 형태의 좌표만 프로브 대상으로 등록
+        self.coords: Dict[str, Tuple[int, int]] = {
+            key: (int(value[0]), int(value[1]))
+            for key, value in (coords or {}).items()
+            if isinstance(value, (tuple, list)) and len(value) == 2
+        }
+
+    @classmethod
+    def from_fixed_coords(cls, screen_id: str, fixed_ui_coords: Dict[str, Dict[str, Any]]) -> 'PixelProbeSet':
+        return cls(screen_id, fixed_ui_coords.get(screen_id, {}))
+
+    def has(self, coord_key: str) -> bool:
+        return coord_key in self.coords
+
+    def check(self, frame, probes: List[Dict[str, Any]]) -> List[bool]:
+        """
+        프레임(화면 영역 캡처, PIL 또는 ndarray)에서 모든 프로브를 한 번에 검사.
+        좌표가 없거나 프레임 밖이면 해당 프로브는 False.
+        """
+        if frame is None or not probes:
+            return [False] * len(probes)
+
+        frame_np = np.asarray(frame)
+        height, width = frame_np.shape[:2]
+
+        valid_idx, xs, ys, colors, tolerances = [], [], [], [], []
+        for i, probe in enumerate(probes):
+            xy = self.coords.get(probe['coord_key'])
+            if xy is None or not (0 <= xy[0] < width and 0 <= xy[1] < height):
+                continue
+            valid_idx.append(i)
+            xs.append(xy[0])
+            ys.append(xy[1])
+            colors.append(probe['color'][:3])
+            tolerances.append(probe.get('tolerance', 0))
+
+        results = [False] * len(probes)
+        if not valid_idx:
+            return results
+
+        if frame_np.ndim == 2:
+            pixels = np.repeat(frame_np[ys, xs][:, None], 3, axis=1).astype(np.int16)
+        else:
+            pixels = frame_np[ys, xs, :3].astype(np.int16)
+        diffs = np.abs(pixels - np.asarray(colors, dtype=np.int16))
+        matched = np.all(diffs <= np.asarray(tolerances, dtype=np.int16)[:, None], axis=1)
+
+        for i, ok in zip(valid_idx, matched):
+            results[i] = bool(ok)
+        return results
+
+    def check_all(self, frame, probes: List[Dict[str, Any]], mode: str = 'all') -> bool:
+        """프로브 결과를 하나의 bool로 합침 (mode: 'all' 또는 'any')"""
+        results = self.check(frame, probes)
+        if not results:
+            return False
+        return any(results) if mode == 'any' else all(results)
+
+
+def normalize_probes(instruction: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    지시(instruction)에서 프로브 목록을 꺼냄.
+    'probes' 리스트 형식과 기존 단일 (coord_key, color, tolerance) 형식을 모두 지원.
+    """
+    probes: Optional[List[Dict[str, Any]]] = instruction.get('probes')
+    if probes:
+        return probes
+    if 'coord_key' in instruction:
+        return [{
+            'coord_key': instruction['coord_key'],
+            'color': instruction['color'],
+            'tolerance': instruction.get('tolerance', 0),
+        }]
+    return []
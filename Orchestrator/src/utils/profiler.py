@@ -0,0 +1,332 @@
+# Orchestrator/src/utils/profiler.py
+# 모니터 틱 구간(span) 계측 + 실행 중 샘플링 프로파일러
+#
+# - span: 모니터 루프의 단계(capture / detect / match / policy / io_enqueue / sleep ...)별,
+#         화면별 호출 수·누적·최대 시간을 집계 (비활성 시 거의 0 비용)
+# - 샘플러: 모든 스레드의 스택을 주기적으로 샘플링해 N초 뒤 collapsed-stack 파일로 저장
+#          (flamegraph.pl / speedscope에서 바로 열 수 있는 형식)
+# - 시작 시간: import / 초기화 / VD 준비 단계별 시간을 집계하고 첫 모니터링 시작 시 예산과 비교해 보고
+# - 실행 중 제어: 제어 파일(logs/profiler.cmd)에 명령을 쓰면 제어 스레드(start_control_watcher)가 1초 내에 반영
+#       명령은 각 모듈이 register_command(이름, 처리 함수)로 등록:
+#       spans on | spans off | spans report | spans reset | sample <초>   (이 모듈)
+#       ops report | ops reset   (제너레이터 정책 실행기의 opcode별 실행 수 / 처리 시간 / 완료 지연, src/core/instruction_vm.py)
+#       ticks report | ticks reset   (상태별 폴링 간격, src/core/tick_scheduler.py)
+#       watchdog report | watchdog reset   (틱 / IO 멈춤·재시작 통계, src/core/watchdog.py)
+#       coverage report | coverage reset | coverage export   (화면별 커버리지 / 사각 구간, src/core/coverage.py)
+#       waits report | waits reset   (wait_for 라벨별 UI 등장 시간 히스토그램 / 시간 초과, src/utils/wait_utils.py)
+#
+# 사용 예 (모니터 코드):
+#   self.spans = PROFILER.for_monitor(self.monitor_id)
+#   with self.spans.span('capture', screen_id):
+#       ...
+
+import sys
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+LOGS_DIR = Path(__file__).resolve().parents[2] / "logs"
+DEFAULT_CONTROL_FILE = LOGS_DIR / "profiler.cmd"
+
+
+# =============================================================================
+# 구간(span) 집계
+# =============================================================================
+class SpanProfiler:
+    """(모니터, 단계, 화면) 별 구간 시간 집계. span은 중첩 가능하며 시간은 포함(inclusive) 기준"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        # key → [count, total, max]
+        self._stats: Dict[Tuple[str, str, str], list] = {}
+        self._since = time.time()
+
+    def for_monitor(self, monitor_id: str) -> 'MonitorSpans':
+        return MonitorSpans(self, monitor_id)
+
+    def record(self, monitor_id: str, phase: str, screen_id: Optional[str], elapsed: float):
+        key = (monitor_id, phase, screen_id or '-')
+        with self._lock:
+            entry = self._stats.get(key)
+            if entry is None:
+                self._stats[key] = [1, elapsed, elapsed]
+            else:
+                entry[0] += 1
+                entry[1] += elapsed
+                if elapsed > entry[2]:
+                    entry[2] = elapsed
+
+    def set_enabled(self, enabled: bool):
+        self.enabled = enabled
+        log.info(f"[Profiler] Span timing {'enabled' if enabled else 'disabled'}")
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+            self._since = time.time()
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """'monitor/phase/screen' → {count, total_ms, avg_ms, max_ms}"""
+        with self._lock:
+            items = [(key, list(entry)) for key, entry in self._stats.items()]
+        return {
+            "/".join(key): {
+                'count': count,
+                'total_ms': total * 1000,
+                'avg_ms': total / count * 1000,
+                'max_ms': max_elapsed * 1000,
+            }
+            for key, (count, total, max_elapsed) in sorted(items)
+        }
+
+    def print_report(self):
+        period = time.time() - self._since
+        log.info(f"[Profiler] Span report ({period:.0f}s, inclusive times)")
+        per_monitor = defaultdict(list)
+        for name, entry in self.snapshot().items():
+            monitor_id, phase, screen_id = name.split("/", 2)
+            per_monitor[monitor_id].append((phase, screen_id, entry))
+        for monitor_id, rows in per_monitor.items():
+            for phase, screen_id, entry in sorted(rows, key=lambda r: -r[2]['total_ms']):
+                log.info(f"[Profiler] {monitor_id:<6}{phase:<22}{screen_id:<5}"
+                         f"n={entry['count']:<7} total={entry['total_ms']:>10.1f}ms "
+                         f"avg={entry['avg_ms']:>8.2f}ms max={entry['max_ms']:>8.1f}ms")
+
+
+class MonitorSpans:
+    """모니터 하나에 묶인 span 헬퍼"""
+
+    def __init__(self, profiler: SpanProfiler, monitor_id: str):
+        self.profiler = profiler
+        self.monitor_id = monitor_id
+
+    @contextmanager
+    def span(self, phase: str, screen_id: Optional[str] = None):
+        if not self.profiler.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.profiler.record(self.monitor_id, phase, screen_id, time.perf_counter() - start)
+
+
+# =============================================================================
+# 스택 샘플러
+# =============================================================================
+class StackSampler:
+    """sys._current_frames()로 모든 스레드 스택을 주기적으로 샘플링 (재시작 없이 부착 가능)"""
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, duration: float, out_path: Optional[Path] = None) -> Optional[Path]:
+        if self.running:
+            log.warning("[Profiler] Sampler already running.")
+            return None
+        if out_path is None:
+            out_path = LOGS_DIR / f"profile_{time.strftime('%Y%m%d_%H%M%S')}.folded"
+        out_path = Path(out_path)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, args=(duration, out_path),
+                                        name="StackSampler", daemon=True)
+        self._thread.start()
+        log.info(f"[Profiler] Sampling all threads for {duration:g}s → {out_path}")
+        return out_path
+
+    def stop(self):
+        self._stop_event.set()
+
+    def _run(self, duration: float, out_path: Path):
+        counts: Dict[str, int] = defaultdict(int)
+        own_ident = threading.get_ident()
+        samples = 0
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline and not self._stop_event.is_set():
+            names = {t.ident: t.name for t in threading.enumerate()}
+            for ident, frame in sys._current_frames().items():
+                if ident == own_ident:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{Path(code.co_filename).stem}:{code.co_name}:{frame.f_lineno}")
+                    frame = frame.f_back
+                stack.append(names.get(ident, str(ident)))
+                counts[";".join(reversed(stack))] += 1
+            samples += 1
+            time.sleep(self.interval)
+
+        with open(out_path, "w", encoding="utf-8") as f:
+            for stack, count in sorted(counts.items(), key=lambda kv: -kv[1]):
+                f.write(f"{stack} {count}\n")
+        log.info(f"[Profiler] Sampling done: {samples} samples, {len(counts)} unique stacks → {out_path}")
+
+
+# =============================================================================
+# 시작 시간
+# =============================================================================
+class StartupTimer:
+    """
+    시작 단계별 시간 기록. 단계는 스레드별로 중첩 가능하며 (예: 'prepare VD1' 안의 'import ...'),
+    finish()에서 생성 시점(main.py가 가장 먼저 import) 이후 경과 시간과 import 합계를 예산(STARTUP_CONFIG)과 비교해 보고합니다.
+    """
+
+    def __init__(self, import_budget_ms: Optional[float] = None, startup_budget_ms: Optional[float] = None):
+        self.import_budget_ms = import_budget_ms
+        self.startup_budget_ms = startup_budget_ms
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._phases: List[Tuple[str, float, float, str]] = []  # (이름, 시작 오프셋, 소요, 스레드)
+        self.finished_at: Optional[float] = None
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            with self._lock:
+                self._phases.append((name, start - self._origin, end - start, threading.current_thread().name))
+
+    def snapshot(self) -> Dict[str, object]:
+        with self._lock:
+            phases = list(self._phases)
+        imports = [p for p in phases if p[0].startswith("import ")]
+        return {
+            'elapsed_ms': ((self.finished_at or time.perf_counter()) - self._origin) * 1000,
+            'import_ms': sum(p[2] for p in imports) * 1000,
+            'phases': [
+                {'name': name, 'start_ms': offset * 1000, 'ms': elapsed * 1000, 'thread': thread}
+                for name, offset, elapsed, thread in sorted(phases, key=lambda p: p[1])
+            ],
+        }
+
+    def finish(self, label: str = "first monitoring"):
+        """첫 번째 호출에서만 보고 (이후 호출은 무시)"""
+        with self._lock:
+            if self.finished_at is not None:
+                return
+            self.finished_at = time.perf_counter()
+        report = self.snapshot()
+        log.info(f"[Startup] {label} after {report['elapsed_ms']:.0f}ms (imports {report['import_ms']:.0f}ms)")
+        for phase in report['phases']:
+            log.info(f"[Startup]   +{phase['start_ms']:>7.0f}ms {phase['ms']:>8.1f}ms  {phase['name']:<60} "
+                     f"[{phase['thread']}]")
+        if self.import_budget_ms and report['import_ms'] > self.import_budget_ms:
+            log.warning(f"[Startup] Import time {report['import_ms']:.0f}ms exceeds budget "
+                        f"{self.import_budget_ms:.0f}ms")
+        if self.startup_budget_ms and report['elapsed_ms'] > self.startup_budget_ms:
+            log.warning(f"[Startup] Startup time {report['elapsed_ms']:.0f}ms exceeds budget "
+                        f"{self.startup_budget_ms:.0f}ms")
+
+
+# =============================================================================
+# 실행 중 제어 (제어 파일)
+# =============================================================================
+_COMMANDS: Dict[str, Callable[..., None]] = {}  # 명령 → 처리 함수 (register_command)
+_commands_lock = threading.Lock()
+
+
+def poll_control_file(control_file: Path = DEFAULT_CONTROL_FILE):
+    """제어 파일에 명령이 있으면 실행하고 파일을 지움"""
+    try:
+        if not control_file.exists():
+            return
+        commands = control_file.read_text(encoding="utf-8").splitlines()
+        control_file.unlink()
+    except OSError as e:
+        log.warning(f"[Profiler] Failed to read control file {control_file}: {e}")
+        return
+
+    for line in commands:
+        handle_command(line)
+
+
+def start_control_watcher(stop_event: threading.Event, interval: float = 1.0,
+                          control_file: Path = DEFAULT_CONTROL_FILE) -> threading.Thread:
+    """stop_event가 set될 때까지 interval초마다 poll_control_file (메인 루프는 다음 예약 작업까지 잠들 수 있으므로 별도 스레드)"""
+    def _run():
+        while not stop_event.wait(interval):
+            poll_control_file(control_file)
+
+    thread = threading.Thread(target=_run, name="ProfilerControl", daemon=True)
+    thread.start()
+    return thread
+
+
+def register_command(name: str, handler: Callable[..., None]):
+    """
+    제어 파일 명령 등록 (예: 'ticks report'). 명령 뒤에 남은 단어는 handler의 위치 인자로 전달.
+    각 모듈이 import 시 자기 명령을 등록 (utils가 core를 거꾸로 import하지 않도록)
+    """
+    with _commands_lock:
+        _COMMANDS[name] = handler
+
+
+def handle_command(line: str):
+    """가장 길게 일치하는 등록 명령 실행 (예: 'sample 30' → 'sample' 처리기에 '30')"""
+    parts = line.strip().split()
+    if not parts:
+        return
+    with _commands_lock:
+        commands = dict(_COMMANDS)
+    for size in range(len(parts), 0, -1):
+        handler = commands.get(" ".join(parts[:size]))
+        if handler is None:
+            continue
+        try:
+            handler(*parts[size:])
+        except Exception as e:
+            log.warning(f"[Profiler] Command {line!r} failed: {e}")
+        return
+    log.warning(f"[Profiler] Unknown command: {line!r} (registered: {', '.join(sorted(commands))})")
+
+
+def _sample_command(duration: str = "30"):
+    try:
+        seconds = float(duration)
+    except ValueError:
+        log.warning(f"[Profiler] Invalid sample duration: {duration!r}")
+        return
+    SAMPLER.start(seconds)
+
+
+def _load_config(name: str) -> Dict:
+    try:
+        from Orchestrator.src.utils import config
+        return getattr(config, name, {})
+    except ImportError:
+        return {}
+
+
+_config = _load_config('PROFILING_CONFIG')
+_startup_config = _load_config('STARTUP_CONFIG')
+PROFILER = SpanProfiler(enabled=_config.get('spans_enabled', False))
+SAMPLER = StackSampler(interval=_config.get('sample_interval', 0.005))
+STARTUP = StartupTimer(import_budget_ms=_startup_config.get('import_budget_ms'),
+                       startup_budget_ms=_startup_config.get('startup_budget_ms'))
+
+register_command('spans on', lambda: PROFILER.set_enabled(True))
+register_command('spans off', lambda: PROFILER.set_enabled(False))
+register_command('spans report', PROFILER.print_report)
+register_command('spans reset', PROFILER.reset)
+register_command('sample', _sample_command)
@@ -0,0 +1,154 @@
+# Orchestrator/src/utils/signature_filter.py
+# 템플릿 매칭 전 단계의 픽셀 시그니처 사전 필터
+#
+# (화면, 템플릿)마다 템플릿을 작은 격자로 축소한 시그니처를 만들어 두고,
+# 템플릿이 마지막으로 발견된 위치의 화면 패치와 비교해 명백한 불일치는
+# matchTemplate 없이 바로 거절합니다.
+# 위치를 아직 모르면(첫 매칭 전) 필터 없이 통과시킵니다.
+# 마지막 위치만 보므로 위치가 고정된 템플릿(DEAD / HOSTILE / ARENA / SLEEP 등)에만 키를 주어 사용합니다
+# (키가 None이면 필터 없음 - 움직이는 버튼 등은 위치가 바뀌면 감사 전까지 계속 거절되기 때문).
+# 거절된 경우 중 일부는 감사(audit)로 전체 매칭을 돌려, 놓친 양성(escaped positive)을 집계합니다.
+
+import threading
+from typing import Any, Dict, Hashable, Tuple
+
+import cv2
+import numpy as np
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
+
+
+# 판정 결과
+PASS = 'pass'  # 사전 필터 통과 → 전체 매칭 수행
+REJECT = 'reject'  # 명백한 불일치 → 전체 매칭 생략
+AUDIT = 'audit'  # 거절 대상이지만 감사용으로 전체 매칭 수행
+
+
+class SignatureFilter:
+    """(화면, 템플릿) 키별 픽셀 시그니처 사전 필터"""
+
+    def __init__(self, grid: int = 8, min_correlation: float = 0.3, max_flat_diff: float = 40.0,
+                 audit_every: int = 20, enabled: bool = True):
+        self.grid = grid  # 시그니처 격자 크기 (grid × grid 평균값)
+        self.min_correlation = min_correlation  # 이 값 미만이면 거절 (전체 매칭 임계값보다 훨씬 느슨함)
+        self.max_flat_diff = max_flat_diff  # 평탄한 템플릿(예: 검은 화면)은 평균 밝기 차이로 판정
+        self.audit_every = audit_every  # 거절 N회마다 1회 감사
+        self.enabled = enabled
+
+        self._lock = threading.Lock()
+        self._signatures: Dict[Hashable, np.ndarray] = {}
+        self._locations: Dict[Hashable, Tuple[int, int]] = {}
+        self._stats: Dict[Hashable, Dict[str, int]] = {}
+
+    # ------------------------------------------------------------------------
+    # 시그니처
+    # ------------------------------------------------------------------------
+    def _grid_signature(self, gray: np.ndarray) -> np.ndarray:
+        size = (min(self.grid, gray.shape[1]), min(self.grid, gray.shape[0]))
+        return cv2.resize(gray, size, interpolation=cv2.INTER_AREA).astype(np.float32).ravel()
+
+    def _template_signature(self, key: Hashable, template_gray: np.ndarray) -> np.ndarray:
+        signature = self._signatures.get(key)
+        if signature is None:
+            signature = self._grid_signature(template_gray)
+            self._signatures[key] = signature
+        return signature
+
+    def _is_obvious_mismatch(self, template_sig: np.ndarray, patch_sig: np.ndarray) -> bool:
+        template_std = float(template_sig.std())
+        patch_std = float(patch_sig.std())
+
+        # 평탄한 템플릿: 평균 밝기 차이로만 판정
+        if template_std < 2.0:
+            return abs(float(template_sig.mean()) - float(patch_sig.mean())) > self.max_flat_diff
+        # 템플릿은 무늬가 있는데 패치가 평탄 (예: 암전/검은 화면)
+        if patch_std < 2.0:
+            return True
+
+        t = (template_sig - template_sig.mean()) / template_std
+        p = (patch_sig - patch_sig.mean()) / patch_std
+        correlation = float(np.mean(t * p))
+        return correlation < self.min_correlation
+
+    def _entry(self, key: Hashable) -> Dict[str, int]:
+        entry = self._stats.get(key)
+        if entry is None:
+            entry = {'checks': 0, 'unfiltered': 0, 'passed': 0, 'rejected': 0, 'audits': 0, 'escaped': 0}
+            self._stats[key] = entry
+        return entry
+
+    # ------------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------------
+    def admit(self, key: Hashable, screen_gray: np.ndarray, template_gray: np.ndarray) -> str:
+        """전체 매칭을 수행할지 판정 (PASS / REJECT / AUDIT)"""
+        if not self.enabled or key is None:
+            return PASS
+
+        with self._lock:
+            entry = self._entry(key)
+            entry['checks'] += 1
+
+            location = self._locations.get(key)
+            if location is None:
+                entry['unfiltered'] += 1
+                return PASS
+
+            x, y = location
+            h, w = template_gray.shape[:2]
+            if y + h > screen_gray.shape[0] or x + w > screen_gray.shape[1]:
+                entry['unfiltered'] += 1
+                return PASS
+
+            template_sig = self._template_signature(key, template_gray)
+            patch_sig = self._grid_signature(screen_gray[y:y + h, x:x + w])
+            if not self._is_obvious_mismatch(template_sig, patch_sig):
+                entry['passed'] += 1
+                return PASS
+
+            entry['rejected'] += 1
+            if self.audit_every and entry['rejected'] % self.audit_every == 0:
+                entry['audits'] += 1
+                return AUDIT
+            return REJECT
+
+    def observe(self, key: Hashable, decision: str, max_loc: Tuple[int, int], found: bool):
+        """전체 매칭 결과를 반영 (발견 위치 학습, 감사 결과 집계)"""
+        if not self.enabled or key is None or not found:
+            return
+        with self._lock:
+            if decision == AUDIT:
+                # 사전 필터가 거절했지만 실제로는 존재 → 놓친 양성
+                self._entry(key)['escaped'] += 1
+            self._locations[key] = (int(max_loc[0]), int(max_loc[1]))
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """키별 통계 (거절률, 감사 대비 놓친 양성 비율 포함)"""
+        with self._lock:
+            result = {}
+            for key, entry in self._stats.items():
+                copied = dict(entry)
+                copied['rejection_rate'] = entry['rejected'] / entry['checks'] if entry['checks'] else 0.0
+                copied['escape_rate'] = entry['escaped'] / entry['audits'] if entry['audits'] else 0.0
+                result[str(key)] = copied
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._signatures.clear()
+            self._locations.clear()
+            self._stats.clear()
+
+    def print_report(self):
+        for key, entry in sorted(self.get_stats().items()):
+            log.info(f"[SignatureFilter] {key}: checks={entry['checks']}, "
+                  f"rejected={entry['rejected']} ({entry['rejection_rate']:.1%}), "
+                  f"audits={entry['audits']}, escaped={entry['escaped']}")
+
+
+SIGNATURE_FILTER = SignatureFilter()
+
+
+def get_prefilter_stats() -> Dict[str, Dict[str, Any]]:
+    return SIGNATURE_FILTER.get_stats()
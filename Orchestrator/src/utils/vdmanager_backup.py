@@ -5,6 +5,9 @@ import keyboard
 import time
 from enum import Enum
 from ..utils.config import TASKBAR_CONFIG
+from Orchestrator.src.utils.log import get_logger
+
+log = get_logger(__name__)
 
 
 class VirtualDesktop(Enum):
@@ -42,32 +45,32 @@ class VDManager:
                 return VirtualDesktop.OTHER
 
         except Exception as e:
-            print(f"VD 체크 중 에러 발생: {e}")
+            log.warning(f"VD 체크 중 에러 발생: {e}")
             return VirtualDesktop.OTHER
 
     def send_key_combination(self, key_combination):
         """keyboard 라이브러리로 키 조합 전송"""
         try:
             keyboard.press_and_release(key_combination)
-            print(f"DEBUG: Sent key combination: {key_combination}")
+            log.debug(f"Sent key combination: {key_combination}")
         except Exception as e:
-            print(f"키 입력 오류: {e}")
+            log.error(f"키 입력 오류: {e}")
 
     def switch_to(self, target_vd: VirtualDesktop):
-        print(f"DEBUG: switch_to called - target: {target_vd.name}")
+        log.debug(f"switch_to called - target: {target_vd.name}")
 
         if target_vd == VirtualDesktop.OTHER:
-            print("DEBUG: Target is OTHER, returning")
+            log.debug("Target is OTHER, returning")
             return
 
         current_vd = self.get_current_vd()
-        print(f"DEBUG: Current VD detected: {current_vd.name}")
+        log.debug(f"Current VD detected: {current_vd.name}")
 
         if current_vd == target_vd:
-            print(f"DEBUG: Already at target {target_vd.name}, returning")
+            log.debug(f"Already at target {target_vd.name}, returning")
             return
 
-        print(f"DEBUG: About to send keyboard input for {current_vd.name} → {target_vd.name}")
+        log.debug(f"About to send keyboard input for {current_vd.name} → {target_vd.name}")
 
         # OTHER에서 VD1으로 = 오른쪽 한 번
         if current_vd == VirtualDesktop.OTHER and target_vd == VirtualDesktop.VD1:
@@ -84,11 +87,11 @@ class VDManager:
 
         # VD1에서 VD2로 = 오른쪽 한 번
         elif current_vd == VirtualDesktop.VD1 and target_vd == VirtualDesktop.VD2:
-            print("DEBUG: Sending Ctrl+Win+Right...")
+            log.debug("Sending Ctrl+Win+Right...")
             time.sleep(0.1)
             self.send_key_combination('ctrl+win+right')
             time.sleep(0.5)
-            print("DEBUG: Keyboard input sent")
+            log.debug("Keyboard input sent")
 
         # VD2에서 VD1로 = 왼쪽 한 번
         elif current_vd == VirtualDesktop.VD2 and target_vd == VirtualDesktop.VD1:
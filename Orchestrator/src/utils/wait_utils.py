@@ -0,0 +1,163 @@
+# Orchestrator/src/utils/wait_utils.py
+# 공용 대기 유틸리티 - "나타날 때까지 기다리기"를 한 곳에서 처리
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from Orchestrator.src.core.clock import clock
+from Orchestrator.src.utils.log import get_logger
+from Orchestrator.src.utils.profiler import register_command
+
+log = get_logger(__name__)
+
+
+# ============================================================================
+# 폴링 정책
+# ============================================================================
+@dataclass
+class PollPolicy:
+    """처음엔 빠르게, 시간이 지날수록 느리게 폴링하는 정책"""
+    initial_interval: float = 0.05  # 첫 폴링 간격 (초)
+    max_interval: float = 0.5  # 최대 폴링 간격 (초)
+    backoff: float = 1.5  # 매 폴링마다 간격에 곱하는 배수
+
+    def intervals(self):
+        """폴링 간격을 순서대로 생성"""
+        interval = self.initial_interval
+        while True:
+            yield interval
+            interval = min(interval * self.backoff, self.max_interval)
+
+
+# 자주 쓰는 정책
+FAST_POLL = PollPolicy(initial_interval=0.05, max_interval=0.5, backoff=1.5)
+SLOW_POLL = PollPolicy(initial_interval=1.0, max_interval=11.0, backoff=2.0)
+
+
+# ============================================================================
+# 등장 시간 히스토그램
+# ============================================================================
+class WaitStats:
+    """UI 요소별 등장 소요 시간(time-to-appear) 히스토그램"""
+
+    BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, float('inf'))
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+
+    def _entry(self, label: str) -> Dict[str, Any]:
+        entry = self._stats.get(label)
+        if entry is None:
+            entry = {
+                'found': 0,
+                'timeout': 0,
+                'polls': 0,
+                'total_time': 0.0,
+                'max_time': 0.0,
+                'histogram': [0] * len(self.BUCKETS),
+            }
+            self._stats[label] = entry
+        return entry
+
+    def record(self, label: str, elapsed: float, found: bool, polls: int):
+        with self._lock:
+            entry = self._entry(label)
+            entry['polls'] += polls
+            if not found:
+                entry['timeout'] += 1
+                return
+            entry['found'] += 1
+            entry['total_time'] += elapsed
+            entry['max_time'] = max(entry['max_time'], elapsed)
+            for i, upper in enumerate(self.BUCKETS):
+                if elapsed <= upper:
+                    entry['histogram'][i] += 1
+                    break
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """현재 통계 복사본 반환 (평균 등장 시간 포함)"""
+        with self._lock:
+            result = {}
+            for label, entry in self._stats.items():
+                copied = dict(entry)
+                copied['histogram'] = list(entry['histogram'])
+                copied['avg_time'] = entry['total_time'] / entry['found'] if entry['found'] else None
+                result[label] = copied
+            return result
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
+
+    def print_report(self):
+        labels = [f"<={b:g}s" if b != float('inf') else ">120s" for b in self.BUCKETS]
+        for label, entry in sorted(self.snapshot().items()):
+            avg = f"{entry['avg_time']:.2f}s" if entry['avg_time'] is not None else "-"
+            log.info(f"[WaitStats] {label}: found={entry['found']}, timeout={entry['timeout']}, "
+                  f"avg={avg}, max={entry['max_time']:.2f}s, polls={entry['polls']}")
+            buckets = ", ".join(f"{name}:{count}" for name, count in zip(labels, entry['histogram']) if count)
+            if buckets:
+                log.info(f"      └ {buckets}")
+
+
+WAIT_STATS = WaitStats()
+register_command('waits report', WAIT_STATS.print_report)
+register_command('waits reset', WAIT_STATS.reset)
+
+
+# ============================================================================
+# 핵심: wait_for
+# ============================================================================
+def wait_for(condition: Callable[[], Any], timeout: float, poll_policy: Optional[PollPolicy] = None,
+             label: Optional[str] = None, stop_event: Optional[threading.Event] = None) -> Any:
+    """
+    condition()이 참 값을 반환할 때까지 대기하고 그 값을 즉시 반환합니다.
+    timeout 안에 만족하지 못하거나 stop_event가 설정되면 None을 반환합니다.
+    label이 주어지면 등장 소요 시간을 WAIT_STATS에 기록합니다.
+    condition()의 예외는 거짓으로 취급합니다 (대기 중 첫 예외는 warning, 이후와 traceback은 debug 로그).
+    """
+    policy = poll_policy or FAST_POLL
+    start_time = clock.monotonic()
+    deadline = start_time + max(0.0, timeout)
+    polls = 0
+    errors = 0
+    intervals = policy.intervals()
+
+    while True:
+        polls += 1
+        try:
+            result = condition()
+        except Exception as e:
+            errors += 1
+            message = f"[wait_for] Condition '{label or 'anonymous'}' raised (poll {polls}): {e!r}"
+            if errors == 1:
+                log.warning(message)
+            log.debug(message, exc_info=True)
+            result = None
+
+        if result:
+            if label:
+                WAIT_STATS.record(label, clock.monotonic() - start_time, True, polls)
+            return result
+
+        remaining = deadline - clock.monotonic()
+        if remaining <= 0:
+            break
+
+        sleep_time = min(next(intervals), remaining)
+        if stop_event is not None:
+            if clock.wait(stop_event, sleep_time):
+                break
+        else:
+            clock.sleep(sleep_time)
+
+    if label:
+        WAIT_STATS.record(label, clock.monotonic() - start_time, False, polls)
+    return None
+
+
+def sleep_unless(stop_condition: Callable[[], bool], duration: float, poll_interval: float = 0.5) -> bool:
+    """duration 동안 대기하되 stop_condition()이 참이 되면 즉시 중단. 중단되었으면 True"""
+    return bool(wait_for(stop_condition, duration, PollPolicy(poll_interval, poll_interval, 1.0)))
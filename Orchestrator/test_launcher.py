@@ -40,7 +40,7 @@ def run_orchestrator(start_vd="VD1"):
     try:
         # 타임 슬라이스를 짧게 설정하여 테스트 용이하게 (예: 60분)
         # 실제 테스트시는 길게 해도 됨, 어차피 강제 전환 기능이 있으므로
-        orchestrator = Orchestrator(vd1_slice_min=60, vd2_slice_min=60)
+        orchestrator = Orchestrator(slice_min=60)
         orchestrator.run_orchestration_loop(start_vd=start_vd)
     except KeyboardInterrupt:
         print("\n중단됨.")
@@ -61,7 +61,7 @@ def test_sm2_standalone():
     # 가짜 Orchestrator (IO 스케줄러만 빌려옴)
     from Orchestrator.src.core.io_scheduler import IOScheduler
     # [추가] 스크린샷 기능을 위해 필요
-    import pyautogui
+    from Orchestrator.src.core.input_backend import inputs
     from Orchestrator.Raven2.utils.screen_info import SCREEN_REGIONS
 
     class MockOrchestrator:
@@ -79,7 +79,7 @@ def test_sm2_standalone():
             """SystemMonitor가 요청하는 스크린샷 기능을 가짜로 제공"""
             if screen_id in SCREEN_REGIONS:
                 region = SCREEN_REGIONS[screen_id]
-                return pyautogui.screenshot(region=region)
+                return inputs.screenshot(region=region)
             else:
                 print(f"[Mock] Unknown Screen ID for capture: {screen_id}")
                 return None